@@ -0,0 +1,89 @@
+"""
+benchmarks/bench_contract_validation.py
+
+계약 검증(validate_contract)이 전체 파이프라인 지연에 더하는 비율을 측정한다.
+파이프라인은 배포된 흐름 그대로 — 엔진 사이는 JSON 으로 넘기고 계약도 JSON 으로 낸다
+(calculation_engine/main.py → meaning_engine/main.py → build_contract / stream_fusion JSONL):
+  analyze_saju → today → build_tboo_json_v33 → JSON → run_engine → JSON
+  → build_interpretation_contract (두 문서 디코드) → [검증] → 계약 JSON
+검증 대상은 퓨전이 실제로 받는 디코드된 문서다.
+기준: 기본 검증(봉투 / meta / evidence 참조 + calculation / meaning 문서 전체) 비용
+      < 파이프라인 지연의 5% (초과 시 exit 1)
+봉투만 검사(documents=False)는 참고용으로 함께 출력한다.
+차트마다 --repeat 번 돌려 최솟값을 쓴다 (다른 프로세스 / 타이머 잡음 제거), 보고 값은 차트별 최솟값의 중앙값.
+
+  python benchmarks/bench_contract_validation.py [--charts 200] [--repeat 3] [--budget 0.05]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "fusion_engine"))
+
+from corpus import build_corpus  # noqa: E402
+from engines import load_calculation_main  # noqa: E402  (경로 설정 포함)
+from engine.saju_core import analyze_saju  # noqa: E402
+from engine.engine_core import run_engine  # noqa: E402
+from build_contract import build_interpretation_contract  # noqa: E402
+from contract_validator import compiled_validators, validate_contract  # noqa: E402
+
+
+def _dumps(doc) -> str:
+    # 엔진 JSONL / stream_fusion 출력과 같은 형식
+    return json.dumps(doc, ensure_ascii=False, separators=(",", ":"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="contract validation overhead benchmark")
+    parser.add_argument("--charts", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3, help="차트당 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--budget", type=float, default=0.05, help="허용 비율 (기본 5%)")
+    args = parser.parse_args()
+
+    calc_main = load_calculation_main()
+    compiled_validators()  # 컴파일 비용은 프로세스당 1회 → 측정에서 제외
+
+    pipeline_s, validate_s, envelope_s = [], [], []
+    for b in build_corpus(args.charts):
+        best = [float("inf")] * 3
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            saju_info, _ = analyze_saju(b.year, b.month, b.day, b.hour, b.minute, b.gender, "bench", defer=True)
+            today_unse = calc_main.compute_today_unse(saju_info["day_gan"], b.gender)
+            calculation_line = _dumps(calc_main.build_tboo_json_v33(
+                "bench", b.gender_label, b.year, b.month, b.day, b.hour, b.minute,
+                saju_info, today_unse,
+            ))
+            meaning_line = _dumps(run_engine(json.loads(calculation_line)))
+            contract = build_interpretation_contract(json.loads(calculation_line), json.loads(meaning_line))
+            t1 = time.perf_counter()
+            validate_contract(contract)
+            t2 = time.perf_counter()
+            _dumps(contract)
+            t3 = time.perf_counter()
+            validate_contract(contract, documents=False)
+            t4 = time.perf_counter()
+            best = [min(best[0], (t1 - t0) + (t3 - t2)), min(best[1], t2 - t1), min(best[2], t4 - t3)]
+        pipeline_s.append(best[0])
+        validate_s.append(best[1])
+        envelope_s.append(best[2])
+
+    pipeline_med = statistics.median(pipeline_s)
+    validate_med = statistics.median(validate_s)
+    envelope_med = statistics.median(envelope_s)
+    ratio = validate_med / pipeline_med
+
+    print(f"charts            : {args.charts} (x{args.repeat}, min)")
+    print(f"pipeline (median) : {pipeline_med * 1e3:.3f} ms")
+    print(f"validate (median) : {validate_med * 1e6:.1f} µs")
+    print(f"overhead          : {ratio * 100:.2f}% (budget {args.budget * 100:.1f}%)")
+    print(f"documents=False   : {envelope_med * 1e6:.1f} µs ({envelope_med / pipeline_med * 100:.2f}%, 참고)")
+    return 0 if ratio < args.budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
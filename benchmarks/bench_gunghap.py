@@ -0,0 +1,130 @@
+"""
+benchmarks/bench_gunghap.py
+
+궁합 top-k 인덱스 (engine/gunghap.py GunghapIndex) 측정 / 검증
+  1) 코퍼스 명식: score_compatibility(단건) == 인덱스 점수 (모든 쌍)
+  2) 모집단 N명 (기본 10만 / 100만): top_k == 전수 비교, 질의당 지연 비교
+
+  python benchmarks/bench_gunghap.py [--sizes 100000,1000000] [--queries 50] [--k 50]
+
+모집단은 네 기둥 60갑자 코드를 seed 고정 난수로 뽑아 만든다 (분포 측정용, 실제 만세력 조합 아님).
+불일치가 있으면 exit 1.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "fusion_engine"))
+
+from corpus import build_corpus  # noqa: E402
+from engines import load_calculation_main  # noqa: E402  (경로 설정 포함)
+from engine.ganji_tables import GAN_10, JI_12  # noqa: E402
+from engine.gunghap import (  # noqa: E402
+    ELEMENTS,
+    GAN_ELEMENT,
+    JI_ELEMENT,
+    GunghapIndex,
+    features_from_saju_info,
+    score_compatibility,
+)
+from engine.saju_core import analyze_saju  # noqa: E402
+
+_GAN_ELEMENT_INDEX = np.array([ELEMENTS.index(GAN_ELEMENT[g]) for g in GAN_10])
+_JI_ELEMENT_INDEX = np.array([ELEMENTS.index(JI_ELEMENT[j]) for j in JI_12])
+
+
+def corpus_check(size: int) -> int:
+    load_calculation_main()
+    features = []
+    for b in build_corpus(size):
+        info, _ = analyze_saju(b.year, b.month, b.day, b.hour, b.minute, b.gender, "bench", defer=True)
+        features.append(features_from_saju_info(info, b.gender))
+    index = GunghapIndex.from_features(features)
+
+    bad = 0
+    for i, a in enumerate(features):
+        scores = index.scores(a)
+        for j, b in enumerate(features):
+            if score_compatibility(a, b)["score"] != scores[j]:
+                bad += 1
+    print(f"corpus pairs={len(features) ** 2}  mismatches={bad}")
+    return bad
+
+
+def population(size: int, seed: int):
+    rng = np.random.default_rng(seed)
+    codes = rng.integers(0, 60, size=(size, 4))          # 년 / 월 / 일 / 시
+    hour_known = rng.random(size) > 0.1
+    gans, jis = codes % 10, codes % 12
+    counts = np.zeros((size, 5), dtype=np.int8)
+    for col in range(4):
+        w = hour_known.astype(np.int8) if col == 3 else np.ones(size, dtype=np.int8)
+        np.add.at(counts, (np.arange(size), _GAN_ELEMENT_INDEX[gans[:, col]]), w)
+        np.add.at(counts, (np.arange(size), _JI_ELEMENT_INDEX[jis[:, col]]), w)
+    gender = rng.integers(1, 3, size=size).astype(np.int8)
+    return gender, gans[:, 2].astype(np.uint8), jis[:, 2].astype(np.uint8), jis[:, 0].astype(np.uint8), counts
+
+
+def population_check(size: int, queries: int, k: int, seed: int) -> int:
+    gender, day_gan, day_ji, year_ji, counts = population(size, seed)
+    t0 = time.perf_counter()
+    index = GunghapIndex(gender, day_gan, day_ji, year_ji, counts)
+    build_ms = (time.perf_counter() - t0) * 1e3
+
+    rng = np.random.default_rng(seed + 1)
+    fast, brute, bad = [], [], 0
+    for qi in rng.integers(0, size, size=queries).tolist():
+        query = {
+            "gender": int(gender[qi]),
+            "day_gan": GAN_10[day_gan[qi]],
+            "day_ji": JI_12[day_ji[qi]],
+            "year_ji": JI_12[year_ji[qi]],
+            "elements": counts[qi].tolist(),
+        }
+        opposite = 3 - query["gender"]
+
+        t0 = time.perf_counter()
+        got = index.top_k(query, k, gender=opposite, exclude=qi)
+        fast.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        want = index.brute_force_top_k(query, k, gender=opposite, genders=gender, exclude=qi)
+        brute.append(time.perf_counter() - t0)
+
+        bad += got != want
+
+    print(
+        f"N={size:>9,}  build={build_ms:8.1f}ms  index={index.nbytes / 1024:8.0f}KB  "
+        f"top_k={statistics.median(fast) * 1e3:7.2f}ms  brute={statistics.median(brute) * 1e3:7.2f}ms  "
+        f"mismatches={bad}/{queries}"
+    )
+    return bad
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="gunghap top-k index benchmark")
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--corpus", type=int, default=60, help="단건 점수 대조용 코퍼스 크기")
+    parser.add_argument("--seed", type=int, default=2026)
+    args = parser.parse_args()
+
+    bad = corpus_check(args.corpus)
+    for size in [int(s) for s in args.sizes.split(",") if s]:
+        bad += population_check(size, args.queries, args.k, args.seed)
+
+    if bad:
+        print("❌ top-k / score mismatch")
+        return 1
+    print("✅ index == brute force")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
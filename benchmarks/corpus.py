@@ -0,0 +1,50 @@
+"""
+benchmarks/corpus.py
+
+결정적(seed 고정) 합성 출생 코퍼스
+- 1900-01-01 ~ 2050-12-31 (만세력 범위) 균등 분포 + 양 끝 날짜
+- 시각 관측 / 미상(unknown hour) 혼합
+- 남성(1) / 여성(2) 혼합
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional
+
+CALENDAR_START = date(1900, 1, 1)
+CALENDAR_END = date(2050, 12, 31)
+
+
+@dataclass(frozen=True)
+class Birth:
+    year: int
+    month: int
+    day: int
+    hour: Optional[int]
+    minute: Optional[int]
+    gender: int  # 1: 남성, 2: 여성
+
+    @property
+    def gender_label(self) -> str:
+        return "남성" if self.gender == 1 else "여성"
+
+
+def build_corpus(
+    size: int,
+    seed: int = 2026,
+    unknown_hour_ratio: float = 0.3,
+) -> List[Birth]:
+    rnd = random.Random(seed)
+    span = (CALENDAR_END - CALENDAR_START).days
+
+    days = [0, span] + [rnd.randint(0, span) for _ in range(max(0, size - 2))]
+    corpus = []
+    for i, offset in enumerate(days[:size]):
+        d = CALENDAR_START + timedelta(days=offset)
+        if rnd.random() < unknown_hour_ratio:
+            hour, minute = None, None
+        else:
+            hour, minute = rnd.randint(0, 23), rnd.randint(0, 59)
+        corpus.append(Birth(d.year, d.month, d.day, hour, minute, 1 + i % 2))
+    return corpus
@@ -0,0 +1,275 @@
+"""
+benchmarks/run_benchmarks.py
+
+엔진 단계별 성능 벤치마크 (단건 / 배치)
+  analyze_saju · get_today_ganji · build_today_domain_operation ·
+  get_year_month_unse · build_month_operation · get_day_unse_range · get_hour_pillars · run_engine ·
+  meaning_cache_hit · build_interpretation_contract ·
+  pipeline_in_process (세 CLI 가 하는 일을 한 프로세스 안에서: 계산 → JSON → 의미 → JSON → 계약 → JSON,
+                       CLI 프로세스 기동 / import / 파일 I/O 는 포함하지 않음)
+
+기록:
+  python benchmarks/run_benchmarks.py --output benchmarks/baseline.json
+비교 (회귀 또는 기준에 있는 단계 / 지표가 빠지면 exit 1):
+  python benchmarks/run_benchmarks.py --compare benchmarks/baseline.json --threshold 0.15
+  (--only 로 고른 단계 밖의 기준 항목은 비교하지 않음)
+
+- 코퍼스는 seed 고정 (benchmarks/corpus.py) → 같은 입력으로 반복 측정
+- 단건: 같은 입력 반복 호출의 중앙값
+- 배치: 코퍼스 전체 1회 순회의 건당 평균
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "fusion_engine"))
+
+from corpus import Birth, build_corpus  # noqa: E402
+from engines import load_calculation_main  # noqa: E402  (경로 설정 포함)
+from engine.saju_core import (  # noqa: E402
+    analyze_saju,
+    build_month_operation,
+    build_today_domain_operation,
+    get_day_unse_range,
+    get_hour_pillars,
+    get_today_ganji,
+    get_year_month_unse,
+)
+from engine.engine_core import run_engine  # noqa: E402
+from engine.result_cache import MeaningResultCache  # noqa: E402
+from utils.solar_time import SEOUL_LONGITUDE  # noqa: E402
+from build_contract import build_interpretation_contract  # noqa: E402
+
+BENCH_VERSION = 1
+TODAY_GANJI = "戊辰"  # 날짜 무관하게 같은 입력을 쓰기 위한 고정값
+CALENDAR_YEAR = (date(2026, 1, 1), date(2027, 1, 1))  # 연간 달력 화면 1회분
+DOMAINS = ["jaemul", "love", "job"]
+
+
+# ------------------------------------------------------------
+# 측정 도구
+# ------------------------------------------------------------
+def time_single(fn: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1e6
+
+
+def time_batch(fn: Callable[[Any], Any], items: List[Any]) -> float:
+    t0 = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - t0) / max(1, len(items)) * 1e6
+
+
+# ------------------------------------------------------------
+# 단계 입력 준비
+# ------------------------------------------------------------
+class Stages:
+    def __init__(self, corpus: List[Birth]):
+        self.calc_main = load_calculation_main()
+        self.corpus = corpus
+        self.infos = [self.analyze(b) for b in corpus]
+        self.calculations = [self.calculation(b, info) for b, info in zip(corpus, self.infos)]
+        self.meanings = [run_engine(c) for c in self.calculations]
+
+    @staticmethod
+    def analyze(b: Birth) -> Dict[str, Any]:
+        saju_info, _ = analyze_saju(b.year, b.month, b.day, b.hour, b.minute, b.gender, "bench", defer=True)
+        return saju_info
+
+    def today_unse(self, day_gan: str, gender: int) -> Dict[str, Any]:
+        today = self.calc_main.get_today_unse(day_gan, TODAY_GANJI)
+        today.update(build_today_domain_operation(day_gan, TODAY_GANJI, gender))
+        return today
+
+    def calculation(self, b: Birth, info: Dict[str, Any]) -> Dict[str, Any]:
+        return self.calc_main.build_tboo_json_v33(
+            "bench", b.gender_label, b.year, b.month, b.day, b.hour, b.minute,
+            info, self.today_unse(info["day_gan"], b.gender),
+        )
+
+    def pipeline(self, b: Birth) -> str:
+        """세 CLI가 하는 일을 프로세스 안에서 그대로 (JSON 직렬화 포함, 프로세스 기동 / 파일 I/O 제외)."""
+        info = self.analyze(b)
+        today = self.calc_main.compute_today_unse(info["day_gan"], b.gender)
+        calculation = self.calc_main.build_tboo_json_v33(
+            "bench", b.gender_label, b.year, b.month, b.day, b.hour, b.minute, info, today,
+        )
+        calculation = json.loads(json.dumps(calculation, ensure_ascii=False, indent=2))
+        meaning = json.loads(json.dumps(run_engine(calculation), ensure_ascii=False, indent=2))
+        contract = build_interpretation_contract(calculation, meaning)
+        return json.dumps(contract, ensure_ascii=False, indent=2)
+
+
+def run_suite(corpus_size: int, repeat: int, seed: int, only: Optional[List[str]]) -> Dict[str, Any]:
+    corpus = build_corpus(corpus_size, seed=seed)
+    stages = Stages(corpus)
+
+    first, info0 = corpus[0], stages.infos[0]
+    day_gans = [(info["day_gan"], b.gender) for b, info in zip(corpus, stages.infos)]
+    pairs = list(zip(stages.calculations, stages.meanings))
+    warm_cache = MeaningResultCache(max_entries=len(stages.calculations))
+    for calculation in stages.calculations:
+        warm_cache.run(calculation)
+    births = [datetime(b.year, b.month, b.day, b.hour, b.minute) for b in corpus if b.hour is not None]
+
+    cases: Dict[str, Any] = {
+        "analyze_saju": (lambda: stages.analyze(first), stages.analyze, corpus),
+        "get_today_ganji": (get_today_ganji, lambda _: get_today_ganji(), corpus),
+        "build_today_domain_operation": (
+            lambda: build_today_domain_operation(info0["day_gan"], TODAY_GANJI, first.gender),
+            lambda x: build_today_domain_operation(x[0], TODAY_GANJI, x[1]),
+            day_gans,
+        ),
+        "get_year_month_unse": (
+            lambda: get_year_month_unse(info0["day_gan"], 2026),
+            lambda x: get_year_month_unse(x[0], 2026),
+            day_gans,
+        ),
+        "build_month_operation": (
+            lambda: build_month_operation(info0["day_gan"], first.gender, 2026),
+            lambda x: build_month_operation(x[0], x[1], 2026),
+            day_gans,
+        ),
+        "get_day_unse_range": (
+            lambda: get_day_unse_range(info0["day_gan"], *CALENDAR_YEAR, domains=DOMAINS, gender=first.gender),
+            lambda x: get_day_unse_range(x[0], *CALENDAR_YEAR, domains=DOMAINS, gender=x[1]),
+            day_gans,
+        ),
+        "get_hour_pillars": (
+            lambda: get_hour_pillars(births, SEOUL_LONGITUDE),
+            lambda x: get_hour_pillars([x], SEOUL_LONGITUDE),
+            births,
+        ),
+        "run_engine": (lambda: run_engine(stages.calculations[0]), run_engine, stages.calculations),
+        "meaning_cache_hit": (
+            lambda: warm_cache.run(stages.calculations[0]),
+            warm_cache.run,
+            stages.calculations,
+        ),
+        "build_interpretation_contract": (
+            lambda: build_interpretation_contract(*pairs[0]),
+            lambda x: build_interpretation_contract(*x),
+            pairs,
+        ),
+        "pipeline_in_process": (lambda: stages.pipeline(first), stages.pipeline, corpus),
+    }
+
+    results: Dict[str, Any] = {}
+    for name, (single, batch, items) in cases.items():
+        if only and name not in only:
+            continue
+        results[name] = {
+            "single_us": round(time_single(single, repeat), 3),
+            "batch_per_item_us": round(time_batch(batch, items), 3),
+            "batch_size": len(items),
+        }
+        print(
+            f"{name:<32} single={results[name]['single_us']:>12.1f}µs  "
+            f"batch={results[name]['batch_per_item_us']:>12.1f}µs/item (n={len(items)})"
+        )
+
+    return {
+        "meta": {
+            "bench_version": BENCH_VERSION,
+            "generated_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "corpus_size": corpus_size,
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+# ------------------------------------------------------------
+# 회귀 비교
+# ------------------------------------------------------------
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+    only: Optional[List[str]] = None,
+) -> List[str]:
+    """회귀 / 누락 목록. 기준에 있는데 이번 측정에 없는 단계 · 지표는 누락으로 실패 처리."""
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        if only and name not in only:
+            continue
+        cur = current["results"].get(name)
+        if cur is None:
+            print(f"❌ {name:<32} missing from this run")
+            regressions.append(f"{name} (missing)")
+            continue
+        for metric in ("single_us", "batch_per_item_us"):
+            b, c = base.get(metric), cur.get(metric)
+            if not b:
+                continue
+            if c is None:
+                print(f"❌ {name:<32} {metric:<18} missing from this run")
+                regressions.append(f"{name}.{metric} (missing)")
+                continue
+            change = c / b - 1
+            mark = "❌" if change > threshold else "  "
+            print(f"{mark} {name:<32} {metric:<18} {b:>12.1f} → {c:>12.1f}µs ({change * 100:+.1f}%)")
+            if change > threshold:
+                regressions.append(f"{name}.{metric}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="TBOO engine benchmark suite")
+    parser.add_argument("--corpus-size", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20, help="단건 측정 반복 횟수")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--only", default=None, help="측정할 단계 (쉼표 구분)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", default=None, help="기준(baseline) JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.15, help="허용 회귀 비율 (기본 15%)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    # 비교 시에는 기준과 같은 코퍼스 설정을 사용
+    meta = (baseline or {}).get("meta", {})
+    corpus_size = meta.get("corpus_size", args.corpus_size)
+    seed = meta.get("seed", args.seed)
+    only = [s for s in args.only.split(",") if s] if args.only else None
+
+    current = run_suite(corpus_size, args.repeat, seed, only)
+
+    if args.output:
+        out_path = Path(args.output).expanduser().resolve()
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"\n📁 저장 완료: {out_path}")
+
+    if baseline is not None:
+        print()
+        regressions = compare(baseline, current, args.threshold, only)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) > {args.threshold * 100:.0f}% or missing case(s)")
+            return 1
+        print("\n✅ no regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
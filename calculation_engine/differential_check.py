@@ -0,0 +1,420 @@
+# differential_check.py
+# - 고정 참조 구현(engine/reference.py) vs 현재 빠른 경로 결과 비교
+# - 대상: analyze_saju / get_daeun_age_and_startpoints / get_si_ji_by_clock (+ get_hour_gan)
+#         solar: analyze_saju(longitude=…) / get_hour_pillars(longitude=…) 의 일주 · 시주
+#                vs 규칙(civil_utc_offset) + 태양시 시지 경계 + 참조 만세력으로 직접 계산한 값
+# - 범위: 1900-01-01 ~ 2050-12-31 전 일자 × 시지 경계 분 × 남/여
+# - 날짜 구간 단위로 여러 프로세스에 나눠 실행, 첫 불일치와 재현 코드 출력
+#
+#   python calculation_engine/differential_check.py
+#   python calculation_engine/differential_check.py --start 1990-01-01 --end 1990-12-31 --workers 4
+#   python calculation_engine/differential_check.py --checks si_ji,daeun
+#   python calculation_engine/differential_check.py --checks solar --start 1948-01-01 --end 1961-12-31
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from engine import reference as ref  # noqa: E402
+from engine.daeun import get_daeun_age_and_startpoints  # noqa: E402
+from engine.saju_core import analyze_saju, get_hour_pillars, load_solar_terms, render_saju_info  # noqa: E402
+from utils.solar_time import LMT_SECONDS_SEOUL, SEOUL_LONGITUDE, civil_utc_offset  # noqa: E402
+from utils.time_utils import get_hour_gan, get_si_ji_by_clock  # noqa: E402
+
+CHECKS = ("si_ji", "daeun", "analyze", "solar")
+CALENDAR_START = date(1900, 1, 1)
+CALENDAR_END = date(2050, 12, 31)
+
+# 시지 구간 경계 (각 구간의 첫 분 / 마지막 분)
+BRANCH_START_MINUTES = (0, 90, 210, 330, 450, 570, 690, 810, 930, 1050, 1170, 1290, 1410)
+BRANCH_END_MINUTES = (89, 209, 329, 449, 569, 689, 809, 929, 1049, 1169, 1289, 1409, 1439)
+BOUNDARY_MINUTES = tuple(sorted(set(BRANCH_START_MINUTES + BRANCH_END_MINUTES)))
+
+# solar 검사 경도 (서해 끝 / 서울 / 울릉도) — analyze_saju 는 서울만, 배치는 전부
+SOLAR_LONGITUDES = (124.7, SEOUL_LONGITUDE, 130.9)
+
+
+# ------------------------------------------------------------
+# 결과 비교
+# ------------------------------------------------------------
+def first_difference(a: Any, b: Any, path: str = "") -> Optional[Tuple[str, Any, Any]]:
+    """처음 다른 위치 (path, 참조 값, 빠른 경로 값). 같으면 None."""
+    if hasattr(a, "to_dict") and hasattr(b, "to_dict"):  # DataFrame
+        if a.equals(b):
+            return None
+        return first_difference(a.to_dict("list"), b.to_dict("list"), path)
+
+    if isinstance(a, dict) and isinstance(b, dict):
+        for key in list(a) + [k for k in b if k not in a]:
+            if key not in a or key not in b:
+                return (f"{path}/{key}", a.get(key, "<missing>"), b.get(key, "<missing>"))
+            diff = first_difference(a[key], b[key], f"{path}/{key}")
+            if diff:
+                return diff
+        return None
+
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        if type(a) is not type(b):
+            return (f"{path} (type)", type(a).__name__, type(b).__name__)
+        for i, (x, y) in enumerate(zip(a, b)):
+            diff = first_difference(x, y, f"{path}/{i}")
+            if diff:
+                return diff
+        if len(a) != len(b):
+            return (f"{path} (length)", len(a), len(b))
+        return None
+
+    if type(a) is not type(b) or a != b:
+        return (path or "/", a, b)
+    return None
+
+
+def divergence(check: str, case: Dict[str, Any], diff: Tuple[str, Any, Any]) -> Dict[str, Any]:
+    path, expected, actual = diff
+    return {
+        "check": check,
+        "case": case,
+        "path": path,
+        "reference": repr(expected),
+        "fast": repr(actual),
+        "reproducer": reproducer(check, case),
+    }
+
+
+def reproducer(check: str, case: Dict[str, Any]) -> str:
+    header = (
+        "# calculation_engine/ 에서 실행\n"
+        "from datetime import datetime\n"
+        "from engine import reference as ref\n"
+    )
+    if check == "si_ji":
+        h, mi = case["hour"], case["minute"]
+        return (
+            header
+            + "from utils.time_utils import get_si_ji_by_clock\n"
+            + f"print(ref.get_si_ji_by_clock({h}, {mi}), get_si_ji_by_clock({h}, {mi}))\n"
+        )
+    if check == "hour_gan":
+        g, j = case["day_gan"], case["hour_ji"]
+        return (
+            header
+            + "from utils.time_utils import get_hour_gan\n"
+            + f"print(ref.get_hour_gan({g!r}, {j!r}), get_hour_gan({g!r}, {j!r}))\n"
+        )
+    if check == "daeun":
+        birth = datetime.fromisoformat(case["birth"])
+        args = f"datetime({birth.year}, {birth.month}, {birth.day}, {birth.hour}, {birth.minute})"
+        return (
+            header
+            + "from engine.daeun import get_daeun_age_and_startpoints\n"
+            + "from engine.saju_core import load_solar_terms\n"
+            + f"birth, direction = {args}, {case['direction']}\n"
+            + "print(ref.get_daeun_age_and_startpoints(birth, ref.load_reference_solar_terms(), direction))\n"
+            + "print(get_daeun_age_and_startpoints(birth, load_solar_terms(), direction))\n"
+        )
+    if check == "solar":
+        call = "{y}, {m}, {d}, {h}, {mi}, 1".format(**case)
+        return (
+            header
+            + "from engine.saju_core import analyze_saju, get_hour_pillars\n"
+            + f"saju_info, _ = analyze_saju({call}, longitude={case['longitude']})\n"
+            + "print(saju_info['day_ganji'], saju_info['hour_ganji'], saju_info['birth_time_correction'])\n"
+            + f"print(get_hour_pillars([datetime({case['y']}, {case['m']}, {case['d']}, {case['h']}, {case['mi']})], "
+            + f"{case['longitude']}))\n"
+        )
+    call = "{y}, {m}, {d}, {h}, {mi}, {gender}".format(**case)
+    return (
+        header
+        + "from engine.saju_core import analyze_saju\n"
+        + "kw = dict(df=ref.load_reference_calendar(), solar_terms=ref.load_reference_solar_terms())\n"
+        + f"expected = ref.analyze_saju({call}, **kw)\n"
+        + f"actual = analyze_saju({call})\n"
+        + "print(expected[0] == actual[0], expected[1].equals(actual[1]))\n"
+    )
+
+
+# ------------------------------------------------------------
+# 검사 (프로세스별)
+# ------------------------------------------------------------
+_REF_CALENDAR = None
+_REF_SOLAR_TERMS = None
+_REF_DAY_GANJI: Dict[date, str] = {}
+_TERM_INSTANTS: Dict[date, List[datetime]] = {}
+
+
+def _init_worker() -> None:
+    global _REF_CALENDAR, _REF_SOLAR_TERMS
+    _REF_CALENDAR = ref.load_reference_calendar()
+    _REF_SOLAR_TERMS = ref.load_reference_solar_terms()
+    _REF_DAY_GANJI.clear()
+    _REF_DAY_GANJI.update(zip(_REF_CALENDAR["양력일자"].dt.date, _REF_CALENDAR["日辰"]))
+    _TERM_INSTANTS.clear()
+    for terms in _REF_SOLAR_TERMS.values():
+        for t in terms:
+            dt = datetime.fromisoformat(t["datetime"]).replace(tzinfo=None, second=0)
+            _TERM_INSTANTS.setdefault(dt.date(), []).append(dt)
+
+
+def check_si_ji() -> Tuple[int, Optional[Dict[str, Any]]]:
+    checked = 0
+    for total in range(24 * 60):
+        h, mi = divmod(total, 60)
+        checked += 1
+        diff = first_difference(ref.get_si_ji_by_clock(h, mi), get_si_ji_by_clock(h, mi))
+        if diff:
+            return checked, divergence("si_ji", {"hour": h, "minute": mi}, diff)
+    for g in ref.GAN_10:
+        for j in ref.JI_12:
+            checked += 1
+            diff = first_difference(ref.get_hour_gan(g, j), get_hour_gan(g, j))
+            if diff:
+                return checked, divergence("hour_gan", {"day_gan": g, "hour_ji": j}, diff)
+    return checked, None
+
+
+def _daeun_births(day: date) -> Iterator[datetime]:
+    base = datetime(day.year, day.month, day.day)
+    for minute in BOUNDARY_MINUTES:
+        yield base + timedelta(minutes=minute)
+    # 절입 시각 전후 1분 (대운수 방향 전환 경계)
+    for instant in _TERM_INSTANTS.get(day, ()):
+        for delta in (-1, 0, 1):
+            birth = instant + timedelta(minutes=delta)
+            if birth.date() == day:
+                yield birth
+
+
+def expected_solar_pillars(wall: datetime, longitude: float) -> Tuple[Optional[str], Optional[str]]:
+    """
+    (일주, 시주) — 날짜별 보정표 / 조회표를 거치지 않고 규칙으로 직접 계산
+    지방 평균태양시 = 민간 시각 + 경도 × 240초 − UTC 오프셋 (1908 이전: 서울 지방 평균시)
+    시지 = 태양시 子 23:00~00:59 부터 2시간 간격
+    """
+    offset = civil_utc_offset(wall)
+    civil_seconds = LMT_SECONDS_SEOUL if offset is None else offset * 60
+    lmt = wall + timedelta(seconds=round(longitude * 240) - civil_seconds)
+    day_ganji = _REF_DAY_GANJI.get(lmt.date())
+    if day_ganji is None:
+        return None, None
+    hour_ji = ref.JI_12[(lmt.hour * 60 + lmt.minute + 60) // 120 % 12]
+    return day_ganji, ref.get_hour_gan(day_ganji[0], hour_ji) + hour_ji
+
+
+def _check_solar_day(day: date) -> Tuple[int, Optional[Dict[str, Any]]]:
+    base = datetime(day.year, day.month, day.day)
+    walls = [base + timedelta(minutes=m) for m in range(24 * 60)]
+    checked = 0
+    for longitude in SOLAR_LONGITUDES:
+        expected = [expected_solar_pillars(wall, longitude) for wall in walls]
+        # 배치 경로: 하루 전체 분
+        for wall, (_, hour_ganji), actual in zip(walls, expected, get_hour_pillars(walls, longitude)):
+            checked += 1
+            if hour_ganji != actual:
+                case = {"y": day.year, "m": day.month, "d": day.day, "h": wall.hour, "mi": wall.minute,
+                        "longitude": longitude}
+                return checked, divergence("solar", case, ("get_hour_pillars", hour_ganji, actual))
+        if longitude != SEOUL_LONGITUDE:
+            continue
+        # 단건 경로: 시주가 바뀌는 분과 그 직전 분
+        for i, wall in enumerate(walls):
+            if i and expected[i][1] == expected[i - 1][1]:
+                continue
+            for k in {max(i - 1, 0), i}:
+                checked += 1
+                w = walls[k]
+                saju_info, _ = analyze_saju(
+                    w.year, w.month, w.day, w.hour, w.minute, 1, longitude=longitude, defer=True
+                )
+                actual = (saju_info["day_ganji"], saju_info["hour_ganji"]) if saju_info else (None, None)
+                if actual != expected[k]:
+                    case = {"y": w.year, "m": w.month, "d": w.day, "h": w.hour, "mi": w.minute,
+                            "longitude": longitude}
+                    return checked, divergence("solar", case, ("analyze_saju", expected[k], actual))
+    return checked, None
+
+
+def check_chunk(
+    start: date,
+    days: int,
+    checks: Tuple[str, ...],
+    analyze_minutes: Tuple[int, ...],
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    solar_terms = load_solar_terms()
+    checked = 0
+
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+
+        if "daeun" in checks:
+            for birth in _daeun_births(day):
+                for direction in (1, -1):
+                    checked += 1
+                    expected = ref.get_daeun_age_and_startpoints(birth, _REF_SOLAR_TERMS, direction)
+                    actual = get_daeun_age_and_startpoints(birth, solar_terms, direction)
+                    diff = first_difference(expected, actual)
+                    if diff:
+                        case = {"birth": birth.isoformat(), "direction": direction}
+                        return checked, divergence("daeun", case, diff)
+
+        if "analyze" in checks:
+            # 참조 구현의 날짜 필터를 그 날짜 행만 남긴 프레임에 적용 (결과 동일, 속도만 개선)
+            ts = datetime(day.year, day.month, day.day)
+            day_frame = _REF_CALENDAR[_REF_CALENDAR["양력일자"] == ts]
+            kw = {"df": day_frame, "solar_terms": _REF_SOLAR_TERMS}
+            hours = [(None, None)] + [divmod(m, 60) for m in analyze_minutes]
+            for gender in (1, 2):
+                for h, mi in hours:
+                    checked += 1
+                    args = (day.year, day.month, day.day, h, mi, gender, "diff")
+                    diff = analysis_difference(ref.analyze_saju(*args, **kw), args)
+                    if diff:
+                        case = {"y": day.year, "m": day.month, "d": day.day, "h": h, "mi": mi, "gender": gender}
+                        return checked, divergence("analyze", minimize_analyze(case, kw) or case, diff)
+
+        if "solar" in checks:
+            n, found = _check_solar_day(day)
+            checked += n
+            if found:
+                return checked, found
+
+    return checked, None
+
+
+def analysis_difference(expected: Tuple[Any, Any], args: Tuple[Any, ...]) -> Optional[Tuple[str, Any, Any]]:
+    """기본 결과와 지연 결과(defer=True, 렌더링 후) 모두 참조 구현과 같은지."""
+    diff = first_difference(expected, analyze_saju(*args))
+    if diff:
+        return diff
+    saju_info, row = analyze_saju(*args, defer=True)
+    if saju_info is None:
+        return first_difference(expected, (saju_info, row))
+    return first_difference(expected, (render_saju_info(saju_info), row.to_dataframe()))
+
+
+def minimize_analyze(case: Dict[str, Any], kw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """같은 날짜에서 더 단순한 입력(시주 미상 → 남성)으로도 재현되면 그 입력을 쓴다."""
+    for gender in (1, 2):
+        args = (case["y"], case["m"], case["d"], None, None, gender, "diff")
+        if analysis_difference(ref.analyze_saju(*args, **kw), args):
+            return {**case, "h": None, "mi": None, "gender": gender}
+    return None
+
+
+# ------------------------------------------------------------
+# 실행
+# ------------------------------------------------------------
+def date_chunks(start: date, end: date, chunk_days: int) -> List[Tuple[date, int]]:
+    chunks = []
+    cur = start
+    while cur <= end:
+        days = min(chunk_days, (end - cur).days + 1)
+        chunks.append((cur, days))
+        cur += timedelta(days=days)
+    return chunks
+
+
+def run_differential(
+    start: date,
+    end: date,
+    checks: Tuple[str, ...],
+    workers: int,
+    chunk_days: int,
+    analyze_minutes: Tuple[int, ...],
+) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    checked = 0
+    first: Optional[Tuple[int, Dict[str, Any]]] = None
+
+    if "si_ji" in checks:
+        n, found = check_si_ji()
+        checked += n
+        if found:
+            first = (-1, found)
+
+    date_checks = tuple(c for c in checks if c != "si_ji")
+    chunks = date_chunks(start, end, chunk_days) if date_checks else []
+    if chunks:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = {
+                pool.submit(check_chunk, s, days, date_checks, analyze_minutes): i
+                for i, (s, days) in enumerate(chunks)
+            }
+            done = 0
+            for future in as_completed(futures):
+                n, found = future.result()
+                checked += n
+                done += 1
+                i = futures[future]
+                if found and (first is None or i < first[0]):
+                    first = (i, found)
+                print(f"\r  {done}/{len(chunks)} chunks, {checked:,} cases", end="", file=sys.stderr)
+        print(file=sys.stderr)
+
+    return {
+        "range": [start.isoformat(), end.isoformat()],
+        "checks": list(checks),
+        "cases": checked,
+        "seconds": round(time.perf_counter() - t0, 2),
+        "first_divergence": first[1] if first else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reference-vs-fast differential checker")
+    parser.add_argument("--start", default=CALENDAR_START.isoformat())
+    parser.add_argument("--end", default=CALENDAR_END.isoformat())
+    parser.add_argument("--checks", default=",".join(CHECKS), help="si_ji,daeun,analyze,solar 중 선택")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-days", type=int, default=366)
+    parser.add_argument(
+        "--all-boundaries",
+        action="store_true",
+        help="analyze 검사에 시지 구간 첫 분 + 마지막 분 모두 사용 (기본: 첫 분만)",
+    )
+    parser.add_argument("--report", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    checks = tuple(c for c in args.checks.split(",") if c)
+    unknown = [c for c in checks if c not in CHECKS]
+    if unknown:
+        parser.error(f"unknown checks: {unknown}")
+
+    result = run_differential(
+        date.fromisoformat(args.start),
+        date.fromisoformat(args.end),
+        checks,
+        args.workers,
+        args.chunk_days,
+        BOUNDARY_MINUTES if args.all_boundaries else BRANCH_START_MINUTES,
+    )
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    found = result["first_divergence"]
+    print(f"checked {result['cases']:,} cases in {result['seconds']}s ({', '.join(checks)})")
+    if found is None:
+        print("✅ no divergence")
+        return 0
+
+    print(f"❌ first divergence: {found['check']} {found['case']}")
+    print(f"   at {found['path']}: reference={found['reference']} fast={found['fast']}")
+    print("\n--- reproducer ---")
+    print(found["reproducer"])
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+engine/calendar_table.py
+
+만세력(manselyeog_1900.csv)의 압축 상주(resident) 표현
+- 1900-01-01 기준 일(day) 오프셋으로 인덱싱
+- 歲次 / 月建 / 日辰 → 60갑자 코드 uint8 배열 3개
+- 음년 / 음월 / 음일 / 윤달 → 작은 정수 배열
+- 약 55k일 기준 전체 수백 KB (pandas 프레임: 수십 MB)
+
+CSV는 프로세스당 한 번만 읽고, 이후 조회는 배열 인덱싱으로 처리한다.
+"""
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from engine.ganji_tables import GANJI_60, MISSING_CODE, ganji_code
+
+DateLike = Union[date, datetime]
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"   # calculation_engine/data/
+CALENDAR_CSV_PATH = DATA_DIR / "manselyeog_1900.csv"
+
+LEAP_MARKERS = ("윤", "閏", "leap", "Y", "y", "True", "true")
+
+
+class CalendarTable:
+    __slots__ = (
+        "start_ordinal",
+        "year_codes",
+        "month_codes",
+        "day_codes",
+        "lunar_year",
+        "lunar_month",
+        "lunar_day",
+        "lunar_leap",
+    )
+
+    def __init__(
+        self,
+        start: date,
+        year_codes: np.ndarray,
+        month_codes: np.ndarray,
+        day_codes: np.ndarray,
+        lunar_year: np.ndarray,
+        lunar_month: np.ndarray,
+        lunar_day: np.ndarray,
+        lunar_leap: np.ndarray,
+    ):
+        self.start_ordinal = start.toordinal()
+        self.year_codes = year_codes
+        self.month_codes = month_codes
+        self.day_codes = day_codes
+        self.lunar_year = lunar_year
+        self.lunar_month = lunar_month
+        self.lunar_day = lunar_day
+        self.lunar_leap = lunar_leap
+
+    # ------------------------------------------------------------
+    # 범위 / 오프셋
+    # ------------------------------------------------------------
+    @property
+    def start(self) -> date:
+        return date.fromordinal(self.start_ordinal)
+
+    @property
+    def end(self) -> date:
+        return date.fromordinal(self.start_ordinal + len(self.day_codes) - 1)
+
+    def __len__(self) -> int:
+        return len(self.day_codes)
+
+    def offset(self, d: DateLike) -> Optional[int]:
+        """해당 날짜의 배열 위치 (만세력에 없는 날짜면 None)."""
+        i = d.toordinal() - self.start_ordinal
+        if 0 <= i < len(self.day_codes) and self.day_codes[i] != MISSING_CODE:
+            return i
+        return None
+
+    def date_at(self, i: int) -> date:
+        return date.fromordinal(self.start_ordinal + i)
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def ganji(self, d: DateLike) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """(歲次, 月建, 日辰) — 만세력에 없는 날짜면 None."""
+        i = self.offset(d)
+        if i is None:
+            return None
+        return (
+            _decode(self.year_codes[i]),
+            _decode(self.month_codes[i]),
+            _decode(self.day_codes[i]),
+        )
+
+    def day_ganji(self, d: DateLike) -> Optional[str]:
+        i = self.offset(d)
+        return None if i is None else _decode(self.day_codes[i])
+
+    def month_ganji(self, d: DateLike) -> Optional[str]:
+        i = self.offset(d)
+        return None if i is None else _decode(self.month_codes[i])
+
+    def lunar(self, d: DateLike) -> Optional[Dict[str, int]]:
+        i = self.offset(d)
+        if i is None:
+            return None
+        return {
+            "year": int(self.lunar_year[i]),
+            "month": int(self.lunar_month[i]),
+            "day": int(self.lunar_day[i]),
+            "leap": int(self.lunar_leap[i]),
+        }
+
+    def month_changes(self, start: DateLike, end: DateLike) -> List[Tuple[date, Optional[str]]]:
+        """
+        [start, end) 안에서 月建이 바뀌는 날짜와 새 月建 목록.
+        - "바뀜"은 만세력의 직전 행과 비교 (첫 행은 항상 바뀜)
+        """
+        present = np.flatnonzero(self.day_codes != MISSING_CODE)
+        codes = self.month_codes[present]
+        changed = np.ones(len(codes), dtype=bool)
+        changed[1:] = codes[1:] != codes[:-1]
+
+        lo = start.toordinal() - self.start_ordinal
+        hi = end.toordinal() - self.start_ordinal
+        rows = present[changed & (present >= lo) & (present < hi)]
+        return [(self.date_at(int(i)), _decode(self.month_codes[i])) for i in rows]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.__slots__ if name != "start_ordinal")
+
+    # ------------------------------------------------------------
+    # 배열 직렬화 (공유 메모리 / 번들)
+    # ------------------------------------------------------------
+    def arrays(self) -> Dict[str, np.ndarray]:
+        out = {"start_ordinal": np.array(self.start_ordinal, dtype=np.int64)}
+        out.update((name, getattr(self, name)) for name in self.__slots__[1:])
+        return out
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "CalendarTable":
+        """arrays() 결과(또는 그 view)로 복원 — 배열은 복사하지 않는다."""
+        start = date.fromordinal(int(arrays["start_ordinal"]))
+        return cls(start, *(arrays[name] for name in cls.__slots__[1:]))
+
+
+def _decode(code: Any) -> Optional[str]:
+    return GANJI_60[code] if code < 60 else None
+
+
+# ------------------------------------------------------------
+# 빌드 (CSV → 배열)
+# ------------------------------------------------------------
+def _small_ints(df: pd.DataFrame, column: str, dtype: Any) -> np.ndarray:
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=dtype)
+    return pd.to_numeric(df[column], errors="coerce").fillna(0).astype(dtype).to_numpy()
+
+
+def _leap_flags(df: pd.DataFrame, column: str = "윤달") -> np.ndarray:
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=np.uint8)
+    numeric = pd.to_numeric(df[column], errors="coerce")
+    marked = df[column].astype(str).str.strip().isin(LEAP_MARKERS)
+    return np.where(numeric.notna(), numeric.fillna(0) != 0, marked).astype(np.uint8)
+
+
+def build_calendar_table(csv_path: Any) -> CalendarTable:
+    df = pd.read_csv(csv_path)
+    dates = pd.to_datetime(df["양력일자"])
+
+    # 기존 조회(== 자정 datetime)와 같게: 자정 행만 유효
+    keep = (dates == dates.dt.normalize()).to_numpy()
+    df, dates = df[keep], dates[keep]
+
+    start = dates.min().date()
+    offsets = (dates.dt.normalize() - pd.Timestamp(start)).dt.days.to_numpy()
+    size = int(offsets.max()) + 1
+
+    # 같은 날짜가 여러 행이면 첫 행 사용 (기존 row.iloc[0])
+    offsets, first = np.unique(offsets, return_index=True)
+
+    def codes(column: str) -> np.ndarray:
+        out = np.full(size, MISSING_CODE, dtype=np.uint8)
+        values = df[column].to_numpy()[first]
+        out[offsets] = np.fromiter((ganji_code(v) for v in values), dtype=np.uint8, count=len(values))
+        return out
+
+    def ints(values: np.ndarray, dtype: Any) -> np.ndarray:
+        out = np.zeros(size, dtype=dtype)
+        out[offsets] = values[first]
+        return out
+
+    return CalendarTable(
+        start,
+        codes("歲次"),
+        codes("月建"),
+        codes("日辰"),
+        ints(_small_ints(df, "음년", np.int16), np.int16),
+        ints(_small_ints(df, "음월", np.int8), np.int8),
+        ints(_small_ints(df, "음일", np.int8), np.int8),
+        ints(_leap_flags(df), np.uint8),
+    )
+
+
+# ------------------------------------------------------------
+# 프로세스 상주 테이블
+# ------------------------------------------------------------
+_TABLE: Optional[CalendarTable] = None
+
+
+def get_calendar_table() -> CalendarTable:
+    """처음 호출 시 CSV를 읽어 만들고, 이후에는 같은 테이블을 돌려준다."""
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = build_calendar_table(CALENDAR_CSV_PATH)
+    return _TABLE
+
+
+def loaded_calendar_table() -> Optional[CalendarTable]:
+    """로드되어 있으면 테이블, 아니면 None (로드를 유발하지 않음)."""
+    return _TABLE
+
+
+def install_calendar_table(table: Optional[CalendarTable]) -> None:
+    """미리 만든 테이블(번들 / 공유 메모리 등)로 교체. None이면 다음 조회 때 다시 로드."""
+    global _TABLE
+    _TABLE = table
+
@@ -14,9 +14,12 @@ def get_daeun_age_and_startpoints(birth: datetime, solar_terms: dict, direction:
     year = str(birth.year)
     if year not in solar_terms:
         return 8, birth, [], birth.year + 7
-    terms = solar_terms[year]
-    term_list = [datetime.fromisoformat(t['datetime']).replace(tzinfo=None) for t in terms]
-    term_list.sort()
+    if hasattr(solar_terms, 'term_datetimes'):   # SolarTermTable: 파싱 없이 정렬된 목록
+        term_list = solar_terms.term_datetimes(birth.year)
+    else:
+        terms = solar_terms[year]
+        term_list = [datetime.fromisoformat(t['datetime']).replace(tzinfo=None) for t in terms]
+        term_list.sort()
     if direction == 1:
         future_terms = [dt for dt in term_list if dt > birth]
         if not future_terms:
@@ -63,14 +66,67 @@ def get_unseong_for_ji(day_gan: str, target_ji: str, unseong_table: dict) -> str
             return unseong
     return ""
 
-def format_daeun_entries(start_age_float, ganji_list, startpoints, birth_year, daeun_rounded=None):
-    labels = []
+# ---------------------------------------------------------
+# 대운 라벨 (지연 렌더링)
+# - 구조 데이터(나이 / 간지 / 시작 연도)만 들고 다니고
+#   문자열은 JSON 출력 / 텍스트 블록 생성 시점에 한 번만 만든다
+# ---------------------------------------------------------
+_DAEUN_LABEL = "만 {}세부터 {}{} 대운 시작 ({})".format   # 템플릿 1회 컴파일
+
+
+def daeun_label_ages(start_age_float, count, daeun_rounded=None):
     base_age = daeun_rounded if daeun_rounded is not None else round(start_age_float)
-    for i, (gan, ji) in enumerate(ganji_list):
-        label_age = base_age - 1 + i * 10 if base_age > 1 else 1 + i * 10
-        start_year = birth_year + label_age
-        labels.append(f"만 {label_age}세부터 {gan}{ji} 대운 시작 ({start_year})")
-    return labels
+    return [base_age - 1 + i * 10 if base_age > 1 else 1 + i * 10 for i in range(count)]
+
+
+class DaeunLabels:
+    """format_daeun_entries 결과의 지연 버전 (읽기 전용 시퀀스, 처음 읽을 때 렌더링)."""
+
+    __slots__ = ("ages", "ganji_list", "birth_year", "_rendered")
+
+    def __init__(self, start_age_float, ganji_list, birth_year, daeun_rounded=None):
+        self.ganji_list = ganji_list
+        self.birth_year = birth_year
+        self.ages = daeun_label_ages(start_age_float, len(ganji_list), daeun_rounded)
+        self._rendered = None
+
+    def render(self) -> list:
+        if self._rendered is None:
+            self._rendered = [
+                _DAEUN_LABEL(age, gan, ji, self.birth_year + age)
+                for age, (gan, ji) in zip(self.ages, self.ganji_list)
+            ]
+        return self._rendered
+
+    def __len__(self):
+        return len(self.ganji_list)
+
+    def __getitem__(self, i):
+        return self.render()[i]
+
+    def __iter__(self):
+        return iter(self.render())
+
+    def __eq__(self, other):
+        if isinstance(other, DaeunLabels):
+            other = other.render()
+        return isinstance(other, (list, tuple)) and self.render() == list(other)
+
+    def __repr__(self):
+        state = "rendered" if self._rendered is not None else "deferred"
+        return f"DaeunLabels({len(self)} labels, {state})"
+
+
+def format_daeun_entries(start_age_float, ganji_list, startpoints, birth_year, daeun_rounded=None):
+    return DaeunLabels(start_age_float, ganji_list, birth_year, daeun_rounded).render()
+
+
+def render_daeun_detail(daeun_detail, daeun_labels):
+    """구조만 있는 daeun_detail 에 label 을 채운 사본 (index 다음 위치)."""
+    return [
+        {"index": e["index"], "label": daeun_labels[e["index"]], **{k: v for k, v in e.items() if k != "index"}}
+        for e in daeun_detail or []
+    ]
 
 def create_saju_row_with_textblock(
     name: str,
@@ -209,3 +265,42 @@ def create_saju_row_with_textblock(
     }
 
     return pd.DataFrame([row])
+
+
+class DeferredSajuRow:
+    """
+    create_saju_row_with_textblock 의 지연 버전
+    - 인자만 보관하고, DataFrame / 텍스트 블록은 처음 접근할 때 한 번 생성
+    - DataFrame 속성 / 인덱싱은 렌더링된 DataFrame 으로 위임 (기존 호출부 호환)
+    """
+
+    __slots__ = ("_kwargs", "_frame")
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._frame = None
+
+    def to_dataframe(self) -> pd.DataFrame:
+        if self._frame is None:
+            self._frame = create_saju_row_with_textblock(**self._kwargs)
+        return self._frame
+
+    @property
+    def text_block(self) -> str:
+        return self.to_dataframe()["텍스트_블록"].iloc[0]
+
+    def __getattr__(self, name):
+        if name.startswith("_"):  # 슬롯 미설정(복원 중 등) 시 재귀 방지
+            raise AttributeError(name)
+        return getattr(self.to_dataframe(), name)
+
+    def __getitem__(self, key):
+        return self.to_dataframe()[key]
+
+    def __len__(self):
+        return 1
+
+    def __repr__(self):
+        state = "rendered" if self._frame is not None else "deferred"
+        return f"DeferredSajuRow({self._kwargs.get('name', '')!r}, {state})"
+
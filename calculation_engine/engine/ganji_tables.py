@@ -0,0 +1,29 @@
+"""
+engine/ganji_tables.py
+
+60갑자 코드표
+- 간지 문자열 ↔ 0..59 코드 (甲子=0, 乙丑=1, ..., 癸亥=59)
+- 코드 c 의 천간 = GAN_10[c % 10], 지지 = JI_12[c % 12]
+- 배열 저장 시 결측은 MISSING_CODE (uint8 255)
+"""
+
+from typing import Dict, Optional, Tuple
+
+GAN_10: Tuple[str, ...] = ("甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸")
+JI_12: Tuple[str, ...] = ("子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥")
+
+GANJI_60: Tuple[str, ...] = tuple(GAN_10[i % 10] + JI_12[i % 12] for i in range(60))
+GANJI_CODE: Dict[str, int] = {ganji: i for i, ganji in enumerate(GANJI_60)}
+
+MISSING_CODE = 255
+
+
+def ganji_code(ganji: Optional[str]) -> int:
+    """간지 문자열 → 코드 (없거나 60갑자가 아니면 MISSING_CODE)."""
+    if not isinstance(ganji, str):
+        return MISSING_CODE
+    return GANJI_CODE.get(ganji, MISSING_CODE)
+
+
+def ganji_from_code(code: int) -> Optional[str]:
+    return GANJI_60[code] if code < 60 else None
@@ -0,0 +1,359 @@
+"""
+engine/gunghap.py
+
+궁합(두 명식 간 구조 관계) 점수와 top-k 인덱스
+- 입력: 원국 네 기둥 간지(saju) + 성별 — analyze_saju / v3.3 JSON 의 구조 그대로
+- 점수는 정수 합산 (해석 문장 없음, 항목별 관계와 점수만)
+
+점수 구성 (A, B 대칭)
+  day_stem     일간 관계       천간합 +30 / 상생 +10 / 비화 +5 / 상극 -10
+  day_branch   일지 관계       육합 +25 / 삼합 +15 / 충 -25 / 원진 -10
+  year_branch  년지(띠) 관계   육합 +10 / 삼합 +8 / 충 -10 / 원진 -5
+  spouse_star  배우자성        상대 일간이 내 정재·정관(+15) / 편재·편관(+8) — 남: 재성, 여: 관성, 양방향 합
+  unseong      12운성          상대 일간이 내 일지에서 갖는 운성 점수, 양방향 합
+  elements     오행 보완       2 × (내 부족분 · 상대 보유분(최대 2) + 그 반대)
+
+인덱스 (GunghapIndex)
+- 명식마다 (성별, 일간, 일지, 년지) 버킷 키 + 오행 특징 벡터를 미리 계산
+- 질의 명식 기준으로 버킷별 상수 점수(오행 외 전부)는 버킷당 한 번만 계산
+- 버킷 상한 = 상수 + 오행 점수 상한 → 상한이 높은 버킷부터 평가하고
+  k번째 점수보다 상한이 낮은 버킷은 건너뜀 (전수 비교와 결과 동일)
+- 순위: 점수 내림차순, 같은 점수면 등록 순서(index) 오름차순
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine.ganji_tables import GAN_10, JI_12
+from engine.sipshin import get_sipshin
+from engine.unseong import get_12un
+
+# ------------------------------------------------------------
+# 오행 / 관계 표
+# ------------------------------------------------------------
+ELEMENTS = ("木", "火", "土", "金", "水")
+GAN_ELEMENT = {g: ELEMENTS[i // 2] for i, g in enumerate(GAN_10)}
+JI_ELEMENT = {
+    "子": "水", "丑": "土", "寅": "木", "卯": "木", "辰": "土", "巳": "火",
+    "午": "火", "未": "土", "申": "金", "酉": "金", "戌": "土", "亥": "水",
+}
+
+STEM_COMBINE = {frozenset(p) for p in ("甲己", "乙庚", "丙辛", "丁壬", "戊癸")}
+BRANCH_COMBINE = {frozenset(p) for p in ("子丑", "寅亥", "卯戌", "辰酉", "巳申", "午未")}
+BRANCH_CLASH = {frozenset(p) for p in ("子午", "丑未", "寅申", "卯酉", "辰戌", "巳亥")}
+BRANCH_WONJIN = {frozenset(p) for p in ("子未", "丑午", "寅酉", "卯申", "辰亥", "巳戌")}
+BRANCH_TRINE = ("申子辰", "寅午戌", "巳酉丑", "亥卯未")
+
+STEM_POINTS = {"천간합": 30, "상생": 10, "비화": 5, "상극": -10}
+DAY_BRANCH_POINTS = {"육합": 25, "삼합": 15, "충": -25, "원진": -10}
+YEAR_BRANCH_POINTS = {"육합": 10, "삼합": 8, "충": -10, "원진": -5}
+SPOUSE_POINTS = {1: {"정재": 15, "편재": 8}, 2: {"정관": 15, "편관": 8}}
+UNSEONG_POINTS = {
+    "장생": 6, "목욕": 0, "관대": 4, "건록": 6, "제왕": 6, "쇠": 0,
+    "병": -2, "사": -4, "묘": -4, "절": -6, "태": 0, "양": 2,
+}
+ELEMENT_UNIT = 2
+ELEMENT_TARGET = 2   # 오행별 2개 미만이면 부족
+
+
+def _generates(a: str, b: str) -> bool:
+    return ELEMENTS[(ELEMENTS.index(a) + 1) % 5] == b
+
+
+def _controls(a: str, b: str) -> bool:
+    return ELEMENTS[(ELEMENTS.index(a) + 2) % 5] == b
+
+
+def stem_relation(a: str, b: str) -> Optional[str]:
+    if frozenset((a, b)) in STEM_COMBINE:
+        return "천간합"
+    ea, eb = GAN_ELEMENT[a], GAN_ELEMENT[b]
+    if ea == eb:
+        return "비화"
+    if _generates(ea, eb) or _generates(eb, ea):
+        return "상생"
+    return "상극"
+
+
+def branch_relation(a: str, b: str) -> Optional[str]:
+    pair = frozenset((a, b))
+    if pair in BRANCH_COMBINE:
+        return "육합"
+    if a != b and any(a in t and b in t for t in BRANCH_TRINE):
+        return "삼합"
+    if pair in BRANCH_CLASH:
+        return "충"
+    if pair in BRANCH_WONJIN:
+        return "원진"
+    return None
+
+
+def spouse_points(gender: int, my_gan: str, partner_gan: str) -> int:
+    return SPOUSE_POINTS.get(gender, {}).get(get_sipshin(my_gan, partner_gan), 0)
+
+
+# 정수 표 (인덱스 / 배치용) — 위 함수들에서 한 번만 생성
+STEM_TABLE = np.array(
+    [[STEM_POINTS[stem_relation(a, b)] for b in GAN_10] for a in GAN_10], dtype=np.int32
+)
+DAY_BRANCH_TABLE = np.array(
+    [[DAY_BRANCH_POINTS.get(branch_relation(a, b), 0) for b in JI_12] for a in JI_12], dtype=np.int32
+)
+YEAR_BRANCH_TABLE = np.array(
+    [[YEAR_BRANCH_POINTS.get(branch_relation(a, b), 0) for b in JI_12] for a in JI_12], dtype=np.int32
+)
+SPOUSE_TABLE = np.array(   # [성별 - 1, 내 일간, 상대 일간]
+    [[[spouse_points(g, a, b) for b in GAN_10] for a in GAN_10] for g in (1, 2)], dtype=np.int32
+)
+UNSEONG_TABLE = np.array(  # [상대 일간, 내 일지]
+    [[UNSEONG_POINTS.get(get_12un(g, j), 0) for j in JI_12] for g in GAN_10], dtype=np.int32
+)
+
+
+# ------------------------------------------------------------
+# 명식 특징
+# ------------------------------------------------------------
+def chart_features(saju: Dict[str, Optional[str]], gender: int) -> Dict[str, Any]:
+    """
+    saju: {"year", "month", "day", "hour"} 간지 (hour 는 None 가능)
+    → 버킷 키 + 오행 개수 (시주 미상이면 6글자 기준)
+    """
+    counts = [0] * 5
+    for key in ("year", "month", "day", "hour"):
+        ganji = saju.get(key)
+        if not ganji:
+            continue
+        counts[ELEMENTS.index(GAN_ELEMENT[ganji[0]])] += 1
+        counts[ELEMENTS.index(JI_ELEMENT[ganji[1]])] += 1
+    return {
+        "gender": gender,
+        "day_gan": saju["day"][0],
+        "day_ji": saju["day"][1],
+        "year_ji": saju["year"][1],
+        "elements": counts,
+    }
+
+
+def features_from_saju_info(saju_info: Dict[str, Any], gender: int) -> Dict[str, Any]:
+    """analyze_saju 결과 → chart_features"""
+    return chart_features({k: saju_info.get(f"{k}_ganji") for k in ("year", "month", "day", "hour")}, gender)
+
+
+def features_from_calculation(calculation_json: Dict[str, Any]) -> Dict[str, Any]:
+    """v3.3 JSON → chart_features"""
+    gender = 1 if (calculation_json.get("user_info") or {}).get("gender") == "남성" else 2
+    return chart_features(calculation_json["saju"], gender)
+
+
+def _element_vectors(counts: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """(보유분: 오행별 최대 ELEMENT_TARGET, 부족분: ELEMENT_TARGET - 보유)"""
+    have = [min(c, ELEMENT_TARGET) for c in counts]
+    need = [ELEMENT_TARGET - h for h in have]
+    return have, need
+
+
+# ------------------------------------------------------------
+# 두 명식 점수
+# ------------------------------------------------------------
+def score_compatibility(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """항목별 관계 / 점수 + 합계 (대칭: score(a, b) == score(b, a))."""
+    stem_rel = stem_relation(a["day_gan"], b["day_gan"])
+    day_rel = branch_relation(a["day_ji"], b["day_ji"])
+    year_rel = branch_relation(a["year_ji"], b["year_ji"])
+    have_a, need_a = _element_vectors(a["elements"])
+    have_b, need_b = _element_vectors(b["elements"])
+
+    components = {
+        "day_stem": STEM_POINTS[stem_rel],
+        "day_branch": DAY_BRANCH_POINTS.get(day_rel, 0),
+        "year_branch": YEAR_BRANCH_POINTS.get(year_rel, 0),
+        "spouse_star": spouse_points(a["gender"], a["day_gan"], b["day_gan"])
+        + spouse_points(b["gender"], b["day_gan"], a["day_gan"]),
+        "unseong": UNSEONG_POINTS.get(get_12un(b["day_gan"], a["day_ji"]), 0)
+        + UNSEONG_POINTS.get(get_12un(a["day_gan"], b["day_ji"]), 0),
+        "elements": ELEMENT_UNIT * (
+            sum(n * h for n, h in zip(need_a, have_b)) + sum(h * n for h, n in zip(have_a, need_b))
+        ),
+    }
+    return {
+        "score": sum(components.values()),
+        "components": components,
+        "relations": {
+            "day_stem": stem_rel,
+            "day_branch": day_rel,
+            "year_branch": year_rel,
+            "sipshin_a_to_b": get_sipshin(a["day_gan"], b["day_gan"]),
+            "sipshin_b_to_a": get_sipshin(b["day_gan"], a["day_gan"]),
+            "unseong_b_at_a": get_12un(b["day_gan"], a["day_ji"]),
+            "unseong_a_at_b": get_12un(a["day_gan"], b["day_ji"]),
+        },
+    }
+
+
+# ------------------------------------------------------------
+# top-k 인덱스
+# ------------------------------------------------------------
+N_BUCKETS = 2 * 10 * 12 * 12
+
+
+def _bucket_key(gender, day_gan, day_ji, year_ji):
+    return ((gender - 1) * 10 + day_gan) * 144 + day_ji * 12 + year_ji
+
+
+def _rank(score_parts, id_parts, k):
+    """점수 내림차순, 동점은 index 오름차순 상위 k개."""
+    if not score_parts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    scores, ids = np.concatenate(score_parts), np.concatenate(id_parts)
+    rank = np.lexsort((ids, -scores))[:k]
+    return scores[rank], ids[rank]
+
+
+class GunghapIndex:
+    """
+    명식 특징 배열 (등록 순서 = index)
+    - gender int8 (1/2), day_gan / day_ji / year_ji uint8 (GAN_10 / JI_12 index)
+    - vec int8[N, 10]: [보유분 5 | 부족분 5]
+    버킷 키 순으로 정렬해 두고 버킷별 [start, end) 구간과 특징 최대값을 보관한다.
+    """
+
+    __slots__ = ("size", "order", "vec", "bucket_start", "bucket_end", "bucket_max", "bucket_ids")
+
+    def __init__(
+        self,
+        gender: np.ndarray,
+        day_gan: np.ndarray,
+        day_ji: np.ndarray,
+        year_ji: np.ndarray,
+        element_counts: np.ndarray,
+    ):
+        self.size = len(gender)
+        keys = _bucket_key(gender.astype(np.int64), day_gan.astype(np.int64), day_ji.astype(np.int64), year_ji.astype(np.int64))
+        self.order = np.argsort(keys, kind="stable")   # 버킷 안에서는 등록 순서 유지
+        sorted_keys = keys[self.order]
+
+        have = np.minimum(element_counts, ELEMENT_TARGET).astype(np.int8)
+        self.vec = np.concatenate([have, ELEMENT_TARGET - have], axis=1)[self.order]
+
+        present = np.unique(sorted_keys)
+        self.bucket_ids = present
+        self.bucket_start = np.searchsorted(sorted_keys, present, side="left")
+        self.bucket_end = np.searchsorted(sorted_keys, present, side="right")
+        self.bucket_max = np.maximum.reduceat(self.vec, self.bucket_start, axis=0).astype(np.int32)
+
+    @classmethod
+    def from_features(cls, features: Iterable[Dict[str, Any]]) -> "GunghapIndex":
+        features = list(features)
+        return cls(
+            np.array([f["gender"] for f in features], dtype=np.int8),
+            np.array([GAN_10.index(f["day_gan"]) for f in features], dtype=np.uint8),
+            np.array([JI_12.index(f["day_ji"]) for f in features], dtype=np.uint8),
+            np.array([JI_12.index(f["year_ji"]) for f in features], dtype=np.uint8),
+            np.array([f["elements"] for f in features], dtype=np.int8).reshape(len(features), 5),
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.__slots__ if name != "size")
+
+    # --------------------------------------------------------
+    def _query_terms(self, query: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """(버킷별 상수 점수, 오행 질의 벡터 q) — 후보 점수 = 상수 + q · vec"""
+        g = query["gender"] - 1
+        dg = GAN_10.index(query["day_gan"])
+        dj = JI_12.index(query["day_ji"])
+        yj = JI_12.index(query["year_ji"])
+
+        b = self.bucket_ids
+        b_gender, rest = np.divmod(b, 1440)
+        b_gan, rest = np.divmod(rest, 144)
+        b_ji, b_year = np.divmod(rest, 12)
+
+        const = (
+            STEM_TABLE[dg, b_gan]
+            + DAY_BRANCH_TABLE[dj, b_ji]
+            + YEAR_BRANCH_TABLE[yj, b_year]
+            + SPOUSE_TABLE[g, dg, b_gan]
+            + SPOUSE_TABLE[b_gender, b_gan, dg]
+            + UNSEONG_TABLE[b_gan, dj]
+            + UNSEONG_TABLE[dg, b_ji]
+        )
+        have, need = _element_vectors(query["elements"])
+        q = ELEMENT_UNIT * np.array(need + have, dtype=np.int32)   # 상대 [보유 | 부족] 과 곱함
+        return const.astype(np.int64), q
+
+    def top_k(
+        self,
+        query: Dict[str, Any],
+        k: int = 50,
+        *,
+        gender: Optional[int] = None,
+        exclude: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        [(index, score)] 상위 k개 — 점수 내림차순, 동점은 index 오름차순.
+        gender: 후보 성별 제한 / exclude: 제외할 index (질의 본인)
+        """
+        const, q = self._query_terms(query)
+        bound = const + self.bucket_max @ q
+        buckets = np.argsort(-bound, kind="stable")
+        if gender is not None:
+            buckets = buckets[(self.bucket_ids[buckets] // 1440) == gender - 1]
+
+        # 후보는 모아 두었다가 k개를 넘겨 쌓일 때만 정렬 → 그 사이 기준점(k번째 점수)은
+        # 실제보다 낮거나 같으므로 가지치기는 보수적이고 결과는 전수 비교와 같다
+        score_parts, id_parts, pending = [], [], 0
+        kth = None
+        for bi in buckets:
+            if kth is not None and bound[bi] < kth:
+                break   # 이후 버킷은 상한이 더 낮음
+            lo, hi = self.bucket_start[bi], self.bucket_end[bi]
+            scores = const[bi] + self.vec[lo:hi] @ q
+            ids = self.order[lo:hi]
+            if exclude is not None:
+                keep = ids != exclude
+                scores, ids = scores[keep], ids[keep]
+            score_parts.append(scores)
+            id_parts.append(ids)
+            pending += len(ids)
+            if pending >= (k if kth is None else 2 * k):
+                best_scores, best_ids = _rank(score_parts, id_parts, k)
+                score_parts, id_parts, pending = [best_scores], [best_ids], len(best_ids)
+                if len(best_ids) >= k:
+                    kth = best_scores[-1]
+
+        best_scores, best_ids = _rank(score_parts, id_parts, k)
+        return list(zip(best_ids.tolist(), best_scores.tolist()))
+
+    def scores(self, query: Dict[str, Any]) -> np.ndarray:
+        """전체 명식 점수 (등록 순서) — 전수 비교 / 검증용."""
+        const, q = self._query_terms(query)
+        per_row = np.repeat(const, self.bucket_end - self.bucket_start) + self.vec @ q
+        out = np.empty(self.size, dtype=np.int64)
+        out[self.order] = per_row
+        return out
+
+    def brute_force_top_k(
+        self,
+        query: Dict[str, Any],
+        k: int = 50,
+        *,
+        gender: Optional[int] = None,
+        genders: Optional[np.ndarray] = None,
+        exclude: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """top_k 와 같은 규칙의 전수 비교 (genders: 등록 순서의 성별 배열, gender 제한 시 필요)."""
+        scores = self.scores(query)
+        ids = np.arange(self.size)
+        keep = np.ones(self.size, dtype=bool)
+        if gender is not None:
+            keep &= genders == gender
+        if exclude is not None:
+            keep[exclude] = False
+        scores, ids = scores[keep], ids[keep]
+        rank = np.lexsort((ids, -scores))[:k]
+        return list(zip(ids[rank].tolist(), scores[rank].tolist()))
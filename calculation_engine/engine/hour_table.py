@@ -0,0 +1,33 @@
+"""
+engine/hour_table.py
+
+시주 조회표 (배치용)
+- 하루 중 분(0..1439) → 시지 index  : SI_JI_INDEX_BY_MINUTE (uint8[1440], 민간 시각 기준)
+                                      SOLAR_SI_JI_INDEX_BY_MINUTE (지방 평균태양시 기준)
+- (일간 index, 시지 index) → 시주 60갑자 코드 : HOUR_GANJI_CODE (uint8[10, 12])
+  (시간 = 일간 × 2 + 시지, 오자시두법 — utils.time_utils.get_hour_gan 과 같음)
+
+시주 계산은 두 번의 배열 gather 로 끝난다.
+"""
+
+import numpy as np
+
+from engine.ganji_tables import GAN_10, GANJI_CODE, JI_12
+from utils.time_utils import SI_JI_BY_MINUTE, SOLAR_SI_JI_BY_MINUTE, get_hour_gan
+
+SI_JI_INDEX_BY_MINUTE = np.array([JI_12.index(ji) for ji in SI_JI_BY_MINUTE], dtype=np.uint8)
+SOLAR_SI_JI_INDEX_BY_MINUTE = np.array([JI_12.index(ji) for ji in SOLAR_SI_JI_BY_MINUTE], dtype=np.uint8)
+
+HOUR_GANJI_CODE = np.array(
+    [[GANJI_CODE[get_hour_gan(gan, ji) + ji] for ji in JI_12] for gan in GAN_10],
+    dtype=np.uint8,
+)
+
+
+def hour_ganji_codes(day_gan_index: np.ndarray, minute_of_day: np.ndarray, solar: bool = False) -> np.ndarray:
+    """
+    일간 index 배열 × 하루 중 분 배열 → 시주 60갑자 코드 배열.
+    solar=True: 분이 지방 평균태양시일 때 (보정된 시각에 민간 시각 경계를 또 적용하지 않도록)
+    """
+    by_minute = SOLAR_SI_JI_INDEX_BY_MINUTE if solar else SI_JI_INDEX_BY_MINUTE
+    return HOUR_GANJI_CODE[day_gan_index, by_minute[minute_of_day]]
@@ -0,0 +1,78 @@
+"""
+engine/month_table.py
+
+연도별 월운 구간표 (月建 절입 구간, 상주 테이블)
+- 만세력 상주 테이블(engine/calendar_table.py)에서 한 번 만든다
+- 月建이 바뀌는 날짜(직전 행과 비교, 첫 행은 항상 바뀜)를 전체 구간에서 한 번만 구하고
+  연도 Y 마다 [Y-01-01, Y+1-03-01) 안의 구간을 최대 13개 미리 잘라 둔다
+  (get_year_month_unse 와 같은 기준: 바뀐 날이 14개 이상이면 13구간, 아니면 개수 - 1)
+- 구간: (시작일 "YYYY-MM-DD", 종료일 "YYYY-MM-DD" (다음 구간 시작 전날), 月建 60갑자 코드)
+
+질의는 dict 조회 한 번 — 연도별 월운 호출마다 만세력을 복사 / 정렬하지 않는다.
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from engine.calendar_table import CalendarTable, get_calendar_table
+from engine.ganji_tables import MISSING_CODE
+
+MONTHS_PER_YEAR = 13
+
+Period = Tuple[str, str, int]
+
+
+class MonthPeriodTable:
+    """
+    periods[year] : 해당 연도의 월운 구간 튜플 (시작일, 종료일, 月建 코드)
+    """
+
+    __slots__ = ("first_year", "last_year", "periods")
+
+    def __init__(self, table: CalendarTable):
+        present = np.flatnonzero(table.day_codes != MISSING_CODE)
+        codes = table.month_codes[present]
+        changed = np.ones(len(codes), dtype=bool)
+        changed[1:] = codes[1:] != codes[:-1]
+        rows = present[changed]
+        row_codes = table.month_codes[rows].tolist()
+        row_dates = [table.date_at(int(i)) for i in rows]
+        row_ordinals = np.array([d.toordinal() for d in row_dates], dtype=np.int64)
+
+        self.first_year = table.start.year
+        self.last_year = table.end.year
+        self.periods: Dict[int, Tuple[Period, ...]] = {}
+        for year in range(self.first_year, self.last_year + 1):
+            lo, hi = np.searchsorted(
+                row_ordinals, (date(year, 1, 1).toordinal(), date(year + 1, 3, 1).toordinal())
+            ).tolist()
+            count = MONTHS_PER_YEAR if hi - lo > MONTHS_PER_YEAR else max(0, hi - lo - 1)
+            self.periods[year] = tuple(
+                (
+                    row_dates[i].isoformat(),
+                    date.fromordinal(int(row_ordinals[i + 1]) - 1).isoformat(),
+                    row_codes[i],
+                )
+                for i in range(lo, lo + count)
+            )
+
+    def year_periods(self, year: int) -> Tuple[Period, ...]:
+        """연도 → 월운 구간 (만세력 범위 밖이면 빈 튜플)."""
+        return self.periods.get(year, ())
+
+
+_TABLE: Optional[MonthPeriodTable] = None
+
+
+def get_month_table() -> MonthPeriodTable:
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = MonthPeriodTable(get_calendar_table())
+    return _TABLE
+
+
+def loaded_month_table() -> Optional[MonthPeriodTable]:
+    return _TABLE
+
@@ -0,0 +1,156 @@
+"""
+engine/pillar_index.py
+
+사주 → 출생 날짜 / 시각 역색인 ("이 사주가 나오는 생년월일시는?")
+- 만세력 상주 테이블(engine/calendar_table.py)에서 한 번 만든다
+- 기둥별(歲次 / 月建 / 日辰) 60갑자 코드 → 해당 날짜 오프셋 목록 (CSR: bounds + postings)
+- 질의: 년 / 월 / 일 간지 중 아무 조합 + 시주(시지 또는 시주 간지)
+  → 주어진 기둥 목록을 교집합 → 연속 날짜 구간 + 시지 시각 창
+- 시주 간지는 일간을 두 개로 좁힌다 (시간 = 일간 × 2 + 시지, 오자시두법)
+
+시각은 analyze_saju(longitude=None) 와 같은 기준(만세력 날짜 + 시계 시각)이다.
+경도 보정을 쓰는 경우 이 창은 지방 평균태양시 기준으로 읽는다.
+"""
+
+import argparse
+import json
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from engine.calendar_table import CalendarTable, get_calendar_table
+from engine.ganji_tables import GAN_10, GANJI_CODE, JI_12, MISSING_CODE
+from utils.time_utils import SI_JI_RANGES, get_hour_gan
+
+PILLARS = ("year", "month", "day")
+
+
+def hour_windows(hour_ji: str) -> List[Tuple[str, str]]:
+    """시지 → 시계 시각 창 [("HH:MM", "HH:MM")] (양 끝 포함, 子시는 두 구간)."""
+    def hhmm(minute: int) -> str:
+        return f"{minute // 60:02d}:{minute % 60:02d}"
+
+    return sorted((hhmm(lo), hhmm(hi)) for (lo, hi), ji in SI_JI_RANGES if ji == hour_ji)
+
+
+class PillarIndex:
+    """
+    기둥별 역색인
+    postings[p] : 날짜 오프셋을 (코드, 오프셋) 순으로 정렬한 배열 (uint16)
+    bounds[p]   : 코드 c 의 오프셋은 postings[p][bounds[p][c]:bounds[p][c + 1]] (오름차순)
+    """
+
+    __slots__ = ("start_ordinal", "day_codes", "postings", "bounds")
+
+    def __init__(self, table: CalendarTable):
+        self.start_ordinal = table.start_ordinal
+        self.day_codes = table.day_codes      # 시주 간지 → 일간 필터용 (상주 테이블 공유)
+        offset_dtype = np.uint16 if len(table) <= np.iinfo(np.uint16).max else np.int32
+        self.postings = {}
+        self.bounds = {}
+        for pillar, codes in zip(PILLARS, (table.year_codes, table.month_codes, table.day_codes)):
+            present = np.flatnonzero(codes != MISSING_CODE)
+            order = present[np.argsort(codes[present], kind="stable")]
+            self.postings[pillar] = order.astype(offset_dtype)
+            self.bounds[pillar] = np.searchsorted(codes[order], np.arange(61)).astype(np.int32)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.postings.values()) + sum(a.nbytes for a in self.bounds.values())
+
+    # --------------------------------------------------------
+    def _posting(self, pillar: str, ganji: str) -> np.ndarray:
+        code = GANJI_CODE.get(ganji)
+        if code is None:
+            raise ValueError(f"{pillar}: 60갑자가 아님: {ganji!r}")
+        lo, hi = self.bounds[pillar][code], self.bounds[pillar][code + 1]
+        return self.postings[pillar][lo:hi]
+
+    def day_offsets(
+        self,
+        year: Optional[str] = None,
+        month: Optional[str] = None,
+        day: Optional[str] = None,
+        hour: Optional[str] = None,
+    ) -> np.ndarray:
+        """조건에 맞는 날짜 오프셋 (오름차순, int64)."""
+        given = {p: g for p, g in zip(PILLARS, (year, month, day)) if g}
+        if given:
+            lists = sorted((self._posting(p, g) for p, g in given.items()), key=len)
+            offsets = lists[0].astype(np.int64)
+            for other in lists[1:]:
+                offsets = np.intersect1d(offsets, other, assume_unique=True)
+        else:
+            offsets = np.flatnonzero(self.day_codes != MISSING_CODE)
+
+        if hour and len(hour) == 2:
+            hour_gan, hour_ji = hour
+            allowed = [i for i, g in enumerate(GAN_10) if get_hour_gan(g, hour_ji) == hour_gan]
+            offsets = offsets[np.isin(self.day_codes[offsets] % 10, allowed)]
+        return offsets
+
+    def lookup(
+        self,
+        year: Optional[str] = None,
+        month: Optional[str] = None,
+        day: Optional[str] = None,
+        hour: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        → {"days": 날짜 수, "ranges": [(시작일, 종료일)] (양 끝 포함),
+           "hour_windows": [("HH:MM", "HH:MM")] 또는 None(시주 조건 없음)}
+        hour: 시지("午") 또는 시주 간지("甲午")
+        """
+        hour_ji = None
+        if hour:
+            hour_ji = hour[-1]
+            if hour_ji not in JI_12 or (len(hour) == 2 and hour not in GANJI_CODE) or len(hour) > 2:
+                raise ValueError(f"hour: 시지 또는 60갑자가 아님: {hour!r}")
+
+        offsets = self.day_offsets(year, month, day, hour)
+        breaks = np.flatnonzero(np.diff(offsets) != 1) + 1
+        starts = np.concatenate([offsets[:1], offsets[breaks]])
+        ends = np.concatenate([offsets[breaks - 1], offsets[-1:]])
+        base = self.start_ordinal
+        return {
+            "days": int(len(offsets)),
+            "ranges": [
+                (date.fromordinal(base + int(s)), date.fromordinal(base + int(e)))
+                for s, e in zip(starts.tolist(), ends.tolist())
+            ],
+            "hour_windows": hour_windows(hour_ji) if hour_ji else None,
+        }
+
+
+# ------------------------------------------------------------
+# 프로세스 상주 색인
+# ------------------------------------------------------------
+_INDEX: Optional[PillarIndex] = None
+
+
+def get_pillar_index() -> PillarIndex:
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = PillarIndex(get_calendar_table())
+    return _INDEX
+
+
+def loaded_pillar_index() -> Optional[PillarIndex]:
+    return _INDEX
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="사주 → 출생 날짜 / 시각 역색인 조회")
+    for pillar in PILLARS:
+        parser.add_argument(f"--{pillar}", default=None, help=f"{pillar} 간지 (예: 甲子)")
+    parser.add_argument("--hour", default=None, help="시지(午) 또는 시주 간지(甲午)")
+    args = parser.parse_args()
+
+    result = get_pillar_index().lookup(args.year, args.month, args.day, args.hour)
+    result["ranges"] = [[s.isoformat(), e.isoformat()] for s, e in result["ranges"]]
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,565 @@
+"""
+engine/reference.py
+
+차등(differential) 검증용 고정 참조 구현 — 수정 금지
+- 최적화 이전의 analyze_saju / 대운 / 시지 계산을 그대로 보존한다
+  (engine/saju_core.py · engine/daeun.py · utils/time_utils.py 원본 사본)
+- 원본과 다른 점은 입력 로딩뿐: 호출마다 읽던 만세력 CSV / 절기 JSON을
+  키워드 인자(df=, solar_terms=)로 받는다
+- 빠른 경로를 바꿀 때는 differential_check.py 로 이 구현과 결과가
+  완전히 같은지 확인한다
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from engine.sipshin import SIPSHIN_MAP
+from engine.unseong import UNSEONG_MAP
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"   # calculation_engine/data/
+
+GAN_10 = ['甲','乙','丙','丁','戊','己','庚','辛','壬','癸']
+JI_12 = ['子','丑','寅','卯','辰','巳','午','未','申','酉','戌','亥']
+
+
+def load_reference_calendar() -> pd.DataFrame:
+    df = pd.read_csv(DATA_DIR / "manselyeog_1900.csv")
+    df["양력일자"] = pd.to_datetime(df["양력일자"])
+    return df
+
+
+def load_reference_solar_terms() -> Dict[str, Any]:
+    with open(DATA_DIR / "solar_terms_1900_2050.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------------------------------------------------------
+# 십신 / 십이운성 (engine/sipshin.py · engine/unseong.py)
+# ---------------------------------------------------------
+def get_sipshin(day_gan, target_gan):
+    return SIPSHIN_MAP.get(day_gan, {}).get(target_gan, "?")
+
+
+def get_12un(day_gan, target_ji):
+    return UNSEONG_MAP.get(day_gan, {}).get(target_ji, "?")
+
+
+# ---------------------------------------------------------
+# 시지 / 시간 (utils/time_utils.py)
+# ---------------------------------------------------------
+def get_si_ji_by_clock(hour, minute):
+    total_min = hour * 60 + minute
+    ranges = [((1410, 1439), '子'), ((0, 89), '子'), ((90, 209), '丑'), ((210, 329), '寅'),
+              ((330, 449), '卯'), ((450, 569), '辰'), ((570, 689), '巳'), ((690, 809), '午'),
+              ((810, 929), '未'), ((930, 1049), '申'), ((1050, 1169), '酉'), ((1170, 1289), '戌'),
+              ((1290, 1409), '亥')]
+    for (start, end), branch in ranges:
+        if start <= total_min <= end:
+            return branch
+    return '?'
+
+def get_hour_gan(day_gan, hour_ji):
+    return GAN_10[(GAN_10.index(day_gan) * 2 + JI_12.index(hour_ji)) % 10]
+
+
+# ---------------------------------------------------------
+# 대운 / 텍스트 블록 (engine/daeun.py)
+# ---------------------------------------------------------
+YANG_GANS = ['甲','丙','戊','庚','壬']
+MINUTES_PER_YEAR = 4320
+
+def get_sex_direction(year_gan, gender):
+    yang = year_gan in YANG_GANS
+    return 1 if (gender == 1 and yang) or (gender == 2 and not yang) else -1
+
+def get_daeun_age_and_startpoints(birth: datetime, solar_terms: dict, direction: int):
+    year = str(birth.year)
+    if year not in solar_terms:
+        return 8, birth, [], birth.year + 7
+    terms = solar_terms[year]
+    term_list = [datetime.fromisoformat(t['datetime']).replace(tzinfo=None) for t in terms]
+    term_list.sort()
+    if direction == 1:
+        future_terms = [dt for dt in term_list if dt > birth]
+        if not future_terms:
+            return 8, birth, [], birth.year + 7
+        target_dt = future_terms[0]
+        delta_min = (target_dt - birth).total_seconds() / 60
+    else:
+        past_terms = [dt for dt in term_list if dt <= birth]
+        if not past_terms:
+            return 8, birth, [], birth.year + 7
+        target_dt = past_terms[-1]
+        delta_min = (birth - target_dt).total_seconds() / 60
+
+    age_raw = delta_min / MINUTES_PER_YEAR
+    age_rounded = round(age_raw)
+    age_rounded = max(1, min(age_rounded, 10))
+    daeun_start_dt = birth + timedelta(days=365.25 * age_raw)
+    startpoints = [daeun_start_dt + timedelta(days=365.25 * 10 * i) for i in range(10)]
+
+    if age_rounded == 1:
+        daeun_year_traditional = birth.year + 1
+    else:
+        daeun_year_traditional = birth.year + age_rounded - 1
+
+    return age_raw, daeun_start_dt, startpoints, daeun_year_traditional
+
+def get_next_ganji(gan, ji, step):
+    return (GAN_10[(GAN_10.index(gan) + step) % 10], JI_12[(JI_12.index(ji) + step) % 12])
+
+def get_daeun_ganji(start_gan, start_ji, direction, count=10):
+    result = []
+    gan, ji = start_gan, start_ji
+    for _ in range(count):
+        gan, ji = get_next_ganji(gan, ji, direction)
+        result.append((gan, ji))
+    return result
+
+def get_sipshin_from_table(day_gan: str, other_gan: str, sipshin_table: dict) -> str:
+    return sipshin_table.get(f"{day_gan}-{other_gan}", "")
+
+def get_unseong_for_ji(day_gan: str, target_ji: str, unseong_table: dict) -> str:
+    for unseong, mapping in unseong_table.items():
+        if mapping.get(day_gan) == target_ji:
+            return unseong
+    return ""
+
+def format_daeun_entries(start_age_float, ganji_list, startpoints, birth_year, daeun_rounded=None):
+    labels = []
+    base_age = daeun_rounded if daeun_rounded is not None else round(start_age_float)
+    for i, (gan, ji) in enumerate(ganji_list):
+        label_age = base_age - 1 + i * 10 if base_age > 1 else 1 + i * 10
+        start_year = birth_year + label_age
+        labels.append(f"만 {label_age}세부터 {gan}{ji} 대운 시작 ({start_year})")
+    return labels
+
+def create_saju_row_with_textblock(
+    name: str,
+    birth_str: str,
+    gender: int,
+    year_ganji: str,
+    month_ganji: str,
+    day_ganji: str,
+    hour_ganji: str,
+    sipshin: dict,
+    unseong: dict,
+    daeun_labels: list,
+    daeun_year_traditional=None,
+    daeun_float=None,
+    daeun_rounded=None,
+    daeun_ganji_list: list = None,
+    daeun_startpoints: list = None,
+    yearly_unse_2025: list = None,
+    sipshin_table: dict = None,
+    unseong_table: dict = None
+) -> pd.DataFrame:
+
+    # -------------------------------------------------
+    # 기본 정보
+    # -------------------------------------------------
+    birth_dt = datetime.strptime(birth_str, "%Y-%m-%d %H:%M")
+    gender_str = "남자" if gender == 1 else "여자"
+
+    day_gan = day_ganji[0]
+    month_gan = month_ganji[0]
+    year_gan = year_ganji[0]
+
+    # -------------------------------------------------
+    # ✅ 핵심 수정: 시주 미상 방어 가드
+    # -------------------------------------------------
+    if hour_ganji:
+        hour_gan = hour_ganji[0]
+        hour_ji = hour_ganji[1]
+        hour_ganji_display = hour_ganji
+    else:
+        hour_gan = ""
+        hour_ji = ""
+        hour_ganji_display = "미상"
+
+    # -------------------------------------------------
+    # 텍스트 블록 구성
+    # -------------------------------------------------
+    lines = []
+    lines.append(
+        f"이름: {name} / 출생일시: {birth_dt.strftime('%Y-%m-%d %H:%M')} / 성별: {gender_str}"
+    )
+    lines.append(
+        f"일간: {day_gan} / 년주: {year_ganji} / 월주: {month_ganji} / "
+        f"일주: {day_ganji} / 시주: {hour_ganji_display}"
+    )
+
+    lines.append(
+        f"십신 - 년간: {year_gan} → {sipshin.get('년간', '')} / "
+        f"월간: {month_gan} → {sipshin.get('월간', '')} / "
+        f"시간: {hour_gan} → {sipshin.get('시간', '') if hour_ganji else ''}"
+    )
+
+    lines.append(
+        f"십이운성 - 년지: {year_ganji[1]} → {unseong.get('년지', '')} / "
+        f"월지: {month_ganji[1]} → {unseong.get('월지', '')} / "
+        f"일지: {day_ganji[1]} → {unseong.get('일지', '')} / "
+        f"시지: {hour_ji} → {unseong.get('시지', '') if hour_ganji else ''}"
+    )
+
+    # -------------------------------------------------
+    # 대운 흐름 (기존 로직 유지)
+    # -------------------------------------------------
+    lines.append("☯ 대운 흐름 (전통 연해자평 기준):")
+    if daeun_ganji_list:
+        for i, ((gan, ji), label) in enumerate(zip(daeun_ganji_list, daeun_labels)):
+            lines.append(f"  • {label}")
+            if sipshin_table and unseong_table:
+                lines.append(
+                    f"    → 월간 {month_gan}: "
+                    f"{get_sipshin_from_table(day_gan, month_gan, sipshin_table)} → "
+                    f"{ji}에서 {get_unseong_for_ji(day_gan, ji, unseong_table)}"
+                )
+                lines.append(
+                    f"    → 년간 {year_gan}: "
+                    f"{get_sipshin_from_table(day_gan, year_gan, sipshin_table)} → "
+                    f"{ji}에서 {get_unseong_for_ji(day_gan, ji, unseong_table)}"
+                )
+                if hour_ganji:
+                    lines.append(
+                        f"    → 시간 {hour_gan}: "
+                        f"{get_sipshin_from_table(day_gan, hour_gan, sipshin_table)} → "
+                        f"{ji}에서 {get_unseong_for_ji(day_gan, ji, unseong_table)}"
+                    )
+                lines.append(
+                    f"    → 대운간 {gan}: "
+                    f"{get_sipshin_from_table(day_gan, gan, sipshin_table)} → "
+                    f"{ji}에서 {get_unseong_for_ji(day_gan, ji, unseong_table)}"
+                )
+
+    # -------------------------------------------------
+    # 기타 정보
+    # -------------------------------------------------
+    lines.append(f"\n📅 전통 연해자평 대운 적용 연도: {daeun_year_traditional}년")
+    lines.append(f"🧮 대운수: 실수={round(daeun_float, 2)}세 / 정수={daeun_rounded}세")
+
+    if yearly_unse_2025:
+        lines.append("\n☯ 2025년 을사년 운세 흐름:")
+        for line in yearly_unse_2025:
+            lines.append(f"  • {line}")
+
+    text_block = "\n".join(lines)
+
+    # -------------------------------------------------
+    # DataFrame row
+    # -------------------------------------------------
+    row = {
+        "텍스트_블록": text_block,
+        "이름": name,
+        "출생일시": birth_str,
+        "성별": gender_str,
+        "일간": day_gan,
+        "년주": year_ganji,
+        "월주": month_ganji,
+        "일주": day_ganji,
+        "시주": hour_ganji,  # None 그대로 유지
+        "십신_년간": sipshin.get('년간', ''),
+        "십신_월간": sipshin.get('월간', ''),
+        "십신_시간": sipshin.get('시간', '') if hour_ganji else '',
+        "운성_년지": unseong.get('년지', ''),
+        "운성_월지": unseong.get('월지', ''),
+        "운성_일지": unseong.get('일지', ''),
+        "운성_시지": unseong.get('시지', '') if hour_ganji else '',
+        "전통_대운시작연도": daeun_year_traditional,
+        "대운수_실수": round(daeun_float, 2),
+        "대운수_정수": daeun_rounded,
+    }
+
+    return pd.DataFrame([row])
+
+
+# ---------------------------------------------------------
+# 사주 분석 (engine/saju_core.py)
+# ---------------------------------------------------------
+def analyze_saju(
+    y: int,
+    m: int,
+    d: int,
+    h: Optional[int],
+    mi: Optional[int],
+    gender: int,
+    name: str = "",
+    return_dataframe: bool = False,
+    *,
+    df: pd.DataFrame,
+    solar_terms: Dict[str, Any],
+):
+    """
+    - 만세력 CSV("data/manselyeog_1900.csv")를 이용해 사주 원국 간지/십신/12운성 계산
+    - 대운(연해자평 방식) 계산 및 2026년(병오년) 운세용 데이터 생성
+    - ✅ 확장: 시주 미상(unknown hour) 상태를 Calculation 레벨에서 명시적으로 표현
+      - 추정/보정/대입 ❌
+      - 관측 불가 상태(unobserved state)만 선언 ⭕
+    """
+    # 0. 출생 시각 (시주 미상인 경우: 날짜까지만 유효)
+    if h is None or mi is None:
+        hour_status = "unknown"
+        birth = datetime(y, m, d, 0, 0)
+    else:
+        hour_status = "observed"
+        birth = datetime(y, m, d, h, mi)
+
+    # 1. 만세력에서 간지 조회 (날짜 기준)
+    # (reference) df = load_reference_calendar() 를 인자로 받음
+
+    row = df[df["양력일자"] == birth.replace(hour=0, minute=0)]
+    if row.empty:
+        print("⚠️ 해당 날짜가 만세력에 없습니다.")
+        return None, None
+
+    row = row.iloc[0]
+
+    year_ganji = row["歲次"]
+    month_ganji = row["月建"]
+    day_ganji = row["日辰"]
+
+    year_gan, year_ji = year_ganji[0], year_ganji[1]
+    month_gan, month_ji = month_ganji[0], month_ganji[1]
+    day_gan, day_ji = day_ganji[0], day_ganji[1]
+
+    # 1-A. 시주 계산(조건부)
+    if hour_status == "observed":
+        hour_ji = get_si_ji_by_clock(h, mi)  # type: ignore[arg-type]
+        hour_gan = get_hour_gan(day_gan, hour_ji)
+        hour_ganji = f"{hour_gan}{hour_ji}"
+    else:
+        hour_ji = None
+        hour_gan = None
+        hour_ganji = None
+
+    # -------------------------------------------------
+    # 2. 십신 (일간 기준)
+    # -------------------------------------------------
+    sip_year = get_sipshin(day_gan, year_gan)
+    sip_month = get_sipshin(day_gan, month_gan)
+
+    if hour_status == "observed" and hour_gan is not None:
+        sip_hour = get_sipshin(day_gan, hour_gan)
+    else:
+        sip_hour = None
+
+    # 일간 십신 표기
+    sip_day = "일간"
+
+    # -------------------------------------------------
+    # 3. 십이운성 (각 기둥 천간 본체 vs 해당 지지)
+    # -------------------------------------------------
+    un_year = get_12un(year_gan, year_ji)
+    un_month = get_12un(month_gan, month_ji)
+    un_day = get_12un(day_gan, day_ji)
+
+    if hour_status == "observed" and hour_gan is not None and hour_ji is not None:
+        un_hour = get_12un(hour_gan, hour_ji)
+    else:
+        un_hour = None
+
+    # -------------------------------------------------
+    # 3-A. 원국 네 기둥 상세 구조
+    # -------------------------------------------------
+    pillars_detail: Dict[str, Any] = {
+        "year": {
+            "label": "년주",
+            "gan": year_gan,
+            "ji": year_ji,
+            "sipshin": sip_year,
+            "un12": un_year,
+            "status": "observed",
+        },
+        "month": {
+            "label": "월주",
+            "gan": month_gan,
+            "ji": month_ji,
+            "sipshin": sip_month,
+            "un12": un_month,
+            "status": "observed",
+        },
+        "day": {
+            "label": "일주",
+            "gan": day_gan,
+            "ji": day_ji,
+            "sipshin": "일간",
+            "un12": un_day,
+            "status": "observed",
+        },
+        "hour": {
+            "label": "시주",
+            "gan": hour_gan,
+            "ji": hour_ji,
+            "sipshin": sip_hour,
+            "un12": un_hour,
+            "status": hour_status,  # observed | unknown
+        },
+    }
+
+    # -------------------------------------------------
+    # 4. 대운 계산 (연해자평 방식)
+    # -------------------------------------------------
+    direction = get_sex_direction(year_gan, gender)
+
+    # (reference) solar_terms = load_reference_solar_terms() 를 인자로 받음
+
+
+    # 대운 시작 나이 계산은 "출생 시각"을 받지만,
+    # 시주 미상에서는 00:00을 사용하되, 이는 추정이 아니라 '표준 입력값' 처리임
+    age_raw, daeun_start_dt, startpoints, daeun_year_traditional = (
+        get_daeun_age_and_startpoints(birth, solar_terms, direction)
+    )
+
+    daeuns = get_daeun_ganji(month_gan, month_ji, direction)
+
+    daeun_labels = format_daeun_entries(
+        age_raw,
+        daeuns,
+        startpoints,
+        y,
+        round(age_raw),
+    )
+
+    # -------------------------------------------------
+    # 4-A. 대운 확장 정보
+    # -------------------------------------------------
+    daeun_detail = []
+    for i, ganji in enumerate(daeuns):
+        d_gan, d_ji = ganji[0], ganji[1]
+        d_sip = get_sipshin(day_gan, d_gan)
+        d_un12 = get_12un(d_gan, d_ji)
+        label = daeun_labels[i] if i < len(daeun_labels) else ""
+        daeun_detail.append(
+            {
+                "index": i,
+                "label": label,
+                "ganji": ganji,
+                "gan": d_gan,
+                "ji": d_ji,
+                "sipshin": d_sip,
+                "un12": d_un12,
+            }
+        )
+
+    # -------------------------------------------------
+    # 5. 2026년 병오년 운세 (2026 = 丙午)
+    # -------------------------------------------------
+    운간 = "丙"
+    운지 = "午"
+
+    yearly_flow = []
+    천간세트: List[Tuple[str, Optional[str]]] = [
+        ("원국_월간", month_gan),
+        ("원국_년간", year_gan),
+        ("원국_시간", hour_gan if hour_status == "observed" else None),
+        ("세운_천간_2026", 운간),
+    ]
+
+    for label, g in 천간세트:
+        if g is None:
+            yearly_flow.append((label, None, None, None))
+            continue
+        s = get_sipshin(day_gan, g)
+        u = get_12un(g, 운지)
+        yearly_flow.append((label, g, s, u))
+
+    # 6. 2026 재물운(정재·편재)
+    yearly_jaemul = []
+    for g in GAN_10:
+        s = get_sipshin(day_gan, g)
+        if s in ["정재", "편재"]:
+            u = get_12un(g, 운지)
+            yearly_jaemul.append((s, g, u))
+
+    # 7. 2026 연애운 (남성: 정재·편재 / 여성: 정관·편관)
+    yearly_love = []
+    love_keys = ["정재", "편재"] if gender == 1 else ["정관", "편관"]
+    for g in GAN_10:
+        s = get_sipshin(day_gan, g)
+        if s in love_keys:
+            u = get_12un(g, 운지)
+            yearly_love.append((s, g, u))
+
+    # 8. 2026 직업운 (정관·편관·식신·상관)
+    yearly_job = []
+    job_keys = ["정관", "편관", "식신", "상관"]
+    for g in GAN_10:
+        s = get_sipshin(day_gan, g)
+        if s in job_keys:
+            u = get_12un(g, 운지)
+            yearly_job.append((s, g, u))
+
+    # -------------------------------------------------
+    # 9. Python 쪽에서 사용할 요약 구조 (Calculation Output)
+    # -------------------------------------------------
+    saju_info: Dict[str, Any] = {
+        "year_ganji": year_ganji,
+        "month_ganji": month_ganji,
+        "day_ganji": day_ganji,
+        "hour_ganji": hour_ganji,
+
+        "day_gan": day_gan,
+        "day_ji": day_ji,
+
+        # ✅ 시주 상태 선언 (핵심)
+        "hour_pillar_state": {
+            "status": hour_status,  # observed | unknown
+            "observability": "observed" if hour_status == "observed" else "unobserved",
+            "confidence": 1.0 if hour_status == "observed" else 0.0,
+            "note": "No estimation applied" if hour_status != "observed" else None,
+        },
+
+        "sipshin": {
+            "원국_년간": sip_year,
+            "원국_월간": sip_month,
+            "원국_시간": sip_hour,  # unknown이면 None
+        },
+
+        "unseong": {
+            "년지": un_year,
+            "월지": un_month,
+            "일지": un_day,
+            "시지": un_hour,  # unknown이면 None
+        },
+
+        "pillars_detail": pillars_detail,
+
+        "daeun_labels": daeun_labels,
+        "daeun_year_traditional": daeun_year_traditional,
+        "daeun_float": age_raw,
+        "daeun_rounded": round(age_raw),
+        "daeun_detail": daeun_detail,
+
+        "2026_flow": yearly_flow,
+        "2026_jaemul": yearly_jaemul,
+        "2026_love": yearly_love,
+        "2026_job": yearly_job,
+    }
+
+    # DataFrame 1행 형태 (기존 기능 유지)
+    df_row = create_saju_row_with_textblock(
+        name=name,
+        birth_str=birth.strftime("%Y-%m-%d %H:%M"),
+        gender=gender,
+        year_ganji=year_ganji,
+        month_ganji=month_ganji,
+        day_ganji=day_ganji,
+        hour_ganji=hour_ganji,
+        sipshin=saju_info["sipshin"],
+        unseong=saju_info["unseong"],
+        daeun_labels=daeun_labels,
+        daeun_year_traditional=daeun_year_traditional,
+        daeun_float=age_raw,
+        daeun_rounded=round(age_raw),
+        daeun_ganji_list=daeuns,
+        daeun_startpoints=startpoints,
+    )
+
+    if return_dataframe:
+        return saju_info, df_row
+
+    return saju_info, df_row
@@ -1,26 +1,114 @@
+import numpy as np
 import pandas as pd
 import json
-from datetime import datetime
+import sys
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 CALC_DIR = Path(__file__).resolve().parent.parent   # calculation_engine/
 DATA_DIR = CALC_DIR / "data"                        # calculation_engine/data/
+ROOT_DIR = CALC_DIR.parent                          # 저장소 루트 (tboo_runtime)
+SOLAR_TERMS_JSON_PATH = DATA_DIR / "solar_terms_1900_2050.json"
 
-from typing import Optional, Any, Dict, List, Tuple
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from typing import Optional, Any, Dict, List, Sequence, Tuple
 
 from engine.daeun import (
     get_sex_direction,
     get_daeun_age_and_startpoints,
     get_daeun_ganji,
-    format_daeun_entries,
+    DaeunLabels,
+    DeferredSajuRow,
     create_saju_row_with_textblock,
+    render_daeun_detail,
+)
+from engine.calendar_table import (
+    CalendarTable,
+    get_calendar_table,
+    install_calendar_table,
+    loaded_calendar_table,
 )
+from engine.ganji_tables import GANJI_60, MISSING_CODE
+from engine.hour_table import hour_ganji_codes
+from engine.month_table import get_month_table, loaded_month_table
+from engine.pillar_index import loaded_pillar_index
 from engine.sipshin import get_sipshin, SIPSHIN_MAP
+from engine.solar_term_table import SolarTermTable
 from engine.unseong import get_12un
-from utils.time_utils import get_si_ji_by_clock, get_hour_gan
+from utils.time_utils import get_si_ji_by_clock, get_si_ji_by_solar_time, get_hour_gan
+from utils.solar_time import (
+    CivilTimeTable,
+    dst_active,
+    get_civil_time_table,
+    install_civil_time_table,
+    loaded_civil_time_table,
+)
+from tboo_runtime import clock
+from tboo_runtime.memory import register_resident
+from tboo_runtime.shared_tables import attached_tables
+from tboo_runtime.tracing import lap_timer
 
 
 GAN_10 = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
+_GANJI_BY_CODE = np.array(GANJI_60, dtype=object)   # 60갑자 코드 → 간지 (배열 gather용)
+
+
+# ---------------------------------------------------------
+# 📌 0) 상주 데이터 (프로세스당 1회 로드)
+# ---------------------------------------------------------
+_SOLAR_TERMS: Optional[SolarTermTable] = None
+
+
+def load_solar_terms() -> SolarTermTable:
+    """
+    solar_terms_1900_2050.json → SolarTermTable (dict 와 같은 Mapping, 배열 기반)
+    읽기 전용으로 공유 (호출 측에서 수정 금지).
+    """
+    global _SOLAR_TERMS
+    if _SOLAR_TERMS is None:
+        with open(SOLAR_TERMS_JSON_PATH, encoding="utf-8") as f:
+            _SOLAR_TERMS = SolarTermTable.from_json(json.load(f))
+    return _SOLAR_TERMS
+
+
+def loaded_solar_terms() -> Optional[SolarTermTable]:
+    return _SOLAR_TERMS
+
+
+def install_solar_terms(table: Optional[SolarTermTable]) -> None:
+    """미리 만든 절입 표(번들 / 공유 메모리 등)로 교체. None이면 다음 조회 때 다시 로드."""
+    global _SOLAR_TERMS
+    _SOLAR_TERMS = table
+
+
+def install_shared_tables() -> bool:
+    """
+    공유 테이블 파일(TBOO_SHARED_TABLES, tboo_runtime/shared_tables.py)이 있으면
+    만세력 / 절입 / 민간시 표를 그 파일의 읽기 전용 view 로 설치 (CSV · JSON 파싱 생략).
+    """
+    shared = attached_tables()
+    if shared is None:
+        return False
+    for group, cls, install in (
+        ("calculation.calendar", CalendarTable, install_calendar_table),
+        ("calculation.solar_terms", SolarTermTable, install_solar_terms),
+        ("calculation.civil_time", CivilTimeTable, install_civil_time_table),
+    ):
+        arrays = shared.table(group)
+        if arrays is not None:
+            install(cls.from_arrays(arrays))
+    return True
+
+
+install_shared_tables()
+
+register_resident("calculation.calendar", loaded_calendar_table)
+register_resident("calculation.solar_terms", loaded_solar_terms)
+register_resident("calculation.civil_time", loaded_civil_time_table)
+register_resident("calculation.pillar_index", loaded_pillar_index)
+register_resident("calculation.month_table", loaded_month_table)
 
 
 # ---------------------------------------------------------
@@ -35,6 +123,8 @@ def analyze_saju(
     gender: int,
     name: str = "",
     return_dataframe: bool = False,
+    longitude: Optional[float] = None,
+    defer: bool = False,
 ):
     """
     - 만세력 CSV("data/manselyeog_1900.csv")를 이용해 사주 원국 간지/십신/12운성 계산
@@ -42,7 +132,18 @@ def analyze_saju(
     - ✅ 확장: 시주 미상(unknown hour) 상태를 Calculation 레벨에서 명시적으로 표현
       - 추정/보정/대입 ❌
       - 관측 불가 상태(unobserved state)만 선언 ⭕
+    - longitude(동경, 도): 출생 시각을 지방 평균태양시로 보정해 일주 / 시주를 정함
+      (한국 표준시 변경 · 서머타임 이력 반영, utils/solar_time.py)
+      보정된 시각의 시지는 지방 평균태양시 경계(子 23:00~00:59)로 정함
+      대운 기산은 절입 시각과 같은 기준인 민간 시각(birth)을 그대로 사용
+      None이면 보정 없음 (기존 동작)
+    - defer=True: 대운 라벨 / 텍스트 블록 렌더링을 출력 시점으로 미룬다 (JSON 만 만드는 경로용)
+      daeun_labels → DaeunLabels, daeun_detail → label 없음, 두 번째 반환값 → DeferredSajuRow
+      (render_saju_info / build_tboo_json_v33 이 렌더링)
+      기본(False)은 문자열 list / label 포함 / DataFrame 그대로
     """
+    laps = lap_timer("analyze_saju")
+
     # 0. 출생 시각 (시주 미상인 경우: 날짜까지만 유효)
     if h is None or mi is None:
         hour_status = "unknown"
@@ -51,28 +152,44 @@ def analyze_saju(
         hour_status = "observed"
         birth = datetime(y, m, d, h, mi)
 
+    # 0-A. 지방 평균태양시 보정 (시각이 있을 때만)
+    pillar_time = birth
+    time_correction = None
+    if longitude is not None and hour_status == "observed":
+        civil_table = get_civil_time_table()
+        offset = civil_table.utc_offset(birth)
+        shift = civil_table.correction_seconds(birth, longitude)
+        pillar_time = birth + timedelta(seconds=shift)
+        time_correction = {
+            "longitude": longitude,
+            "civil_time": birth.strftime("%Y-%m-%d %H:%M"),
+            "local_mean_time": pillar_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "utc_offset_minutes": offset,
+            "dst": dst_active(birth),
+            "correction_seconds": shift,
+        }
+
     # 1. 만세력에서 간지 조회 (날짜 기준)
-    df = pd.read_csv(DATA_DIR / "manselyeog_1900.csv")
-    df["양력일자"] = pd.to_datetime(df["양력일자"])
+    calendar = get_calendar_table()
+    laps.lap("calendar_load")
 
-    row = df[df["양력일자"] == birth.replace(hour=0, minute=0)]
-    if row.empty:
+    row = calendar.ganji(pillar_time)
+    if row is None:
         print("⚠️ 해당 날짜가 만세력에 없습니다.")
         return None, None
 
-    row = row.iloc[0]
-
-    year_ganji = row["歲次"]
-    month_ganji = row["月建"]
-    day_ganji = row["日辰"]
+    year_ganji, month_ganji, day_ganji = row
 
     year_gan, year_ji = year_ganji[0], year_ganji[1]
     month_gan, month_ji = month_ganji[0], month_ganji[1]
     day_gan, day_ji = day_ganji[0], day_ganji[1]
+    laps.lap("calendar_lookup")
 
     # 1-A. 시주 계산(조건부)
     if hour_status == "observed":
-        hour_ji = get_si_ji_by_clock(h, mi)  # type: ignore[arg-type]
+        # 민간 시각 경계(子 23:30~)에는 태양시와의 차이가 이미 들어 있으므로 보정된 시각에는 쓰지 않는다
+        si_ji_of = get_si_ji_by_clock if time_correction is None else get_si_ji_by_solar_time
+        hour_ji = si_ji_of(pillar_time.hour, pillar_time.minute)
         hour_gan = get_hour_gan(day_gan, hour_ji)
         hour_ganji = f"{hour_gan}{hour_ji}"
     else:
@@ -144,13 +261,15 @@ def analyze_saju(
         },
     }
 
+    laps.lap("natal")
+
     # -------------------------------------------------
     # 4. 대운 계산 (연해자평 방식)
     # -------------------------------------------------
     direction = get_sex_direction(year_gan, gender)
 
-    with open(DATA_DIR / "solar_terms_1900_2050.json", encoding="utf-8") as f:
-          solar_terms = json.load(f)
+    solar_terms = load_solar_terms()
+    laps.lap("solar_terms")
 
 
     # 대운 시작 나이 계산은 "출생 시각"을 받지만,
@@ -161,13 +280,10 @@ def analyze_saju(
 
     daeuns = get_daeun_ganji(month_gan, month_ji, direction)
 
-    daeun_labels = format_daeun_entries(
-        age_raw,
-        daeuns,
-        startpoints,
-        y,
-        round(age_raw),
-    )
+    # defer: 라벨 문자열은 출력 시점에 렌더링 (render_saju_info / build_tboo_json_v33)
+    daeun_labels = DaeunLabels(age_raw, daeuns, y, round(age_raw))
+    if not defer:
+        daeun_labels = daeun_labels.render()
 
     # -------------------------------------------------
     # 4-A. 대운 확장 정보
@@ -177,11 +293,10 @@ def analyze_saju(
         d_gan, d_ji = ganji[0], ganji[1]
         d_sip = get_sipshin(day_gan, d_gan)
         d_un12 = get_12un(d_gan, d_ji)
-        label = daeun_labels[i] if i < len(daeun_labels) else ""
+        entry = {"index": i} if defer else {"index": i, "label": daeun_labels[i]}
         daeun_detail.append(
             {
-                "index": i,
-                "label": label,
+                **entry,
                 "ganji": ganji,
                 "gan": d_gan,
                 "ji": d_ji,
@@ -190,6 +305,8 @@ def analyze_saju(
             }
         )
 
+    laps.lap("daeun")
+
     # -------------------------------------------------
     # 5. 2026년 병오년 운세 (2026 = 丙午)
     # -------------------------------------------------
@@ -238,6 +355,8 @@ def analyze_saju(
             u = get_12un(g, 운지)
             yearly_job.append((s, g, u))
 
+    laps.lap("year_2026")
+
     # -------------------------------------------------
     # 9. Python 쪽에서 사용할 요약 구조 (Calculation Output)
     # -------------------------------------------------
@@ -284,9 +403,11 @@ def analyze_saju(
         "2026_love": yearly_love,
         "2026_job": yearly_job,
     }
+    if time_correction is not None:
+        saju_info["birth_time_correction"] = time_correction
 
-    # DataFrame 1행 형태 (기존 기능 유지)
-    df_row = create_saju_row_with_textblock(
+    # DataFrame 1행 형태 (기존 기능 유지) — defer 면 처음 접근할 때 생성
+    df_row = (DeferredSajuRow if defer else create_saju_row_with_textblock)(
         name=name,
         birth_str=birth.strftime("%Y-%m-%d %H:%M"),
         gender=gender,
@@ -303,6 +424,8 @@ def analyze_saju(
         daeun_ganji_list=daeuns,
         daeun_startpoints=startpoints,
     )
+    laps.lap("dataframe")
+    laps.done()
 
     if return_dataframe:
         return saju_info, df_row
@@ -310,21 +433,68 @@ def analyze_saju(
     return saju_info, df_row
 
 
+def render_saju_info(saju_info: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    analyze_saju(defer=True) 결과의 지연 필드를 렌더링한 사본 (기본 analyze_saju 결과와 같은 모양)
+    - daeun_labels: 문자열 list
+    - daeun_detail: 항목마다 label 포함
+    """
+    if saju_info is None:
+        return None
+    labels = list(saju_info["daeun_labels"])
+    rendered = dict(saju_info)
+    rendered["daeun_labels"] = labels
+    rendered["daeun_detail"] = render_daeun_detail(saju_info["daeun_detail"], labels)
+    return rendered
+
+
 # ---------------------------------------------------------
-# 📌 2) 오늘의 간지
+# 📌 1-A) 시주 배치 계산 (배열 gather)
 # ---------------------------------------------------------
-def get_today_ganji():
-    df = df = pd.read_csv(DATA_DIR / "manselyeog_1900.csv")
-    df["양력일자"] = pd.to_datetime(df["양력일자"])
+def get_hour_pillars(
+    births: Sequence[datetime],
+    longitude: Optional[float] = None,
+) -> List[Optional[str]]:
+    """
+    출생 시각 목록 → 시주 간지 목록 (analyze_saju 의 시주와 같은 규칙)
+    - longitude가 있으면 지방 평균태양시로 보정한 날짜 / 분으로 조회 (시지는 태양시 경계)
+    - 일간: 만세력 일진 코드 배열 gather, 시주: HOUR_GANJI_CODE gather
+    - 만세력에 없는 날짜는 None
+    """
+    if not births:
+        return []
+    ordinals = np.fromiter((b.toordinal() for b in births), dtype=np.int64, count=len(births))
+    minutes = np.fromiter((b.hour * 60 + b.minute for b in births), dtype=np.int64, count=len(births))
+
+    if longitude is not None:
+        civil = get_civil_time_table()
+        inside = (ordinals >= civil.start_ordinal) & (ordinals < civil.start_ordinal + len(civil.after))
+        if not inside.all():
+            raise ValueError("시각 보정표 범위(1900~2050) 밖의 날짜가 있습니다.")
+        ordinals, minutes = civil.correct_batch(ordinals, minutes, longitude)
+
+    calendar = get_calendar_table()
+    idx = ordinals - calendar.start_ordinal
+    valid = (idx >= 0) & (idx < len(calendar))
+    day_codes = np.full(len(idx), MISSING_CODE, dtype=np.uint8)
+    day_codes[valid] = calendar.day_codes[idx[valid]]
+    valid &= day_codes != MISSING_CODE
+
+    codes = hour_ganji_codes(day_codes % 10, minutes, solar=longitude is not None)
+    ganji = _GANJI_BY_CODE[codes].tolist()
+    return [g if ok else None for g, ok in zip(ganji, valid.tolist())]
 
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    row = df[df["양력일자"] == today]
 
-    if row.empty:
+# ---------------------------------------------------------
+# 📌 2) 오늘의 간지
+# ---------------------------------------------------------
+def get_today_ganji(target_date: Optional[datetime] = None):
+    today = target_date or clock.now()
+    day_ganji = get_calendar_table().day_ganji(today)
+
+    if day_ganji is None:
         raise ValueError("오늘 날짜에 해당하는 만세력 데이터가 없습니다.")
 
-    row = row.iloc[0]
-    day_ganji = row["日辰"]
     return day_ganji
 
 
@@ -346,12 +516,22 @@ def get_today_unse(day_gan: str, today_ganji: str):
 # ---------------------------------------------------------
 # 📌 3-A) 오늘의 재물/연애/직장 작동 구조 생성 (일운 도메인)
 # ---------------------------------------------------------
+def domain_sipshin_keys(gender: int) -> Dict[str, List[str]]:
+    """도메인별 작동 십신 (연애는 성별에 따라 재성 / 관성)."""
+    return {
+        "jaemul": ["정재", "편재"],
+        "love": ["정재", "편재"] if gender == 1 else ["정관", "편관"],
+        "job": ["정관", "편관", "식신", "상관"],
+    }
+
+
 def build_today_domain_operation(day_gan: str, today_ganji: str, gender: int):
     today_ji = today_ganji[1]
 
-    jaemul_keys = ["정재", "편재"]
-    love_keys = ["정재", "편재"] if gender == 1 else ["정관", "편관"]
-    job_keys = ["정관", "편관", "식신", "상관"]
+    keys = domain_sipshin_keys(gender)
+    jaemul_keys = keys["jaemul"]
+    love_keys = keys["love"]
+    job_keys = keys["job"]
 
     def _build(keys):
         out = []
@@ -369,21 +549,45 @@ def build_today_domain_operation(day_gan: str, today_ganji: str, gender: int):
     }
 
 
+# ---------------------------------------------------------
+# 📌 3-B) 연도별 세운 (year_flow)
+# ---------------------------------------------------------
+def get_year_ganji(year: int) -> str:
+    """세운 간지 (입춘 기준 해의 간지, 1984 = 甲子)."""
+    return GANJI_60[(year - 4) % 60]
+
+
+def build_year_flow(day_gan: str, years: Sequence[int]) -> List[Dict[str, Any]]:
+    """
+    연도별 세운 항목 (daeun_detail 항목과 같은 키 + year, ganji 는 today / 월운처럼 문자열)
+    - sipshin: 일간 기준 세운 천간 / un12: 세운 천간의 세운 지지 12운성 (2026_flow 세운 행과 같은 기준)
+    """
+    flow = []
+    for year in years:
+        ganji = get_year_ganji(year)
+        gan, ji = ganji[0], ganji[1]
+        flow.append(
+            {
+                "year": year,
+                "ganji": ganji,
+                "gan": gan,
+                "ji": ji,
+                "sipshin": get_sipshin(day_gan, gan),
+                "un12": get_12un(gan, ji),
+            }
+        )
+    return flow
+
+
 # ---------------------------------------------------------
 # 📌 4) 월운(月運)용 구조 생성
 # ---------------------------------------------------------
 def get_month_unse_for_date(day_gan: str, target_date: datetime):
-    df = pd.read_csv(DATA_DIR / "manselyeog_1900.csv")
-    df["양력일자"] = pd.to_datetime(df["양력일자"])
+    month_ganji = get_calendar_table().month_ganji(target_date)
 
-    base_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    row = df[df["양력일자"] == base_date]
-
-    if row.empty:
+    if month_ganji is None:
         raise ValueError("해당 날짜에 대한 월운 데이터를 찾을 수 없습니다.")
 
-    row = row.iloc[0]
-    month_ganji = row["月建"]
     month_gan, month_ji = month_ganji[0], month_ganji[1]
 
     month_sipshin = get_sipshin(day_gan, month_gan)
@@ -397,14 +601,14 @@ def get_month_unse_for_date(day_gan: str, target_date: datetime):
 
 
 def get_today_month_unse(day_gan: str):
-    today = datetime.now()
+    today = clock.now()
     return get_month_unse_for_date(day_gan, today)
 
 
 # -------------------------------------------------------------
 # 2026년(또는 임의 연도) 전체 월운 JSON 생성
 # -------------------------------------------------------------
-def get_year_month_unse(day_gan: str, year: int, df_manse) -> list:
+def _month_changes_from_frame(df_manse, start_range, end_range) -> list:
     df_all = df_manse.copy()
 
     if "date" in df_all.columns:
@@ -417,32 +621,51 @@ def get_year_month_unse(day_gan: str, year: int, df_manse) -> list:
     df_all["prev_month_ganji"] = df_all["月建"].shift(1)
     df_all["month_change"] = df_all["月建"] != df_all["prev_month_ganji"]
 
-    start_range = pd.to_datetime(f"{year}-01-01")
-    end_range = pd.to_datetime(f"{year + 1}-03-01")
+    df_range = df_all[
+        (df_all["date"] >= pd.Timestamp(start_range)) & (df_all["date"] < pd.Timestamp(end_range))
+    ]
+    changes = df_range[df_range["month_change"]]
+    return list(zip(changes["date"].dt.date, changes["月建"]))
 
-    df_range = df_all[(df_all["date"] >= start_range) & (df_all["date"] < end_range)]
-    changes = df_range[df_range["month_change"]].reset_index(drop=True)
 
-    if len(changes) < 14:
-        limit = max(0, len(changes) - 1)
+def get_year_month_unse(day_gan: str, year: int, df_manse=None) -> list:
+    """
+    df_manse: None(상주 만세력 테이블) / CalendarTable / 만세력 DataFrame
+    """
+    start_range = date(year, 1, 1)
+    end_range = date(year + 1, 3, 1)
+
+    if df_manse is None:
+        # 상주 월운 구간표 (engine/month_table.py) — 구간 경계 / 月建은 아래 계산과 같다
+        changes = None
+        periods = get_month_table().year_periods(year)
+    elif isinstance(df_manse, CalendarTable):
+        changes = df_manse.month_changes(start_range, end_range)
+    else:
+        changes = _month_changes_from_frame(df_manse, start_range, end_range)
+
+    if changes is not None:
+        if len(changes) < 14:
+            limit = max(0, len(changes) - 1)
+        else:
+            limit = 13
+        periods = [
+            (
+                changes[i][0].strftime("%Y-%m-%d"),
+                (changes[i + 1][0] - timedelta(days=1)).strftime("%Y-%m-%d"),
+                changes[i][1],
+            )
+            for i in range(limit)
+        ]
     else:
-        limit = 13
+        periods = [(start, end, GANJI_60[code]) for start, end, code in periods]
 
     month_unse_list = []
 
-    for i in range(limit):
-        row = changes.iloc[i]
-        start_dt = row["date"]
-        boundary_dt = changes.iloc[i + 1]["date"]
-        end_dt = boundary_dt - pd.Timedelta(days=1)
-
-        month_ganji = row["月建"]
+    for start_date_str, end_date_str, month_ganji in periods:
         month_gan = month_ganji[0]
         month_ji = month_ganji[1]
 
-        start_date_str = start_dt.strftime("%Y-%m-%d")
-        end_date_str = end_dt.strftime("%Y-%m-%d")
-
         sipshin = get_sipshin(day_gan, month_gan)
         un12 = get_12un(month_gan, month_ji)
 
@@ -467,21 +690,57 @@ def get_year_month_unse(day_gan: str, year: int, df_manse) -> list:
     return month_unse_list
 
 
+# ---------------------------------------------------------
+# 📌 4-A) 연간 월운 작동 구조 (month_operation)
+# ---------------------------------------------------------
+MONTH_DOMAINS = ("jaemul", "love", "job")
+_MONTH_DOMAIN_FLAGS: Dict[int, List[Dict[str, bool]]] = {}
+
+
+def build_month_operation(day_gan: str, gender: int, year: int) -> Dict[str, Any]:
+    """
+    대상 연도의 13개 월운 구간 (get_year_month_unse 와 같은 구간 / 간지 / 십신 / 12운성, note 없음)
+    - 상주 월운 구간표(engine/month_table.py) + 60갑자 코드 사전 계산표 조회만
+    - domains: {jaemul, love, job} → 그 달 月建 천간 십신이 도메인 작동 십신인지 (연애는 성별 기준)
+    - 만세력 범위 밖 연도면 ValueError
+    """
+    if day_gan not in GAN_10:
+        raise ValueError(f"일간 오류: {day_gan!r}")
+    periods = get_month_table().year_periods(year)
+    if not periods:
+        raise ValueError(f"{year}년 월운 데이터를 찾을 수 없습니다.")
+
+    flags = _MONTH_DOMAIN_FLAGS.get(gender)
+    if flags is None:
+        flags = _MONTH_DOMAIN_FLAGS[gender] = _domain_flags_by_sipshin(MONTH_DOMAINS, gender)
+    sipshin_row = _SIPSHIN_ROWS[GAN_10.index(day_gan)]
+
+    months = []
+    for start, end, code in periods:
+        i = sipshin_row[code]
+        months.append(
+            {
+                "ganji": GANJI_60[code],
+                "sipshin": SIPSHIN_NAMES[i],
+                "unseong": _UNSEONG_NAMES[code],
+                "start_date": start,
+                "end_date": end,
+                "domains": dict(flags[i]),
+            }
+        )
+    return {"year": year, "months": months}
+
+
 # ---------------------------------------------------------
 # 📌 5) 특정 날짜 일운(日運) 계산 함수
 # ---------------------------------------------------------
 def get_day_unse_for_date(day_gan: str, target_date: datetime):
-    df = pd.read_csv(DATA_DIR / "manselyeog_1900.csv")
-    df["양력일자"] = pd.to_datetime(df["양력일자"])
-
     base_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    row = df[df["양력일자"] == base_date]
+    day_ganji = get_calendar_table().day_ganji(base_date)
 
-    if row.empty:
+    if day_ganji is None:
         raise ValueError("해당 날짜에 대한 일운 데이터를 찾을 수 없습니다.")
 
-    row = row.iloc[0]
-    day_ganji = row["日辰"]
     g, j = day_ganji[0], day_ganji[1]
 
     sip = get_sipshin(day_gan, g)
@@ -493,3 +752,79 @@ def get_day_unse_for_date(day_gan: str, target_date: datetime):
         "sipshin": sip,
         "unseong": un12,
     }
+
+
+# ---------------------------------------------------------
+# 📌 5-A) 기간 일운 (달력 화면용, 벡터화)
+# ---------------------------------------------------------
+# 60갑자 코드 기준 사전 계산표
+# - _SIPSHIN_CODE[일간 index, 간지 코드] → SIPSHIN_NAMES index
+# - _UNSEONG_BY_CODE[간지 코드]          → 해당 일진의 12운성 (천간 기준, get_12un(g, j))
+SIPSHIN_NAMES = ("비견", "겁재", "식신", "상관", "편재", "정재", "편관", "정관", "편인", "정인")
+
+_SIPSHIN_CODE = np.array(
+    [[SIPSHIN_NAMES.index(get_sipshin(dg, gz[0])) for gz in GANJI_60] for dg in GAN_10],
+    dtype=np.uint8,
+)
+_UNSEONG_BY_CODE = np.array([get_12un(gz[0], gz[1]) for gz in GANJI_60], dtype=object)
+_SIPSHIN_BY_INDEX = np.array(SIPSHIN_NAMES, dtype=object)
+_SIPSHIN_ROWS = _SIPSHIN_CODE.tolist()        # 구간 몇 개짜리 조회용 (numpy 스칼라 인덱싱 없이)
+_UNSEONG_NAMES = _UNSEONG_BY_CODE.tolist()
+
+
+def get_day_unse_range(
+    day_gan: str,
+    start: date,
+    end: date,
+    *,
+    domains: Optional[List[str]] = None,
+    gender: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    [start, end) 각 날짜의 일운 — get_day_unse_for_date 와 같은 항목을 한 번에.
+    - 만세력 배열 구간 슬라이스 + 사전 계산표 인덱싱 (날짜별 조회 없음)
+    - domains: ["jaemul", "love", "job"] 중 선택 → 행마다 "domains": {도메인: 그날 일진 십신이 작동 십신인지}
+      ("love"는 gender 필요)
+    - 구간 안에 만세력에 없는 날짜가 있으면 ValueError
+    """
+    if day_gan not in GAN_10:
+        raise ValueError(f"일간 오류: {day_gan!r}")
+    table = get_calendar_table()
+    lo = start.toordinal() - table.start_ordinal
+    hi = end.toordinal() - table.start_ordinal
+    if hi <= lo:
+        return []
+
+    codes = table.day_codes[lo:hi] if 0 <= lo and hi <= len(table) else None
+    if codes is None or (codes == MISSING_CODE).any():
+        raise ValueError("해당 기간에 대한 일운 데이터를 찾을 수 없습니다.")
+
+    sipshin_idx = _SIPSHIN_CODE[GAN_10.index(day_gan)][codes]
+    dates = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D")).astype(str).tolist()
+    ganji = _GANJI_BY_CODE[codes].tolist()
+    sipshin = _SIPSHIN_BY_INDEX[sipshin_idx].tolist()
+    unseong = _UNSEONG_BY_CODE[codes].tolist()
+
+    if not domains:
+        return [
+            {"date": d, "ganji": g, "sipshin": s, "unseong": u}
+            for d, g, s, u in zip(dates, ganji, sipshin, unseong)
+        ]
+
+    if "love" in domains and gender is None:
+        raise ValueError("love 도메인에는 gender가 필요합니다.")
+    by_sipshin = _domain_flags_by_sipshin(tuple(domains), gender or 1)
+
+    return [
+        {"date": d, "ganji": g, "sipshin": s, "unseong": u, "domains": dict(by_sipshin[i])}
+        for d, g, s, u, i in zip(dates, ganji, sipshin, unseong, sipshin_idx.tolist())
+    ]
+
+
+def _domain_flags_by_sipshin(domains: Tuple[str, ...], gender: int) -> List[Dict[str, bool]]:
+    """SIPSHIN_NAMES index → {도메인: 작동 여부}"""
+    keys = domain_sipshin_keys(gender)
+    for name in domains:
+        if name not in keys:
+            raise ValueError(f"알 수 없는 도메인: {name!r}")
+    return [{name: s in keys[name] for name in domains} for s in SIPSHIN_NAMES]
@@ -0,0 +1,125 @@
+"""
+engine/solar_term_table.py
+
+절입 시각(solar_terms_1900_2050.json)의 배열 표현
+- 연도별 구간 bounds + 절입 시각(현지 시계, epoch 초) + UTC 오프셋(초) + 절기 이름 코드
+- dict 와 같은 Mapping 인터페이스 (solar_terms["1990"] → [{"name", "datetime"}, ...])
+  를 유지하므로 기존 호출부는 그대로 동작한다
+- 대운 계산은 term_datetimes(year) 로 문자열 파싱 없이 정렬된 naive datetime 목록을 받는다
+- 배열만으로 이루어져 있어 공유 메모리 / 번들에 그대로 실을 수 있다 (arrays / from_arrays)
+"""
+
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class SolarTermTable(Mapping):
+    __slots__ = ("first_year", "bounds", "seconds", "utc_offsets", "name_codes", "names")
+
+    def __init__(
+        self,
+        first_year: int,
+        bounds: np.ndarray,
+        seconds: np.ndarray,
+        utc_offsets: np.ndarray,
+        name_codes: np.ndarray,
+        names: np.ndarray,
+    ):
+        self.first_year = int(first_year)
+        self.bounds = bounds            # int32[연도 수 + 1]
+        self.seconds = seconds          # int64 — 현지 시계 시각 (tz 제거) epoch 초
+        self.utc_offsets = utc_offsets  # int32 — 초
+        self.name_codes = name_codes    # uint8 → names
+        self.names = names              # 절기 이름 (고정폭 유니코드 배열)
+
+    @classmethod
+    def from_json(cls, data: Dict[str, List[Dict[str, str]]]) -> "SolarTermTable":
+        years = sorted(int(y) for y in data)
+        first = years[0]
+        names: List[str] = []
+        bounds = np.zeros(years[-1] - first + 2, dtype=np.int32)
+        seconds, offsets, codes = [], [], []
+        for y in range(first, years[-1] + 1):
+            for term in data.get(str(y), []):
+                dt = datetime.fromisoformat(term["datetime"])
+                if term["name"] not in names:
+                    names.append(term["name"])
+                seconds.append((dt.replace(tzinfo=None) - _EPOCH) // timedelta(seconds=1))
+                offset = dt.utcoffset()
+                offsets.append(0 if offset is None else int(offset.total_seconds()))
+                codes.append(names.index(term["name"]))
+            bounds[y - first + 1] = len(seconds)
+        return cls(
+            first,
+            bounds,
+            np.array(seconds, dtype=np.int64),
+            np.array(offsets, dtype=np.int32),
+            np.array(codes, dtype=np.uint8),
+            np.array(names),
+        )
+
+    # ------------------------------------------------------------
+    # 배열 직렬화 (공유 메모리 / 번들)
+    # ------------------------------------------------------------
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "first_year": np.array(self.first_year, dtype=np.int32),
+            "bounds": self.bounds,
+            "seconds": self.seconds,
+            "utc_offsets": self.utc_offsets,
+            "name_codes": self.name_codes,
+            "names": self.names,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "SolarTermTable":
+        return cls(int(arrays["first_year"]), *(arrays[k] for k in cls.__slots__[1:]))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.__slots__ if name != "first_year")
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def _span(self, year: int):
+        i = year - self.first_year
+        if not 0 <= i < len(self.bounds) - 1 or self.bounds[i] == self.bounds[i + 1]:
+            return None
+        return int(self.bounds[i]), int(self.bounds[i + 1])
+
+    def term_datetimes(self, year: int) -> List[datetime]:
+        """해당 연도 절입 시각 (현지 시계, naive, 오름차순)."""
+        span = self._span(year)
+        if span is None:
+            return []
+        return sorted(_EPOCH + timedelta(seconds=s) for s in self.seconds[span[0]:span[1]].tolist())
+
+    def __getitem__(self, year: Any) -> List[Dict[str, str]]:
+        span = self._span(int(year)) if str(year).isdigit() else None
+        if span is None:
+            raise KeyError(year)
+        lo, hi = span
+        out = []
+        for s, off, code in zip(
+            self.seconds[lo:hi].tolist(), self.utc_offsets[lo:hi].tolist(), self.name_codes[lo:hi].tolist()
+        ):
+            dt = (_EPOCH + timedelta(seconds=s)).replace(tzinfo=timezone(timedelta(seconds=off)))
+            out.append({"name": str(self.names[code]), "datetime": dt.isoformat()})
+        return out
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self.bounds) - 1):
+            if self.bounds[i] != self.bounds[i + 1]:
+                yield str(self.first_year + i)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(np.diff(self.bounds)))
+
+    def __contains__(self, year: Any) -> bool:
+        return str(year).isdigit() and self._span(int(year)) is not None
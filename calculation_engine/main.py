@@ -1,5 +1,5 @@
 # main.py (FINAL · no-month-flow)
-# - TBOO JSON Schema v3.3 (월운 제거)
+# - TBOO JSON Schema v3.3 (월운 제거 — --months 요청 시에만 month_operation, 상주 월운 구간표 기반)
 # - today: base / operation 분리
 # - year_2026_operation / daeun / fortune_layers 유지
 # - 시주 미상 지원
@@ -7,10 +7,12 @@
 
 from __future__ import annotations
 
+import argparse
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 # ------------------------------------------------------------
 # 0. 경로 고정
@@ -24,6 +26,8 @@ OUTPUT_DIR = BASE_DIR / "output"
 try:
     from engine.saju_core import (
         analyze_saju,
+        build_month_operation,
+        build_year_flow,
         get_today_ganji,
         get_today_unse,
         build_today_domain_operation,
@@ -31,11 +35,22 @@ try:
 except ImportError:
     from saju_core import (  # type: ignore
         analyze_saju,
+        build_month_operation,
+        build_year_flow,
         get_today_ganji,
         get_today_unse,
         build_today_domain_operation,
     )
 
+from engine.daeun import render_daeun_detail
+
+# engine.saju_core 로드 시 저장소 루트가 sys.path에 올라감
+from tboo_runtime import clock
+from tboo_runtime.clock import add_clock_arguments, clock_from_args, set_clock
+from tboo_runtime.output_writer import get_output_writer
+from tboo_runtime.profiling import add_profiling_arguments, profiling_session_from_args
+from tboo_runtime.tracing import StageTracer, attach_trace, enable_tracing, stage, traced
+
 
 # ------------------------------------------------------------
 # 2. 유틸
@@ -47,6 +62,25 @@ def parse_optional_int(token: str) -> Optional[int]:
     return int(t)
 
 
+def parse_year_range(text: str) -> List[int]:
+    """"2026-2035" → [2026, ..., 2035] (양 끝 포함), "2026" → [2026]."""
+    start, _, end = text.partition("-")
+    first, last = int(start), int(end or start)
+    if last < first:
+        raise argparse.ArgumentTypeError(f"잘못된 연도 범위: {text!r}")
+    return list(range(first, last + 1))
+
+
+def parse_target_year(text: str) -> Any:
+    """"2026" → 2026, "current" → "current" (--months 연도 생략: 실행 시점 clock 기준 올해)."""
+    if text == "current":
+        return text
+    try:
+        return int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"잘못된 연도: {text!r}") from None
+
+
 def ensure_output_dir() -> Path:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     return OUTPUT_DIR
@@ -57,9 +91,69 @@ def hour_suffix_from_state(hour_state: Dict[str, Any]) -> str:
     return "with-hour" if status == "observed" else "hour-null"
 
 
+def gender_int_from_label(gender: str) -> int:
+    return 1 if gender == "남성" else 2
+
+
 # ------------------------------------------------------------
-# 3. JSON 빌더 (월운 없음)
+# 2-A. 오늘 운 (today) 계산
 # ------------------------------------------------------------
+@traced("compute_today_unse")
+def compute_today_unse(
+    day_gan: str,
+    gender_int: int,
+    target_date: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    today_ganji = get_today_ganji(target_date)
+    today_unse = get_today_unse(day_gan, today_ganji)
+    today_unse.update(
+        build_today_domain_operation(day_gan, today_ganji, gender_int)
+    )
+    return today_unse
+
+
+def build_today_block(today_unse: Dict[str, Any]) -> Dict[str, Any]:
+    # today (A안 구조)
+    return {
+        "base": {
+            "ganji": today_unse.get("ganji"),
+            "sipshin": today_unse.get("sipshin"),
+            "unseong": today_unse.get("unseong"),
+            "reference": "day_gan",
+        },
+        "operation": {
+            "money": today_unse.get("today_jaemul", []),
+            "love": today_unse.get("today_love", []),
+            "job": today_unse.get("today_job", []),
+        },
+    }
+
+
+def refresh_today_block(
+    tboo_json: Dict[str, Any],
+    target_date: datetime,
+) -> Dict[str, Any]:
+    """
+    기존 v3.3 JSON에서 today만 다시 계산해 교체한다.
+    - 원국 / 대운 / year_2026_operation은 재계산하지 않음
+    - 입력 dict는 수정하지 않음 (today 외 섹션은 그대로 공유)
+    """
+    day_gan = (tboo_json.get("saju", {}).get("day") or "")[:1]
+    if not day_gan:
+        raise ValueError("saju.day 없음")
+
+    gender_int = gender_int_from_label(tboo_json.get("user_info", {}).get("gender", ""))
+    today_unse = compute_today_unse(day_gan, gender_int, target_date)
+
+    refreshed = dict(tboo_json)
+    refreshed["today"] = build_today_block(today_unse)
+    return refreshed
+
+
+# ------------------------------------------------------------
+# 3. JSON 빌더 (월운은 month_operation 요청 시에만)
+# ------------------------------------------------------------
+@traced("build_tboo_json_v33")
 def build_tboo_json_v33(
     name: str,
     gender: str,
@@ -70,10 +164,15 @@ def build_tboo_json_v33(
     minute: Optional[int],
     saju_info: Dict[str, Any],
     today_unse: Dict[str, Any],
+    year_flow: Optional[List[Dict[str, Any]]] = None,
+    month_operation: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     hour_state = saju_info.get("hour_pillar_state", {}) or {}
     hour_status = hour_state.get("status", "observed")
 
+    # analyze_saju(defer=True) 결과면 대운 라벨은 여기서(직렬화 직전) 처음 렌더링된다
+    daeun_labels = list(saju_info.get("daeun_labels") or [])
+
     # birthday 포맷
     if hour_status == "observed" and hour is not None and minute is not None:
         birthday = f"{birth_year:04d}-{birth_month:02d}-{birth_day:02d} {hour:02d}:{minute:02d}"
@@ -87,20 +186,7 @@ def build_tboo_json_v33(
         "day": {"type": "event_peak", "weight": 1.2},
     }
 
-    # today (A안 구조)
-    today_block = {
-        "base": {
-            "ganji": today_unse.get("ganji"),
-            "sipshin": today_unse.get("sipshin"),
-            "unseong": today_unse.get("unseong"),
-            "reference": "day_gan",
-        },
-        "operation": {
-            "money": today_unse.get("today_jaemul", []),
-            "love": today_unse.get("today_love", []),
-            "job": today_unse.get("today_job", []),
-        },
-    }
+    today_block = build_today_block(today_unse)
 
     raw_flow = saju_info.get("2026_flow", [])
     year_2026_operation = {
@@ -110,7 +196,7 @@ def build_tboo_json_v33(
         "job": saju_info.get("2026_job", []),
     }
 
-    return {
+    tboo_json = {
         "schema_version": "3.3",
         "user_info": {
             "name": name,
@@ -127,9 +213,9 @@ def build_tboo_json_v33(
         "pillars_detail": saju_info.get("pillars_detail"),
         "sipshin": saju_info.get("sipshin"),
         "unseong": saju_info.get("unseong"),
-        "daeun_detail": saju_info.get("daeun_detail"),
+        "daeun_detail": render_daeun_detail(saju_info.get("daeun_detail"), daeun_labels),
         "daeun": {
-            "labels": saju_info.get("daeun_labels"),
+            "labels": daeun_labels,
             "years_traditional": saju_info.get("daeun_year_traditional"),
             "ages": saju_info.get("daeun_rounded"),
         },
@@ -140,21 +226,19 @@ def build_tboo_json_v33(
             "hour_pillar": "observed" if hour_status == "observed" else "unobserved"
         },
     }
+    if saju_info.get("birth_time_correction"):
+        tboo_json["birth_time_correction"] = saju_info["birth_time_correction"]
+    if year_flow:
+        tboo_json["year_flow"] = year_flow
+    if month_operation:
+        tboo_json["month_operation"] = month_operation
+    return tboo_json
 
 
 # ------------------------------------------------------------
 # 4. main
 # ------------------------------------------------------------
-def main() -> None:
-    print("▶ 입력 형식:")
-    print("  이름 YYYY MM DD HH mm 성별(1:남성, 2:여성)")
-    print("  - 시간 모르면 HH mm에 x x 입력")
-
-    raw = input().strip().split()
-    if len(raw) < 7:
-        print("❌ 입력 형식 오류")
-        return
-
+def run(args: argparse.Namespace, raw: List[str], tracer: Optional[StageTracer]) -> None:
     name = raw[0]
     year, month, day = map(int, raw[1:4])
     hour = parse_optional_int(raw[4])
@@ -168,9 +252,10 @@ def main() -> None:
         minute = None
 
     try:
-        saju_info, _ = analyze_saju(
-            year, month, day, hour, minute, gender_int, name
-        )
+        with stage("analyze_saju"):
+            saju_info, _ = analyze_saju(
+                year, month, day, hour, minute, gender_int, name, longitude=args.longitude, defer=True
+            )
     except Exception as e:
         print("❌ 사주 계산 오류:", e)
         return
@@ -181,15 +266,20 @@ def main() -> None:
         return
 
     try:
-        today_ganji = get_today_ganji()
-        today_unse = get_today_unse(day_gan, today_ganji)
-        today_unse.update(
-            build_today_domain_operation(day_gan, today_ganji, gender_int)
-        )
+        today_unse = compute_today_unse(day_gan, gender_int)
     except Exception as e:
         print("❌ 오늘 운 계산 오류:", e)
         return
 
+    month_operation = None
+    if args.months:
+        months_year = clock.now().year if args.months == "current" else args.months
+        try:
+            month_operation = build_month_operation(day_gan, gender_int, months_year)
+        except ValueError as e:
+            print("❌ 월운 계산 오류:", e)
+            return
+
     tboo_json = build_tboo_json_v33(
         name=name,
         gender=gender,
@@ -200,17 +290,107 @@ def main() -> None:
         minute=minute,
         saju_info=saju_info,
         today_unse=today_unse,
+        year_flow=build_year_flow(day_gan, args.years) if args.years else None,
+        month_operation=month_operation,
     )
+    if args.trace:
+        attach_trace(tboo_json, tracer)
 
-    print(json.dumps(tboo_json, ensure_ascii=False, indent=2))
+    with stage("json_encode"):
+        text = json.dumps(tboo_json, ensure_ascii=False, indent=2)
 
+    # 파일 기록은 output writer 스레드에서 (콘솔 출력과 겹침)
     out_dir = ensure_output_dir()
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ts = clock.now().strftime("%Y%m%d_%H%M%S")
     suffix = hour_suffix_from_state(tboo_json.get("hour_pillar_state", {}))
     path = out_dir / f"{name}_saju_v33_{ts}_{suffix}.json"
-    path.write_text(json.dumps(tboo_json, ensure_ascii=False, indent=2), encoding="utf-8")
+    writer = get_output_writer()
+    writer.write_file(path, text)
+    if args.jsonl:
+        writer.append(
+            Path(args.jsonl).expanduser().resolve(),
+            json.dumps(tboo_json, ensure_ascii=False, separators=(",", ":")),
+        )
+    print(text)
+    writer.flush()
     print(f"\n📁 저장 완료: {path}")
 
+    if args.trace_export:
+        tracer.write(Path(args.trace_export).expanduser().resolve())
+        print(f"⏱  트레이스 저장: {args.trace_export}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TBOO Saju Calculation Engine")
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="단계별 소요 시간을 출력 JSON의 meta.trace 에 기록",
+    )
+    parser.add_argument(
+        "--trace-export",
+        default=None,
+        help="단계별 트레이스 저장 경로 (*.prom: Prometheus text, 그 외: JSON)",
+    )
+    parser.add_argument(
+        "--longitude",
+        type=float,
+        default=None,
+        help="출생지 경도(동경, 도) — 지정 시 지방 평균태양시로 보정해 일주 / 시주 계산 (예: 서울 126.98)",
+    )
+    parser.add_argument(
+        "--years",
+        type=parse_year_range,
+        default=None,
+        help="세운 항목(year_flow)을 만들 연도 범위 YYYY-YYYY 또는 YYYY (예: 2026-2035)",
+    )
+    parser.add_argument(
+        "--months",
+        nargs="?",
+        type=parse_target_year,
+        const="current",
+        default=None,
+        metavar="YYYY",
+        help="해당 연도 13개 월운(month_operation)을 추가 (연도 생략 시 올해)",
+    )
+    parser.add_argument(
+        "--jsonl",
+        default=None,
+        help="결과를 이 JSONL 파일에 한 줄로 추가 기록 (*.gz: gzip) — stream_fusion 입력용",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="stdin의 모든 줄을 한 줄에 한 명씩 처리 (--profile / --trace-malloc 이 여러 명식을 합산)",
+    )
+    add_clock_arguments(parser)
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+    tracer = enable_tracing() if args.trace or args.trace_export else None
+    set_clock(clock_from_args(args))
+
+    print("▶ 입력 형식:")
+    print("  이름 YYYY MM DD HH mm 성별(1:남성, 2:여성)")
+    print("  - 시간 모르면 HH mm에 x x 입력")
+
+    if not args.batch:
+        raw = input().strip().split()
+        if len(raw) < 7:
+            print("❌ 입력 형식 오류")
+            return
+        with profiling_session_from_args(args):
+            run(args, raw, tracer)
+        return
+
+    # 배치: 세션 하나가 모든 줄을 감싼다 (트레이스도 합산)
+    rows = [line.split() for line in sys.stdin.read().splitlines() if line.strip()]
+    with profiling_session_from_args(args):
+        for line_no, raw in enumerate(rows, start=1):
+            if len(raw) < 7:
+                print(f"❌ 입력 형식 오류 ({line_no}행)")
+                continue
+            run(args, raw, tracer)
+
 
 if __name__ == "__main__":
     main()
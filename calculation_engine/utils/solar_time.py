@@ -0,0 +1,192 @@
+# utils/solar_time.py
+#
+# 출생 시각(한국 민간 시각) → 지방 평균태양시(local mean solar time) 보정
+# - 한국 표준시 변경 이력: 1908 UTC+8:30 / 1912 UTC+9 / 1954 UTC+8:30 / 1961 UTC+9
+#   (1908-04-01 이전 시각은 한성(서울) 지방 평균시로 본다 → 출생지와의 경도 차이만 보정)
+# - 서머타임(1948~1960, 1987~1988) 기간은 시계가 1시간 앞서 있으므로 추가로 뺀다
+# - 보정량(초) = 경도 × 240 − UTC 오프셋(분) × 60
+#   (1908-04-01 이전: 경도 × 240 − 서울 경도 × 240)
+# - 보정된 시각의 시지는 지방 평균태양시 경계(utils/time_utils.py SOLAR_SI_JI_BY_MINUTE)로 정한다
+# - 날짜 기준 사전 계산표(CivilTimeTable): 1900-01-01 ~ 2050-12-31 날짜별 UTC 오프셋
+#   (하루 중 전환이 있는 1987/1988 전환일은 switch_minute 로 처리, 경도는 조회 시 적용)
+#
+# 전환 규칙은 IANA tz database Asia/Seoul 과 같다.
+# 시계가 겹치는 시간(서머타임 종료 직전 1시간 등)은 먼저 오는 쪽(서머타임)으로 본다.
+
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+SEOUL_LONGITUDE = 126.9780
+LMT_SECONDS_SEOUL = round(SEOUL_LONGITUDE * 240)   # 1908 이전 민간 시각의 UTC 오프셋(초)
+
+# (시행 시각(현지 시계), UTC 오프셋 분)
+STANDARD_TIME_CHANGES: Tuple[Tuple[datetime, int], ...] = (
+    (datetime(1908, 4, 1), 510),
+    (datetime(1912, 1, 1), 540),
+    (datetime(1954, 3, 21), 510),
+    (datetime(1961, 8, 10), 540),
+)
+
+# 서머타임 [시작, 종료) — 현지 시계 기준 (종료는 서머타임 시계로 읽은 시각)
+DST_PERIODS: Tuple[Tuple[datetime, datetime], ...] = (
+    (datetime(1948, 6, 1), datetime(1948, 9, 13)),
+    (datetime(1949, 4, 3), datetime(1949, 9, 11)),
+    (datetime(1950, 4, 1), datetime(1950, 9, 10)),
+    (datetime(1951, 5, 6), datetime(1951, 9, 9)),
+    (datetime(1955, 5, 5), datetime(1955, 9, 9)),
+    (datetime(1956, 5, 20), datetime(1956, 9, 30)),
+    (datetime(1957, 5, 5), datetime(1957, 9, 22)),
+    (datetime(1958, 5, 4), datetime(1958, 9, 21)),
+    (datetime(1959, 5, 3), datetime(1959, 9, 20)),
+    (datetime(1960, 5, 1), datetime(1960, 9, 18)),
+    (datetime(1987, 5, 10, 2), datetime(1987, 10, 11, 3)),
+    (datetime(1988, 5, 8, 2), datetime(1988, 10, 9, 3)),
+)
+
+TABLE_START = date(1900, 1, 1)
+TABLE_END = date(2051, 1, 1)   # 미포함
+
+
+# ---------------------------------------------------------
+# 단건 규칙
+# ---------------------------------------------------------
+def dst_active(wall: datetime) -> bool:
+    return any(start <= wall < end for start, end in DST_PERIODS)
+
+
+def civil_utc_offset(wall: datetime) -> Optional[int]:
+    """현지 시계 시각의 UTC 오프셋(분, 서머타임 포함). 1908-04-01 이전은 None (서울 지방 평균시)."""
+    offset = None
+    for since, minutes in STANDARD_TIME_CHANGES:
+        if wall >= since:
+            offset = minutes
+    if offset is None:
+        return None
+    if dst_active(wall):
+        offset += 60
+    return offset
+
+
+def correction_seconds(wall: datetime, longitude: float) -> int:
+    """민간 시각 + 보정량 = 지방 평균태양시."""
+    offset = civil_utc_offset(wall)
+    if offset is None:
+        return round(longitude * 240) - LMT_SECONDS_SEOUL
+    return round(longitude * 240) - offset * 60
+
+
+# ---------------------------------------------------------
+# 날짜 기준 사전 계산표
+# ---------------------------------------------------------
+LMT_MARK = -1   # 1908-04-01 이전 (서울 지방 평균시, LMT_SECONDS_SEOUL)
+
+
+class CivilTimeTable:
+    """
+    날짜별 UTC 오프셋(분) — 경도와 무관하게 하나만 상주
+    day = 날짜 - TABLE_START (일)
+    하루 중 분 m < switch_minute[day] → before[day], 아니면 after[day]
+    """
+
+    __slots__ = ("start_ordinal", "switch_minute", "before", "after")
+
+    def __init__(self, switch_minute: np.ndarray, before: np.ndarray, after: np.ndarray):
+        self.start_ordinal = TABLE_START.toordinal()
+        self.switch_minute = switch_minute
+        self.before = before
+        self.after = after
+
+    def utc_offset(self, wall: datetime) -> Optional[int]:
+        i = wall.toordinal() - self.start_ordinal
+        if not 0 <= i < len(self.after):
+            return civil_utc_offset(wall)
+        minute = wall.hour * 60 + wall.minute
+        offset = int(self.before[i] if minute < self.switch_minute[i] else self.after[i])
+        return None if offset == LMT_MARK else offset
+
+    def correction_seconds(self, wall: datetime, longitude: float) -> int:
+        offset = self.utc_offset(wall)
+        civil_seconds = LMT_SECONDS_SEOUL if offset is None else offset * 60
+        return round(longitude * 240) - civil_seconds
+
+    def to_local_mean_time(self, wall: datetime, longitude: float) -> datetime:
+        return wall + timedelta(seconds=self.correction_seconds(wall, longitude))
+
+    def correct_batch(
+        self,
+        ordinals: np.ndarray,
+        minutes: np.ndarray,
+        longitude: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (날짜 서수, 하루 중 분) 배열 → 지방 평균태양시 (날짜 서수, 하루 중 분) 배열.
+        범위 밖 날짜는 호출 측에서 걸러야 한다.
+        """
+        i = ordinals - self.start_ordinal
+        offset = np.where(minutes < self.switch_minute[i], self.before[i], self.after[i]).astype(np.int64)
+        shift = round(longitude * 240) - np.where(offset == LMT_MARK, LMT_SECONDS_SEOUL, offset * 60)
+        days, seconds = np.divmod(minutes.astype(np.int64) * 60 + shift, 86400)
+        return ordinals + days, seconds // 60
+
+    @property
+    def nbytes(self) -> int:
+        return self.switch_minute.nbytes + self.before.nbytes + self.after.nbytes
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {"switch_minute": self.switch_minute, "before": self.before, "after": self.after}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "CivilTimeTable":
+        return cls(arrays["switch_minute"], arrays["before"], arrays["after"])
+
+
+def build_civil_time_table() -> CivilTimeTable:
+    size = TABLE_END.toordinal() - TABLE_START.toordinal()
+    switch_minute = np.full(size, 1440, dtype=np.int16)
+    before = np.full(size, LMT_MARK, dtype=np.int16)
+    after = np.full(size, LMT_MARK, dtype=np.int16)
+
+    # 오프셋이 일정한 구간별로 채운다: 시행 시각이 하루 중간이면 그날은 switch_minute 로 분할
+    changes = sorted(
+        [since for since, _ in STANDARD_TIME_CHANGES]
+        + [t for period in DST_PERIODS for t in period]
+    )
+    end = datetime.combine(TABLE_END, datetime.min.time())
+    for k, since in enumerate(changes):
+        until = changes[k + 1] if k + 1 < len(changes) else end
+        offset = civil_utc_offset(since)
+        lo = since.toordinal() - TABLE_START.toordinal()
+        hi = until.toordinal() - TABLE_START.toordinal()
+        if since.hour or since.minute:
+            switch_minute[lo] = since.hour * 60 + since.minute
+            after[lo] = offset
+            lo += 1
+        before[lo:hi + 1] = offset   # until 당일 전환 전까지 포함
+        after[lo:hi] = offset
+    return CivilTimeTable(switch_minute, before, after)
+
+
+_TABLE: Optional[CivilTimeTable] = None
+
+
+def get_civil_time_table() -> CivilTimeTable:
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = build_civil_time_table()
+    return _TABLE
+
+
+def loaded_civil_time_table() -> Optional[CivilTimeTable]:
+    return _TABLE
+
+
+def install_civil_time_table(table: Optional[CivilTimeTable]) -> None:
+    """미리 만든 표(번들 / 공유 메모리 등)로 교체. None이면 다음 조회 때 다시 생성."""
+    global _TABLE
+    _TABLE = table
+
+
+def to_local_mean_time(wall: datetime, longitude: float) -> datetime:
+    return get_civil_time_table().to_local_mean_time(wall, longitude)
@@ -3,15 +3,40 @@
 GAN_10 = ['甲','乙','丙','丁','戊','己','庚','辛','壬','癸']
 JI_12 = ['子','丑','寅','卯','辰','巳','午','未','申','酉','戌','亥']
 
+# 시지 구간 (하루 중 분, 양 끝 포함) — 한국 민간 시각 기준
+# (표준시 동경 135도와 실제 태양시의 약 30분 차이가 경계에 이미 들어 있음: 子 23:30~01:29)
+SI_JI_RANGES = [((1410, 1439), '子'), ((0, 89), '子'), ((90, 209), '丑'), ((210, 329), '寅'),
+                ((330, 449), '卯'), ((450, 569), '辰'), ((570, 689), '巳'), ((690, 809), '午'),
+                ((810, 929), '未'), ((930, 1049), '申'), ((1050, 1169), '酉'), ((1170, 1289), '戌'),
+                ((1290, 1409), '亥')]
+
+# 0..1439분 → 시지 (모듈 로드 시 1회 생성)
+SI_JI_BY_MINUTE = tuple(
+    next(branch for (start, end), branch in SI_JI_RANGES if start <= m <= end)
+    for m in range(1440)
+)
+
+# 시지 구간 — 지방 평균태양시 기준 (보정된 시각용, 子 23:00~00:59)
+SOLAR_SI_JI_RANGES = [((1380, 1439), '子'), ((0, 59), '子')] + [
+    ((60 + 120 * i, 179 + 120 * i), ji) for i, ji in enumerate(JI_12[1:])
+]
+
+SOLAR_SI_JI_BY_MINUTE = tuple(
+    next(branch for (start, end), branch in SOLAR_SI_JI_RANGES if start <= m <= end)
+    for m in range(1440)
+)
+
 def get_si_ji_by_clock(hour, minute):
     total_min = hour * 60 + minute
-    ranges = [((1410, 1439), '子'), ((0, 89), '子'), ((90, 209), '丑'), ((210, 329), '寅'),
-              ((330, 449), '卯'), ((450, 569), '辰'), ((570, 689), '巳'), ((690, 809), '午'),
-              ((810, 929), '未'), ((930, 1049), '申'), ((1050, 1169), '酉'), ((1170, 1289), '戌'),
-              ((1290, 1409), '亥')]
-    for (start, end), branch in ranges:
-        if start <= total_min <= end:
-            return branch
+    if 0 <= total_min < 1440:
+        return SI_JI_BY_MINUTE[int(total_min)]
+    return '?'
+
+def get_si_ji_by_solar_time(hour, minute):
+    """지방 평균태양시(utils/solar_time.py 로 보정한 시각) → 시지. 경계 보정을 다시 하지 않는다."""
+    total_min = hour * 60 + minute
+    if 0 <= total_min < 1440:
+        return SOLAR_SI_JI_BY_MINUTE[int(total_min)]
     return '?'
 
 def get_hour_gan(day_gan, hour_ji):
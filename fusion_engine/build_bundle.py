@@ -0,0 +1,110 @@
+"""
+fusion_engine/build_bundle.py
+
+엔진 데이터 번들 빌드 (tboo_runtime/data_bundle.py)
+  calculation.calendar     manselyeog_1900.csv        → 60갑자 코드 / 음력 배열
+  calculation.solar_terms  solar_terms_1900_2050.json → 절입 시각 epoch 초 / 오프셋 / 이름 코드 배열
+  meaning.lexicons         schemas/canonical/*.json   → 문자열 표 (shared_tables.pack_strings)
+- 원본 sha256 이 기존 번들 기록과 같으면 건너뜀 (--force 로 강제)
+- 배포 / 이미지 빌드 단계에서 한 번 실행하면 엔진 기동 시 파싱이 없어진다
+- 번들을 만드는 곳은 여기뿐 — 엔진 import 는 오래된 번들을 무시하고 원본을 읽을 뿐 다시 빌드하지 않는다
+
+    python fusion_engine/build_bundle.py            # build/tboo_data.bundle
+    python fusion_engine/build_bundle.py --check    # 최신이 아니면 exit 1
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from engines import BASE_DIR  # noqa: F401  (경로 설정)
+from engine.calendar_table import CALENDAR_CSV_PATH, build_calendar_table
+from engine.engine_core import LEXICON_FILES, SCHEMA_DIR, load_json
+from engine.saju_core import SOLAR_TERMS_JSON_PATH
+from engine.solar_term_table import SolarTermTable
+from tboo_runtime import clock
+from tboo_runtime.data_bundle import (
+    BUNDLE_FORMAT,
+    BUNDLE_VERSION,
+    bundle_path,
+    bundle_status,
+    source_fingerprint,
+)
+from tboo_runtime.shared_tables import MappedTables, pack_strings, write_tables
+
+
+def bundle_sources() -> Dict[str, Path]:
+    sources = {"calendar": CALENDAR_CSV_PATH, "solar_terms": SOLAR_TERMS_JSON_PATH}
+    sources.update((f"lexicon.{name}", SCHEMA_DIR / name) for name in LEXICON_FILES)
+    return sources
+
+
+def _recorded_hashes(path: Path) -> Optional[Dict[str, str]]:
+    try:
+        meta = MappedTables(path).meta
+    except (OSError, ValueError):
+        return None
+    if meta.get("format") != BUNDLE_FORMAT or meta.get("version") != BUNDLE_VERSION:
+        return None
+    return {name: s.get("sha256") for name, s in (meta.get("sources") or {}).items()}
+
+
+def build_bundle(path: Optional[Path] = None, force: bool = False) -> Dict[str, Any]:
+    path = Path(path) if path else bundle_path()
+    fingerprints = {name: source_fingerprint(p) for name, p in bundle_sources().items()}
+    hashes = {name: f["sha256"] for name, f in fingerprints.items()}
+
+    if not force and path.is_file() and _recorded_hashes(path) == hashes:
+        # 내용은 같고 mtime 만 바뀐 경우(checkout 등) 기록을 갱신하지 않아도 로드 시 sha256 으로 통과
+        return {"path": str(path), "built": False, "reason": "sources unchanged"}
+
+    t0 = time.perf_counter()
+    calendar = build_calendar_table(CALENDAR_CSV_PATH)
+    with open(SOLAR_TERMS_JSON_PATH, encoding="utf-8") as f:
+        solar_terms = SolarTermTable.from_json(json.load(f))
+    lexicons = tuple(load_json(SCHEMA_DIR / name) for name in LEXICON_FILES)
+
+    write_tables(
+        path,
+        {
+            "calculation.calendar": calendar.arrays(),
+            "calculation.solar_terms": solar_terms.arrays(),
+            "meaning.lexicons": pack_strings(lexicons),
+        },
+        meta={
+            "format": BUNDLE_FORMAT,
+            "version": BUNDLE_VERSION,
+            "built_at": clock.now().isoformat(),
+            "sources": fingerprints,
+        },
+    )
+    return {
+        "path": str(path),
+        "built": True,
+        "bytes": path.stat().st_size,
+        "seconds": round(time.perf_counter() - t0, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="TBOO data bundle builder")
+    parser.add_argument("--output", default=None, help="번들 경로 (기본: TBOO_DATA_BUNDLE 또는 build/tboo_data.bundle)")
+    parser.add_argument("--force", action="store_true", help="원본이 같아도 다시 빌드")
+    parser.add_argument("--check", action="store_true", help="빌드하지 않고 최신 여부만 확인 (최신 아니면 exit 1)")
+    args = parser.parse_args()
+    path = Path(args.output).expanduser().resolve() if args.output else None
+
+    if args.check:
+        status, _ = bundle_status(path)
+        print(json.dumps({"path": str(path or bundle_path()), "status": status}, ensure_ascii=False))
+        return 0 if status == "fresh" else 1
+
+    print(json.dumps(build_bundle(path, force=args.force), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,24 @@
+import argparse
 import json
+import sys
+import time
 from pathlib import Path
-from datetime import datetime
+from typing import Optional
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from contract_refs import compact_meaning_evidence, expand_contract
+from contract_validator import validate_contract
+from stream_fusion import DEFAULT_KEY_FIELDS, run_stream_fusion
+from tboo_runtime import clock
+from tboo_runtime.clock import add_clock_arguments, clock_from_args, set_clock
+from tboo_runtime.output_writer import get_output_writer
+from tboo_runtime.profiling import add_profiling_arguments, profiling_session_from_args
+from tboo_runtime.tracing import StageTracer, attach_trace, enable_tracing, lap_timer, stage
+
+CONTRACT_VERSIONS = ("1.0", "1.1")
 
 
 def load_json(path: Path) -> dict:
@@ -8,8 +26,8 @@ def load_json(path: Path) -> dict:
         return json.load(f)
 
 
-def latest_json_in(dir_path: Path) -> Path:
-    candidates = sorted(dir_path.glob("*.json"))
+def latest_json_in(dir_path: Path, pattern: str = "*.json") -> Path:
+    candidates = sorted(dir_path.glob(pattern))
     if not candidates:
         raise FileNotFoundError(f"No json files in {dir_path}")
     return candidates[-1]
@@ -18,58 +36,247 @@ def latest_json_in(dir_path: Path) -> Path:
 def build_interpretation_contract(
     calculation_json: dict,
     meaning_json: dict,
+    version: str = "1.0",
+    validate: bool = False,
+    validate_documents: bool = True,
 ) -> dict:
     """
-    TBOO_INTERPRETATION_CONTRACT_v1.0
+    TBOO_INTERPRETATION_CONTRACT_v1.0 / v1.1
     - calculation: 사주 계산 엔진 결과 (fact)
     - meaning: 의미 엔진 결과 (frame)
+    - v1.1: meaning evidence가 calculation 필드를 JSON Pointer로 참조
+            (expand_contract()로 v1.0 복원)
+    - validate=True: contracts/tboo_interpretation_contract_v1.json 스키마 검사
+                     (봉투 / meta / calculation / meaning 문서 전체 / evidence 참조,
+                      실패 시 ContractValidationError)
+    - validate_documents=False: 문서는 최상위 필수 키만 검사
     """
-    return {
-        "meta": {
-            "contract": "TBOO_INTERPRETATION_CONTRACT",
-            "version": "1.0",
-            "generated_at": datetime.now().isoformat(),
-            "engine_stack": {
-                "calculation_engine": "TBOO_SAJU_ENGINE",
-                "meaning_engine": "TBOO_MEANING_ENGINE",
-            },
-            "language": "ko",
-            "timezone": "Asia/Seoul",
+    if version not in CONTRACT_VERSIONS:
+        raise ValueError(f"Unknown contract version: {version!r}")
+
+    laps = lap_timer("build_interpretation_contract")
+    meta = {
+        "contract": "TBOO_INTERPRETATION_CONTRACT",
+        "version": version,
+        "generated_at": clock.now().isoformat(),
+        "engine_stack": {
+            "calculation_engine": "TBOO_SAJU_ENGINE",
+            "meaning_engine": "TBOO_MEANING_ENGINE",
         },
+        "language": "ko",
+        "timezone": "Asia/Seoul",
+    }
+
+    if version == "1.1":
+        meta["evidence_refs"] = "json-pointer"
+        meaning_json = compact_meaning_evidence(meaning_json, calculation_json)
+        laps.lap("compact_refs")
+
+    contract = {
+        "meta": meta,
         "calculation": calculation_json,
         "meaning": meaning_json,
     }
+    if validate:
+        validate_contract(contract, documents=validate_documents)
+        laps.lap("validate")
+    laps.done()
+    return contract
+
+
+# ------------------------------------------------------------
+# v1.0 vs v1.1 크기/지연 비교 (output/ 샘플 기준)
+# ------------------------------------------------------------
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def compare_contract_formats(calculation_json: dict, meaning_json: dict, repeat: int = 200) -> dict:
+    v10 = build_interpretation_contract(calculation_json, meaning_json, "1.0")
+    v11 = build_interpretation_contract(calculation_json, meaning_json, "1.1")
+
+    def size(obj, **kw) -> int:
+        return len(json.dumps(obj, ensure_ascii=False, **kw).encode("utf-8"))
+
+    return {
+        "bytes_indent2": {"1.0": size(v10, indent=2), "1.1": size(v11, indent=2)},
+        "bytes_compact": {
+            "1.0": size(v10, separators=(",", ":")),
+            "1.1": size(v11, separators=(",", ":")),
+        },
+        "build_us": {
+            "1.0": _best_of(lambda: build_interpretation_contract(calculation_json, meaning_json, "1.0"), repeat) * 1e6,
+            "1.1": _best_of(lambda: build_interpretation_contract(calculation_json, meaning_json, "1.1"), repeat) * 1e6,
+        },
+        "expand_us": _best_of(lambda: expand_contract(v11), repeat) * 1e6,
+        "roundtrip_ok": expand_contract(v11)["meaning"] == v10["meaning"],
+    }
+
+
+def run_compare(contract_dir: Path) -> None:
+    paths = sorted(contract_dir.glob("tboo_interpretation_contract_*.json"))
+    if not paths:
+        raise FileNotFoundError(f"No contract samples in {contract_dir}")
+
+    for path in paths:
+        sample = load_json(path)
+        result = compare_contract_formats(sample["calculation"], sample["meaning"])
+        b10, b11 = result["bytes_indent2"]["1.0"], result["bytes_indent2"]["1.1"]
+        print(f"📄 {path.name}")
+        print(f"   bytes (indent=2): v1.0={b10:,}  v1.1={b11:,}  (-{(1 - b11 / b10) * 100:.1f}%)")
+        c10, c11 = result["bytes_compact"]["1.0"], result["bytes_compact"]["1.1"]
+        print(f"   bytes (compact) : v1.0={c10:,}  v1.1={c11:,}  (-{(1 - c11 / c10) * 100:.1f}%)")
+        print(
+            f"   build: v1.0={result['build_us']['1.0']:.1f}µs  "
+            f"v1.1={result['build_us']['1.1']:.1f}µs  "
+            f"expand v1.1→v1.0={result['expand_us']:.1f}µs  "
+            f"roundtrip={'OK' if result['roundtrip_ok'] else 'MISMATCH'}"
+        )
 
 
 def main():
-    base_dir = Path(__file__).resolve().parents[1]
+    parser = argparse.ArgumentParser(description="TBOO interpretation contract fusion")
+    parser.add_argument(
+        "--contract-version",
+        choices=CONTRACT_VERSIONS,
+        default="1.0",
+        help="1.1: meaning evidence를 calculation JSON Pointer 참조로 출력",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="output/ 샘플 계약으로 v1.0 / v1.1 크기·지연 비교만 수행",
+    )
+    # 배치 모드: subject key 조인
+    parser.add_argument("--calculation-jsonl", default=None, help="calculation 결과 JSONL")
+    parser.add_argument("--meaning-jsonl", default=None, help="meaning 결과 JSONL")
+    parser.add_argument("--output", default=None, help="계약 JSONL 출력 경로")
+    parser.add_argument(
+        "--unmatched-report",
+        default=None,
+        help="매칭 실패 보고서 JSONL (기본: <output>.unmatched.jsonl)",
+    )
+    parser.add_argument(
+        "--key-fields",
+        default=",".join(DEFAULT_KEY_FIELDS),
+        help="subject_id가 없을 때 사용할 user_info 필드 (쉼표 구분)",
+    )
+    parser.add_argument("--max-pending", type=int, default=10000, help="짝 대기 레코드 상한")
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="계약 스키마 검사 생략 (기본: 생성 시 봉투 / meta / 문서 전체 / evidence 참조 검사)",
+    )
+    parser.add_argument(
+        "--envelope-only",
+        action="store_true",
+        help="calculation / meaning 문서는 최상위 필수 키만 검사 (봉투 / meta / evidence 참조는 그대로)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="단계별 소요 시간 기록 (단건: meta.trace 에 첨부 / 배치: 전체 누적 요약 출력)",
+    )
+    parser.add_argument(
+        "--trace-export",
+        default=None,
+        help="단계별 트레이스 저장 경로 (*.prom: Prometheus text, 그 외: JSON)",
+    )
+    add_clock_arguments(parser)
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+    tracer = enable_tracing() if args.trace or args.trace_export else None
+    set_clock(clock_from_args(args))
 
-    # ✅ 실제 엔진 출력 폴더
-    calculation_dir = base_dir / "calculation_engine" / "output"
-    meaning_dir = base_dir / "meaning_engine" / "output"
+    if args.calculation_jsonl or args.meaning_jsonl:
+        if not (args.calculation_jsonl and args.meaning_jsonl and args.output):
+            parser.error("--calculation-jsonl, --meaning-jsonl, --output 을 함께 지정하세요")
 
-    calculation_path = latest_json_in(calculation_dir)
-    meaning_path = latest_json_in(meaning_dir)
+    # 배치 모드에서는 프로파일이 전체 레코드를 합산
+    with profiling_session_from_args(args):
+        run(args, tracer)
 
-    calculation = load_json(calculation_path)
-    meaning = load_json(meaning_path)
 
-    contract = build_interpretation_contract(calculation, meaning)
+def run(args: argparse.Namespace, tracer: Optional[StageTracer]) -> None:
+    if args.calculation_jsonl:
+        output_path = Path(args.output).expanduser().resolve()
+        report_path = (
+            Path(args.unmatched_report).expanduser().resolve()
+            if args.unmatched_report
+            else output_path.with_suffix(".unmatched.jsonl")
+        )
+        stats = run_stream_fusion(
+            Path(args.calculation_jsonl).expanduser().resolve(),
+            Path(args.meaning_jsonl).expanduser().resolve(),
+            output_path,
+            report_path,
+            lambda c, m: build_interpretation_contract(
+                c, m, args.contract_version,
+                validate=not args.no_validate, validate_documents=not args.envelope_only,
+            ),
+            key_fields=tuple(k for k in args.key_fields.split(",") if k),
+            max_pending=args.max_pending,
+        )
+        print("✅ Stream fusion complete")
+        print(f"   matched   : {stats['matched']:,}")
+        print(f"   unmatched : {stats['unmatched']:,} (evicted={stats['evicted']:,}, duplicate={stats['duplicate']:,})")
+        print(f"   invalid   : {stats['invalid']:,}")
+        print(f"   output    : {output_path}")
+        print(f"   report    : {report_path}")
+        if args.trace:
+            print(tracer.to_json(indent=2))
+        if args.trace_export:
+            tracer.write(Path(args.trace_export).expanduser().resolve())
+        return
 
     # ✅ 루트 output 폴더
-    output_dir = base_dir / "output"
+    output_dir = BASE_DIR / "output"
+
+    if args.compare:
+        run_compare(output_dir)
+        return
+
+    # ✅ 실제 엔진 출력 폴더
+    calculation_dir = BASE_DIR / "calculation_engine" / "output"
+    meaning_dir = BASE_DIR / "meaning_engine" / "output"
+
+    calculation_path = latest_json_in(calculation_dir, "*_saju_v33_*.json")
+    meaning_path = latest_json_in(meaning_dir, "meaning_v1_*.json")
+
+    with stage("json_decode"):
+        calculation = load_json(calculation_path)
+        meaning = load_json(meaning_path)
+
+    contract = build_interpretation_contract(
+        calculation, meaning, args.contract_version,
+        validate=not args.no_validate, validate_documents=not args.envelope_only,
+    )
+    if args.trace:
+        attach_trace(contract, tracer)
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = clock.now().strftime("%Y%m%d_%H%M%S")
     out_path = output_dir / f"tboo_interpretation_contract_{timestamp}.json"
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(contract, f, ensure_ascii=False, indent=2)
+    writer = get_output_writer()
+    with stage("json_encode"):
+        writer.write_file(out_path, json.dumps(contract, ensure_ascii=False, indent=2))
+    writer.flush()
 
     print("✅ Fusion complete")
     print(f"   calculation: {calculation_path.name}")
     print(f"   meaning     : {meaning_path.name}")
+    print(f"   version     : {args.contract_version}")
     print(f"   output      : {out_path}")
+    if args.trace_export:
+        tracer.write(Path(args.trace_export).expanduser().resolve())
+        print(f"   trace       : {args.trace_export}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,209 @@
+"""
+fusion_engine/contract_refs.py
+
+TBOO_INTERPRETATION_CONTRACT v1.1 — evidence by reference
+- meaning.evidence (및 subject)가 calculation 필드를 복사하는 대신
+  JSON Pointer(RFC 6901) 참조 {"$ref": "#/calculation/..."} 로 가리킨다.
+- expand_contract()는 v1.1 → v1.0 (참조 해제, 복사본 재구성)
+"""
+
+from typing import Any, Dict, List
+
+REF_KEY = "$ref"
+
+
+# ------------------------------------------------------------
+# JSON Pointer
+# ------------------------------------------------------------
+def escape_pointer_token(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def unescape_pointer_token(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def resolve_pointer(doc: Any, pointer: str) -> Any:
+    """'#/calculation/saju' 또는 '/calculation/saju' 형태를 해석."""
+    if pointer.startswith("#"):
+        pointer = pointer[1:]
+    if pointer == "":
+        return doc
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON Pointer: {pointer!r}")
+
+    cur = doc
+    for raw in pointer[1:].split("/"):
+        token = unescape_pointer_token(raw)
+        if isinstance(cur, list):
+            cur = cur[int(token)]
+        elif isinstance(cur, dict):
+            cur = cur[token]
+        else:
+            raise KeyError(f"Cannot resolve {pointer!r} at {token!r}")
+    return cur
+
+
+def is_ref(node: Any) -> bool:
+    return isinstance(node, dict) and len(node) == 1 and REF_KEY in node
+
+
+# ------------------------------------------------------------
+# v1.0 → v1.1
+# ------------------------------------------------------------
+# meaning 컨텍스트별 evidence 출처 (calculation 기준 포인터)
+# - 값이 실제로 같을 때만 참조로 바꾼다 (다르면 복사본 유지)
+# - 출처가 없는 컨텍스트 / 필드는 복사본 그대로 (같은 값을 문서 전체에서 찾지 않는다
+#   — 우연히 같은 무관한 값을 가리키게 되고, 비용도 calculation 크기에 비례)
+EVIDENCE_SOURCES: Dict[str, Any] = {
+    "natal": {"pillars": "/saju", "sipshin": "/sipshin", "unseong": "/unseong"},
+    "fortune_2026_overall": "/year_2026_operation",
+    "fortune_2026_money": "/year_2026_operation/money",
+    "fortune_2026_love": "/year_2026_operation/love",
+    "fortune_2026_job": "/year_2026_operation/job",
+    "today": "/today",
+    "month_operation": "/month_operation",
+}
+
+SUBJECT_SOURCE = "/user_info"
+
+
+def evidence_source(ctx: str, calculation_json: Dict[str, Any]) -> Any:
+    """컨텍스트의 evidence 포인터 (daeun_<i> / year_<YYYY> 는 해당 항목 위치)."""
+    if ctx in EVIDENCE_SOURCES:
+        return EVIDENCE_SOURCES[ctx]
+    kind, _, key = ctx.partition("_")
+    if kind == "daeun" and key.isdigit():
+        return f"/daeun_detail/{key}"
+    if kind == "year" and key.isdigit():
+        for i, entry in enumerate(calculation_json.get("year_flow") or []):
+            if entry.get("year") == int(key):
+                return f"/year_flow/{i}"
+    return None
+
+
+def same_json(a: Any, b: Any) -> bool:
+    """타입까지 같은 JSON 값인지 (== 와 달리 1 / 1.0 / True 를 구분, list 와 tuple 은 같은 배열)."""
+    if isinstance(a, (list, tuple)):
+        return (
+            isinstance(b, (list, tuple))
+            and len(a) == len(b)
+            and all(same_json(x, y) for x, y in zip(a, b))
+        )
+    if isinstance(a, dict):
+        return (
+            isinstance(b, dict)
+            and a.keys() == b.keys()
+            and all(same_json(v, b[k]) for k, v in a.items())
+        )
+    return type(a) is type(b) and a == b
+
+
+def _ref_or_value(node: Any, calculation_json: Dict[str, Any], hint: Any, base: str) -> Any:
+    if not isinstance(node, (dict, list)) or not node:
+        return node
+
+    if isinstance(hint, dict) and isinstance(node, dict):
+        return {
+            k: _ref_or_value(v, calculation_json, hint.get(k), base)
+            for k, v in node.items()
+        }
+
+    if isinstance(hint, str):
+        try:
+            if same_json(resolve_pointer(calculation_json, hint), node):
+                return {REF_KEY: f"#{base}{hint}"}
+        except (KeyError, IndexError, ValueError):
+            pass
+    return node
+
+
+def compact_meaning_evidence(
+    meaning_json: Dict[str, Any],
+    calculation_json: Dict[str, Any],
+    base: str = "/calculation",
+) -> Dict[str, Any]:
+    """meaning_payload.*.evidence (+ subject) 를 calculation 참조로 치환한 meaning 사본."""
+    out = dict(meaning_json)
+    if "subject" in meaning_json:
+        out["subject"] = _ref_or_value(
+            meaning_json["subject"], calculation_json, SUBJECT_SOURCE, base
+        )
+    out["meaning_payload"] = {
+        ctx: {
+            **body,
+            "evidence": _ref_or_value(
+                body.get("evidence"), calculation_json, evidence_source(ctx, calculation_json), base
+            ),
+        }
+        if isinstance(body, dict) and "evidence" in body
+        else body
+        for ctx, body in (meaning_json.get("meaning_payload", {}) or {}).items()
+    }
+    return out
+
+
+# ------------------------------------------------------------
+# v1.1 → v1.0
+# ------------------------------------------------------------
+def _copy_json(node: Any) -> Any:
+    if isinstance(node, dict):
+        return {k: _copy_json(v) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_copy_json(v) for v in node]
+    return node
+
+
+def expand_refs(node: Any, root: Dict[str, Any]) -> Any:
+    if is_ref(node):
+        return _copy_json(resolve_pointer(root, node[REF_KEY]))
+    if isinstance(node, dict):
+        return {k: expand_refs(v, root) for k, v in node.items()}
+    if isinstance(node, list):
+        return [expand_refs(v, root) for v in node]
+    return node
+
+
+def expand_contract(contract: Dict[str, Any]) -> Dict[str, Any]:
+    """v1.1 계약을 v1.0 소비자용으로 확장 (v1.0이면 그대로 반환)."""
+    meta = contract.get("meta", {}) or {}
+    if meta.get("version") != "1.1":
+        return contract
+
+    expanded_meta = {k: v for k, v in meta.items() if k != "evidence_refs"}
+    expanded_meta["version"] = "1.0"
+
+    # 참조는 subject / meaning_payload.*.evidence 에만 존재
+    meaning = dict(contract.get("meaning", {}) or {})
+    if "subject" in meaning:
+        meaning["subject"] = expand_refs(meaning["subject"], contract)
+    meaning["meaning_payload"] = {
+        ctx: {**body, "evidence": expand_refs(body.get("evidence"), contract)}
+        if isinstance(body, dict) and "evidence" in body
+        else body
+        for ctx, body in (meaning.get("meaning_payload", {}) or {}).items()
+    }
+
+    return {
+        **contract,
+        "meta": expanded_meta,
+        "meaning": meaning,
+    }
+
+
+def find_ref_targets(contract: Dict[str, Any]) -> List[str]:
+    """검증/디버그용: 계약 안의 모든 참조 포인터 목록."""
+    out: List[str] = []
+
+    def walk(node: Any) -> None:
+        if is_ref(node):
+            out.append(node[REF_KEY])
+        elif isinstance(node, dict):
+            for v in node.values():
+                walk(v)
+        elif isinstance(node, list):
+            for v in node:
+                walk(v)
+
+    walk(contract.get("meaning", {}))
+    return out
@@ -0,0 +1,606 @@
+"""
+fusion_engine/contract_validator.py
+
+contracts/tboo_interpretation_contract_v1.json 스키마를 한 번만 컴파일해
+전용 검사 함수(파이썬 코드)로 만든다. 호출마다 스키마를 해석하지 않는다.
+
+검사 함수는 두 단계:
+  빠른 경로 — 노드마다 불리언 식 하나 (필수 키 / 위치는 바로 꺼내 KeyError · IndexError 로,
+              enum 은 바로 집합 조회), 항목 / 값 반복만 문장으로
+  느린 경로 — 빠른 검사가 실패했을 때만 키워드별로 다시 검사해 첫 위반의 경로 / 메시지를 만든다
+엔진이 만든 정상 문서는 빠른 경로 한 번으로 끝나므로 계약마다 문서 전체를 검사한다.
+
+지원 키워드 (JSON Schema 2020-12 부분집합)
+  type / enum / const / required / properties / additionalProperties
+  items / prefixItems / minItems / maxItems / minLength / maxLength
+  anyOf / $ref ("#/$defs/<name>")
+
+사용:
+  validate_contract(contract)        # TBOO_INTERPRETATION_CONTRACT v1.0 / v1.1 — 문서 전체 (+ evidence 참조)
+  validate_contract(contract, documents=False)  # 봉투 / meta / evidence 참조만 (문서는 최상위 필수 키만)
+  validate_calculation(calc_json)    # build_tboo_json_v33 결과
+  validate_meaning(meaning_json)     # run_engine 결과
+실패 시 ContractValidationError(ValueError) — .path 는 JSON Pointer
+"""
+
+import copy
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from contract_refs import is_ref, resolve_pointer, REF_KEY
+from tboo_runtime.memory import register_resident
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+CONTRACT_SCHEMA_PATH = BASE_DIR / "contracts" / "tboo_interpretation_contract_v1.json"
+
+# 직렬화 전 dict도 검사하므로 tuple도 배열로 취급
+_PY_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+    "object": (dict,),
+    "array": (list, tuple),
+}
+
+
+def _py_types(types: Any) -> tuple:
+    """JSON Schema type (문자열 / 목록) → 파이썬 타입 튜플 (bool 은 integer 가 아님)."""
+    names = [types] if isinstance(types, str) else list(types)
+    return tuple(t for name in names for t in _PY_TYPES[name])
+
+
+class ContractValidationError(ValueError):
+    def __init__(self, path: str, message: str):
+        self.path = path
+        self.message = message
+        super().__init__(f"{path or '/'}: {message}")
+
+    def prefix(self, path: str) -> None:
+        self.path = path + self.path
+        self.args = (f"{self.path or '/'}: {self.message}",)
+
+
+# ------------------------------------------------------------
+# 코드 생성
+# ------------------------------------------------------------
+class _Fallback(Exception):
+    """빠른 검사 실패 → 키워드별 검사로 넘어간다 (외부로 나가지 않음)."""
+
+
+# 빠른 검사는 필수 키 / 위치를 바로 꺼내고 enum 은 바로 집합 조회한다
+# (없는 키 KeyError, 짧은 배열 IndexError, 해시 불가 값 TypeError 도 실패로 본다)
+_FALLBACK = (_Fallback, LookupError, TypeError)
+
+
+class _Compiler:
+    def __init__(self, schema: Dict[str, Any]):
+        self.defs = schema.get("$defs", {})
+        self.consts: Dict[str, Any] = {}
+        self.lines: List[str] = []
+        self.functions: List[str] = []
+        self.inlining: List[str] = []
+        self.shared: set = set()
+        self.counter = 0
+
+    # 상수 (enum 집합, 허용 키 집합 등)는 네임스페이스로 넘긴다
+    def const(self, value: Any) -> str:
+        name = f"_C{len(self.consts)}"
+        self.consts[name] = value
+        return name
+
+    def var(self) -> str:
+        self.counter += 1
+        return f"x{self.counter}"
+
+    def fail(self, path: str, message: str) -> str:
+        return f"raise _Err({path}, {message!r})"
+
+    def type_test(self, types: Any, x: str) -> str:
+        py_types = _py_types(types)
+        if py_types == (type(None),):
+            return f"{x} is None"
+        if len(py_types) == 1:
+            return f"type({x}) is {py_types[0].__name__}"
+        return f"type({x}) in {self.const(frozenset(py_types))}"
+
+    # --------------------------------------------------------
+    # 빠른 검사: 노드마다 불리언 식 하나, 반복만 문장으로 (실패 시 raise _Fallback)
+    # --------------------------------------------------------
+    def bind(self, expr: str, v: str, subject: str) -> str:
+        """expr 안의 자리표시 변수 v 를 subject 로. 두 번 이상 쓰이면 처음 한 번만 평가 (:=)."""
+        pattern = rf"\b{v}\b"
+        if len(re.findall(pattern, expr)) <= 1:
+            return re.sub(pattern, lambda _: subject, expr)
+        # 첫 등장은 항상 가장 왼쪽 피연산자(타입 검사 등)라 가장 먼저, 반드시 평가된다
+        return re.sub(pattern, lambda _: f"({v} := {subject})", expr, count=1)
+
+    def fast(self, schema: Any, x: str, shallow: bool = False) -> Optional[str]:
+        """
+        x 가 schema 를 만족하면 True 인 식 (필수 키 / 위치가 없거나 enum 값이 해시 불가면 _FALLBACK 예외).
+        식 하나로 못 만드는 부분(항목 / 값마다 도는 반복, 재귀 $ref)이 있으면 None.
+        shallow=True: 그런 부분은 빼고 만든다 (check 가 문장으로 따로 검사).
+        """
+        if schema is True or schema == {}:
+            return "True"
+
+        if "$ref" in schema:
+            name = schema["$ref"].split("/")[-1]
+            if name in self.shared:
+                return f"f_{name}({x}) is None"
+            if name in self.inlining:
+                return None
+            self.inlining.append(name)
+            try:
+                return self.fast(self.defs[name], x, shallow)
+            finally:
+                self.inlining.pop()
+
+        parts: List[str] = []
+        if "anyOf" in schema:
+            alts = [self.alternative(alt) for alt in schema["anyOf"]]
+            parts.append("(" + " or ".join(f"{a}({x})" for a in alts) + ")")
+        if "const" in schema:
+            parts.append(f"{x} == {self.const(schema['const'])}")
+        if "enum" in schema:
+            parts.append(f"{x} in {self.const(frozenset(schema['enum']))}")
+
+        types = schema.get("type")
+        type_list = [] if types is None else [types] if isinstance(types, str) else list(types)
+        if type_list:
+            parts.append(f"({self.type_test(type_list, x)})")
+
+        def add(kind: str, conds: List[str]) -> None:
+            if not conds:
+                return
+            body = " and ".join(conds)
+            if type_list == [kind]:
+                parts.append(body)
+            else:
+                parts.append(f"(not ({self.type_test(kind, x)}) or ({body}))")
+
+        add("string", self.length_conds(x, schema.get("minLength"), schema.get("maxLength")))
+
+        if any(k in schema for k in ("required", "properties", "additionalProperties")):
+            conds = self.object_conds(schema, x, shallow)
+            if conds is None:
+                return None
+            add("object", conds)
+
+        if any(k in schema for k in ("items", "prefixItems", "minItems", "maxItems")):
+            conds = self.array_conds(schema, x, shallow)
+            if conds is None:
+                return None
+            add("array", conds)
+
+        return " and ".join(parts) or "True"
+
+    def length_conds(self, x: str, lo: Optional[int], hi: Optional[int]) -> List[str]:
+        if lo is not None and lo == hi:
+            return [f"len({x}) == {int(lo)}"]
+        conds = []
+        if lo is not None:
+            conds.append(f"len({x}) >= {int(lo)}")
+        if hi is not None:
+            conds.append(f"len({x}) <= {int(hi)}")
+        return conds
+
+    def object_conds(self, schema: Dict[str, Any], x: str, shallow: bool) -> Optional[List[str]]:
+        conds = []
+        required = schema.get("required", [])
+        properties = schema.get("properties", {})
+        checked = set()
+        for key, sub in properties.items():
+            v = self.var()
+            expr = self.fast(sub, v)
+            if expr is None:
+                if shallow:
+                    checked.add(key)   # check_nested 가 x[key] 로 꺼낸다
+                    continue
+                return None
+            if expr == "True":
+                continue
+            checked.add(key)
+            expr = self.bind(expr, v, f"{x}[{key!r}]")
+            conds.append(f"({expr})" if key in required else f"({key!r} not in {x} or ({expr}))")
+        # 스키마 없는 필수 키는 존재만 (나머지는 x[key] 가 KeyError 로 검사)
+        conds[:0] = [f"{key!r} in {x}" for key in required if key not in checked]
+
+        extra = schema.get("additionalProperties", True)
+        if extra is False:
+            conds.append(f"{x}.keys() <= {self.const(frozenset(properties))}")
+        elif extra is not True and not shallow:
+            return None
+        return conds
+
+    def array_conds(self, schema: Dict[str, Any], x: str, shallow: bool) -> Optional[List[str]]:
+        lo = schema.get("minItems")
+        conds = self.length_conds(x, lo, schema.get("maxItems"))
+        for i, sub in enumerate(schema.get("prefixItems", [])):
+            v = self.var()
+            expr = self.fast(sub, v)
+            if expr is None:
+                if shallow:
+                    continue
+                return None
+            if expr == "True":
+                continue
+            expr = self.bind(expr, v, f"{x}[{i}]")
+            # minItems 로 이미 길이가 보장된 위치는 길이 검사 생략
+            conds.append(f"({expr})" if i < (lo or 0) else f"(len({x}) <= {i} or ({expr}))")
+
+        items = schema.get("items")
+        if items is not None and items is not True and items != {} and not shallow:
+            return None
+        return conds
+
+    def check(self, schema: Any, x: str, ind: str) -> None:
+        if schema is True or schema == {}:
+            return
+        if "$ref" in schema:
+            name = schema["$ref"].split("/")[-1]
+            if name in self.inlining or name in self.shared:
+                self.lines.append(f"{ind}f_{name}({x})")
+                return
+            self.inlining.append(name)
+            self.check(self.defs[name], x, ind)
+            self.inlining.pop()
+            return
+        expr = self.fast(schema, x, shallow=True)
+        if expr != "True":
+            self.lines.append(f"{ind}if not ({expr}):")
+            self.lines.append(f"{ind}    raise _Fallback")
+        self.check_nested(schema, x, ind)
+
+    def expressible(self, schema: Any) -> bool:
+        return self.fast(schema, "_") is not None
+
+    def check_nested(self, schema: Dict[str, Any], x: str, ind: str) -> None:
+        """fast(shallow=True) 가 빼 놓은 부분(반복 / 식으로 못 만든 하위 노드)을 문장으로."""
+        out = self.lines.append
+        types = schema.get("type")
+        type_list = [] if types is None else [types] if isinstance(types, str) else list(types)
+
+        if any(k in schema for k in ("required", "properties", "additionalProperties")):
+            sub = ind
+            if type_list != ["object"]:
+                out(f"{ind}if type({x}) is dict:")
+                sub = ind + "    "
+            required = schema.get("required", [])
+            properties = schema.get("properties", {})
+            for key, prop in properties.items():
+                if self.expressible(prop):
+                    continue
+                v = self.var()
+                if key in required:
+                    out(f"{sub}{v} = {x}[{key!r}]")
+                    self.check(prop, v, sub)
+                else:
+                    out(f"{sub}{v} = {x}.get({key!r}, _MISSING)")
+                    out(f"{sub}if {v} is not _MISSING:")
+                    self.check(prop, v, sub + "    ")
+            extra = schema.get("additionalProperties", True)
+            if extra is not True and extra is not False:
+                v = self.var()
+                if properties:
+                    k = self.var()
+                    out(f"{sub}for {k}, {v} in {x}.items():")
+                    out(f"{sub}    if {k} in {self.const(frozenset(properties))}:")
+                    out(f"{sub}        continue")
+                else:
+                    out(f"{sub}for {v} in {x}.values():")
+                self.check(extra, v, sub + "    ")
+
+        if any(k in schema for k in ("items", "prefixItems", "minItems", "maxItems")):
+            sub = ind
+            if type_list != ["array"]:
+                out(f"{ind}if {self.type_test('array', x)}:")
+                sub = ind + "    "
+            prefix = schema.get("prefixItems", [])
+            for i, item in enumerate(prefix):
+                if self.expressible(item):
+                    continue
+                v = self.var()
+                out(f"{sub}if len({x}) > {i}:")
+                out(f"{sub}    {v} = {x}[{i}]")
+                self.check(item, v, sub + "    ")
+            items = schema.get("items")
+            if items is not None and items is not True and items != {}:
+                v = self.var()
+                start = f"{x}[{len(prefix)}:]" if prefix else x
+                out(f"{sub}for {v} in {start}:")
+                self.check(items, v, sub + "    ")
+
+    def alternative(self, schema: Any) -> str:
+        """anyOf 후보 하나 → 만족 여부(bool)를 돌려주는 함수 이름."""
+        self.counter += 1
+        name = f"_alt{self.counter}"
+        outer, self.lines = self.lines, []
+        self.check(schema, "x0", "        ")
+        body = self.lines or ["        pass"]
+        self.lines = outer
+        self.functions.extend(
+            [f"def {name}(x0):", "    try:"] + body
+            + ["    except _FALLBACK:", "        return False", "    return True", ""]
+        )
+        return name
+
+    # --------------------------------------------------------
+    # 느린 검사: 키워드별로 — 첫 위반의 경로 / 메시지
+    # --------------------------------------------------------
+    def emit(self, schema: Any, x: str, path: str, ind: str) -> None:
+        """schema 검사 코드를 x 에 대해 생성. path 는 에러 시에만 평가되는 식."""
+        out = self.lines.append
+        if schema is True or schema == {}:
+            return
+
+        if "$ref" in schema:
+            name = schema["$ref"].split("/")[-1]
+            # 재귀가 아니면 인라인 (함수 호출/try 비용 제거)
+            if name not in self.inlining:
+                self.inlining.append(name)
+                self.emit(self.defs[name], x, path, ind)
+                self.inlining.pop()
+                return
+            out(f"{ind}try:")
+            out(f"{ind}    s_{name}({x})")
+            out(f"{ind}except _Err as e:")
+            out(f"{ind}    e.prefix({path})")
+            out(f"{ind}    raise")
+            return
+
+        if "anyOf" in schema:
+            alts = []
+            for alt in schema["anyOf"]:
+                alts.append(self.subfunction(alt))
+            out(f"{ind}for _alt in ({', '.join(alts)},):")
+            out(f"{ind}    try:")
+            out(f"{ind}        _alt({x})")
+            out(f"{ind}        break")
+            out(f"{ind}    except _Err:")
+            out(f"{ind}        pass")
+            out(f"{ind}else:")
+            out(f"{ind}    {self.fail(path, 'no anyOf alternative matched')}")
+
+        if "const" in schema:
+            expected = schema["const"]
+            out(f"{ind}if {x} != {self.const(expected)}:")
+            out(f"{ind}    {self.fail(path, f'expected {expected!r}')}")
+
+        if "enum" in schema:
+            allowed = schema["enum"]
+            out(f"{ind}if type({x}).__hash__ is None or {x} not in {self.const(frozenset(allowed))}:")
+            out(f"{ind}    {self.fail(path, f'not one of {allowed!r}')}")
+
+        types = schema.get("type")
+        if types is not None:
+            type_list = [types] if isinstance(types, str) else list(types)
+            out(f"{ind}if not ({self.type_test(type_list, x)}):")
+            out(f"{ind}    {self.fail(path, f'expected type {types}')}")
+        else:
+            type_list = []
+
+        # 타입별 세부 검사 (여러 타입 허용 시 해당 타입일 때만)
+        multi = len(type_list) > 1
+
+        if "minLength" in schema or "maxLength" in schema:
+            guard = f"{ind}if type({x}) is str:" if multi or not type_list else None
+            sub = ind + "    " if guard else ind
+            if guard:
+                out(guard)
+            if "minLength" in schema:
+                out(f"{sub}if len({x}) < {int(schema['minLength'])}:")
+                out(f"{sub}    {self.fail(path, 'string too short')}")
+            if "maxLength" in schema:
+                out(f"{sub}if len({x}) > {int(schema['maxLength'])}:")
+                out(f"{sub}    {self.fail(path, 'string too long')}")
+
+        if any(k in schema for k in ("required", "properties", "additionalProperties")):
+            guard = multi or not type_list
+            sub = ind + "    " if guard else ind
+            if guard:
+                out(f"{ind}if type({x}) is dict:")
+            self.emit_object(schema, x, path, sub)
+
+        if any(k in schema for k in ("items", "prefixItems", "minItems", "maxItems")):
+            guard = multi or not type_list
+            sub = ind + "    " if guard else ind
+            if guard:
+                out(f"{ind}if type({x}) is list or type({x}) is tuple:")
+            self.emit_array(schema, x, path, sub)
+
+    def emit_object(self, schema: Dict[str, Any], x: str, path: str, ind: str) -> None:
+        out = self.lines.append
+        required = schema.get("required", [])
+        properties = schema.get("properties", {})
+
+        for key in required:
+            out(f"{ind}if {key!r} not in {x}:")
+            out(f"{ind}    {self.fail(path, f'missing required {key!r}')}")
+
+        for key, sub in properties.items():
+            if sub is True or sub == {}:
+                continue
+            v = self.var()
+            child = f"{path} + {'/' + key!r}"
+            if key in required:
+                out(f"{ind}{v} = {x}[{key!r}]")
+                self.emit(sub, v, child, ind)
+            else:
+                out(f"{ind}{v} = {x}.get({key!r}, _MISSING)")
+                out(f"{ind}if {v} is not _MISSING:")
+                self.emit(sub, v, child, ind + "    ")
+
+        extra = schema.get("additionalProperties", True)
+        if extra is True:
+            return
+        known = self.const(frozenset(properties))
+        k, v = self.var(), self.var()
+        out(f"{ind}for {k}, {v} in {x}.items():")
+        out(f"{ind}    if {k} in {known}:")
+        out(f"{ind}        continue")
+        child = f"{path} + '/' + {k}"
+        if extra is False:
+            out(f"{ind}    {self.fail(child, 'unexpected property')}")
+        else:
+            self.emit(extra, v, child, ind + "    ")
+
+    def emit_array(self, schema: Dict[str, Any], x: str, path: str, ind: str) -> None:
+        out = self.lines.append
+        if "minItems" in schema:
+            out(f"{ind}if len({x}) < {int(schema['minItems'])}:")
+            out(f"{ind}    {self.fail(path, 'too few items')}")
+        if "maxItems" in schema:
+            out(f"{ind}if len({x}) > {int(schema['maxItems'])}:")
+            out(f"{ind}    {self.fail(path, 'too many items')}")
+
+        prefix = schema.get("prefixItems", [])
+        for i, sub in enumerate(prefix):
+            v = self.var()
+            out(f"{ind}if len({x}) > {i}:")
+            out(f"{ind}    {v} = {x}[{i}]")
+            self.emit(sub, v, f"{path} + '/{i}'", ind + "    ")
+
+        items = schema.get("items")
+        if items is None or items is True or items == {}:
+            return
+        i, v = self.var(), self.var()
+        start = f"{x}[{len(prefix)}:]" if prefix else x
+        out(f"{ind}for {i}, {v} in enumerate({start}, {len(prefix)}):")
+        self.emit(items, v, f"{path} + '/' + str({i})", ind + "    ")
+
+    def function(self, name: str, schema: Any) -> None:
+        outer, self.lines = self.lines, []
+        self.emit(schema, "x0", "''", "    ")
+        body = self.lines or ["    pass"]
+        self.lines = outer
+        self.functions.extend([f"def {name}(x0):"] + body + [""])
+
+    def subfunction(self, schema: Any) -> str:
+        self.counter += 1
+        name = f"_sub{self.counter}"
+        self.function(name, schema)
+        return name
+
+    def fast_function(self, name: str, schema: Any) -> None:
+        outer, self.lines = self.lines, []
+        self.check(schema, "x0", "    ")
+        body = self.lines or ["    pass"]
+        self.lines = outer
+        self.functions.extend([f"def {name}(x0):"] + body + [""])
+
+    def compile(self) -> str:
+        for name, schema in self.defs.items():
+            self.inlining = [name]
+            self.fast_function(f"f_{name}", schema)
+            self.inlining = [name]
+            self.function(f"s_{name}", schema)
+            # 빠른 검사가 실패했을 때만 느린 검사로 (정상 문서는 f_ 한 번)
+            self.functions.extend([
+                f"def v_{name}(x0):",
+                "    try:",
+                f"        f_{name}(x0)",
+                "    except _FALLBACK:",
+                f"        s_{name}(x0)",
+                "",
+            ])
+        return "\n".join(self.functions)
+
+
+def compile_schema(schema: Dict[str, Any]) -> Dict[str, Callable[[Any], None]]:
+    """$defs 각각을 검사 함수로 컴파일. {"<def name>": fn(obj) -> None}"""
+    compiler = _Compiler(schema)
+    source = compiler.compile()
+    namespace: Dict[str, Any] = {
+        "_Err": ContractValidationError,
+        "_Fallback": _Fallback,
+        "_FALLBACK": _FALLBACK,
+        "_MISSING": object(),
+        "NoneType": type(None),
+        **compiler.consts,
+    }
+    exec(compile(source, "<tboo_contract_validator>", "exec"), namespace)
+    return {name: namespace[f"v_{name}"] for name in compiler.defs}
+
+
+def _with_envelope(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    contract_envelope: contract_v1 과 같되 calculation / meaning 은 객체 + 최상위 필수 키만 검사.
+    이미 검사한 문서를 다시 싸기만 할 때용 (validate_contract(documents=False)).
+    """
+    schema = copy.deepcopy(schema)
+    defs = schema["$defs"]
+    envelope = copy.deepcopy(defs["contract_v1"])
+    for key, sub in envelope["properties"].items():
+        name = sub.get("$ref", "").split("/")[-1] if isinstance(sub, dict) else ""
+        if key in ("calculation", "meaning") and name in defs:
+            envelope["properties"][key] = {"type": "object", "required": defs[name].get("required", [])}
+    defs["contract_envelope"] = envelope
+    return schema
+
+
+@lru_cache(maxsize=None)
+def compiled_validators(path: Path = CONTRACT_SCHEMA_PATH) -> Dict[str, Callable[[Any], None]]:
+    with open(path, "r", encoding="utf-8") as f:
+        return compile_schema(_with_envelope(json.load(f)))
+
+
+register_resident(
+    "fusion.contract_validators",
+    lambda: compiled_validators() if compiled_validators.cache_info().currsize else None,
+)
+
+
+# ------------------------------------------------------------
+# 공개 API
+# ------------------------------------------------------------
+def validate_calculation(calculation_json: Dict[str, Any]) -> None:
+    compiled_validators()["calculation_v3_3"](calculation_json)
+
+
+def validate_meaning(meaning_json: Dict[str, Any]) -> None:
+    compiled_validators()["meaning_slots_v1_1"](meaning_json)
+
+
+def validate_contract(contract: Dict[str, Any], documents: bool = True) -> None:
+    """
+    기본: 봉투 / meta / calculation / meaning 문서 전체 + (v1.1) evidence 참조 해석 가능 여부
+    documents=False: 문서는 최상위 필수 키만 (이미 검사한 문서를 다시 싸기만 할 때)
+    """
+    compiled_validators()["contract_v1" if documents else "contract_envelope"](contract)
+
+    # v1.1: evidence 참조가 실제로 해석되는지 확인
+    if contract["meta"]["version"] == "1.1":
+        _check_evidence_refs(contract)
+
+
+def _check_evidence_refs(contract: Dict[str, Any]) -> None:
+    """compact_meaning_evidence 가 만드는 참조 위치(subject, 컨텍스트 evidence 와 그 한 단계 아래)만 본다."""
+    meaning = contract["meaning"]
+
+    def check(node: Any, path: str) -> None:
+        pointer = node[REF_KEY]
+        try:
+            resolve_pointer(contract, pointer)
+        except (KeyError, IndexError, ValueError) as e:
+            raise ContractValidationError(path, f"unresolvable $ref {pointer!r}") from e
+
+    if is_ref(meaning.get("subject")):
+        check(meaning["subject"], "/meaning/subject")
+    payload = meaning.get("meaning_payload")
+    if type(payload) is not dict:
+        raise ContractValidationError("/meaning/meaning_payload", "expected type object")
+    for ctx, body in payload.items():
+        evidence = body.get("evidence") if type(body) is dict else None
+        if type(evidence) is not dict:
+            continue
+        if is_ref(evidence):
+            check(evidence, f"/meaning/meaning_payload/{ctx}/evidence")
+            continue
+        for key, value in evidence.items():
+            if is_ref(value):
+                check(value, f"/meaning/meaning_payload/{ctx}/evidence/{key}")
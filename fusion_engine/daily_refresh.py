@@ -0,0 +1,113 @@
+"""
+fusion_engine/daily_refresh.py
+
+기존 calculation / meaning 결과 쌍에서 today만 새 날짜로 갱신한다.
+- calculation: today 블록만 재계산 (get_today_unse / build_today_domain_operation)
+- meaning    : today 컨텍스트만 재생성 (build_meaning_slots "today")
+- 나머지 섹션(원국, 대운, 2026, natal/fortune 컨텍스트)은 그대로 재사용
+- 어떤 섹션이 바뀌었는지 보고 → 다운스트림 캐시는 나머지를 유지
+- --store: pregenerate.py 사전 생성본이 있으면 계산 없이 그 today를 사용
+"""
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from engines import load_calculation_main
+from engine.engine_core import refresh_today_context
+from pregenerate import apply_pregenerated, load_pregenerated
+from stream_fusion import subject_key
+from tboo_runtime.output_writer import get_output_writer
+
+
+def changed_sections(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    """top-level 키 기준으로 값이 달라진 섹션 목록."""
+    keys = list(old) + [k for k in new if k not in old]
+    return [k for k in keys if old.get(k) != new.get(k)]
+
+
+def refresh_daily(
+    calculation_json: Dict[str, Any],
+    meaning_json: Dict[str, Any],
+    target_date: datetime,
+    pregenerated: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, List[str]]]:
+    """
+    Returns (calculation, meaning, changes)
+    changes 예:
+      {"calculation": ["today"], "meaning": ["meaning_payload/today"]}
+    같은 간지 일자면 두 목록 모두 비어 있다.
+    pregenerated: 같은 날짜의 사전 생성 레코드 (load_pregenerated(...).get(subject_key))
+    """
+    if pregenerated is not None:
+        new_calculation, new_meaning = apply_pregenerated(calculation_json, meaning_json, pregenerated)
+    else:
+        calc_main = load_calculation_main()
+        new_calculation = calc_main.refresh_today_block(calculation_json, target_date)
+        new_meaning = refresh_today_context(meaning_json, new_calculation)
+
+    old_payload = meaning_json.get("meaning_payload", {}) or {}
+    new_payload = new_meaning.get("meaning_payload", {}) or {}
+
+    changes = {
+        "calculation": changed_sections(calculation_json, new_calculation),
+        "meaning": [
+            f"meaning_payload/{ctx}"
+            for ctx in changed_sections(old_payload, new_payload)
+        ],
+    }
+    return new_calculation, new_meaning, changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TBOO daily (today) refresh")
+    parser.add_argument("--calculation", required=True, help="calculation v3.3 JSON")
+    parser.add_argument("--meaning", required=True, help="meaning JSON")
+    parser.add_argument("--date", required=True, help="YYYY-MM-DD")
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="변경된 파일만 덮어쓰기 (기본: 변경 보고만 출력)",
+    )
+    parser.add_argument(
+        "--store",
+        default=None,
+        help="pregenerate.py 저장 디렉터리 (해당 날짜 사전 생성본이 있으면 사용)",
+    )
+    args = parser.parse_args()
+
+    calculation_path = Path(args.calculation).expanduser().resolve()
+    meaning_path = Path(args.meaning).expanduser().resolve()
+    target_date = datetime.strptime(args.date, "%Y-%m-%d")
+
+    with open(calculation_path, "r", encoding="utf-8") as f:
+        calculation = json.load(f)
+    with open(meaning_path, "r", encoding="utf-8") as f:
+        meaning = json.load(f)
+
+    entry = None
+    if args.store:
+        store = load_pregenerated(Path(args.store).expanduser().resolve(), target_date.date())
+        entry = store.get(subject_key(calculation)) if store is not None else None
+
+    new_calculation, new_meaning, changes = refresh_daily(calculation, meaning, target_date, entry)
+
+    if args.in_place:
+        writer = get_output_writer()
+        if changes["calculation"]:
+            writer.write_file(calculation_path, json.dumps(new_calculation, ensure_ascii=False, indent=2))
+        if changes["meaning"]:
+            writer.write_file(meaning_path, json.dumps(new_meaning, ensure_ascii=False, indent=2))
+        writer.flush()
+
+    print(json.dumps(
+        {"date": args.date, "pregenerated": entry is not None, "changed": changes},
+        ensure_ascii=False,
+        indent=2,
+    ))
+
+
+if __name__ == "__main__":
+    main()
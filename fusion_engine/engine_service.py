@@ -0,0 +1,278 @@
+"""
+fusion_engine/engine_service.py
+
+계산 / 의미 엔진 호출 앞단 (요청 합치기 + 동시 실행 상한)
+- 출생 키(생년월일시분 · 성별 · 경도)와 오늘 날짜가 같은 동시 요청은 계산 한 번을 공유한다
+  (analyze_saju / today 운 / run_engine 결과는 이름과 무관 — 이름은 응답에 따로 덧붙임)
+- 실제 계산(leader)만 AdmissionController 슬롯을 쓴다. 초과 요청은 대기열에서 기다리다
+  상한 / 시간 초과면 Overloaded 로 거절 → 합쳐진 요청들도 같은 Overloaded 를 받는다
+- 계산 결과는 캐시하지 않는다 (진행 중인 계산만 공유). 의미 결과는 meaning_cache(MeaningResultCache)를 주면
+  차트 지문이 같은 요청이 의미 엔진 / 슬롯 없이 재사용한다. 응답 dict 의 중첩 객체는 요청 간에 공유되므로 읽기 전용
+
+    service = EngineService(max_concurrent=4, max_queue=64, queue_timeout=2.0, meaning_cache=MeaningResultCache())
+    calculation = service.calculation(BirthRequest.parse("홍길동 1990 05 05 10 30 1"))
+    meaning = service.meaning(request)            # 계산 + 의미 (둘 다 합치기)
+    service.stats() / service.to_prometheus()
+
+    python fusion_engine/engine_service.py --requests 400 --distinct 20 --threads 32 [--meaning-cache 4096]
+    (같은 요청 묶음을 합치기 on / off 로 돌려 계산 횟수 · 거절 수 · 지연 비교)
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from engines import load_calculation_main
+from engine.engine_core import run_engine
+from engine.result_cache import MeaningResultCache
+from engine.saju_core import analyze_saju
+from tboo_runtime import clock
+from tboo_runtime.admission import AdmissionController, Overloaded, SingleFlight, to_prometheus
+from tboo_runtime.clock import add_clock_arguments, clock_from_args, set_clock
+
+
+# ------------------------------------------------------------
+# 요청 / 키
+# ------------------------------------------------------------
+@dataclass(frozen=True)
+class BirthRequest:
+    name: str
+    year: int
+    month: int
+    day: int
+    hour: Optional[int]
+    minute: Optional[int]
+    gender_int: int
+    longitude: Optional[float] = None
+
+    @classmethod
+    def parse(cls, line: str, longitude: Optional[float] = None) -> "BirthRequest":
+        """CLI 입력 형식: 이름 YYYY MM DD HH mm 성별(1/2) — 시간 모르면 x x."""
+        calc_main = load_calculation_main()
+        raw = line.split()
+        if len(raw) != 7:
+            raise ValueError(f"입력 형식 오류: {line!r}")
+        return cls(
+            name=raw[0],
+            year=int(raw[1]),
+            month=int(raw[2]),
+            day=int(raw[3]),
+            hour=calc_main.parse_optional_int(raw[4]),
+            minute=calc_main.parse_optional_int(raw[5]),
+            gender_int=int(raw[6]),
+            longitude=longitude,
+        )
+
+    def birth_key(self) -> Tuple[Hashable, ...]:
+        """이름을 뺀 정규화 키 (시 / 분 중 하나라도 없으면 시주 미상으로 통일, 경도는 0.01도)."""
+        hour, minute = (self.hour, self.minute) if self.hour is not None and self.minute is not None else (None, None)
+        longitude = None if self.longitude is None else round(self.longitude, 2)
+        return (self.year, self.month, self.day, hour, minute, self.gender_int, longitude)
+
+    @property
+    def gender(self) -> str:
+        return "남성" if self.gender_int == 1 else "여성"
+
+
+def _with_name(document: Dict[str, Any], field: str, name: str) -> Dict[str, Any]:
+    """공유 결과에 요청자 이름만 바꿔 붙인 얕은 복사본."""
+    return {**document, field: {**(document.get(field) or {}), "name": name}}
+
+
+# ------------------------------------------------------------
+# 서비스
+# ------------------------------------------------------------
+class _Endpoint:
+    """엔드포인트 하나의 합치기 + 계산 / 거절 / 오류 지표. fn 은 스스로 슬롯을 잡는다."""
+
+    def __init__(self, coalesce: bool):
+        self.flight = SingleFlight() if coalesce else None
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "computed": 0, "shed": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def call(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        def compute() -> Any:
+            result = fn()
+            self._count("computed")
+            return result
+
+        self._count("requests")
+        try:
+            if self.flight is None:
+                return compute()
+            return self.flight.do(key, compute)[0]
+        except Overloaded:
+            self._count("shed")
+            raise
+        except Exception:
+            self._count("errors")
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        flight = self.flight.stats() if self.flight else {"coalesced": 0, "in_flight": 0}
+        with self._lock:
+            counters = dict(self._counters)
+        return {**counters, "coalesced": flight["coalesced"], "in_flight": flight["in_flight"]}
+
+
+class EngineService:
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_queue: int = 64,
+        queue_timeout: Optional[float] = 2.0,
+        coalesce: bool = True,
+        meaning_cache: Optional[MeaningResultCache] = None,
+    ):
+        # 계산 / 의미는 같은 CPU 를 쓰므로 슬롯 하나를 공유
+        self.gate = AdmissionController(max_concurrent or os.cpu_count() or 1, max_queue, queue_timeout)
+        self._calculation = _Endpoint(coalesce)
+        self._meaning = _Endpoint(coalesce)
+        self._calc_main = load_calculation_main()
+        self.meaning_cache = meaning_cache
+
+    # 이름 없는(공유 가능한) 결과 ----------------------------------
+    def _compute_calculation(self, request: BirthRequest, today: date) -> Dict[str, Any]:
+        calc_main = self._calc_main
+        hour, minute = request.birth_key()[3:5]
+        saju_info, _ = analyze_saju(
+            request.year, request.month, request.day, hour, minute,
+            request.gender_int, "", longitude=request.longitude, defer=True,
+        )
+        today_unse = calc_main.compute_today_unse(
+            saju_info["day_gan"], request.gender_int, datetime.combine(today, datetime.min.time())
+        )
+        return calc_main.build_tboo_json_v33(
+            "", request.gender, request.year, request.month, request.day, hour, minute, saju_info, today_unse
+        )
+
+    def _shared_calculation(self, request: BirthRequest, today: date) -> Dict[str, Any]:
+        key = request.birth_key() + (today,)
+        return self._calculation.call(key, lambda: self.gate.run(self._compute_calculation, request, today))
+
+    # 공개 API ----------------------------------------------------
+    def calculation(self, request: BirthRequest) -> Dict[str, Any]:
+        today = clock.now().date()
+        return _with_name(self._shared_calculation(request, today), "user_info", request.name)
+
+    def meaning(self, request: BirthRequest, slot_encoding: str = "text") -> Dict[str, Any]:
+        today = clock.now().date()
+        key = request.birth_key() + (today, slot_encoding)
+        def compute() -> Dict[str, Any]:
+            # 계산 결과는 슬롯 밖에서 받아 온다 (슬롯을 쥔 채 다른 슬롯을 기다리지 않도록)
+            calculation = self._shared_calculation(request, today)
+            if self.meaning_cache is None:
+                return self.gate.run(run_engine, calculation, slot_encoding=slot_encoding)
+            # 캐시 적중이면 슬롯을 쓰지 않는다
+            return self.meaning_cache.run(
+                calculation, slot_encoding, compute=lambda c, **kw: self.gate.run(run_engine, c, **kw)
+            )
+
+        meaning = self._meaning.call(key, compute)
+        return _with_name(meaning, "subject", request.name)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {
+            "calculation": self._calculation.stats(),
+            "meaning": self._meaning.stats(),
+            "admission": self.gate.stats(),
+        }
+        if self.meaning_cache is not None:
+            stats["meaning_cache"] = self.meaning_cache.stats()
+        return stats
+
+    def to_prometheus(self) -> str:
+        return to_prometheus(self.stats())
+
+
+# ------------------------------------------------------------
+# 부하 시뮬레이션
+# ------------------------------------------------------------
+def _random_request(rng: random.Random, i: int) -> BirthRequest:
+    hour = rng.choice([None] + list(range(24)))
+    return BirthRequest(
+        name=f"user{i}",
+        year=rng.randint(1950, 2005),
+        month=rng.randint(1, 12),
+        day=rng.randint(1, 28),
+        hour=hour,
+        minute=None if hour is None else rng.randint(0, 59),
+        gender_int=rng.randint(1, 2),
+    )
+
+
+def simulate(args: argparse.Namespace, coalesce: bool) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    distinct = [_random_request(rng, i) for i in range(args.distinct)]
+    burst = [distinct[rng.randrange(len(distinct))] for _ in range(args.requests)]
+    cache = MeaningResultCache(args.meaning_cache) if args.meaning_cache else None
+    service = EngineService(
+        args.max_concurrent, args.max_queue, args.queue_timeout, coalesce=coalesce, meaning_cache=cache
+    )
+
+    latencies = []
+
+    def one(request: BirthRequest) -> str:
+        t0 = time.perf_counter()
+        try:
+            service.meaning(request)
+            status = "ok"
+        except Overloaded:
+            status = "shed"
+        latencies.append(time.perf_counter() - t0)
+        return status
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as pool:
+        statuses = list(pool.map(one, burst))
+    elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "coalesce": coalesce,
+        "elapsed_s": round(elapsed, 3),
+        "ok": statuses.count("ok"),
+        "shed": statuses.count("shed"),
+        "latency_ms_p50": round(latencies[len(latencies) // 2] * 1e3, 1),
+        "latency_ms_p99": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e3, 1),
+        "stats": service.stats(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="TBOO engine service — coalescing / admission simulation")
+    parser.add_argument("--requests", type=int, default=400, help="동시 요청 수")
+    parser.add_argument("--distinct", type=int, default=20, help="서로 다른 출생 키 수")
+    parser.add_argument("--threads", type=int, default=32, help="요청 스레드 수")
+    parser.add_argument("--max-concurrent", type=int, default=None, help="동시 계산 상한 (기본: CPU 수)")
+    parser.add_argument("--max-queue", type=int, default=64, help="대기열 상한 (초과 시 즉시 거절)")
+    parser.add_argument("--queue-timeout", type=float, default=2.0, help="대기 시간 상한(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--meaning-cache", type=int, default=0, help="의미 결과 캐시 항목 수 (0: 끔)")
+    parser.add_argument("--prometheus", action="store_true", help="합치기 on 실행의 지표를 Prometheus text 로 출력")
+    add_clock_arguments(parser)
+    args = parser.parse_args()
+    set_clock(clock_from_args(args))
+
+    report = {"off": simulate(args, coalesce=False), "on": simulate(args, coalesce=True)}
+    if args.prometheus:
+        print(to_prometheus(report["on"]["stats"]), end="")
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""
+fusion_engine/engines.py
+
+calculation_engine / meaning_engine 모듈을 한 프로세스에서 불러오기 위한 경로 설정.
+- 두 엔진 모두 `engine` 네임스페이스 패키지를 쓰므로 (__init__.py 없음)
+  두 디렉터리를 sys.path에 올리면 engine.saju_core / engine.engine_core가 함께 보인다.
+- 두 CLI가 모두 main.py 이름이므로 calculation main은 별도 이름으로 로드한다.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+CALCULATION_DIR = BASE_DIR / "calculation_engine"
+MEANING_DIR = BASE_DIR / "meaning_engine"
+
+for _p in (BASE_DIR, MEANING_DIR, CALCULATION_DIR):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+
+def load_calculation_main():
+    """calculation_engine/main.py (build_tboo_json_v33 등)를 모듈로 로드."""
+    name = "calculation_main"
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, CALCULATION_DIR / "main.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,205 @@
+"""
+fusion_engine/population.py
+
+만세력 전체(또는 기간)에 대한 분포 집계 — 날짜마다 analyze_saju / run_engine 을 돌리지 않는다
+- 만세력 상주 테이블의 歲次 / 月建 / 日辰 코드 배열을 기간만큼 슬라이스
+- 60갑자별 ontology(combination_type / desire_direction …)와 십신 / 12운성을 코드 표로 한 번 만들고
+  날짜 배열에 gather (engine_core / saju_core 의 같은 함수로 만든 표이므로 결과가 같다)
+- (그룹, 값) 쌍을 bincount 로 세어 건수 / 그룹 내 비율 표를 만든다
+- 집계 단위: 만세력 날짜 1일 = 1명 (시주 미상, 성별 무관 항목만)
+
+    python fusion_engine/population.py --field existence_type --by year --start 1950-01-01 --end 2000-01-01
+    python fusion_engine/population.py --field day_gan --by decade --format csv
+    python fusion_engine/population.py --list
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from engines import CALCULATION_DIR  # noqa: F401  (경로 설정)
+from engine.calendar_table import CalendarTable, get_calendar_table
+from engine.engine_core import (
+    COMBINATION_TO_EXISTENCE_KEY,
+    compute_ganji_ontology,
+    derive_desire_direction,
+    derive_existence_type,
+)
+from engine.ganji_tables import GAN_10, GANJI_60, JI_12, MISSING_CODE
+from engine.sipshin import get_sipshin
+from engine.unseong import get_12un
+
+Values = Tuple[Any, ...]
+
+
+# ------------------------------------------------------------
+# 60갑자 코드 → 범주 표
+# ------------------------------------------------------------
+def _categorical(labels: List[Any]) -> Tuple[Values, np.ndarray]:
+    """코드별 라벨 → (값 목록, 코드 → 값 index 표)."""
+    values = tuple(dict.fromkeys(labels))
+    return values, np.array([values.index(v) for v in labels], dtype=np.int16)
+
+
+_ONTOLOGY = [compute_ganji_ontology(g[0], g[1]) for g in GANJI_60]
+COMBINATION_BY_CODE = _categorical([o["combination_type"] for o in _ONTOLOGY])
+EXISTENCE_BY_CODE = _categorical([derive_existence_type(o) for o in _ONTOLOGY])
+DESIRE_BY_CODE = _categorical([derive_desire_direction(o) for o in _ONTOLOGY])
+UNSEONG_BY_CODE = _categorical([get_12un(g[0], g[1]) for g in GANJI_60])
+SIPSHIN_BY_GAN_PAIR = _categorical([get_sipshin(a, b) for a in GAN_10 for b in GAN_10])  # [일간 × 10 + 대상 천간]
+
+
+class PopulationFrame:
+    """
+    기간 [start, end) 의 만세력 날짜 배열
+    fields : 이름 → (값 목록, 날짜별 값 index)  — 집계 대상 / 그룹 기준 모두 사용 가능
+    groups : 날짜 자체에서 나오는 그룹 기준 (year / decade / month / lunar_year)
+    """
+
+    def __init__(self, table: CalendarTable, start: date, end: date):
+        lo = max(0, start.toordinal() - table.start_ordinal)
+        hi = min(len(table), end.toordinal() - table.start_ordinal)
+        rows = lo + np.flatnonzero(table.day_codes[lo:hi] != MISSING_CODE)
+        self.size = len(rows)
+
+        self.year = table.year_codes[rows].astype(np.int64)
+        self.month = table.month_codes[rows].astype(np.int64)
+        self.day = table.day_codes[rows].astype(np.int64)
+        self.lunar_year = table.lunar_year[rows].astype(np.int64)
+        days = np.datetime64(table.start, "D") + rows
+        self.solar_year = days.astype("datetime64[Y]").astype(np.int64) + 1970
+        self.solar_month = days.astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+    # --------------------------------------------------------
+    def fields(self) -> Dict[str, Callable[[], Tuple[Values, np.ndarray]]]:
+        day_gan = self.day % 10
+
+        def ganji(codes):
+            return lambda: (GANJI_60, codes)
+
+        def by_code(table, codes):
+            return lambda: (table[0], table[1][codes])
+
+        def sipshin(codes):
+            return lambda: (SIPSHIN_BY_GAN_PAIR[0], SIPSHIN_BY_GAN_PAIR[1][day_gan * 10 + codes % 10])
+
+        return {
+            "year_ganji": ganji(self.year),
+            "month_ganji": ganji(self.month),
+            "day_ganji": ganji(self.day),
+            "day_gan": lambda: (GAN_10, day_gan),
+            "day_ji": lambda: (JI_12, self.day % 12),
+            "combination_type.year": by_code(COMBINATION_BY_CODE, self.year),
+            "combination_type.month": by_code(COMBINATION_BY_CODE, self.month),
+            "combination_type.day": by_code(COMBINATION_BY_CODE, self.day),
+            "existence_type": by_code(EXISTENCE_BY_CODE, self.day),
+            "desire_direction": by_code(DESIRE_BY_CODE, self.day),
+            "unseong.year": by_code(UNSEONG_BY_CODE, self.year),
+            "unseong.month": by_code(UNSEONG_BY_CODE, self.month),
+            "unseong.day": by_code(UNSEONG_BY_CODE, self.day),
+            "sipshin.year": sipshin(self.year),
+            "sipshin.month": sipshin(self.month),
+        }
+
+    def groups(self) -> Dict[str, Callable[[], Tuple[Values, np.ndarray]]]:
+        def numeric(values):
+            uniq, index = np.unique(values, return_inverse=True)
+            return tuple(uniq.tolist()), index
+
+        return {
+            "all": lambda: (("all",), np.zeros(self.size, dtype=np.int64)),
+            "year": lambda: numeric(self.solar_year),
+            "decade": lambda: numeric(self.solar_year // 10 * 10),
+            "month": lambda: numeric(self.solar_month),
+            "lunar_year": lambda: numeric(self.lunar_year),
+            **self.fields(),
+        }
+
+    # --------------------------------------------------------
+    def distribution(self, field: str, by: str = "all") -> Dict[str, Any]:
+        fields, groups = self.fields(), self.groups()
+        if field not in fields:
+            raise ValueError(f"Unknown field: {field!r} (choices: {sorted(fields)})")
+        if by not in groups:
+            raise ValueError(f"Unknown group: {by!r} (choices: {sorted(groups)})")
+
+        values, value_index = fields[field]()
+        group_values, group_index = groups[by]()
+        counts = np.bincount(
+            group_index.astype(np.int64) * len(values) + value_index,
+            minlength=len(group_values) * len(values),
+        ).reshape(len(group_values), len(values))
+        totals = counts.sum(axis=1)
+
+        rows = []
+        for g, label in enumerate(group_values):
+            if not totals[g]:
+                continue
+            present = np.flatnonzero(counts[g])
+            rows.append({
+                "group": label,
+                "total": int(totals[g]),
+                "counts": {values[v]: int(counts[g, v]) for v in present},
+                "shares": {values[v]: round(float(counts[g, v] / totals[g]), 6) for v in present},
+            })
+        return {"field": field, "by": by, "days": self.size, "rows": rows}
+
+
+def population_distribution(
+    field: str,
+    by: str = "all",
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Dict[str, Any]:
+    """[start, end) 기간 분포 (기본: 만세력 전체)."""
+    table = get_calendar_table()
+    start = start or table.start
+    end = end or date.fromordinal(table.end.toordinal() + 1)
+    result = PopulationFrame(table, start, end).distribution(field, by)
+    result.update(start=start.isoformat(), end=end.isoformat())
+    return result
+
+
+def write_csv(result: Dict[str, Any], out) -> None:
+    writer = csv.writer(out)
+    writer.writerow([result["by"], result["field"], "count", "share"])
+    for row in result["rows"]:
+        for value, count in row["counts"].items():
+            writer.writerow([row["group"], value, count, row["shares"][value]])
+
+
+# ------------------------------------------------------------
+# CLI
+# ------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="TBOO population distribution over the calendar")
+    parser.add_argument("--field", default="existence_type", help="집계 항목")
+    parser.add_argument("--by", default="all", help="그룹 기준 (year / decade / month / lunar_year / 항목 이름)")
+    parser.add_argument("--start", default=None, help="YYYY-MM-DD (포함, 기본: 만세력 처음)")
+    parser.add_argument("--end", default=None, help="YYYY-MM-DD (미포함, 기본: 만세력 끝 다음날)")
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--list", action="store_true", help="항목 / 그룹 기준 목록")
+    args = parser.parse_args()
+
+    def parse(s):
+        return datetime.strptime(s, "%Y-%m-%d").date() if s else None
+
+    if args.list:
+        frame = PopulationFrame(get_calendar_table(), date.min, date.min)
+        print(json.dumps({"fields": sorted(frame.fields()), "by": sorted(frame.groups())}, ensure_ascii=False, indent=2))
+        return
+
+    result = population_distribution(args.field, args.by, parse(args.start), parse(args.end))
+    if args.format == "csv":
+        write_csv(result, sys.stdout)
+    else:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
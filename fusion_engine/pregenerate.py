@@ -0,0 +1,322 @@
+"""
+fusion_engine/pregenerate.py
+
+다음 날 today 블록 사전 생성 (비혼잡 시간대 배치)
+- 자정(KST) 직후 요청이 몰리므로, 전날 밤에 로스터 전체의 내일 today를 미리 계산
+- 입력: calculation v3.3 레코드 JSONL (로스터)
+- calculation today 블록 + meaning today 컨텍스트만 생성
+  (원국 / 대운 / 2026 / natal·fortune 컨텍스트는 날짜와 무관하므로 재사용)
+- today는 (일간, 성별)에만 의존 → 그룹(최대 20개)마다 한 번만 계산하고
+  사용자 레코드는 그룹을 참조 (사용자 수와 무관하게 계산 20회 + I/O)
+- 저장: <store>/<YYYY-MM-DD>/groups.json   (그룹 id → today / meaning_today)
+        <store>/<YYYY-MM-DD>/today.jsonl   (subject_key 당 한 줄, group 참조)
+        <store>/<YYYY-MM-DD>/manifest.json (마지막에 기록 — 있으면 완성본)
+- 서빙: load_pregenerated() → PregeneratedStore.get(subject_key) → apply_pregenerated() 로
+        기존 결과 쌍의 today만 교체 (today.jsonl 은 메모리에 올리지 않고 byte offset 색인으로 조회)
+
+    python fusion_engine/pregenerate.py --roster roster.jsonl --store pregenerated/
+    python fusion_engine/pregenerate.py --roster roster.jsonl --store pregenerated/ \
+        --clock kst --wait-until 02:30          # KST 기준 내일분, 02:30에 시작
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from engines import load_calculation_main
+from engine.engine_core import build_today_context
+from stream_fusion import DEFAULT_KEY_FIELDS, JsonlWriter, iter_jsonl, subject_key
+from tboo_runtime import clock
+from tboo_runtime.clock import add_clock_arguments, clock_from_args, set_clock
+
+TODAY_FILE = "today.jsonl"
+GROUPS_FILE = "groups.json"
+ERRORS_FILE = "errors.jsonl"
+MANIFEST_FILE = "manifest.json"
+
+
+def store_dir(store: Path, target_date: date) -> Path:
+    return store / target_date.isoformat()
+
+
+def _atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+# ------------------------------------------------------------
+# 생성
+# ------------------------------------------------------------
+def today_group_key(calculation_json: Dict[str, Any]) -> Tuple[str, int]:
+    """
+    today 블록을 결정하는 입력은 (일간, 성별)뿐이다
+    (get_today_unse: 일간 / build_today_domain_operation: 일간 + 성별).
+    → 날짜마다 최대 10 × 2 = 20개의 서로 다른 결과
+    """
+    day_gan = (calculation_json.get("saju", {}).get("day") or "")[:1]
+    if not day_gan:
+        raise ValueError("saju.day 없음")
+    calc_main = load_calculation_main()
+    gender_int = calc_main.gender_int_from_label(calculation_json.get("user_info", {}).get("gender", ""))
+    return day_gan, gender_int
+
+
+def group_id(day_gan: str, gender_int: int) -> str:
+    return f"{day_gan}{gender_int}"
+
+
+def compute_group(
+    day_gan: str,
+    gender_int: int,
+    target_date: date,
+    *,
+    slot_encoding: str = "text",
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """(calculation today 블록, meaning today 컨텍스트)"""
+    calc_main = load_calculation_main()
+    target = datetime.combine(target_date, datetime.min.time())
+    today_block = calc_main.build_today_block(
+        calc_main.compute_today_unse(day_gan, gender_int, target)
+    )
+    meaning_today = build_today_context({"today": today_block}, slot_encoding=slot_encoding)
+    return today_block, meaning_today
+
+
+def pregenerate_roster(
+    roster_path: Path,
+    store: Path,
+    target_date: date,
+    *,
+    slot_encoding: str = "text",
+    key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+) -> Dict[str, Any]:
+    """
+    로스터 전체를 한 번 훑어 <store>/<date>/ 에 기록하고 manifest를 돌려준다.
+    - (일간, 성별) 그룹마다 한 번만 계산 → groups.json
+    - today.jsonl 은 사용자별 {subject_key, date, group} 참조 레코드
+    - 파일은 임시 파일에 쓴 뒤 rename → 읽는 쪽은 부분 파일을 보지 않음
+    - manifest.json 은 마지막에 기록 (서빙 측 완성 판단 기준)
+    - 레코드 오류는 errors.jsonl 로 보고하고 계속 진행
+    """
+    out_dir = store_dir(store, target_date)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_FILE
+    if manifest_path.exists():
+        manifest_path.unlink()  # 재생성 중에는 미완성으로 보이게
+
+    today_path = out_dir / TODAY_FILE
+    tmp_path = today_path.with_name(today_path.name + ".tmp")
+    started = time.perf_counter()
+    groups: Dict[str, Dict[str, Any]] = {}
+    failed = 0
+
+    with JsonlWriter(tmp_path) as records, JsonlWriter(out_dir / ERRORS_FILE) as errors:
+        for line_no, calculation_json in iter_jsonl(roster_path):
+            key = subject_key(calculation_json, key_fields)
+            try:
+                day_gan, gender_int = today_group_key(calculation_json)
+                gid = group_id(day_gan, gender_int)
+                if gid not in groups:
+                    today_block, meaning_today = compute_group(
+                        day_gan, gender_int, target_date, slot_encoding=slot_encoding
+                    )
+                    groups[gid] = {"today": today_block, "meaning_today": meaning_today, "users": 0}
+            except (ValueError, KeyError, TypeError) as e:
+                failed += 1
+                errors.write({"key": key, "line": line_no, "error": str(e)})
+                continue
+            groups[gid]["users"] += 1
+            records.write({"subject_key": key, "date": target_date.isoformat(), "group": gid})
+        count = records.count
+
+    _atomic_write_json(out_dir / GROUPS_FILE, groups)
+    os.replace(tmp_path, today_path)
+
+    manifest = {
+        "date": target_date.isoformat(),
+        "generated_at": clock.now().isoformat(),
+        "records": count,
+        "groups": len(groups),
+        "failed": failed,
+        "slot_encoding": slot_encoding,
+        "key_fields": list(key_fields),
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        "roster": str(roster_path),
+    }
+    _atomic_write_json(manifest_path, manifest)
+    return manifest
+
+
+# ------------------------------------------------------------
+# 서빙
+# ------------------------------------------------------------
+class PregeneratedStore:
+    """
+    <store>/<date>/ 사전 생성본 조회
+    - groups.json / manifest 만 메모리에 올린다 (그룹 최대 20개)
+    - today.jsonl 은 처음 조회할 때 한 번 훑어 {subject_key: byte offset} 색인만 만들고,
+      get() 은 그 위치의 한 줄만 읽어 group 참조를 푼다
+    - 반환 레코드의 today / meaning_today 는 같은 그룹 사용자끼리 공유하므로 수정하지 말 것
+    """
+
+    def __init__(self, out_dir: Path, manifest: Dict[str, Any], groups: Dict[str, Dict[str, Any]]):
+        self.out_dir = out_dir
+        self.manifest = manifest
+        self.groups = groups
+        self.path = out_dir / TODAY_FILE
+        self._offsets: Optional[Dict[str, int]] = None
+
+    def _resolve(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        shared = self.groups[record["group"]]
+        record["today"] = shared["today"]
+        record["meaning_today"] = shared["meaning_today"]
+        record["slot_encoding"] = self.manifest.get("slot_encoding", "text")
+        return record
+
+    def _index(self) -> Dict[str, int]:
+        if self._offsets is None:
+            offsets: Dict[str, int] = {}
+            with open(self.path, "rb") as f:
+                offset = 0
+                for line in f:
+                    if line.strip():
+                        offsets[json.loads(line)["subject_key"]] = offset
+                    offset += len(line)
+            self._offsets = offsets
+        return self._offsets
+
+    def get(self, key: str, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        offset = self._index().get(key)
+        if offset is None:
+            return default
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return self._resolve(json.loads(f.readline()))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index()
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """today.jsonl 순서대로 레코드를 하나씩 (색인 / 전체 적재 없음)."""
+        for _, record in iter_jsonl(self.path):
+            yield self._resolve(record)
+
+
+def load_pregenerated(store: Path, target_date: date) -> Optional[PregeneratedStore]:
+    """
+    해당 날짜 사전 생성본 — manifest가 없으면(미생성 / 생성 중) None.
+    레코드는 PregeneratedStore.get(subject_key) 로 하나씩 읽는다
+    (group 참조를 풀어 today / meaning_today, manifest 의 slot_encoding 을 채운 dict).
+    """
+    out_dir = store_dir(store, target_date)
+    manifest_path = out_dir / MANIFEST_FILE
+    if not manifest_path.exists():
+        return None
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    with open(out_dir / GROUPS_FILE, "r", encoding="utf-8") as f:
+        groups = json.load(f)
+
+    return PregeneratedStore(out_dir, manifest, groups)
+
+
+def apply_pregenerated(
+    calculation_json: Dict[str, Any],
+    meaning_json: Dict[str, Any],
+    entry: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    기존 결과 쌍의 today만 사전 생성본으로 교체 (입력 dict는 수정하지 않음).
+    meaning 결과의 slot 인코딩이 사전 생성본과 다르면 today 블록에서 다시 만든다.
+    """
+    new_calculation = dict(calculation_json)
+    new_calculation["today"] = entry["today"]
+
+    encoding = (meaning_json.get("meta", {}) or {}).get("slot_encoding", "text")
+    meaning_today = entry["meaning_today"]
+    if encoding != entry.get("slot_encoding", "text"):
+        meaning_today = build_today_context({"today": entry["today"]}, slot_encoding=encoding)
+
+    new_meaning = dict(meaning_json)
+    new_meaning["meaning_payload"] = {
+        **(meaning_json.get("meaning_payload", {}) or {}),
+        "today": meaning_today,
+    }
+    return new_calculation, new_meaning
+
+
+# ------------------------------------------------------------
+# CLI
+# ------------------------------------------------------------
+def wait_until(hhmm: str) -> None:
+    """오늘(현재 시계 기준) HH:MM까지 대기. 이미 지났으면 바로 시작."""
+    hour, minute = map(int, hhmm.split(":"))
+    current = clock.now()
+    start_at = current.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    delay = (start_at - current).total_seconds()
+    if delay > 0:
+        print(f"⏳ {start_at.isoformat()} 까지 대기 ({delay:,.0f}s)", file=sys.stderr)
+        time.sleep(delay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TBOO next-day today pre-generation")
+    parser.add_argument("--roster", required=True, help="calculation v3.3 레코드 JSONL")
+    parser.add_argument("--store", required=True, help="사전 생성 저장 디렉터리")
+    parser.add_argument(
+        "--date",
+        default=None,
+        help="생성 대상 날짜 YYYY-MM-DD (기본: 현재 시계 기준 내일)",
+    )
+    parser.add_argument(
+        "--slot-ids",
+        action="store_true",
+        help="meaning today 슬롯을 정수 ID로 저장",
+    )
+    parser.add_argument(
+        "--key-fields",
+        default=",".join(DEFAULT_KEY_FIELDS),
+        help="subject_id가 없을 때 사용할 user_info 필드 (쉼표 구분)",
+    )
+    parser.add_argument(
+        "--wait-until",
+        default=None,
+        metavar="HH:MM",
+        help="이 시각(현재 시계 기준)까지 기다렸다가 시작",
+    )
+    add_clock_arguments(parser)
+    args = parser.parse_args()
+    set_clock(clock_from_args(args))
+
+    if args.wait_until:
+        wait_until(args.wait_until)
+
+    target_date = (
+        datetime.strptime(args.date, "%Y-%m-%d").date()
+        if args.date
+        else clock.today() + timedelta(days=1)
+    )
+
+    manifest = pregenerate_roster(
+        Path(args.roster).expanduser().resolve(),
+        Path(args.store).expanduser().resolve(),
+        target_date,
+        slot_encoding="id" if args.slot_ids else "text",
+        key_fields=tuple(k for k in args.key_fields.split(",") if k),
+    )
+    print(json.dumps(manifest, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
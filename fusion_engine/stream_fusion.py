@@ -0,0 +1,220 @@
+"""
+fusion_engine/stream_fusion.py
+
+calculation / meaning JSONL 스트림을 subject key로 조인해 계약을 스트리밍 생성한다.
+- "최신 파일 1개 + 최신 파일 1개" 페어링 대신 레코드 단위 키 매칭
+- 한 번의 선형 패스 (두 스트림을 번갈아 한 줄씩 읽음)
+- 메모리 상한: 짝을 기다리는 레코드는 max_pending 개까지만 보관
+  (초과 시 두 스트림을 통틀어 가장 먼저 들어온 레코드를 unmatched 보고서로 내보냄)
+- 결과는 JSONL로 한 줄씩 기록, 매칭 실패 레코드는 보고서(JSONL)로 기록
+  (직렬화는 호출 스레드, 파일 I/O 는 tboo_runtime/output_writer.py 백그라운드 스레드)
+- 경로가 .gz 면 gzip 으로 읽고 쓴다
+"""
+
+import gzip
+import json
+from collections import OrderedDict
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from tboo_runtime.output_writer import OutputWriter, get_output_writer
+
+DEFAULT_KEY_FIELDS = ("name", "gender", "birthday")
+
+Record = Tuple[int, Dict[str, Any]]  # (line_no, record)
+
+
+# ------------------------------------------------------------
+# 입력 / 키
+# ------------------------------------------------------------
+def iter_jsonl(path: Path) -> Iterator[Record]:
+    opener = gzip.open if Path(path).suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if line:
+                yield line_no, json.loads(line)
+
+
+def subject_key(record: Dict[str, Any], key_fields: Sequence[str] = DEFAULT_KEY_FIELDS) -> str:
+    """
+    subject 식별 키
+    - record.subject_id 가 있으면 우선 사용
+    - calculation: user_info / meaning: subject 의 key_fields 조합
+    """
+    if record.get("subject_id") is not None:
+        return str(record["subject_id"])
+
+    subject = record.get("user_info") or record.get("subject") or {}
+    if subject.get("subject_id") is not None:
+        return str(subject["subject_id"])
+
+    return "|".join(str(subject.get(k, "")) for k in key_fields)
+
+
+# ------------------------------------------------------------
+# 출력
+# ------------------------------------------------------------
+class JsonlWriter:
+    """
+    레코드를 한 줄씩 기록하는 스트리밍 writer.
+    줄은 chunk_chars 만큼 모아 공용 OutputWriter 큐로 넘기고, 기록은 백그라운드에서 묶음 단위로 한다
+    (디스크가 밀리면 write 가 대기). flush_every 레코드마다 그때까지의 줄을 파일에 반영한다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        flush_every: int = 1000,
+        append: bool = False,
+        writer: Optional[OutputWriter] = None,
+        chunk_chars: int = 1 << 16,
+    ):
+        self.path = path
+        self.flush_every = flush_every
+        self.chunk_chars = chunk_chars
+        self.count = 0
+        self._lines: List[str] = []
+        self._chars = 0
+        self._writer: Optional[OutputWriter] = None
+        if path is not None:
+            self._writer = writer or get_output_writer()
+            self._writer.open(path, append=append)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self.count += 1
+        if self._writer is None:
+            return
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        self._lines.append(line)
+        self._chars += len(line)
+        if self._chars >= self.chunk_chars:
+            self._push()
+        if self.count % self.flush_every == 0:
+            self._push()
+            self._writer.flush()
+
+    def _push(self) -> None:
+        self._writer.append_lines(self.path, self._lines)
+        self._lines = []
+        self._chars = 0
+
+    def close(self) -> None:
+        """남은 줄을 모두 기록하고 파일을 닫을 때까지 대기 (이후 rename 등 가능)."""
+        if self._writer is not None:
+            self._push()
+            self._writer.close_path(self.path)
+            self._writer = None
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ------------------------------------------------------------
+# 조인
+# ------------------------------------------------------------
+def fuse_streams(
+    calculation_records: Iterable[Record],
+    meaning_records: Iterable[Record],
+    build_contract: Callable[[dict, dict], dict],
+    write_contract: Callable[[dict], None],
+    write_unmatched: Callable[[dict], None],
+    *,
+    key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+    max_pending: int = 10000,
+) -> Dict[str, int]:
+    """
+    windowed symmetric hash join.
+    - 대기 레코드는 (side, key) → 레코드 OrderedDict 하나에 도착 순서대로 보관
+      → 짝 찾기는 키 조회, 상한 초과 시 축출은 양쪽 통틀어 가장 오래된 레코드 (O(1))
+    - 두 스트림이 대체로 같은 순서(같은 배치에서 생성)라면 대기열은 작게 유지됨
+    - 같은 키가 대기 중에 다시 들어오면 이전 레코드는 duplicate로 보고
+    - build_contract가 ValueError(검증 실패)를 내면 해당 쌍은 invalid로 보고
+    """
+    pending: "OrderedDict[Tuple[str, str], Record]" = OrderedDict()
+    stats = {
+        "matched": 0,
+        "unmatched": 0,
+        "duplicate": 0,
+        "evicted": 0,
+        "invalid": 0,
+        "max_pending": 0,
+    }
+
+    def report(side: str, key: str, item: Record, reason: str) -> None:
+        stats["unmatched"] += 1
+        write_unmatched({"side": side, "key": key, "line": item[0], "reason": reason})
+
+    def accept(side: str, other: str, item: Record) -> None:
+        key = subject_key(item[1], key_fields)
+        partner = pending.pop((other, key), None)
+        if partner is not None:
+            calc, meaning = (item, partner) if side == "calculation" else (partner, item)
+            try:
+                contract = build_contract(calc[1], meaning[1])
+            except ValueError as e:  # ContractValidationError 포함
+                stats["invalid"] += 1
+                write_unmatched({
+                    "side": "pair",
+                    "key": key,
+                    "line": calc[0],
+                    "meaning_line": meaning[0],
+                    "reason": "invalid",
+                    "detail": str(e),
+                })
+                return
+            write_contract(contract)
+            stats["matched"] += 1
+            return
+
+        earlier = pending.pop((side, key), None)
+        if earlier is not None:
+            stats["duplicate"] += 1
+            report(side, key, earlier, "duplicate")
+        pending[side, key] = item
+
+        size = len(pending)
+        stats["max_pending"] = max(stats["max_pending"], size)
+        if size > max_pending:
+            (old_side, old_key), old_item = pending.popitem(last=False)
+            stats["evicted"] += 1
+            report(old_side, old_key, old_item, "evicted")
+
+    for calc_item, meaning_item in zip_longest(calculation_records, meaning_records):
+        if calc_item is not None:
+            accept("calculation", "meaning", calc_item)
+        if meaning_item is not None:
+            accept("meaning", "calculation", meaning_item)
+
+    for (side, key), item in pending.items():
+        report(side, key, item, "no_match")
+    pending.clear()
+
+    return stats
+
+
+def run_stream_fusion(
+    calculation_path: Path,
+    meaning_path: Path,
+    output_path: Path,
+    report_path: Path,
+    build_contract: Callable[[dict, dict], dict],
+    *,
+    key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+    max_pending: int = 10000,
+) -> Dict[str, int]:
+    with JsonlWriter(output_path) as contracts, JsonlWriter(report_path) as unmatched:
+        stats = fuse_streams(
+            iter_jsonl(calculation_path),
+            iter_jsonl(meaning_path),
+            build_contract,
+            contracts.write,
+            unmatched.write,
+            key_fields=key_fields,
+            max_pending=max_pending,
+        )
+    return stats
@@ -0,0 +1,149 @@
+"""
+fusion_engine/worker_tables.py
+
+사전 fork / spawn 워커용 공유 엔진 테이블
+- 부모: 두 엔진의 테이블을 한 번 로드해 공유 테이블 파일(tboo_runtime/shared_tables.py)로 기록하고
+  TBOO_SHARED_TABLES 를 설정 → 이후 뜨는 워커는 import 시점에 파일을 mmap view 로 붙인다
+    calculation.calendar     만세력 코드 / 음력 배열
+    calculation.solar_terms  절입 시각 배열
+    calculation.civil_time   날짜별 UTC 오프셋 표
+    meaning.lexicons         ganji lexicon / 조합 규칙 (문자열 표 — shared_tables.pack_strings)
+- 워커는 CSV / JSON 을 읽지 않는다. 배열 테이블은 페이지 캐시 한 벌을 공유하므로
+  워커 수가 늘어도 엔진 데이터 메모리는 일정하다
+- 십신 / 12운성 표는 모듈 상수(코드)라 파싱 비용이 없어 대상에서 제외
+
+    publish_engine_tables()          # 서버 부모 프로세스에서 워커 생성 전에 1회
+    python fusion_engine/worker_tables.py --workers 4   # shared / private 워커 메모리 · 기동 시간 비교
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from engines import BASE_DIR, load_calculation_main  # noqa: F401  (경로 설정 포함)
+from tboo_runtime import shared_tables
+from tboo_runtime.shared_tables import ENV_VAR, Tables, default_table_path, pack_strings, write_tables
+
+
+def engine_tables() -> Tables:
+    """현재 프로세스에서 엔진 테이블을 로드해 배열 그룹으로."""
+    from engine.calendar_table import get_calendar_table
+    from engine.engine_core import GANJI_BRANCH_LEXICON, GANJI_COMBINATION_RULES, GANJI_STEM_LEXICON
+    from engine.saju_core import load_solar_terms
+    from utils.solar_time import get_civil_time_table
+
+    return {
+        "calculation.calendar": get_calendar_table().arrays(),
+        "calculation.solar_terms": load_solar_terms().arrays(),
+        "calculation.civil_time": get_civil_time_table().arrays(),
+        "meaning.lexicons": pack_strings((GANJI_STEM_LEXICON, GANJI_BRANCH_LEXICON, GANJI_COMBINATION_RULES)),
+    }
+
+
+def publish_engine_tables(path: Optional[Path] = None) -> Path:
+    """
+    테이블 파일을 기록하고 이 프로세스 + 이후 자식 프로세스가 쓰도록 설정.
+    부모 자신도 파일 view 로 교체하므로 fork 된 워커와 같은 페이지를 본다.
+    """
+    path = write_tables(path or default_table_path(), engine_tables())
+    os.environ[ENV_VAR] = str(path)
+    shared_tables.attach(path)
+
+    from engine.saju_core import install_shared_tables
+
+    install_shared_tables()
+    return path
+
+
+# ------------------------------------------------------------
+# 워커 메모리 / 기동 시간 비교
+# ------------------------------------------------------------
+def _smaps_rollup() -> Dict[str, int]:
+    """/proc/self/smaps_rollup (kB → bytes). Linux 외에는 빈 dict."""
+    out: Dict[str, int] = {}
+    try:
+        with open("/proc/self/smaps_rollup", "r") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    out[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    except OSError:
+        pass
+    return out
+
+
+def _worker(queue) -> None:
+    t0 = time.perf_counter()
+    calc_main = load_calculation_main()
+    from engine.engine_core import run_engine
+    from engine.saju_core import analyze_saju
+
+    info, _ = analyze_saju(1990, 5, 5, 10, 30, 1, "worker", defer=True)
+    today = calc_main.compute_today_unse(info["day_gan"], 1)
+    run_engine(calc_main.build_tboo_json_v33("worker", "남성", 1990, 5, 5, 10, 30, info, today))
+    ready = time.perf_counter() - t0
+
+    smaps = _smaps_rollup()
+    queue.put({
+        "pid": os.getpid(),
+        "shared_tables": shared_tables.attached_tables() is not None,
+        "startup_ms": round(ready * 1e3, 1),
+        "rss": smaps.get("Rss"),
+        "pss": smaps.get("Pss"),
+        "private": (smaps.get("Private_Clean", 0) + smaps.get("Private_Dirty", 0)) or None,
+    })
+
+
+def run_workers(count: int, start_method: str) -> list:
+    ctx = mp.get_context(start_method)
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(queue,)) for _ in range(count)]
+    for p in procs:
+        p.start()
+    results = [queue.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return sorted(results, key=lambda r: r["pid"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="shared engine tables for worker processes")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--start-method", default="spawn", choices=mp.get_all_start_methods())
+    parser.add_argument("--mode", default="both", choices=("shared", "private", "both"))
+    parser.add_argument("--path", default=None, help="테이블 파일 경로 (기본: /dev/shm/tboo_tables_<pid>.bin)")
+    args = parser.parse_args()
+
+    def summary(results):
+        def mib(key):
+            values = [r[key] for r in results if r[key] is not None]
+            return round(sum(values) / 2**20, 1) if values else None
+
+        return {
+            "workers": results,
+            "startup_ms_mean": round(sum(r["startup_ms"] for r in results) / len(results), 1),
+            "total_pss_mib": mib("pss"),
+            "total_private_mib": mib("private"),
+        }
+
+    report: Dict[str, Any] = {}
+    if args.mode in ("private", "both"):
+        os.environ.pop(ENV_VAR, None)
+        report["private"] = summary(run_workers(args.workers, args.start_method))
+    if args.mode in ("shared", "both"):
+        path = publish_engine_tables(Path(args.path) if args.path else None)
+        try:
+            report["table_file"] = {"path": str(path), "bytes": path.stat().st_size}
+            report["shared"] = summary(run_workers(args.workers, args.start_method))
+        finally:
+            path.unlink(missing_ok=True)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,14 +22,24 @@ Renderer responsibility:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent   # meaning_engine/
 SCHEMA_DIR = BASE_DIR / "schemas" / "canonical"
+ROOT_DIR = BASE_DIR.parent                          # repo root (tboo_runtime)
+
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
 
 from typing import Any, Dict, List, Optional, Tuple
 
+from tboo_runtime.memory import register_resident
+from tboo_runtime.shared_tables import attached_tables, unpack_strings
+from tboo_runtime.tracing import lap_timer
+
 
 # ---------------------------------------------------------------------
 # Paths / loaders
@@ -46,9 +56,19 @@ def load_json(path: Path) -> dict:
 # Schemas (required for Ganji Ontology only)
 # ---------------------------------------------------------------------
 # NOTE: narrative_directives 제거 (A-2 YES)
-GANJI_STEM_LEXICON = load_json(SCHEMA_DIR / "ganji_stem_lexicon_v1.0.json")
-GANJI_BRANCH_LEXICON = load_json(SCHEMA_DIR / "ganji_branch_lexicon_v1.0.json")
-GANJI_COMBINATION_RULES = load_json(SCHEMA_DIR / "ganji_combination_rules_v1.0.json")
+# Worker processes attached to a shared table file (TBOO_SHARED_TABLES) take
+# the lexicons from it instead of re-reading and parsing the schema files.
+LEXICON_FILES = (
+    "ganji_stem_lexicon_v1.0.json",
+    "ganji_branch_lexicon_v1.0.json",
+    "ganji_combination_rules_v1.0.json",
+)
+_shared_tables = attached_tables()
+_shared_lexicons = _shared_tables.table("meaning.lexicons") if _shared_tables else None
+GANJI_STEM_LEXICON, GANJI_BRANCH_LEXICON, GANJI_COMBINATION_RULES = (
+    unpack_strings(_shared_lexicons) if _shared_lexicons is not None
+    else tuple(load_json(SCHEMA_DIR / name) for name in LEXICON_FILES)
+)
 
 
 # ---------------------------------------------------------------------
@@ -190,6 +210,180 @@ SIPSHIN_TO_EMOTION_ENGINE_KEY = {
 }
 
 
+# ---------------------------------------------------------------------
+# Interned slot strings (built once, reused by every chart)
+# ---------------------------------------------------------------------
+
+SLOT_DOMAINS = ("money", "love", "job")
+
+DESIRE_DIRECTION_KEYS = {
+    stem["desire_vector"]: f"desire.{stem['desire_vector']}"
+    for stem in GANJI_STEM_LEXICON.get("stems", {}).values()
+    if stem.get("desire_vector")
+}
+
+DOMAIN_ENGINE_SLOTS = {
+    (domain, sipshin): f"{domain}.engine_{sipshin}"
+    for domain in SLOT_DOMAINS
+    for sipshin in SIPSHIN_TO_EMOTION_ENGINE_KEY
+}
+
+DOMAIN_STATE_SLOTS = {
+    (domain, un12): f"{domain}.state_{rhythm}"
+    for domain in SLOT_DOMAINS
+    for un12, rhythm in UNSEONG_TO_RHYTHM_KEY.items()
+}
+
+YEAR_THEME_SIPSHIN_SLOTS = {
+    sipshin: f"year_theme.by_{sipshin}" for sipshin in SIPSHIN_TO_EMOTION_ENGINE_KEY
+}
+
+YEAR_THEME_STATE_SLOTS = {
+    un12: f"year_theme.state_{rhythm}" for un12, rhythm in UNSEONG_TO_RHYTHM_KEY.items()
+}
+
+TODAY_EMOTION_SLOTS = {
+    sipshin: f"today.emotion_{emotion}"
+    for sipshin, emotion in SIPSHIN_TO_EMOTION_ENGINE_KEY.items()
+}
+
+TODAY_STATE_SLOTS = {
+    un12: f"today.state_{rhythm}" for un12, rhythm in UNSEONG_TO_RHYTHM_KEY.items()
+}
+
+
+# ---------------------------------------------------------------------
+# Slot vocabulary (integer slot IDs + versioned string table)
+# ---------------------------------------------------------------------
+
+SLOT_VOCAB_NAME = "tboo_slot_vocab"
+SLOT_VOCAB_VERSION = "1.0"
+
+
+def _build_slot_vocabulary() -> Tuple[str, ...]:
+    """
+    Enumerate every slot string the derivations above can emit for
+    in-lexicon input. Order is fixed by the key maps, so IDs are stable
+    as long as the maps/lexicons are unchanged (guarded by the checksum).
+    """
+    words: List[str] = ["year_theme.unknown", "today.unknown"]
+    words += COMBINATION_TO_EXISTENCE_KEY.keys()      # pillars_combination_types
+    words += COMBINATION_TO_EXISTENCE_KEY.values()
+    words += DESIRE_DIRECTION_KEYS.values()
+    words += SIPSHIN_TO_EMOTION_ENGINE_KEY.values()
+    words += UNSEONG_TO_RHYTHM_KEY.values()
+    words += YEAR_THEME_SIPSHIN_SLOTS.values()
+    words += YEAR_THEME_STATE_SLOTS.values()
+    words += TODAY_EMOTION_SLOTS.values()
+    words += TODAY_STATE_SLOTS.values()
+    words += DOMAIN_ENGINE_SLOTS.values()
+    words += DOMAIN_STATE_SLOTS.values()
+    return tuple(_dedupe(words))
+
+
+SLOT_VOCABULARY = _build_slot_vocabulary()
+SLOT_IDS = {word: i for i, word in enumerate(SLOT_VOCABULARY)}
+SLOT_VOCAB_CHECKSUM = hashlib.sha256(
+    "\n".join(SLOT_VOCABULARY).encode("utf-8")
+).hexdigest()[:16]
+
+register_resident(
+    "meaning.lexicons",
+    lambda: (GANJI_STEM_LEXICON, GANJI_BRANCH_LEXICON, GANJI_COMBINATION_RULES),
+)
+register_resident(
+    "meaning.slot_vocabulary",
+    lambda: (
+        SLOT_VOCABULARY,
+        SLOT_IDS,
+        DOMAIN_ENGINE_SLOTS,
+        DOMAIN_STATE_SLOTS,
+        YEAR_THEME_SIPSHIN_SLOTS,
+        YEAR_THEME_STATE_SLOTS,
+        TODAY_EMOTION_SLOTS,
+        TODAY_STATE_SLOTS,
+    ),
+)
+
+
+def slot_table(include_strings: bool = True) -> Dict[str, Any]:
+    """Versioned string table for decoding integer slot IDs."""
+    table: Dict[str, Any] = {
+        "name": SLOT_VOCAB_NAME,
+        "version": SLOT_VOCAB_VERSION,
+        "checksum": SLOT_VOCAB_CHECKSUM,
+        "size": len(SLOT_VOCABULARY),
+    }
+    if include_strings:
+        table["strings"] = list(SLOT_VOCABULARY)
+    return table
+
+
+def encode_slot_ids(slots: Any) -> Any:
+    """
+    Replace known slot strings with their integer IDs (recursively).
+    Strings outside the vocabulary (fallback keys such as "rhythm.?")
+    are kept as-is, so the encoding stays lossless.
+    Slot values never contain integers, which keeps decoding unambiguous.
+    """
+    if isinstance(slots, str):
+        return SLOT_IDS.get(slots, slots)
+    if isinstance(slots, list):
+        return [encode_slot_ids(x) for x in slots]
+    if isinstance(slots, dict):
+        return {k: encode_slot_ids(v) for k, v in slots.items()}
+    return slots
+
+
+def decode_slot_ids(slots: Any, strings: Optional[List[str]] = None) -> Any:
+    """Inverse of `encode_slot_ids`."""
+    table = SLOT_VOCABULARY if strings is None else strings
+    if isinstance(slots, int) and not isinstance(slots, bool):
+        return table[slots]
+    if isinstance(slots, list):
+        return [decode_slot_ids(x, strings) for x in slots]
+    if isinstance(slots, dict):
+        return {k: decode_slot_ids(v, strings) for k, v in slots.items()}
+    return slots
+
+
+def expand_slot_ids(
+    meaning_json: Dict[str, Any],
+    table: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Expand an ID-encoded meaning payload back to the string form emitted
+    by `run_engine(..., slot_encoding="text")`.
+
+    `table` defaults to this engine's vocabulary; pass a stored
+    `slot_table()` to decode payloads produced by another version.
+    """
+    meta = meaning_json.get("meta", {}) or {}
+    if meta.get("slot_encoding") != "id":
+        return meaning_json
+
+    table = table or slot_table()
+    ref = meta.get("slot_table", {}) or {}
+    if ref.get("checksum") != table.get("checksum"):
+        raise ValueError(
+            f"Slot table mismatch: payload={ref.get('checksum')!r} "
+            f"table={table.get('checksum')!r}"
+        )
+    strings = table.get("strings")
+    if strings is None:
+        raise ValueError("Slot table has no 'strings'.")
+
+    out = dict(meaning_json)
+    out["meta"] = {
+        k: v for k, v in meta.items() if k not in ("slot_encoding", "slot_table")
+    }
+    out["meaning_payload"] = {
+        ctx: {**body, "slots": decode_slot_ids(body.get("slots"), strings)}
+        for ctx, body in (meaning_json.get("meaning_payload", {}) or {}).items()
+    }
+    return out
+
+
 # ---------------------------------------------------------------------
 # Slot derivations (NO prose, only semantic keys)
 # ---------------------------------------------------------------------
@@ -208,7 +402,7 @@ def derive_desire_direction(day_ontology: Dict[str, Any]) -> Optional[str]:
     if not vector:
         return None
 
-    return f"desire.{vector}"
+    return DESIRE_DIRECTION_KEYS.get(vector) or f"desire.{vector}"
 
 
 def derive_action_rhythm(unseong_map: Dict[str, Any]) -> Optional[str]:
@@ -249,9 +443,14 @@ def derive_year_theme(year_flow: List[List[Any]]) -> List[str]:
 
     theme: List[str] = []
     if sipshin:
-        theme.append(f"year_theme.by_{sipshin}")
+        theme.append(
+            YEAR_THEME_SIPSHIN_SLOTS.get(sipshin) or f"year_theme.by_{sipshin}"
+        )
     if un12:
-        theme.append(f"year_theme.state_{UNSEONG_TO_RHYTHM_KEY.get(un12, un12)}")
+        theme.append(
+            YEAR_THEME_STATE_SLOTS.get(un12)
+            or f"year_theme.state_{UNSEONG_TO_RHYTHM_KEY.get(un12, un12)}"
+        )
     return _dedupe(theme) if theme else ["year_theme.unknown"]
 
 
@@ -265,9 +464,15 @@ def derive_domain_flow(domain_ops: List[List[Any]], domain: str) -> List[str]:
         sipshin = row[0] if len(row) > 0 else None
         un12 = row[2] if len(row) > 2 else None
         if sipshin:
-            out.append(f"{domain}.engine_{sipshin}")
+            out.append(
+                DOMAIN_ENGINE_SLOTS.get((domain, sipshin))
+                or f"{domain}.engine_{sipshin}"
+            )
         if un12:
-            out.append(f"{domain}.state_{UNSEONG_TO_RHYTHM_KEY.get(un12, un12)}")
+            out.append(
+                DOMAIN_STATE_SLOTS.get((domain, un12))
+                or f"{domain}.state_{UNSEONG_TO_RHYTHM_KEY.get(un12, un12)}"
+            )
     return _dedupe(out)
 
 
@@ -276,12 +481,129 @@ def derive_today_wave(today_block: Dict[str, Any]) -> List[str]:
     un12 = today_block.get("unseong")
     out: List[str] = []
     if sipshin:
-        out.append(f"today.emotion_{SIPSHIN_TO_EMOTION_ENGINE_KEY.get(sipshin, sipshin)}")
+        out.append(
+            TODAY_EMOTION_SLOTS.get(sipshin)
+            or f"today.emotion_{SIPSHIN_TO_EMOTION_ENGINE_KEY.get(sipshin, sipshin)}"
+        )
     if un12:
-        out.append(f"today.state_{UNSEONG_TO_RHYTHM_KEY.get(un12, un12)}")
+        out.append(
+            TODAY_STATE_SLOTS.get(un12)
+            or f"today.state_{UNSEONG_TO_RHYTHM_KEY.get(un12, un12)}"
+        )
     return _dedupe(out) if out else ["today.unknown"]
 
 
+# ---------------------------------------------------------------------
+# Timeline contexts (daeun_<i> / year_<YYYY>)
+# ---------------------------------------------------------------------
+
+# Sipshin that drive each domain (same split as the calculation's
+# domain operations; love follows the subject's gender).
+DOMAIN_SIPSHIN = {
+    "money": ("정재", "편재"),
+    "job": ("정관", "편관", "식신", "상관"),
+}
+LOVE_SIPSHIN = {"남성": ("정재", "편재"), "여성": ("정관", "편관")}
+
+
+def _ganji_slots(gan: str, ji: str) -> Dict[str, Optional[str]]:
+    ontology = compute_ganji_ontology(gan, ji)
+    return {
+        "existence_type": derive_existence_type(ontology),
+        "desire_direction": derive_desire_direction(ontology),
+    }
+
+
+# Ontology-derived slots for every lexicon stem × branch, computed once so
+# a timeline context costs a few dict lookups instead of an ontology pass.
+GANJI_SLOT_TABLE: Dict[str, Dict[str, Optional[str]]] = {
+    gan + ji: _ganji_slots(gan, ji)
+    for gan in GANJI_STEM_LEXICON.get("stems", {})
+    for ji in GANJI_BRANCH_LEXICON.get("branches", {})
+}
+
+register_resident("meaning.ganji_slot_table", lambda: GANJI_SLOT_TABLE)
+
+
+def timeline_entry(calculated: Dict[str, Any], context_type: str) -> Optional[Dict[str, Any]]:
+    """
+    Calculation entry behind a timeline context:
+      daeun_<i>    → daeun_detail[i]
+      year_<YYYY>  → the year_flow entry for YYYY
+    """
+    kind, _, key = context_type.partition("_")
+    if not key.isdigit():
+        return None
+    if kind == "daeun":
+        detail = calculated.get("daeun_detail") or []
+        i = int(key)
+        return detail[i] if i < len(detail) else None
+    if kind == "year":
+        flow = calculated.get("year_flow") or []
+        year = int(key)
+        if flow:
+            i = year - flow[0].get("year", year)   # year_flow is consecutive years
+            if 0 <= i < len(flow) and flow[i].get("year") == year:
+                return flow[i]
+        return next((e for e in flow if e.get("year") == year), None)
+    return None
+
+
+def timeline_context_types(calculated: Dict[str, Any], daeun: bool = False) -> List[str]:
+    """
+    Timeline contexts for a calculation, in output order.
+    year_<YYYY> follows year_flow (itself opt-in on the calculation side);
+    daeun_detail is always present, so daeun_<i> is requested explicitly.
+    """
+    cycles = [f"daeun_{e.get('index', i)}" for i, e in enumerate(calculated.get("daeun_detail") or [])] if daeun else []
+    years = [f"year_{e['year']}" for e in calculated.get("year_flow") or [] if "year" in e]
+    return cycles + years
+
+
+def derive_cycle_slots(entry: Dict[str, Any], gender: str) -> Dict[str, Any]:
+    """Slots shared by daeun / year contexts (ganji ontology + domain flows)."""
+    gan, ji = entry.get("gan"), entry.get("ji")
+    sipshin, un12 = entry.get("sipshin"), entry.get("un12")
+    ganji = GANJI_SLOT_TABLE.get(f"{gan}{ji}") or _ganji_slots(gan, ji)
+    row = [[sipshin, gan, un12]]
+    domain_sipshin = {**DOMAIN_SIPSHIN, "love": LOVE_SIPSHIN.get(gender, ())}
+    return {
+        "existence_type": ganji["existence_type"],
+        "desire_direction": ganji["desire_direction"],
+        **{
+            f"{domain}_flow": derive_domain_flow(row, domain) if sipshin in domain_sipshin[domain] else []
+            for domain in SLOT_DOMAINS
+        },
+    }
+
+
+# Calculation domain flag → slot domain (month_operation "domains").
+MONTH_DOMAIN_KEYS = (("money", "jaemul"), ("love", "love"), ("job", "job"))
+
+
+def derive_month_slots(month: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Slots for one month_operation period. Domain flows follow the
+    calculation's per-month domain flags (no sipshin re-derivation).
+    """
+    ganji = month.get("ganji") or ""
+    sipshin, un12 = month.get("sipshin"), month.get("unseong")
+    flags = month.get("domains") or {}
+    ontology = GANJI_SLOT_TABLE.get(ganji)
+    if ontology is None:
+        gan, ji = split_ganji(ganji)
+        ontology = _ganji_slots(gan, ji) if gan and ji else {}
+    slots = {
+        "existence_type": ontology.get("existence_type"),
+        "desire_direction": ontology.get("desire_direction"),
+        "emotion_engine": SIPSHIN_TO_EMOTION_ENGINE_KEY.get(sipshin, f"emotion.{sipshin}") if sipshin else None,
+        "rhythm": UNSEONG_TO_RHYTHM_KEY.get(un12, f"rhythm.{un12}") if un12 else None,
+    }
+    for domain, flag in MONTH_DOMAIN_KEYS:
+        slots[f"{domain}_flow"] = derive_domain_flow([[sipshin, None, un12]], domain) if flags.get(flag) else []
+    return slots
+
+
 # ---------------------------------------------------------------------
 # Meaning slots builder (service router)
 # ---------------------------------------------------------------------
@@ -389,13 +711,83 @@ def build_meaning_slots(
             "today_job": derive_domain_flow(today_ops.get("job", []) or [], "job"),
         }
 
+    if context_type == "month_operation":
+        months = (calculated.get("month_operation") or {}).get("months") or []
+        return {"months": [derive_month_slots(m) for m in months]}
+
+    if context_type.startswith(("daeun_", "year_")):
+        entry = timeline_entry(calculated, context_type) or {}
+        gender = (calculated.get("user_info") or calculated.get("subject") or {}).get("gender", "")
+        sipshin, un12 = entry.get("sipshin"), entry.get("un12")
+        cycle = derive_cycle_slots(entry, gender)
+
+        if context_type.startswith("daeun_"):
+            return {
+                "emotion_engine": (
+                    SIPSHIN_TO_EMOTION_ENGINE_KEY.get(sipshin, f"emotion.{sipshin}") if sipshin else None
+                ),
+                "rhythm": UNSEONG_TO_RHYTHM_KEY.get(un12, f"rhythm.{un12}") if un12 else None,
+                **cycle,
+            }
+
+        return {
+            "year_theme": derive_year_theme(
+                [[context_type, entry.get("gan"), sipshin, un12]] if entry else []
+            ),
+            **cycle,
+        }
+
+
+def context_evidence(calculated: Dict[str, Any], context_type: str) -> Any:
+    """Evidence attached to a context (the calculation's own objects, not copies)."""
+    if context_type == "natal":
+        return {
+            "pillars": calculated.get("saju", {}),
+            "sipshin": calculated.get("sipshin", {}),
+            "unseong": calculated.get("unseong", {}),
+        }
+    if context_type == "fortune_2026_overall":
+        return calculated.get("year_2026_operation", {})
+    if context_type == "fortune_2026_money":
+        # ─────────────────────────────────────────────
+        # [PATCH] year_2026_operation money / jaemul alias
+        # ─────────────────────────────────────────────
+        return (
+            safe_get(calculated, "year_2026_operation", "money", default=None)
+            or safe_get(calculated, "year_2026_operation", "jaemul", default=[])
+        )
+    if context_type in ("fortune_2026_love", "fortune_2026_job"):
+        return safe_get(calculated, "year_2026_operation", context_type[len("fortune_2026_"):], default=[])
+    if context_type in ("today", "month_operation"):
+        return calculated.get(context_type, {})
+    return timeline_entry(calculated, context_type)
+
 
 # ---------------------------------------------------------------------
 # Engine entry
 # ---------------------------------------------------------------------
 
-def run_engine(calculated_saju_json: Dict[str, Any]) -> Dict[str, Any]:
-    """Main entry: returns meaning engine output (slots only)."""
+def run_engine(
+    calculated_saju_json: Dict[str, Any],
+    *,
+    slot_encoding: str = "text",
+    daeun: bool = False,
+) -> Dict[str, Any]:
+    """
+    Main entry: returns meaning engine output (slots only).
+
+    slot_encoding:
+      - "text": slot strings (default, renderer-readable)
+      - "id"  : integer slot IDs; decode with `slot_table()` /
+                `expand_slot_ids()`
+    daeun:
+      also emit a daeun_<i> context per daeun_detail entry (opt-in like
+      month_operation / year_<YYYY>, which follow the calculation's
+      optional sections)
+    """
+    if slot_encoding not in ("text", "id"):
+        raise ValueError(f"Unknown slot_encoding: {slot_encoding!r}")
+
     saju = calculated_saju_json.get("saju", {})
     day_ganji = saju.get("day", "")
     day_gan, day_ji = split_ganji(day_ganji)
@@ -403,86 +795,116 @@ def run_engine(calculated_saju_json: Dict[str, Any]) -> Dict[str, Any]:
     if not (day_gan and day_ji):
         raise ValueError("Invalid 'saju.day' ganji. Expected 2-char string like '丁亥'.")
 
+    laps = lap_timer("run_engine")
     pillars_ontology = compute_pillars_ontology(saju)
     day_ontology = pillars_ontology.get("day") or compute_ganji_ontology(day_gan, day_ji)
+    laps.lap("ontology")
+
+    context_types = [
+        "natal",
+        "fortune_2026_overall",
+        "fortune_2026_money",
+        "fortune_2026_love",
+        "fortune_2026_job",
+        "today",
+    ]
+    if calculated_saju_json.get("month_operation"):
+        context_types.append("month_operation")
+    # year_<YYYY> for every year_flow entry, daeun_<i> per daeun_detail entry when asked
+    context_types += timeline_context_types(calculated_saju_json, daeun)
 
     meaning_payload = {
-        "natal": {
-            "slots": build_meaning_slots(
-                calculated_saju_json,
-                "natal",
-                pillars_ontology=pillars_ontology,
-                day_ontology=day_ontology,
-            ),
-            "evidence": {
-                "pillars": saju,
-                "sipshin": calculated_saju_json.get("sipshin", {}),
-                "unseong": calculated_saju_json.get("unseong", {}),
-            },
-        },
-        "fortune_2026_overall": {
+        context_type: {
             "slots": build_meaning_slots(
                 calculated_saju_json,
-                "fortune_2026_overall",
+                context_type,
                 pillars_ontology=pillars_ontology,
                 day_ontology=day_ontology,
             ),
-            "evidence": calculated_saju_json.get("year_2026_operation", {}),
-        },
-        "fortune_2026_money": {
-        "slots": build_meaning_slots(
-            calculated_saju_json,
-            "fortune_2026_money",
-            pillars_ontology=pillars_ontology,
-            day_ontology=day_ontology,
-        ),
-        # ─────────────────────────────────────────────
-        # [PATCH] year_2026_operation money / jaemul alias
-        # ─────────────────────────────────────────────
-        "evidence": (
-            safe_get(calculated_saju_json, "year_2026_operation", "money", default=None)
-            or safe_get(calculated_saju_json, "year_2026_operation", "jaemul", default=[])
-        ),
-    },
+            "evidence": context_evidence(calculated_saju_json, context_type),
+        }
+        for context_type in context_types
+    }
+    laps.lap("slots")
 
-        "fortune_2026_love": {
-            "slots": build_meaning_slots(
-                calculated_saju_json,
-                "fortune_2026_love",
-                pillars_ontology=pillars_ontology,
-                day_ontology=day_ontology,
-            ),
-            "evidence": safe_get(calculated_saju_json, "year_2026_operation", "love", default=[]),
-        },
-        "fortune_2026_job": {
-            "slots": build_meaning_slots(
-                calculated_saju_json,
-                "fortune_2026_job",
-                pillars_ontology=pillars_ontology,
-                day_ontology=day_ontology,
-            ),
-            "evidence": safe_get(calculated_saju_json, "year_2026_operation", "job", default=[]),
-        },
-        "today": {
-            "slots": build_meaning_slots(
-                calculated_saju_json,
-                "today",
-                pillars_ontology=pillars_ontology,
-                day_ontology=day_ontology,
-            ),
-            "evidence": calculated_saju_json.get("today", {}),
-        },
+    meta: Dict[str, Any] = {
+        "engine": "TBOO_MEANING_ENGINE",
+        "version": "meaning_slots_v1.1",
+        "note": "Slots-only output. No materials, no narrative directives.",
     }
+    if slot_encoding == "id":
+        for body in meaning_payload.values():
+            body["slots"] = encode_slot_ids(body["slots"])
+        meta["slot_encoding"] = "id"
+        meta["slot_table"] = slot_table(include_strings=False)
+        laps.lap("slot_ids")
+    laps.done()
 
     # NOTE: narrative_directives 완전 제거 (A-2 YES)
     return {
-        "meta": {
-            "engine": "TBOO_MEANING_ENGINE",
-            "version": "meaning_slots_v1.1",
-            "note": "Slots-only output. No materials, no narrative directives.",
-        },
+        "meta": meta,
         "subject": calculated_saju_json.get("user_info", calculated_saju_json.get("subject", {})),
         "context": calculated_saju_json.get("context", {}),
         "pillars_ontology": pillars_ontology,
         "meaning_payload": meaning_payload,
     }
+
+
+def refresh_today_context(
+    meaning_json: Dict[str, Any],
+    calculated_saju_json: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Rebuild only the `today` context of an existing meaning payload.
+
+    Natal / 2026 contexts and `pillars_ontology` are reused as-is; the
+    slot encoding of the original payload is preserved. ID-encoded
+    payloads must carry this engine's vocabulary checksum, otherwise the
+    refreshed `today` IDs would not match the rest of the payload.
+    """
+    meta = meaning_json.get("meta", {}) or {}
+    slot_encoding = meta.get("slot_encoding", "text")
+    if slot_encoding == "id":
+        checksum = (meta.get("slot_table", {}) or {}).get("checksum")
+        if checksum != SLOT_VOCAB_CHECKSUM:
+            raise ValueError(
+                f"Slot table mismatch: payload={checksum!r} engine={SLOT_VOCAB_CHECKSUM!r} "
+                "(re-run run_engine for this chart)"
+            )
+    refreshed = dict(meaning_json)
+    refreshed["meaning_payload"] = {
+        **(meaning_json.get("meaning_payload", {}) or {}),
+        "today": build_today_context(
+            calculated_saju_json,
+            pillars_ontology=meaning_json.get("pillars_ontology", {}) or {},
+            slot_encoding=slot_encoding,
+        ),
+    }
+    return refreshed
+
+
+def build_today_context(
+    calculated_saju_json: Dict[str, Any],
+    *,
+    pillars_ontology: Optional[Dict[str, Any]] = None,
+    slot_encoding: str = "text",
+) -> Dict[str, Any]:
+    """
+    Build the `today` meaning context ({"slots", "evidence"}) on its own.
+
+    Today slots depend only on the calculation `today` block, so this is
+    what overnight pre-generation runs without a full meaning payload.
+    """
+    pillars_ontology = pillars_ontology or {}
+    slots = build_meaning_slots(
+        calculated_saju_json,
+        "today",
+        pillars_ontology=pillars_ontology,
+        day_ontology=pillars_ontology.get("day") or {},
+    )
+    if slot_encoding == "id":
+        slots = encode_slot_ids(slots)
+    return {
+        "slots": slots,
+        "evidence": context_evidence(calculated_saju_json, "today"),
+    }
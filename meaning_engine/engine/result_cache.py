@@ -0,0 +1,304 @@
+"""engine/result_cache.py
+
+Content-addressed cache of `run_engine` results
+-----------------------------------------------
+
+Meaning slots and `pillars_ontology` are fully determined by the
+calculation values the slot derivations read (pillars, sipshin, unseong,
+year_2026_operation, today, the ganji / sipshin / unseong of each
+timeline and month entry, the subject's gender) plus the lexicons and
+engine code. Charts that agree on those values share one cached result,
+whatever the subject's name, birthday or daeun labels.
+
+The `today` block changes every day while everything else is fixed per
+chart, so it is kept out of the key: the cache holds the static contexts
+and `today` is rebuilt from the request on every hit
+(`build_today_context`, the same path as `refresh_today_context`).
+A chart therefore keeps hitting across days.
+
+- `chart_fingerprint()`: canonical JSON over the static inputs → blake2b
+- key: (fingerprint, `ENGINE_VERSION`, slot_encoding, daeun)
+  `ENGINE_VERSION` hashes the lexicons, the slot vocabulary and the
+  engine sources, so any change there is a different key
+- the cache holds {meta, pillars_ontology, slots per context} with
+  `today` slots left out (null, keeping the context order); evidence,
+  subject, context and `today` are rebuilt from the request's own
+  calculation, so the response equals `run_engine` output
+- memory tier: bounded LRU (`max_entries`)
+- disk tier (optional): `<directory>/<ENGINE_VERSION>/<fp[:2]>/<fp>.<encoding>[.daeun].json`,
+  written through the shared output writer (atomic replace via a
+  per-process unique temp file, so workers sharing a directory never
+  clobber each other's partial writes)
+- `stats()`: hits / disk_hits / misses / evictions / hit_rate
+
+Cached slots / ontology are shared between callers and read-only.
+
+    cache = MeaningResultCache(max_entries=4096, directory=Path("cache/meaning"))
+    meaning = cache.run(calculation_json, slot_encoding="text")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from engine.engine_core import (
+    GANJI_BRANCH_LEXICON,
+    GANJI_COMBINATION_RULES,
+    GANJI_STEM_LEXICON,
+    MONTH_DOMAIN_KEYS,
+    SLOT_VOCAB_CHECKSUM,
+    build_today_context,
+    context_evidence,
+    run_engine,
+)
+from tboo_runtime.memory import register_resident
+from tboo_runtime.output_writer import get_output_writer
+
+# Calculation fields hashed as-is (small, read whole by the slot derivations).
+# `today` is not one of them: its context is rebuilt per request.
+FINGERPRINT_FIELDS = ("saju", "sipshin", "unseong", "year_2026_operation")
+
+# Contexts rebuilt from the request instead of being cached.
+PER_REQUEST_CONTEXT = "today"
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+# Built once: json.dumps() with options constructs a new encoder per call.
+_CANONICAL = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"), check_circular=False)
+
+
+def _canonical(obj: Any) -> bytes:
+    return _CANONICAL.encode(obj).encode("utf-8")
+
+
+def _engine_version() -> str:
+    h = hashlib.sha256()
+    for lexicon in (GANJI_STEM_LEXICON, GANJI_BRANCH_LEXICON, GANJI_COMBINATION_RULES):
+        h.update(_canonical(lexicon))
+    h.update(SLOT_VOCAB_CHECKSUM.encode("ascii"))
+    for source in ("engine_core.py", "result_cache.py"):
+        h.update((Path(__file__).resolve().parent / source).read_bytes())
+    return h.hexdigest()[:16]
+
+
+ENGINE_VERSION = _engine_version()
+
+
+def chart_fingerprint(calculated: Dict[str, Any]) -> str:
+    """
+    Canonical fingerprint of the values the static slot derivations read.
+    Timeline / month entries contribute only their slot inputs (labels,
+    ages and dates live in the evidence, which is not cached); `today`
+    does not contribute at all.
+    """
+    subject = calculated.get("user_info") or calculated.get("subject") or {}
+    months = (calculated.get("month_operation") or {}).get("months") or []
+    doc = [
+        [calculated.get(field) for field in FINGERPRINT_FIELDS],
+        subject.get("gender"),
+        [
+            [e.get("index", i), e.get("gan"), e.get("ji"), e.get("sipshin"), e.get("un12")]
+            for i, e in enumerate(calculated.get("daeun_detail") or [])
+        ],
+        [
+            [e.get("year"), e.get("gan"), e.get("ji"), e.get("sipshin"), e.get("un12")]
+            for e in calculated.get("year_flow") or []
+        ],
+        [
+            [m.get("ganji"), m.get("sipshin"), m.get("unseong")]
+            + [(m.get("domains") or {}).get(flag) for _, flag in MONTH_DOMAIN_KEYS]
+            for m in months
+        ],
+    ]
+    return hashlib.blake2b(_canonical(doc), digest_size=16).hexdigest()
+
+
+def _cacheable(meaning_json: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "meta": dict(meaning_json["meta"]),   # callers may attach meta.trace to their copy
+        "pillars_ontology": meaning_json["pillars_ontology"],
+        "slots": {
+            ctx: None if ctx == PER_REQUEST_CONTEXT else body["slots"]
+            for ctx, body in meaning_json["meaning_payload"].items()
+        },
+    }
+
+
+def _respond(cached: Dict[str, Any], calculated: Dict[str, Any], slot_encoding: str) -> Dict[str, Any]:
+    """Same shape / values as run_engine output (evidence and `today` from this calculation)."""
+    pillars_ontology = cached["pillars_ontology"]
+    payload = {}
+    for ctx, slots in cached["slots"].items():
+        if ctx == PER_REQUEST_CONTEXT:
+            payload[ctx] = build_today_context(
+                calculated, pillars_ontology=pillars_ontology, slot_encoding=slot_encoding
+            )
+        else:
+            payload[ctx] = {"slots": slots, "evidence": context_evidence(calculated, ctx)}
+    return {
+        "meta": dict(cached["meta"]),
+        "subject": calculated.get("user_info", calculated.get("subject", {})),
+        "context": calculated.get("context", {}),
+        "pillars_ontology": pillars_ontology,
+        "meaning_payload": payload,
+    }
+
+
+class MeaningResultCache:
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        directory: Optional[Path] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.directory = Path(directory) / ENGINE_VERSION if directory else None
+        self._entries: "OrderedDict[Tuple[str, str, str, bool], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_writes": 0}
+
+    # ------------------------------------------------------------
+    # lookup / store
+    # ------------------------------------------------------------
+    def key(
+        self, calculated: Dict[str, Any], slot_encoding: str = "text", daeun: bool = False
+    ) -> Tuple[str, str, str, bool]:
+        return (chart_fingerprint(calculated), ENGINE_VERSION, slot_encoding, daeun)
+
+    def _disk_path(self, key: Tuple[str, str, str, bool]) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        fingerprint, _, slot_encoding, daeun = key
+        suffix = ".daeun" if daeun else ""
+        return self.directory / fingerprint[:2] / f"{fingerprint}.{slot_encoding}{suffix}.json"
+
+    def _load_disk(self, key: Tuple[str, str, str, bool]) -> Optional[Dict[str, Any]]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cached if all(k in cached for k in ("meta", "pillars_ontology", "slots")) else None
+
+    def _remember(self, key: Tuple[str, str, str, bool], cached: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def lookup(self, key: Tuple[str, str, str, bool]) -> Optional[Dict[str, Any]]:
+        """Cached result body ({meta, pillars_ontology, slots}) or None."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return cached
+        cached = self._load_disk(key)
+        if cached is not None:
+            self._remember(key, cached)
+            with self._lock:
+                self._counters["disk_hits"] += 1
+            return cached
+        with self._lock:
+            self._counters["misses"] += 1
+        return None
+
+    def store(self, key: Tuple[str, str, str, bool], meaning_json: Dict[str, Any]) -> None:
+        cached = _cacheable(meaning_json)
+        self._remember(key, cached)
+        path = self._disk_path(key)
+        if path is not None:
+            get_output_writer().write_file(path, json.dumps(cached, ensure_ascii=False, separators=(",", ":")))
+            with self._lock:
+                self._counters["disk_writes"] += 1
+
+    # ------------------------------------------------------------
+    # entry point
+    # ------------------------------------------------------------
+    def run(
+        self,
+        calculated: Dict[str, Any],
+        slot_encoding: str = "text",
+        compute: Optional[Callable[..., Dict[str, Any]]] = None,
+        daeun: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Cached `run_engine(calculated, slot_encoding=..., daeun=...)`.
+        `compute` replaces run_engine on a miss (e.g. to run it under an
+        admission slot); it receives the same arguments.
+        """
+        key = self.key(calculated, slot_encoding, daeun)
+        cached = self.lookup(key)
+        if cached is not None:
+            return _respond(cached, calculated, slot_encoding)
+        meaning_json = (compute or run_engine)(calculated, slot_encoding=slot_encoding, daeun=daeun)
+        self.store(key, meaning_json)
+        return meaning_json
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+        lookups = counters["hits"] + counters["disk_hits"] + counters["misses"]
+        return {
+            **counters,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hit_rate": round((counters["hits"] + counters["disk_hits"]) / lookups, 4) if lookups else 0.0,
+        }
+
+
+# ---------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------
+
+_CACHE: Optional[MeaningResultCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_result_cache() -> MeaningResultCache:
+    """
+    Process-wide cache (created on first use).
+    TBOO_MEANING_CACHE_SIZE: max entries, TBOO_MEANING_CACHE_DIR: disk tier.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            directory = os.environ.get("TBOO_MEANING_CACHE_DIR")
+            _CACHE = MeaningResultCache(
+                int(os.environ.get("TBOO_MEANING_CACHE_SIZE") or DEFAULT_MAX_ENTRIES),
+                Path(directory).expanduser() if directory else None,
+            )
+        return _CACHE
+
+
+def loaded_result_cache() -> Optional[MeaningResultCache]:
+    return _CACHE
+
+
+def cached_run_engine(
+    calculated: Dict[str, Any], *, slot_encoding: str = "text", daeun: bool = False
+) -> Dict[str, Any]:
+    """`run_engine` through the process-wide cache."""
+    return get_result_cache().run(calculated, slot_encoding, daeun=daeun)
+
+
+register_resident("meaning.result_cache", loaded_result_cache)
@@ -8,10 +8,16 @@ from __future__ import annotations
 
 import argparse
 import json
-from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-from engine.engine_core import run_engine
+from engine.engine_core import run_engine, slot_table
+from engine.result_cache import MeaningResultCache
+from tboo_runtime import clock
+from tboo_runtime.clock import add_clock_arguments, clock_from_args, set_clock
+from tboo_runtime.output_writer import get_output_writer
+from tboo_runtime.profiling import add_profiling_arguments, profiling_session_from_args
+from tboo_runtime.tracing import StageTracer, attach_trace, enable_tracing, stage
 
 
 def main() -> None:
@@ -26,9 +32,48 @@ def main() -> None:
         default=None,
         help="Output directory (default: meaning_engine/output)",
     )
+    parser.add_argument(
+        "--slot-ids",
+        action="store_true",
+        help="Emit integer slot IDs (string table saved next to the output)",
+    )
+    parser.add_argument(
+        "--daeun",
+        action="store_true",
+        help="Also emit a daeun_<i> context per daeun cycle (daeun_detail)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record per-stage timings in meta.trace",
+    )
+    parser.add_argument(
+        "--trace-export",
+        default=None,
+        help="Write per-stage timings (*.prom: Prometheus text, otherwise JSON)",
+    )
+    parser.add_argument(
+        "--jsonl",
+        default=None,
+        help="Also append the result as one line to this JSONL file (*.gz: gzip)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse meaning results for identical charts from this directory (content-addressed)",
+    )
 
+    add_clock_arguments(parser)
+    add_profiling_arguments(parser)
     args = parser.parse_args()
+    tracer = enable_tracing() if args.trace or args.trace_export else None
+    set_clock(clock_from_args(args))
+
+    with profiling_session_from_args(args):
+        run(args, tracer)
 
+
+def run(args: argparse.Namespace, tracer: Optional[StageTracer]) -> None:
     # ─────────────────────────────────────────────
     # 입력 파일 처리
     # ─────────────────────────────────────────────
@@ -40,7 +85,7 @@ def main() -> None:
 # [PATCH] 디렉터리 입력 지원
 # ─────────────────────────────────────────────
     if in_path.is_dir():
-        candidates = sorted(in_path.glob("*.json"))
+        candidates = sorted(in_path.glob("*_saju_v33_*.json"))
         if not candidates:
             raise FileNotFoundError(f"No json files in directory: {in_path}")
         in_path = candidates[-1]  # 최신 json 선택
@@ -67,32 +112,59 @@ def main() -> None:
     # ─────────────────────────────────────────────
     # 계산 결과 로드
     # ─────────────────────────────────────────────
-    with open(in_path, "r", encoding="utf-8") as f:
+    with stage("json_decode"), open(in_path, "r", encoding="utf-8") as f:
         calculation_json = json.load(f)
 
     # ─────────────────────────────────────────────
     # 의미 엔진 실행
     # ─────────────────────────────────────────────
-    meaning_slots = run_engine(calculation_json)
+    slot_encoding = "id" if args.slot_ids else "text"
+    if args.cache_dir:
+        cache = MeaningResultCache(directory=Path(args.cache_dir).expanduser().resolve())
+        meaning_slots = cache.run(calculation_json, slot_encoding, daeun=args.daeun)
+        print(f"🗃  meaning cache: {'hit' if cache.stats()['disk_hits'] else 'miss'}")
+    else:
+        meaning_slots = run_engine(calculation_json, slot_encoding=slot_encoding, daeun=args.daeun)
+    if args.trace:
+        attach_trace(meaning_slots, tracer)
 
     # ─────────────────────────────────────────────
     # 결과 파일명 생성 (세션 합의 반영)
     # ─────────────────────────────────────────────
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = clock.now().strftime("%Y%m%d_%H%M%S")
     out_filename = f"meaning_v1_{timestamp}_{hour_tag}.json"
     out_path = out_dir / out_filename
 
     # ─────────────────────────────────────────────
     # 저장
     # ─────────────────────────────────────────────
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(meaning_slots, f, ensure_ascii=False, indent=2)
+    # 직렬화는 여기서, 파일 기록은 output writer 스레드에서
+    writer = get_output_writer()
+    with stage("json_encode"):
+        writer.write_file(out_path, json.dumps(meaning_slots, ensure_ascii=False, indent=2))
+        if args.jsonl:
+            writer.append(
+                Path(args.jsonl).expanduser().resolve(),
+                json.dumps(meaning_slots, ensure_ascii=False, separators=(",", ":")),
+            )
+
+    # ID 모드: 문자열 테이블은 버전(checksum)당 한 번만 저장
+    # (결과 JSON 과 같은 폴더에 두면 최신 파일 선택(glob 정렬)에 섞이므로 하위 폴더)
+    if args.slot_ids:
+        table = slot_table()
+        table_path = out_dir / "slot_tables" / f"slot_table_{table['checksum']}.json"
+        if not table_path.exists():
+            writer.write_file(table_path, json.dumps(table, ensure_ascii=False, indent=2))
+    writer.flush()
 
     # 콘솔 로그
     print("\n==============================")
     print("✅ MEANING ENGINE COMPLETED")
     print(f"📥 Input : {in_path.name}")
     print(f"📤 Output: {out_path}")
+    if args.trace_export:
+        tracer.write(Path(args.trace_export).expanduser().resolve())
+        print(f"⏱  Trace : {args.trace_export}")
     print("==============================\n")
 
 
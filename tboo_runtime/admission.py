@@ -0,0 +1,196 @@
+"""
+tboo_runtime/admission.py
+
+요청 합치기(single-flight) + 동시 실행 상한(admission control)
+- SingleFlight: 같은 키로 동시에 들어온 호출은 먼저 온 호출(leader) 하나만 계산하고
+  나머지(follower)는 그 결과 / 예외를 그대로 받는다. 완료되면 키는 바로 지워진다 (캐시 아님)
+- AdmissionController: 동시에 계산하는 수를 max_concurrent 로 제한
+  초과분은 max_queue 개까지 대기열에서 queue_timeout 초 기다리고,
+  대기열이 가득 찼거나 시간이 지나면 Overloaded 로 즉시 거절 (load shedding)
+- 지표: 요청 / 합쳐진 요청 / 계산 / 거절(사유별) / 대기 시간 / 최대 동시 실행
+  stats() 는 dict, to_prometheus() 는 Prometheus text
+
+    flight = SingleFlight()
+    gate = AdmissionController(max_concurrent=4, max_queue=64, queue_timeout=2.0)
+
+    def handle(key):
+        return flight.do(key, lambda: gate.run(compute, key))
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class Overloaded(RuntimeError):
+    """동시 실행 / 대기열 상한 초과로 거절된 요청. reason: "queue_full" | "timeout"."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"engine overloaded ({reason})")
+        self.reason = reason
+
+
+# ------------------------------------------------------------
+# 요청 합치기
+# ------------------------------------------------------------
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """(결과, shared) — shared 는 다른 호출의 계산 결과를 받았으면 True."""
+        with self._lock:
+            self.requests += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"requests": self.requests, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+
+# ------------------------------------------------------------
+# 동시 실행 상한 / 대기열 / 거절
+# ------------------------------------------------------------
+class AdmissionController:
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int = 0,
+        queue_timeout: Optional[float] = None,
+    ):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+        self._counters = {
+            "admitted": 0,
+            "queued": 0,
+            "shed_queue_full": 0,
+            "shed_timeout": 0,
+            "queue_wait_seconds_total": 0.0,
+            "queue_wait_seconds_max": 0.0,
+            "active_max": 0,
+        }
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self._acquire()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify()
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self.slot():
+            return fn(*args, **kwargs)
+
+    def _acquire(self) -> None:
+        c = self._counters
+        with self._cond:
+            if self._active >= self.max_concurrent:
+                if self._waiting >= self.max_queue:
+                    c["shed_queue_full"] += 1
+                    raise Overloaded("queue_full")
+                c["queued"] += 1
+                self._waiting += 1
+                t0 = time.perf_counter()
+                deadline = None if self.queue_timeout is None else t0 + self.queue_timeout
+                try:
+                    while self._active >= self.max_concurrent:
+                        remaining = None if deadline is None else deadline - time.perf_counter()
+                        if remaining is not None and remaining <= 0:
+                            c["shed_timeout"] += 1
+                            if self._active < self.max_concurrent:
+                                self._cond.notify()   # 받은 신호를 버리지 않도록 다음 대기자에게
+                            raise Overloaded("timeout")
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+                    waited = time.perf_counter() - t0
+                    c["queue_wait_seconds_total"] += waited
+                    c["queue_wait_seconds_max"] = max(c["queue_wait_seconds_max"], waited)
+            self._active += 1
+            c["admitted"] += 1
+            c["active_max"] = max(c["active_max"], self._active)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                **self._counters,
+                "shed": self._counters["shed_queue_full"] + self._counters["shed_timeout"],
+                "active": self._active,
+                "waiting": self._waiting,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+            }
+
+
+# ------------------------------------------------------------
+# 내보내기
+# ------------------------------------------------------------
+_COUNTER_NAMES = {
+    "requests", "coalesced", "computed", "errors",
+    "admitted", "queued", "shed", "shed_queue_full", "shed_timeout",
+    "hits", "disk_hits", "misses", "evictions", "disk_writes",   # 의미 결과 캐시
+}
+
+
+def to_prometheus(stats: Dict[str, Dict[str, Any]], prefix: str = "tboo_admission") -> str:
+    """{엔드포인트: stats dict} → Prometheus text (숫자 값만, 엔드포인트는 label)."""
+    lines = []
+    names = sorted({k for s in stats.values() for k, v in s.items() if isinstance(v, (int, float))})
+    for name in names:
+        kind = "counter" if name.endswith("_total") or name in _COUNTER_NAMES else "gauge"
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for endpoint in sorted(stats):
+            value = stats[endpoint].get(name)
+            if isinstance(value, (int, float)):
+                lines.append(f'{prefix}_{name}{{endpoint="{endpoint}"}} {value}')
+    return "\n".join(lines) + "\n"
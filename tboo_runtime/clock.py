@@ -0,0 +1,127 @@
+"""
+tboo_runtime/clock.py
+
+주입 가능한 시계 (datetime.now() 직접 호출 대체)
+- 엔진 / CLI는 now() / today() 만 호출하고, 어떤 시계인지는 호출자가 정한다
+- 기본은 SystemClock (기존 datetime.now()와 동일: naive 로컬 시각)
+- KSTClock   : 서버 로컬 타임존과 무관하게 Asia/Seoul 벽시계 시각 (naive)
+- FixedClock : 특정 시각으로 고정 (사전 생성 / 재현 / 테스트)
+
+사용:
+    with use_clock(FixedClock(datetime(2026, 3, 1))):
+        get_today_ganji()          # 2026-03-01 기준
+
+CLI:
+    add_clock_arguments(parser)    # --now / --clock
+    set_clock(clock_from_args(args))
+"""
+
+import argparse
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+# Asia/Seoul 은 1988년 이후 서머타임이 없으므로 고정 +09:00 으로 충분하다
+KST = timezone(timedelta(hours=9), "KST")
+
+
+class SystemClock:
+    """서버 로컬 시각 (naive)."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class KSTClock:
+    """Asia/Seoul 벽시계 시각 (naive, 만세력 조회 기준과 같은 표현)."""
+
+    def now(self) -> datetime:
+        return datetime.now(KST).replace(tzinfo=None)
+
+
+class FixedClock:
+    """항상 같은 시각을 돌려주는 시계."""
+
+    def __init__(self, at: datetime):
+        if at.tzinfo is not None:
+            at = at.astimezone(KST).replace(tzinfo=None)
+        self.at = at
+
+    def now(self) -> datetime:
+        return self.at
+
+    def __repr__(self) -> str:
+        return f"FixedClock({self.at.isoformat()})"
+
+
+CLOCKS = {"system": SystemClock, "kst": KSTClock}
+
+_DEFAULT = SystemClock()
+_CLOCK: ContextVar[Optional[object]] = ContextVar("tboo_clock", default=None)
+
+
+# ------------------------------------------------------------
+# 현재 시계
+# ------------------------------------------------------------
+def get_clock():
+    return _CLOCK.get() or _DEFAULT
+
+
+def set_clock(clock) -> None:
+    """현재 컨텍스트의 시계 교체 (None이면 기본 SystemClock)."""
+    _CLOCK.set(clock)
+
+
+@contextmanager
+def use_clock(clock) -> Iterator[object]:
+    token = _CLOCK.set(clock)
+    try:
+        yield clock
+    finally:
+        _CLOCK.reset(token)
+
+
+def now() -> datetime:
+    return get_clock().now()
+
+
+def today() -> date:
+    return get_clock().now().date()
+
+
+# ------------------------------------------------------------
+# CLI
+# ------------------------------------------------------------
+def parse_instant(text: str) -> datetime:
+    """YYYY-MM-DD 또는 ISO 8601 시각 (오프셋이 있으면 KST 벽시계로 변환)."""
+    try:
+        value = datetime.fromisoformat(text.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"시각 형식 오류: {text!r} (YYYY-MM-DD 또는 ISO 8601)")
+    if value.tzinfo is not None:
+        value = value.astimezone(KST).replace(tzinfo=None)
+    return value
+
+
+def add_clock_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("clock")
+    group.add_argument(
+        "--now",
+        type=parse_instant,
+        default=None,
+        metavar="ISO",
+        help="현재 시각 고정 (YYYY-MM-DD 또는 ISO 8601) — 오늘 운 / 타임스탬프 모두 이 시각 기준",
+    )
+    group.add_argument(
+        "--clock",
+        choices=sorted(CLOCKS),
+        default="system",
+        help="--now 가 없을 때 사용할 시계 (기본: system = 서버 로컬 시각)",
+    )
+
+
+def clock_from_args(args: argparse.Namespace):
+    if args.now is not None:
+        return FixedClock(args.now)
+    return CLOCKS[args.clock]()
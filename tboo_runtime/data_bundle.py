@@ -0,0 +1,104 @@
+"""
+tboo_runtime/data_bundle.py
+
+엔진 원본 데이터의 사전 컴파일 번들 (AOT)
+- 만세력 CSV / 절입 JSON / 의미 lexicon JSON 을 빌드 시점에 배열 · 문자열 표로 컴파일해
+  shared_tables 형식 파일 하나로 기록 (빌드: python fusion_engine/build_bundle.py)
+- 기동 시에는 파일을 mmap 하고 배열 view 를 붙이기만 한다 (CSV / ISO 문자열 파싱 없음)
+- 헤더 meta: 번들 형식 / 버전 + 원본별 {path, size, mtime_ns, sha256}
+- 엔진 import 는 번들을 읽기만 한다 (잠금 / 하위 프로세스 / 쓰기 없음)
+  원본이 바뀐 번들(stale:<원본>, 크기 · mtime 이 같으면 통과, 다르면 sha256 비교) /
+  형식 버전이 다른 번들 / 깨진 번들은 쓰지 않고 원본 CSV / JSON 을 직접 파싱한다
+  (stderr 경고 1회, 번들 없음은 조용히)
+- 다시 만드는 것은 명시적인 빌드 단계뿐: python fusion_engine/build_bundle.py (배포 / 이미지 빌드)
+
+위치: TBOO_DATA_BUNDLE 또는 <repo>/build/tboo_data.bundle
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from tboo_runtime.shared_tables import MappedTables
+
+BUNDLE_ENV = "TBOO_DATA_BUNDLE"
+BUNDLE_FORMAT = "tboo_data_bundle"
+BUNDLE_VERSION = 2   # 2: lexicon 을 pickle blob 대신 문자열 표로
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_BUNDLE_PATH = ROOT_DIR / "build" / "tboo_data.bundle"
+
+
+def bundle_path() -> Path:
+    return Path(os.environ.get(BUNDLE_ENV) or DEFAULT_BUNDLE_PATH)
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def source_fingerprint(path: Path) -> Dict[str, Any]:
+    path = Path(path).resolve()
+    st = path.stat()
+    try:
+        rel = str(path.relative_to(ROOT_DIR))
+    except ValueError:
+        rel = str(path)
+    return {"path": rel, "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": file_sha256(path)}
+
+
+def _source_matches(recorded: Dict[str, Any]) -> bool:
+    path = Path(recorded["path"])
+    path = path if path.is_absolute() else ROOT_DIR / path
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    if st.st_size == recorded["size"] and st.st_mtime_ns == recorded["mtime_ns"]:
+        return True
+    return st.st_size == recorded["size"] and file_sha256(path) == recorded["sha256"]
+
+
+def bundle_status(path: Optional[Path] = None) -> Tuple[str, Optional[MappedTables]]:
+    """
+    ("fresh", 번들) | ("missing" / "invalid" / "version" / "stale:<원본>", None)
+    fresh 는 형식 · 버전 · checksum · 모든 원본 일치.
+    """
+    path = Path(path) if path else bundle_path()
+    if not path.is_file():
+        return "missing", None
+    try:
+        bundle = MappedTables(path)
+    except (OSError, ValueError):
+        return "invalid", None
+    meta = bundle.meta
+    if meta.get("format") != BUNDLE_FORMAT or meta.get("version") != BUNDLE_VERSION:
+        return "version", None
+    for name, recorded in (meta.get("sources") or {}).items():
+        if not _source_matches(recorded):
+            return f"stale:{name}", None
+    if not bundle.verify():
+        return "invalid", None
+    return "fresh", bundle
+
+
+def open_bundle(path: Optional[Path] = None) -> Optional[MappedTables]:
+    """
+    최신 번들이면 MappedTables, 없으면 None (조용히).
+    최신이 아니면 None + stderr 경고 — 다시 빌드하지 않는다 (엔진이 원본을 직접 파싱).
+    """
+    path = Path(path) if path else bundle_path()
+    status, bundle = bundle_status(path)
+    if status in ("fresh", "missing"):
+        return bundle
+    print(
+        f"⚠️ data bundle ignored ({status}) — rebuild: python fusion_engine/build_bundle.py",
+        file=sys.stderr,
+    )
+    return None
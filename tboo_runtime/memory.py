@@ -0,0 +1,152 @@
+"""
+tboo_runtime/memory.py
+
+상주(resident) 테이블 메모리 보고
+- 각 엔진 모듈이 import 시점에 register_resident(name, getter) 로 등록
+  getter 는 로드된 객체(없으면 None)를 돌려주고, 로드를 유발하지 않는다
+- memory_report() 는 등록된 테이블별 추정 바이트 수 + 프로세스 RSS
+
+    python -m tboo_runtime.memory   # 두 엔진을 올리고 모든 테이블을 로드한 뒤 보고
+"""
+
+import os
+import sys
+import types
+from typing import Any, Callable, Dict, Optional
+
+_RESIDENT: Dict[str, Callable[[], Any]] = {}
+
+
+def register_resident(name: str, getter: Callable[[], Any]) -> None:
+    _RESIDENT[name] = getter
+
+
+def registered_residents() -> Dict[str, Callable[[], Any]]:
+    return dict(_RESIDENT)
+
+
+# ------------------------------------------------------------
+# 크기 추정
+# ------------------------------------------------------------
+def deep_sizeof(obj: Any) -> int:
+    """
+    컨테이너를 따라가며 합산한 바이트 수 (같은 객체는 한 번만).
+    - numpy 배열: nbytes (+ 헤더)
+    - pandas DataFrame: memory_usage(deep=True)
+    - __slots__ / __dict__ 객체: 속성 합산
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if id(cur) in seen:
+            continue
+        seen.add(id(cur))
+
+        if hasattr(cur, "memory_usage") and hasattr(cur, "columns"):  # DataFrame
+            total += int(cur.memory_usage(deep=True).sum())
+            continue
+        if hasattr(cur, "nbytes") and hasattr(cur, "dtype"):  # ndarray
+            total += sys.getsizeof(cur) if cur.base is None else int(cur.nbytes) + sys.getsizeof(cur)
+            continue
+
+        total += sys.getsizeof(cur)
+        if isinstance(cur, dict):
+            stack.extend(cur.keys())
+            stack.extend(cur.values())
+        elif isinstance(cur, (list, tuple, set, frozenset)):
+            stack.extend(cur)
+        elif isinstance(cur, (str, bytes, int, float, bool, type(None), type, types.ModuleType)):
+            continue
+        elif isinstance(cur, types.FunctionType):
+            stack.append(cur.__code__)
+        elif isinstance(cur, types.CodeType):
+            stack.extend(cur.co_consts)
+        else:
+            slots = getattr(type(cur), "__slots__", ())
+            stack.extend(getattr(cur, s) for s in slots if hasattr(cur, s))
+            if hasattr(cur, "__dict__"):
+                stack.append(vars(cur))
+    return total
+
+
+def process_rss_bytes() -> Optional[int]:
+    """현재 RSS (Linux /proc), 불가하면 최대 RSS (resource), 둘 다 없으면 None."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+# ------------------------------------------------------------
+# 보고
+# ------------------------------------------------------------
+def memory_report() -> Dict[str, Any]:
+    tables: Dict[str, Any] = {}
+    total = 0
+    for name in sorted(_RESIDENT):
+        obj = _RESIDENT[name]()
+        if obj is None:
+            tables[name] = {"loaded": False, "bytes": 0}
+            continue
+        size = deep_sizeof(obj)
+        total += size
+        tables[name] = {"loaded": True, "bytes": size, "type": type(obj).__name__}
+    return {
+        "tables": tables,
+        "resident_bytes": total,
+        "rss_bytes": process_rss_bytes(),
+    }
+
+
+def format_memory_report(report: Dict[str, Any]) -> str:
+    def kib(n: Optional[int]) -> str:
+        return "n/a" if n is None else f"{n / 1024:,.1f} KiB"
+
+    lines = [f"{'table':<36} {'size':>14}"]
+    for name, info in report["tables"].items():
+        lines.append(f"{name:<36} {kib(info['bytes']) if info['loaded'] else '(not loaded)':>14}")
+    lines.append(f"{'resident total':<36} {kib(report['resident_bytes']):>14}")
+    lines.append(f"{'process RSS':<36} {kib(report['rss_bytes']):>14}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "fusion_engine"))
+    import engines  # noqa: F401  (두 엔진 경로 설정)
+    from contract_validator import compiled_validators
+    from engine.calendar_table import CALENDAR_CSV_PATH, get_calendar_table
+    from engine.engine_core import SLOT_VOCABULARY  # noqa: F401  (의미 엔진 테이블 등록)
+    from engine.saju_core import load_solar_terms
+
+    # `python -m` 실행 시 이 파일은 __main__ 이므로 등록부가 있는 모듈을 다시 가져온다
+    from tboo_runtime.memory import deep_sizeof, format_memory_report, memory_report
+
+    get_calendar_table()
+    load_solar_terms()
+    compiled_validators()
+
+    print(format_memory_report(memory_report()))
+
+    # 비교: 예전 방식 (pandas 프레임 상주)
+    import pandas as pd
+
+    df = pd.read_csv(CALENDAR_CSV_PATH)
+    df["양력일자"] = pd.to_datetime(df["양력일자"])
+    print(f"\n(reference) pandas calendar frame: {deep_sizeof(df) / 1024:,.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
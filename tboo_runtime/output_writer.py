@@ -0,0 +1,312 @@
+"""
+tboo_runtime/output_writer.py
+
+결과 파일 비동기 기록기 (계산 / 의미 / 계약 공용)
+- 호출 스레드는 직렬화한 bytes 를 큐에 넣기만 하고, 쓰기 · 압축 · fsync 는 백그라운드 스레드가 처리
+- JSONL append 는 batch_bytes 가 모이거나 linger 초가 지나면 경로별로 묶어 한 번에 write
+- 경로가 .gz 로 끝나면 gzip 스트림으로 기록 (zlib 은 GIL 을 놓으므로 계산과 병렬)
+- fsync_interval 초마다 열린 파일을 fsync (None 이면 close 시에만 flush)
+- 역압(backpressure): 큐에 쌓인 bytes 가 max_pending_bytes 를 넘으면 호출 스레드가 대기
+  (대기 누적 시간은 stats()["stall_seconds"])
+- 단일 파일(write_file)은 임시 파일 → os.replace 로 원자적 기록
+  (임시 파일 이름은 프로세스 / 호출마다 달라 여러 워커가 같은 경로를 써도 서로 덮지 않는다)
+- 백그라운드 쓰기 오류는 다음 호출(append / flush / close)에서 다시 올린다
+
+    writer = get_output_writer()
+    writer.append(path, line)         # JSONL 한 줄 (str / bytes, 개행 자동)
+    writer.append_lines(path, lines)  # 여러 줄 한 번에
+    writer.write_file(path, text)
+    writer.close_path(path)           # 해당 파일 닫기 (rename 전 등)
+    writer.flush()                    # 지금까지 넣은 것 모두 기록될 때까지 대기
+"""
+
+import atexit
+import gzip
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, IO, List, Optional, Tuple, Union
+
+Data = Union[str, bytes]
+
+DEFAULT_MAX_PENDING_BYTES = 64 << 20
+DEFAULT_BATCH_BYTES = 1 << 20
+
+# 큐 항목: (op, path, payload) — op: "open" | "line" | "file" | "close" | "barrier"
+_Item = Tuple[str, Optional[Path], Any]
+
+
+def _as_path(path) -> Path:
+    return path if isinstance(path, Path) else Path(path)   # Path() 재생성은 줄당 수 µs
+
+
+def _to_bytes(data: Data) -> bytes:
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def unique_tmp_path(path: Path) -> Path:
+    """path 옆의 임시 파일 경로 (<name>.<pid>.<난수>.tmp — 같은 경로를 쓰는 다른 프로세스 / 스레드와 겹치지 않음)."""
+    return path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex[:12]}.tmp")
+
+
+class OutputWriter:
+    def __init__(
+        self,
+        *,
+        max_pending_bytes: int = DEFAULT_MAX_PENDING_BYTES,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        fsync_interval: Optional[float] = None,
+        linger: float = 0.05,
+        compresslevel: int = 6,
+    ):
+        self.max_pending_bytes = max_pending_bytes
+        self.batch_bytes = batch_bytes
+        self.fsync_interval = fsync_interval
+        self.linger = linger
+        self.compresslevel = compresslevel
+
+        self._items: Deque[_Item] = deque()
+        self._pending_bytes = 0
+        self._cond = threading.Condition()
+        self._handles: Dict[Path, IO[bytes]] = {}
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._urgent = 0   # 큐에 있는 줄 외 연산 수 (있으면 linger 없이 바로 기록)
+        self._last_fsync = time.monotonic()
+        self._stats = {"lines": 0, "files": 0, "bytes": 0, "batches": 0, "fsyncs": 0, "stall_seconds": 0.0}
+
+        self._thread = threading.Thread(target=self._run, name="tboo-output-writer", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------
+    # 호출 스레드 API
+    # ------------------------------------------------------------
+    def open(self, path: Path, append: bool = False) -> None:
+        """JSONL 파일 열기 (append=False 면 비움). append 전에 부르지 않으면 이어 쓰기로 열린다."""
+        self._put(("open", _as_path(path), append), 0)
+
+    def append(self, path: Path, line: Data) -> None:
+        data = _to_bytes(line)
+        if not data.endswith(b"\n"):
+            data += b"\n"
+        self._put(("line", _as_path(path), data), len(data))
+
+    def append_lines(self, path: Path, lines: List[str]) -> None:
+        """여러 줄을 한 항목으로 (호출 측에서 모아 넘기면 줄당 큐 비용이 없어진다)."""
+        if lines:
+            data = ("\n".join(lines) + "\n").encode("utf-8")
+            self._put(("line", _as_path(path), data), len(data))
+
+    def write_file(self, path: Path, data: Data) -> None:
+        data = _to_bytes(data)
+        self._put(("file", _as_path(path), data), len(data))
+
+    def close_path(self, path: Path, wait: bool = True) -> None:
+        self._put(("close", _as_path(path), None), 0)
+        if wait:
+            self.flush()
+
+    def flush(self) -> None:
+        """지금까지 넣은 항목이 모두 기록(및 flush)될 때까지 대기."""
+        done = threading.Event()
+        self._put(("barrier", None, done), 0)
+        done.wait()
+        self._raise_error()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._raise_error()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {**self._stats, "pending_bytes": self._pending_bytes}
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _put(self, item: _Item, size: int) -> None:
+        self._raise_error()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("OutputWriter is closed")
+            if size and self._pending_bytes + size > self.max_pending_bytes and self._pending_bytes:
+                t0 = time.perf_counter()
+                while self._pending_bytes + size > self.max_pending_bytes and self._pending_bytes:
+                    self._cond.wait()
+                self._stats["stall_seconds"] += time.perf_counter() - t0
+            was_empty = not self._items
+            self._items.append(item)
+            self._pending_bytes += size
+            if item[0] != "line":
+                self._urgent += 1
+            # 줄 append 는 묶음이 찰 때만 깨운다 (한 줄마다 깨우면 스레드 전환 비용이 쓰기보다 큼)
+            if was_empty or item[0] != "line" or self._pending_bytes >= self.batch_bytes:
+                self._cond.notify_all()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    # ------------------------------------------------------------
+    # 백그라운드 스레드
+    # ------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._items and not self._closed:
+                    self._cond.wait(timeout=self.fsync_interval)
+                    if not self._items:
+                        self._maybe_fsync()
+                if not self._items and self._closed:
+                    break
+                if not self._urgent and not self._closed and self._pending_bytes < self.batch_bytes:
+                    self._cond.wait(timeout=self.linger)   # 묶음이 찰 때까지 잠시 대기
+                batch, size = [], 0
+                while self._items and size < self.batch_bytes:
+                    item = self._items.popleft()
+                    batch.append(item)
+                    if item[0] in ("line", "file"):
+                        size += len(item[2])
+                    if item[0] != "line":
+                        self._urgent -= 1
+            try:
+                self._write_batch(batch)
+            except BaseException as e:  # 다음 호출에서 올림
+                self._error = e
+                for op, _, payload in batch:
+                    if op == "barrier":
+                        payload.set()
+            with self._cond:
+                self._pending_bytes -= size
+                self._stats["batches"] += 1
+                self._cond.notify_all()
+        self._close_all()
+
+    def _handle(self, path: Path, append: bool = True) -> IO[bytes]:
+        handle = self._handles.get(path)
+        if handle is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            mode = "ab" if append else "wb"
+            if path.suffix == ".gz":
+                handle = gzip.open(path, mode, compresslevel=self.compresslevel)
+            else:
+                handle = open(path, mode)
+            self._handles[path] = handle
+        return handle
+
+    def _write_batch(self, batch) -> None:
+        lines: Dict[Path, list] = {}
+
+        def drain() -> None:
+            for p, chunks in lines.items():
+                data = b"".join(chunks)
+                self._handle(p).write(data)
+                self._stats["bytes"] += len(data)
+                self._stats["lines"] += data.count(b"\n")
+            lines.clear()
+
+        for op, path, payload in batch:
+            if op == "line":
+                lines.setdefault(path, []).append(payload)
+                continue
+            drain()   # 순서 보장: 다른 연산 전에 모인 줄을 먼저 기록
+            if op == "open":
+                self._close_handle(path)
+                self._handle(path, append=payload)
+            elif op == "file":
+                self._write_file(path, payload)
+            elif op == "close":
+                self._close_handle(path)
+            elif op == "barrier":
+                for handle in self._handles.values():
+                    handle.flush()
+                payload.set()
+        drain()
+        self._maybe_fsync()
+
+    def _write_file(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = unique_tmp_path(path)
+        try:
+            if path.suffix == ".gz":
+                with gzip.open(tmp, "wb", compresslevel=self.compresslevel) as f:
+                    f.write(data)
+            else:
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                    if self.fsync_interval is not None:
+                        f.flush()
+                        os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._stats["files"] += 1
+        self._stats["bytes"] += len(data)
+
+    def _maybe_fsync(self) -> None:
+        if self.fsync_interval is None or time.monotonic() - self._last_fsync < self.fsync_interval:
+            return
+        for handle in self._handles.values():
+            handle.flush()
+            os.fsync(_fileno(handle))
+        self._stats["fsyncs"] += 1
+        self._last_fsync = time.monotonic()
+
+    def _close_handle(self, path: Path) -> None:
+        handle = self._handles.pop(path, None)
+        if handle is not None:
+            handle.flush()
+            if self.fsync_interval is not None:
+                os.fsync(_fileno(handle))
+            handle.close()
+
+    def _close_all(self) -> None:
+        for path in list(self._handles):
+            try:
+                self._close_handle(path)
+            except BaseException as e:
+                self._error = self._error or e
+
+
+def _fileno(handle: IO[bytes]) -> int:
+    raw = getattr(handle, "fileobj", None)   # gzip.GzipFile → 원본 파일
+    return (raw or handle).fileno()
+
+
+# ------------------------------------------------------------
+# 프로세스 공용 writer
+# ------------------------------------------------------------
+_WRITER: Optional[OutputWriter] = None
+_WRITER_LOCK = threading.Lock()
+
+
+def get_output_writer() -> OutputWriter:
+    """프로세스 공용 writer (처음 호출 시 생성, 종료 시 자동 close)."""
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = OutputWriter(fsync_interval=float(os.environ["TBOO_FSYNC_INTERVAL"]) if os.environ.get("TBOO_FSYNC_INTERVAL") else None)
+            atexit.register(close_output_writer)
+        return _WRITER
+
+
+def close_output_writer() -> None:
+    global _WRITER
+    with _WRITER_LOCK:
+        writer, _WRITER = _WRITER, None
+    if writer is not None:
+        writer.close()
@@ -0,0 +1,195 @@
+"""
+tboo_runtime/profiling.py
+
+CLI 공용 프로파일링 모드
+- --profile PATH      : cProfile → pstats 파일 저장 + 정렬된 상위 N개 함수 출력
+- --trace-malloc      : tracemalloc → 최대(peak) 메모리 + 단계별 최대 메모리 + 상위 N개 할당 위치 출력
+  · 단계 경계(tracing.stage / lap_timer / traced 가 기록하는 지점)마다 직전 경계 이후의 최대치를 재고
+    (tracemalloc.reset_peak) 그 단계 이름으로 기록 — 트레이싱이 꺼져 있어도 세션 동안 켠다
+  · 할당 위치는 두 번: 최대치를 기록한 단계가 끝난 시점에 살아 있는 것 / 종료 시점에 살아 있는 것
+    (tracemalloc 은 최대치 순간의 스냅샷을 주지 않는다 — 단계 끝이 가장 가까운 지점)
+- 세션 하나가 CLI 실행 전체를 감싸므로 배치 모드에서는 모든 레코드가 합산된다
+  (계산 CLI 는 --batch 로 stdin 의 여러 줄을 한 세션에서 처리)
+
+사용:
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+    with profiling_session_from_args(args):
+        run(args)
+"""
+
+import argparse
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO
+
+from tboo_runtime.tracing import active_tracer, tracing
+
+SORT_KEYS = ("cumulative", "tottime", "calls")
+
+
+def add_profiling_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("profiling")
+    group.add_argument(
+        "--profile",
+        default=None,
+        metavar="PATH",
+        help="cProfile 결과를 pstats 파일로 저장하고 상위 함수 요약 출력",
+    )
+    group.add_argument(
+        "--profile-sort",
+        choices=SORT_KEYS,
+        default="cumulative",
+        help="요약 정렬 기준 (기본: cumulative)",
+    )
+    group.add_argument(
+        "--trace-malloc",
+        action="store_true",
+        help="tracemalloc으로 최대 메모리(전체 / 단계별)와 상위 할당 위치 출력",
+    )
+    group.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        help="요약에 표시할 항목 수 (--profile / --trace-malloc 공용)",
+    )
+
+
+def format_profile(profiler: cProfile.Profile, sort: str, top: int) -> str:
+    buf = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buf)
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    return buf.getvalue()
+
+
+_MALLOC_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, top: int) -> List[str]:
+    lines = []
+    for stat in snapshot.filter_traces(_MALLOC_FILTERS).statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"  {stat.size / 1024:10.1f} KiB  {stat.count:8d} blocks  {frame.filename}:{frame.lineno}"
+        )
+    return lines
+
+
+class MallocStages:
+    """단계 경계마다 직전 경계 이후의 tracemalloc 최대치를 단계 이름으로 기록 (StageTracer.on_record)."""
+
+    def __init__(self, top: int = 25):
+        self.top = top
+        self.peaks: Dict[str, int] = {}
+        self.peak = 0
+        self.peak_stage: Optional[str] = None
+        self.peak_sites: List[str] = []
+
+    def record(self, name: str) -> None:
+        _, peak = tracemalloc.get_traced_memory()
+        if peak > self.peaks.get(name, 0):
+            self.peaks[name] = peak
+        if peak > self.peak:
+            self.peak, self.peak_stage = peak, name
+            # 스냅샷은 요약만 남기고 버린다 (붙잡고 있으면 이후 측정에 섞임)
+            self.peak_sites = top_allocations(tracemalloc.take_snapshot(), self.top)
+        tracemalloc.reset_peak()
+
+    def finish(self) -> int:
+        """종료 시점까지의 전체 최대치."""
+        _, peak = tracemalloc.get_traced_memory()
+        if peak > self.peak:
+            self.peak, self.peak_stage, self.peak_sites = peak, None, []
+        return self.peak
+
+
+def format_malloc(
+    snapshot: tracemalloc.Snapshot,
+    peak: int,
+    current: int,
+    top: int,
+    stages: Optional[MallocStages] = None,
+) -> str:
+    where = ""
+    if stages is not None and stages.peak_stage:
+        where = f" (stage '{stages.peak_stage}')"
+    elif stages is not None and stages.peaks:
+        where = " (after the last stage)"
+    lines = [
+        f"peak memory   : {peak / 1024 / 1024:.2f} MiB{where}",
+        f"current memory: {current / 1024 / 1024:.2f} MiB (at exit)",
+    ]
+    if stages is not None and stages.peaks:
+        lines.append("peak by stage (highest since the previous stage boundary):")
+        for name, value in sorted(stages.peaks.items(), key=lambda kv: -kv[1])[:top]:
+            lines.append(f"  {value / 1024 / 1024:10.2f} MiB  {name}")
+    if stages is not None and stages.peak_sites:
+        lines.append(f"top {top} allocation sites live at the end of stage '{stages.peak_stage}' (peak, by size):")
+        lines += stages.peak_sites
+    lines.append(f"top {top} allocation sites still live at exit (by size):")
+    lines += top_allocations(snapshot, top)
+    return "\n".join(lines)
+
+
+@contextmanager
+def profiling_session(
+    profile_path: Optional[Path] = None,
+    trace_malloc: bool = False,
+    top: int = 25,
+    sort: str = "cumulative",
+    out: TextIO = sys.stderr,
+) -> Iterator[None]:
+    """둘 다 꺼져 있으면 아무 것도 하지 않는다."""
+    profiler = cProfile.Profile() if profile_path is not None else None
+    started_malloc = trace_malloc and not tracemalloc.is_tracing()
+    stages = MallocStages(top) if trace_malloc else None
+
+    with ExitStack() as cleanup:
+        if stages is not None:
+            # 단계 경계를 받으려면 트레이서가 필요 (CLI 가 --trace 로 이미 켰으면 그것을 쓴다)
+            tracer = active_tracer() or cleanup.enter_context(tracing())
+            previous_hook = tracer.on_record
+            tracer.on_record = stages.record
+            cleanup.callback(setattr, tracer, "on_record", previous_hook)
+        if started_malloc:
+            tracemalloc.start()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            if stages is not None:
+                current, _ = tracemalloc.get_traced_memory()
+                peak = stages.finish()   # 스냅샷 자체의 할당이 섞이기 전에
+                snapshot = tracemalloc.take_snapshot()
+                if started_malloc:
+                    tracemalloc.stop()
+                print("\n── trace-malloc ──", file=out)
+                print(format_malloc(snapshot, peak, current, top, stages), file=out)
+        if profiler is not None:
+            profile_path = Path(profile_path).expanduser().resolve()
+            profile_path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(profile_path))
+            print(f"\n── profile ({sort}, top {top}) → {profile_path} ──", file=out)
+            print(format_profile(profiler, sort, top), file=out)
+
+
+def profiling_session_from_args(args: argparse.Namespace, out: TextIO = sys.stderr):
+    return profiling_session(
+        args.profile,
+        args.trace_malloc,
+        top=args.profile_top,
+        sort=args.profile_sort,
+        out=out,
+    )
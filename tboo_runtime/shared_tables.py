@@ -0,0 +1,265 @@
+"""
+tboo_runtime/shared_tables.py
+
+프로세스 간 공유 테이블 파일 (읽기 전용 mmap)
+- 부모 프로세스가 엔진 테이블(numpy 배열 묶음 + 작은 pickle blob)을 파일 하나에 한 번 기록
+  문자열 트리(lexicon JSON 등)는 pack_strings() 로 배열 그룹(문자열 표 + 토큰)으로 바꿔 기록
+- 워커는 파일을 ACCESS_READ 로 mmap 하고 배열을 np.frombuffer view 로 붙인다
+  → 페이지 캐시 한 벌을 모든 워커가 공유 (워커 수와 무관하게 상주 메모리 일정), 파싱 없음
+- 예외: 문자열 트리는 unpack_strings() 로 워커마다 dict / list 트리로 복원한다 (사본이 워커 수만큼).
+  의미 엔진은 lexicon 을 중첩 dict 로 조회하고 import 시 전체를 순회하므로(GANJI_SLOT_TABLE,
+  ENGINE_VERSION 해시) 배열 위 조회로는 이득이 없다. lexicon 은 파일 속 약 7.5 KB → 복원 트리
+  약 65 KB / 0.2 ms (JSON 파싱 없음) — 만세력 · 절입 배열과 달리 워커당 비용이 남는 것은 이 부분뿐
+- 환경 변수 TBOO_SHARED_TABLES=<파일 경로> 가 있으면 엔진 모듈이 import 시점에 자동으로 붙는다
+  (saju_core: 만세력 / 절입 / 민간시 표, engine_core: 의미 lexicon)
+
+파일 구조
+  b"TBOOTBL1" | 헤더 길이 (uint64 LE) | 헤더 JSON | (64바이트 정렬) 배열 / blob 데이터
+  헤더: {"tables": {그룹: {배열 이름: {dtype, shape, offset}}}, "blobs": {이름: {offset, size}},
+         "meta": {...}, "checksum": 데이터 영역 sha256}
+
+TBOO_SHARED_TABLES 가 없으면 빌드된 데이터 번들(tboo_runtime/data_bundle.py)이 원본과 같을 때 그것을 쓴다.
+
+공유 메모리(multiprocessing.shared_memory) 대신 파일 mmap 을 쓰는 이유:
+resource tracker 가 워커 종료 시 세그먼트를 지우는 문제가 없고, fork / spawn / 별도 exec
+어떤 방식으로 뜬 워커도 경로만 알면 붙을 수 있다. 기본 위치는 /dev/shm (tmpfs).
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from tboo_runtime.output_writer import unique_tmp_path
+
+ENV_VAR = "TBOO_SHARED_TABLES"
+MAGIC = b"TBOOTBL1"
+ALIGN = 64
+
+Tables = Dict[str, Dict[str, np.ndarray]]
+
+
+def _align(n: int) -> int:
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+# ------------------------------------------------------------
+# 기록
+# ------------------------------------------------------------
+def write_tables(
+    path: Path,
+    tables: Tables,
+    blobs: Optional[Dict[str, Any]] = None,
+    meta: Optional[Dict[str, Any]] = None,
+) -> Path:
+    """배열 묶음 + blob 을 한 파일로 기록 (프로세스별 임시 파일 → rename, 원자적 — 동시 빌드도 안전)."""
+    header: Dict[str, Any] = {"tables": {}, "blobs": {}, "meta": meta or {}}
+    chunks = []
+    offset = 0
+    for group, arrays in tables.items():
+        entries = header["tables"][group] = {}
+        for name, array in arrays.items():
+            data = np.asarray(array)
+            if not data.flags.c_contiguous:
+                data = data.copy(order="C")   # ascontiguousarray 는 0차원을 1차원으로 바꾼다
+            entries[name] = {"dtype": data.dtype.str, "shape": list(data.shape), "offset": offset}
+            chunks.append((offset, data.tobytes()))
+            offset = _align(offset + data.nbytes)
+    for name, obj in (blobs or {}).items():
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        header["blobs"][name] = {"offset": offset, "size": len(data)}
+        chunks.append((offset, data))
+        offset = _align(offset + len(data))
+
+    body = bytearray(offset)
+    for chunk_offset, data in chunks:
+        body[chunk_offset: chunk_offset + len(data)] = data
+    header["checksum"] = hashlib.sha256(body).hexdigest()
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    data_start = _align(len(MAGIC) + 8 + len(header_bytes))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = unique_tmp_path(path)
+    try:
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(len(header_bytes).to_bytes(8, "little"))
+            f.write(header_bytes)
+            f.seek(data_start)
+            f.write(body)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return path
+
+
+# ------------------------------------------------------------
+# 문자열 표 (str / list / dict 트리 → 배열 그룹)
+# - strings: 중복 없는 문자열을 UTF-8 로 이어 붙인 바이트 + 시작 오프셋 (n + 1개)
+# - tokens : (태그, 값) 쌍의 전위 순회. str → 문자열 id, list / dict → 원소 수
+#            dict 는 항목마다 키(str 토큰) 다음에 값
+# 복원 시 문자열은 sys.intern 으로 한 번씩만 만들어 키 / 값이 같은 객체를 공유한다.
+# ------------------------------------------------------------
+_TAG_STR, _TAG_LIST, _TAG_DICT = 0, 1, 2
+
+
+def pack_strings(obj: Any) -> Dict[str, np.ndarray]:
+    """str / list / dict 트리 → {"string_data", "string_offsets", "tokens"} 배열 (tuple 은 list 로)."""
+    ids: Dict[str, int] = {}
+    tokens = []
+
+    def emit_str(value: str) -> None:
+        tokens.append((_TAG_STR, ids.setdefault(value, len(ids))))
+
+    def walk(node: Any) -> None:
+        if isinstance(node, str):
+            emit_str(node)
+        elif isinstance(node, dict):
+            tokens.append((_TAG_DICT, len(node)))
+            for key, value in node.items():
+                emit_str(key)
+                walk(value)
+        elif isinstance(node, (list, tuple)):
+            tokens.append((_TAG_LIST, len(node)))
+            for value in node:
+                walk(value)
+        else:
+            raise TypeError(f"string tables hold str / list / dict only, got {type(node).__name__}")
+
+    walk(obj)
+    encoded = [text.encode("utf-8") for text in ids]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return {
+        "string_data": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "string_offsets": offsets,
+        "tokens": np.array(tokens, dtype=np.int32).reshape(-1, 2),
+    }
+
+
+def unpack_strings(arrays: Dict[str, np.ndarray]) -> Any:
+    """pack_strings() 배열 → 트리 (문자열은 intern 된 공유 객체, 트리는 호출한 프로세스의 사본)."""
+    data = arrays["string_data"].tobytes()
+    offsets = arrays["string_offsets"].tolist()
+    strings = [sys.intern(data[a:b].decode("utf-8")) for a, b in zip(offsets, offsets[1:])]
+    tokens = arrays["tokens"].tolist()
+    pos = 0
+
+    def read() -> Any:
+        nonlocal pos
+        tag, value = tokens[pos]
+        pos += 1
+        if tag == _TAG_STR:
+            return strings[value]
+        if tag == _TAG_LIST:
+            return [read() for _ in range(value)]
+        out = {}
+        for _ in range(value):
+            key = read()
+            out[key] = read()
+        return out
+
+    return read()
+
+
+def default_table_path() -> Path:
+    base = Path("/dev/shm") if Path("/dev/shm").is_dir() else Path(tempfile.gettempdir())
+    return base / f"tboo_tables_{os.getpid()}.bin"
+
+
+# ------------------------------------------------------------
+# 붙이기 (읽기 전용 view)
+# ------------------------------------------------------------
+class MappedTables:
+    __slots__ = ("path", "_file", "_mm", "_header", "_data_start", "_tables")
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a TBOO table file: {self.path}")
+        size = int.from_bytes(self._mm[len(MAGIC): len(MAGIC) + 8], "little")
+        start = len(MAGIC) + 8
+        self._header = json.loads(self._mm[start: start + size].decode("utf-8"))
+        self._data_start = _align(start + size)
+        self._tables: Tables = {}
+
+    def groups(self):
+        return list(self._header["tables"])
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self._header.get("meta", {})
+
+    def verify(self) -> bool:
+        """데이터 영역 sha256 == 헤더 checksum."""
+        return hashlib.sha256(self._mm[self._data_start:]).hexdigest() == self._header.get("checksum")
+
+    def table(self, group: str) -> Optional[Dict[str, np.ndarray]]:
+        """그룹의 배열 view (복사 없음, 쓰기 불가). 없으면 None."""
+        if group not in self._header["tables"]:
+            return None
+        if group not in self._tables:
+            arrays = {}
+            for name, e in self._header["tables"][group].items():
+                dtype = np.dtype(e["dtype"])
+                count = int(np.prod(e["shape"], dtype=np.int64))
+                arrays[name] = np.frombuffer(
+                    self._mm, dtype=dtype, count=count, offset=self._data_start + e["offset"]
+                ).reshape(e["shape"])
+            self._tables[group] = arrays
+        return self._tables[group]
+
+    def blob(self, name: str) -> Any:
+        """pickle blob 복원 (프로세스마다 객체가 생김 — 작은 표 전용). 없으면 None."""
+        e = self._header["blobs"].get(name)
+        if e is None:
+            return None
+        start = self._data_start + e["offset"]
+        return pickle.loads(self._mm[start: start + e["size"]])
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._mm)
+
+
+_ATTACHED: Optional[MappedTables] = None
+
+
+def attach(path: Path) -> MappedTables:
+    """이 프로세스의 공유 테이블로 붙인다 (이후 attached_tables() 가 돌려줌)."""
+    global _ATTACHED
+    _ATTACHED = MappedTables(path)
+    return _ATTACHED
+
+
+_BUNDLE_CHECKED = False
+
+
+def attached_tables() -> Optional[MappedTables]:
+    """
+    붙어 있는 테이블. 아직 없으면
+    1) TBOO_SHARED_TABLES 파일 (워커 공유)
+    2) 원본과 일치하는 데이터 번들 (tboo_runtime/data_bundle.py, 읽기만 — 오래되면 건너뜀)
+    순으로 붙는다. 둘 다 없으면 None (엔진이 원본을 직접 파싱).
+    """
+    global _ATTACHED, _BUNDLE_CHECKED
+    if _ATTACHED is None and os.environ.get(ENV_VAR):
+        attach(Path(os.environ[ENV_VAR]))
+    if _ATTACHED is None and not _BUNDLE_CHECKED:
+        _BUNDLE_CHECKED = True
+        from tboo_runtime.data_bundle import open_bundle
+
+        _ATTACHED = open_bundle()
+    return _ATTACHED
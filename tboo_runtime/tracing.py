@@ -0,0 +1,232 @@
+"""
+tboo_runtime/tracing.py
+
+단계별(stage) 경량 트레이서
+- 이름 붙은 단계의 소요 시간 / 호출 횟수를 누적
+- 비활성 상태에서는 아무 것도 기록하지 않음
+  (stage() / lap_timer() 는 공용 no-op 객체를 돌려줌 → 호출 1회 비용만 남음)
+- JSON 요약 / Prometheus text exposition 내보내기
+- 출력 JSON의 meta 에 요약을 붙이는 것은 호출 측(CLI)에서 선택
+
+사용:
+    with tracing() as tracer:
+        analyze_saju(...)
+    print(tracer.to_prometheus())
+
+엔진 코드:
+    with stage("run_engine.ontology"):
+        ...
+    laps = lap_timer("analyze_saju")
+    ...; laps.lap("calendar_load")
+    ...; laps.done()
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, Optional
+
+_ACTIVE: ContextVar[Optional["StageTracer"]] = ContextVar("tboo_stage_tracer", default=None)
+
+
+# ------------------------------------------------------------
+# 누적기
+# ------------------------------------------------------------
+class StageTracer:
+    """단계 이름 → (호출 수, 누적 시간, 최대 시간)"""
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        self.totals: Dict[str, float] = {}
+        self.maxima: Dict[str, float] = {}
+        # 단계가 끝날 때마다 이름으로 불림 (profiling --trace-malloc 의 단계별 메모리)
+        self.on_record: Optional[Callable[[str], None]] = None
+
+    def record(self, name: str, seconds: float) -> None:
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        if seconds > self.maxima.get(name, 0.0):
+            self.maxima[name] = seconds
+        if self.on_record is not None:
+            self.on_record(name)
+
+    def merge(self, other: "StageTracer") -> None:
+        for name, count in other.counts.items():
+            self.counts[name] = self.counts.get(name, 0) + count
+            self.totals[name] = self.totals.get(name, 0.0) + other.totals[name]
+            self.maxima[name] = max(self.maxima.get(name, 0.0), other.maxima[name])
+
+    def reset(self) -> None:
+        self.counts.clear()
+        self.totals.clear()
+        self.maxima.clear()
+
+    # ------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------
+    def summary(self) -> Dict[str, Any]:
+        stages = {}
+        for name in sorted(self.counts):
+            count, total = self.counts[name], self.totals[name]
+            stages[name] = {
+                "count": count,
+                "total_ms": round(total * 1e3, 4),
+                "mean_ms": round(total / count * 1e3, 4),
+                "max_ms": round(self.maxima[name] * 1e3, 4),
+            }
+        return {"unit": "ms", "stages": stages}
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.summary(), ensure_ascii=False, **kwargs)
+
+    def to_prometheus(self, prefix: str = "tboo_stage") -> str:
+        lines = [
+            f"# HELP {prefix}_calls_total Number of times the stage ran.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        names = sorted(self.counts)
+        lines += [f'{prefix}_calls_total{{stage="{n}"}} {self.counts[n]}' for n in names]
+        lines += [
+            f"# HELP {prefix}_seconds_total Cumulative wall time spent in the stage.",
+            f"# TYPE {prefix}_seconds_total counter",
+        ]
+        lines += [f'{prefix}_seconds_total{{stage="{n}"}} {self.totals[n]:.9f}' for n in names]
+        lines += [
+            f"# HELP {prefix}_seconds_max Longest single run of the stage.",
+            f"# TYPE {prefix}_seconds_max gauge",
+        ]
+        lines += [f'{prefix}_seconds_max{{stage="{n}"}} {self.maxima[n]:.9f}' for n in names]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Any) -> None:
+        """*.prom → Prometheus text, 그 외 → JSON 요약."""
+        text = self.to_prometheus() if str(path).endswith(".prom") else self.to_json(indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+# ------------------------------------------------------------
+# 활성화
+# ------------------------------------------------------------
+def active_tracer() -> Optional[StageTracer]:
+    return _ACTIVE.get()
+
+
+def enable_tracing(tracer: Optional[StageTracer] = None) -> StageTracer:
+    tracer = tracer or StageTracer()
+    _ACTIVE.set(tracer)
+    return tracer
+
+
+def disable_tracing() -> None:
+    _ACTIVE.set(None)
+
+
+@contextmanager
+def tracing(tracer: Optional[StageTracer] = None) -> Iterator[StageTracer]:
+    tracer = tracer or StageTracer()
+    token = _ACTIVE.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _ACTIVE.reset(token)
+
+
+# ------------------------------------------------------------
+# 계측 지점
+# ------------------------------------------------------------
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def lap(self, name: str) -> None:
+        return None
+
+    def done(self) -> None:
+        return None
+
+
+_NULL = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("tracer", "name", "t0")
+
+    def __init__(self, tracer: StageTracer, name: str) -> None:
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.t0 = time.perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.tracer.record(self.name, time.perf_counter() - self.t0)
+
+
+class _LapTimer:
+    """함수 본문을 들여쓰기 없이 구간별로 나눠 재는 타이머."""
+
+    __slots__ = ("tracer", "prefix", "start", "last")
+
+    def __init__(self, tracer: StageTracer, prefix: str) -> None:
+        self.tracer = tracer
+        self.prefix = prefix
+        self.start = self.last = time.perf_counter()
+
+    def lap(self, name: str) -> None:
+        now = time.perf_counter()
+        self.tracer.record(f"{self.prefix}.{name}", now - self.last)
+        self.last = now
+
+    def done(self) -> None:
+        self.tracer.record(self.prefix, time.perf_counter() - self.start)
+
+
+def stage(name: str) -> Any:
+    """with stage("name"): ... — 비활성 시 no-op."""
+    tracer = _ACTIVE.get()
+    if tracer is None:
+        return _NULL
+    return _Stage(tracer, name)
+
+
+def lap_timer(prefix: str) -> Any:
+    """laps.lap("구간") 마다 prefix.구간 을 기록, laps.done() 에서 prefix 전체를 기록."""
+    tracer = _ACTIVE.get()
+    if tracer is None:
+        return _NULL
+    return _LapTimer(tracer, prefix)
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """함수 전체를 하나의 단계로 기록하는 데코레이터."""
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _ACTIVE.get()
+            if tracer is None:
+                return fn(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                tracer.record(name, time.perf_counter() - t0)
+
+        return wrapper
+
+    return decorator
+
+
+def attach_trace(document: Dict[str, Any], tracer: Optional[StageTracer]) -> Dict[str, Any]:
+    """document["meta"]["trace"] 에 요약을 붙인다 (tracer가 None이면 그대로)."""
+    if tracer is not None:
+        document.setdefault("meta", {})["trace"] = tracer.summary()
+    return document
@@ -0,0 +1,54 @@
+"""
+tests/conftest.py
+
+엔진 경로 설정 (fusion_engine/engines.py) + 공용 픽스처
+- make_calculation(...): analyze_saju → today → build_tboo_json_v33 (날짜 고정, 결정적)
+
+    python -m pytest -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "fusion_engine"))
+
+from engines import load_calculation_main  # noqa: E402  (경로 설정 포함)
+from engine.saju_core import analyze_saju, build_month_operation, build_year_flow  # noqa: E402
+
+TODAY = datetime(2026, 10, 19)
+
+# (이름, 성별, 년, 월, 일, 시, 분) — 시각 미상 / 남녀 / 만세력 양 끝 근처 포함
+BIRTHS = (
+    ("갑", 1, 1987, 7, 1, 0, 20),
+    ("을", 2, 1990, 5, 5, 10, 30),
+    ("병", 1, 1954, 3, 21, None, None),
+    ("정", 2, 2001, 12, 31, 23, 50),
+    ("무", 1, 1900, 2, 10, 6, 0),
+)
+
+
+@pytest.fixture(scope="session")
+def make_calculation():
+    calc_main = load_calculation_main()
+
+    def build(name, gender, year, month, day, hour, minute, *, years=None, months_year=None):
+        saju_info, _ = analyze_saju(year, month, day, hour, minute, gender, name, defer=True)
+        day_gan = saju_info["day_gan"]
+        return calc_main.build_tboo_json_v33(
+            name, "남성" if gender == 1 else "여성", year, month, day, hour, minute,
+            saju_info,
+            calc_main.compute_today_unse(day_gan, gender, TODAY),
+            year_flow=build_year_flow(day_gan, years) if years else None,
+            month_operation=build_month_operation(day_gan, gender, months_year) if months_year else None,
+        )
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def calculations(make_calculation):
+    """BIRTHS 명식 (세운 2026~2028 / 2026년 월운 포함)."""
+    return [make_calculation(*b, years=range(2026, 2029), months_year=2026) for b in BIRTHS]
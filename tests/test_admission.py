@@ -0,0 +1,203 @@
+"""
+요청 합치기 / 동시 실행 상한 (tboo_runtime/admission.py, fusion_engine/engine_service.py)
+- 같은 키 동시 요청은 계산 한 번, 결과 · 예외를 함께 받는다
+- 상한을 넘으면 대기열 → queue_full / timeout 으로 거절
+"""
+
+import threading
+import time
+
+import pytest
+
+from conftest import TODAY
+from engine.engine_core import run_engine
+from engine.result_cache import MeaningResultCache
+from engine_service import BirthRequest, EngineService
+from tboo_runtime.admission import AdmissionController, Overloaded, SingleFlight, to_prometheus
+from tboo_runtime.clock import FixedClock, use_clock
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def _in_threads(count, target):
+    results, errors = [None] * count, []
+
+    def run(i):
+        try:
+            results[i] = target(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+# ------------------------------------------------------------
+# SingleFlight
+# ------------------------------------------------------------
+def test_concurrent_callers_share_one_computation():
+    flight, calls, release = SingleFlight(), [], threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait()
+        return {"value": 42}
+
+    def caller(i):
+        if i == 0:
+            return flight.do("k", compute)
+        _wait_for(lambda: calls)   # leader 가 계산 중일 때 들어온다
+        return flight.do("k", compute)
+
+    def releaser():
+        _wait_for(lambda: flight.stats()["coalesced"] == 7)
+        release.set()
+
+    threading.Thread(target=releaser).start()
+    results, errors = _in_threads(8, caller)
+    assert errors == [] and len(calls) == 1
+    assert [shared for _, shared in results].count(False) == 1
+    assert all(value is results[0][0] for value, _ in results)
+    assert flight.stats() == {"requests": 8, "coalesced": 7, "in_flight": 0}
+    assert flight.do("k", lambda: 1) == (1, False)   # 끝난 뒤에는 다시 계산 (캐시 아님)
+
+
+def test_followers_receive_the_leaders_error():
+    flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+
+    def failing():
+        started.set()
+        release.wait()
+        raise ValueError("boom")
+
+    def caller(i):
+        if i:
+            started.wait()
+        return flight.do("k", failing)
+
+    def releaser():
+        _wait_for(lambda: flight.stats()["coalesced"] == 2)
+        release.set()
+
+    threading.Thread(target=releaser).start()
+    _, errors = _in_threads(3, caller)
+    assert len(errors) == 3 and all(isinstance(e, ValueError) for e in errors)
+    assert flight.in_flight() == 0
+
+
+# ------------------------------------------------------------
+# AdmissionController
+# ------------------------------------------------------------
+def test_queue_full_is_shed_and_queued_request_still_runs():
+    gate = AdmissionController(max_concurrent=1, max_queue=1)
+    ran = []
+    with gate.slot():
+        waiter = threading.Thread(target=gate.run, args=(ran.append, "queued"))
+        waiter.start()
+        _wait_for(lambda: gate.stats()["waiting"] == 1)
+        with pytest.raises(Overloaded) as full:
+            gate.run(lambda: None)   # 대기열이 가득
+        assert full.value.reason == "queue_full"
+    waiter.join()
+    assert ran == ["queued"]
+
+    stats = gate.stats()
+    assert stats["shed_queue_full"] == 1 and stats["shed"] == 1 and stats["queued"] == 1
+    assert stats["active"] == 0 and stats["waiting"] == 0 and stats["active_max"] == 1
+
+
+def test_queue_timeout_is_shed():
+    gate = AdmissionController(max_concurrent=1, max_queue=4, queue_timeout=0.05)
+    with gate.slot():
+        with pytest.raises(Overloaded) as timeout:
+            gate.run(lambda: None)
+    assert timeout.value.reason == "timeout"
+    stats = gate.stats()
+    assert stats["shed_timeout"] == 1 and stats["queue_wait_seconds_max"] >= 0.05
+    assert gate.run(lambda x: x + 1, 1) == 2
+
+
+def test_queued_request_runs_when_a_slot_frees():
+    gate = AdmissionController(max_concurrent=2, max_queue=4, queue_timeout=5.0)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def work(i):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return i
+
+    results, errors = _in_threads(6, lambda i: gate.run(work, i))
+    assert errors == [] and results == list(range(6))
+    assert peak[0] <= 2 and gate.stats()["queued"] >= 1 and gate.stats()["admitted"] == 6
+
+
+def test_max_concurrent_must_be_positive():
+    with pytest.raises(ValueError):
+        AdmissionController(0)
+
+
+# ------------------------------------------------------------
+# EngineService
+# ------------------------------------------------------------
+def _slow_calculation(service, release):
+    compute = service._compute_calculation
+
+    def slow(request, today):
+        release.wait()
+        return compute(request, today)
+
+    service._compute_calculation = slow
+
+
+def test_service_coalesces_same_birth_and_keeps_names(make_calculation):
+    service, release = EngineService(max_concurrent=2), threading.Event()
+    _slow_calculation(service, release)
+    names = [f"사용자{i}" for i in range(6)]
+
+    def request(i):
+        with use_clock(FixedClock(TODAY)):   # 시계는 스레드(컨텍스트)마다
+            return service.calculation(BirthRequest.parse(f"{names[i]} 1990 05 05 10 30 1"))
+
+    def releaser():
+        _wait_for(lambda: service.stats()["calculation"]["coalesced"] == len(names) - 1)
+        release.set()
+
+    threading.Thread(target=releaser).start()
+    results, errors = _in_threads(len(names), request)
+    assert errors == []
+    assert service.stats()["calculation"]["computed"] == 1
+    for name, result in zip(names, results):
+        assert result == make_calculation(name, 1, 1990, 5, 5, 10, 30)
+
+
+def test_service_meaning_with_cache_matches_run_engine(make_calculation):
+    service = EngineService(max_concurrent=1, meaning_cache=MeaningResultCache())
+    with use_clock(FixedClock(TODAY)):
+        first = service.meaning(BirthRequest.parse("갑 1987 07 01 00 20 1"), "id")
+        second = service.meaning(BirthRequest.parse("을 1987 07 01 00 20 1"), "id")
+    assert first == run_engine(make_calculation("갑", 1, 1987, 7, 1, 0, 20), slot_encoding="id")
+    assert second["subject"]["name"] == "을"
+    stats = service.stats()
+    assert stats["meaning_cache"]["hits"] == 1 and stats["admission"]["admitted"] == 3   # 계산 2 + 의미 1
+    assert 'tboo_admission_computed{endpoint="calculation"} 2' in service.to_prometheus()
+
+
+def test_service_sheds_when_saturated():
+    service = EngineService(max_concurrent=1, max_queue=0)
+    with service.gate.slot(), pytest.raises(Overloaded):
+        service.calculation(BirthRequest.parse("병 1954 03 21 x x 1"))
+    assert service.stats()["calculation"]["shed"] == 1
+    assert to_prometheus({"a": {"shed": 1, "label": "x"}}) == '# TYPE tboo_admission_shed counter\ntboo_admission_shed{endpoint="a"} 1\n'
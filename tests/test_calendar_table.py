@@ -0,0 +1,65 @@
+"""
+압축 만세력 (engine/calendar_table.py) — 배열 조회 == CSV 행, memory_report 등록
+"""
+
+from datetime import date
+
+import pandas as pd
+
+from engine.calendar_table import CALENDAR_CSV_PATH, CalendarTable, build_calendar_table, get_calendar_table
+from tboo_runtime.memory import format_memory_report, memory_report
+
+
+def test_lookups_match_csv_rows():
+    table = get_calendar_table()
+    df = pd.read_csv(CALENDAR_CSV_PATH)
+    for _, row in df.iloc[::997].iterrows():
+        d = date.fromisoformat(row["양력일자"])
+        assert table.ganji(d) == (row["歲次"], row["月建"], row["日辰"])
+        lunar = table.lunar(d)
+        assert (lunar["year"], lunar["month"], lunar["day"], lunar["leap"]) == (
+            row["음년"], row["음월"], row["음일"], row["윤달"],
+        )
+    assert table.start == date(1900, 1, 1)
+    assert table.ganji(date(1899, 12, 31)) is None
+    assert table.day_ganji(table.end) is not None
+
+
+def test_month_changes_follow_month_column():
+    table = get_calendar_table()
+    changes = table.month_changes(date(2026, 1, 1), date(2027, 1, 1))
+    assert len(changes) == 12
+    for d, ganji in changes:
+        assert table.month_ganji(d) == ganji != table.month_ganji(date.fromordinal(d.toordinal() - 1))
+
+
+def test_arrays_round_trip_without_copy():
+    table = get_calendar_table()
+    restored = CalendarTable.from_arrays(table.arrays())
+    assert restored.day_codes is table.day_codes
+    assert restored.ganji(date(1990, 5, 5)) == table.ganji(date(1990, 5, 5))
+
+
+def test_memory_report_counts_the_compact_table():
+    table = get_calendar_table()
+    assert table.nbytes < 1 << 20   # 수백 KB (pandas 프레임이 아니라)
+    report = memory_report()
+    entry = report["tables"]["calculation.calendar"]
+    assert entry["loaded"] and entry["type"] == "CalendarTable"
+    assert table.nbytes <= entry["bytes"] < 2 * table.nbytes
+    assert "calculation.calendar" in format_memory_report(report)
+
+
+def test_build_keeps_first_row_of_a_date(tmp_path):
+    csv = tmp_path / "cal.csv"
+    csv.write_text(
+        "양력일자,음년,음월,음일,윤달,歲次,月建,日辰\n"
+        "1900-01-01,1899,12,1,0,己亥,丙子,甲戌\n"
+        "1900-01-01,1899,12,1,0,己亥,丙子,乙亥\n"
+        "1900-01-04,1899,12,4,윤,己亥,丙子,丁丑\n",
+        encoding="utf-8",
+    )
+    table = build_calendar_table(csv)
+    assert table.day_ganji(date(1900, 1, 1)) == "甲戌"
+    assert table.day_ganji(date(1900, 1, 2)) is None   # 빈 날짜
+    assert table.lunar(date(1900, 1, 4))["leap"] == 1
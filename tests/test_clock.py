@@ -0,0 +1,70 @@
+"""
+주입 가능한 시계 (tboo_runtime/clock.py) + 다음 날 today 사전 생성 (fusion_engine/pregenerate.py)
+- 사전 생성본을 적용한 결과 == 그날 처음부터 계산한 today
+"""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+
+from conftest import TODAY
+from engine.engine_core import run_engine
+from engines import load_calculation_main
+from pregenerate import apply_pregenerated, load_pregenerated, pregenerate_roster
+from stream_fusion import subject_key
+from tboo_runtime import clock
+from tboo_runtime.clock import FixedClock, parse_instant, use_clock
+
+
+def test_fixed_clock_drives_today():
+    calc_main = load_calculation_main()
+    with use_clock(FixedClock(datetime(2026, 10, 20, 0, 5))):
+        assert clock.today() == date(2026, 10, 20)
+        by_clock = calc_main.compute_today_unse("甲", 1)
+    assert by_clock == calc_main.compute_today_unse("甲", 1, datetime(2026, 10, 20))
+    assert by_clock != calc_main.compute_today_unse("甲", 1, datetime(2026, 10, 19))
+    assert not isinstance(clock.get_clock(), FixedClock)   # 컨텍스트를 나가면 원래 시계
+
+
+def test_offsets_become_kst_wall_time():
+    # 2026-10-19 16:30 UTC == 2026-10-20 01:30 KST → 날짜가 바뀐다
+    assert parse_instant("2026-10-19T16:30:00+00:00") == datetime(2026, 10, 20, 1, 30)
+    assert FixedClock(datetime(2026, 10, 19, 16, 30, tzinfo=timezone.utc)).now().date() == date(2026, 10, 20)
+    assert parse_instant("2026-10-19") == datetime(2026, 10, 19)
+
+
+def test_pregenerated_today_equals_fresh_computation(tmp_path, calculations):
+    roster = tmp_path / "roster.jsonl"
+    roster.write_text("".join(json.dumps(c, ensure_ascii=False) + "\n" for c in calculations), encoding="utf-8")
+    tomorrow = (TODAY + timedelta(days=1)).date()
+
+    manifest = pregenerate_roster(roster, tmp_path / "store", tomorrow)
+    assert manifest["records"] == len(calculations) and manifest["failed"] == 0
+    store = load_pregenerated(tmp_path / "store", tomorrow)
+    assert load_pregenerated(tmp_path / "store", tomorrow + timedelta(days=1)) is None
+
+    calc_main = load_calculation_main()
+    for calculation in calculations:
+        entry = store.get(subject_key(calculation))
+        meaning = run_engine(calculation)
+        new_calculation, new_meaning = apply_pregenerated(calculation, meaning, entry)
+
+        gender = calc_main.gender_int_from_label(calculation["user_info"]["gender"])
+        expected_today = calc_main.build_today_block(
+            calc_main.compute_today_unse(calculation["saju"]["day"][0], gender, datetime.combine(tomorrow, datetime.min.time()))
+        )
+        assert new_calculation["today"] == expected_today
+        assert new_meaning["meaning_payload"] == run_engine(new_calculation)["meaning_payload"]
+        assert calculation["today"] != expected_today   # 입력은 그대로
+
+
+def test_apply_reencodes_for_id_payloads(tmp_path, calculations):
+    roster = tmp_path / "roster.jsonl"
+    roster.write_text(json.dumps(calculations[0], ensure_ascii=False) + "\n", encoding="utf-8")
+    day = date(2026, 10, 20)
+    pregenerate_roster(roster, tmp_path, day)   # text 로 생성
+    entry = load_pregenerated(tmp_path, day).get(subject_key(calculations[0]))
+
+    meaning = run_engine(calculations[0], slot_encoding="id")
+    new_calculation, new_meaning = apply_pregenerated(calculations[0], meaning, entry)
+    expected = run_engine(new_calculation, slot_encoding="id")["meaning_payload"]["today"]
+    assert new_meaning["meaning_payload"]["today"] == expected
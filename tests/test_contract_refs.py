@@ -0,0 +1,73 @@
+"""
+계약 v1.1 (evidence JSON Pointer 참조) → v1.0 복원 (contract_refs.expand_contract)
+"""
+
+import json
+
+from build_contract import build_interpretation_contract
+from contract_refs import compact_meaning_evidence, expand_contract, find_ref_targets, resolve_pointer, same_json
+from engine.engine_core import run_engine
+
+
+def test_v1_1_expands_to_v1_0(calculations):
+    for calculation in calculations:
+        meaning = run_engine(calculation)
+        v10 = build_interpretation_contract(calculation, meaning, "1.0", validate=True)
+        v11 = build_interpretation_contract(calculation, meaning, "1.1", validate=True)
+
+        assert find_ref_targets(v11), "v1.1 evidence 가 참조로 바뀌지 않음"
+        expanded = expand_contract(v11)
+        assert expanded["meta"]["version"] == "1.0"
+        assert "evidence_refs" not in expanded["meta"]
+        assert expanded["meaning"] == v10["meaning"]
+        assert expanded["calculation"] == v10["calculation"]
+        assert len(json.dumps(v11, ensure_ascii=False)) < len(json.dumps(v10, ensure_ascii=False))
+
+
+def test_expanded_evidence_is_a_copy(calculations):
+    calculation = calculations[0]
+    v11 = build_interpretation_contract(calculation, run_engine(calculation), "1.1")
+    expanded = expand_contract(v11)
+    expanded["meaning"]["meaning_payload"]["today"]["evidence"]["mutated"] = True
+    assert "mutated" not in expanded["calculation"]["today"]
+
+
+def test_v1_0_passes_through(calculations):
+    calculation = calculations[1]
+    v10 = build_interpretation_contract(calculation, run_engine(calculation), "1.0")
+    assert expand_contract(v10) is v10
+
+
+def test_resolve_pointer_escapes():
+    doc = {"a/b": {"c~d": [10, 20]}}
+    assert resolve_pointer(doc, "#/a~1b/c~0d/1") == 20
+
+
+def test_refs_only_to_evidence_sources():
+    calculation = {"user_info": {"name": "갑"}, "today": {"score": 1}, "other": {"score": 1}}
+    meaning = {
+        "subject": {"name": "갑"},
+        "meaning_payload": {
+            "today": {"evidence": {"score": 1}},
+            "custom": {"evidence": {"score": 1}},  # 출처 없음 → 같은 값이 있어도 복사
+        },
+    }
+    out = compact_meaning_evidence(meaning, calculation)
+    assert out["subject"] == {"$ref": "#/calculation/user_info"}
+    assert out["meaning_payload"]["today"]["evidence"] == {"$ref": "#/calculation/today"}
+    assert out["meaning_payload"]["custom"]["evidence"] == {"score": 1}
+
+
+def test_source_with_other_type_is_copied():
+    # 1 == 1.0 이지만 JSON 값으로는 다르다
+    calculation = {"today": {"score": 1.0}}
+    meaning = {"meaning_payload": {"today": {"evidence": {"score": 1}}}}
+    out = compact_meaning_evidence(meaning, calculation)
+    assert out["meaning_payload"]["today"]["evidence"] == {"score": 1}
+
+
+def test_same_json():
+    assert same_json({"a": ("甲", 1)}, {"a": ["甲", 1]})
+    assert not same_json(1, True)
+    assert not same_json([1], [1.0])
+    assert not same_json({"a": 1}, {"a": 1, "b": 2})
@@ -0,0 +1,155 @@
+"""
+계약 스키마 검사 (fusion_engine/contract_validator.py)
+- 엔진이 만든 계약은 통과, 문서 안 위반은 기본 검사(documents=True)에서 첫 위반 경로 / 메시지로 거절
+- 컴파일러: 필수 키 누락 / 타입 / enum(해시 불가 값 포함) / 길이 / anyOf / 없는 $ref
+"""
+
+import copy
+
+import pytest
+
+from build_contract import build_interpretation_contract
+from contract_validator import ContractValidationError, compile_schema, validate_contract
+from engine.engine_core import run_engine
+
+
+@pytest.fixture(scope="module")
+def contract(calculations):
+    calculation = calculations[1]
+    return build_interpretation_contract(calculation, run_engine(calculation))
+
+
+def test_engine_contracts_pass(calculations):
+    for calculation in calculations:
+        meaning = run_engine(calculation)
+        for version in ("1.0", "1.1"):
+            validate_contract(build_interpretation_contract(calculation, meaning, version))
+
+
+def _delete(doc, path, key):
+    del _at(doc, path)[key]
+
+
+def _set(doc, path, key, value):
+    _at(doc, path)[key] = value
+
+
+def _at(doc, path):
+    for part in path:
+        doc = doc[part]
+    return doc
+
+
+# (변경, 기대 경로, 기대 메시지)
+VIOLATIONS = [
+    (lambda c: _delete(c, ["calculation", "saju"], "day"), "/calculation/saju", "missing required 'day'"),
+    (lambda c: _delete(c, ["meaning", "meaning_payload"], "today"), "/meaning/meaning_payload", "missing required 'today'"),
+    (lambda c: _set(c, ["calculation", "daeun_detail", 3], "gan", 7), "/calculation/daeun_detail/3/gan", "expected type string"),
+    (lambda c: _set(c, ["calculation", "daeun_detail", 3], "index", True), "/calculation/daeun_detail/3/index", "expected type integer"),
+    (lambda c: _set(c, ["calculation", "pillars_detail", "day"], "ji", "亥亥"), "/calculation/pillars_detail/day/ji", "string too long"),
+    (lambda c: _set(c, ["calculation", "pillars_detail", "year"], "status", "bogus"), "/calculation/pillars_detail/year/status", "not one of"),
+    (lambda c: _set(c, ["calculation", "pillars_detail", "year"], "status", ["observed"]), "/calculation/pillars_detail/year/status", "not one of"),
+    (lambda c: _set(c, ["calculation", "year_2026_operation", "money"], 0, ("재물", "乙乙", "흐름")), "/calculation/year_2026_operation/money/0/1", "string too long"),
+    (lambda c: _set(c, ["calculation", "year_2026_operation", "money"], 0, ("재물", "乙")), "/calculation/year_2026_operation/money/0", "too few items"),
+    (lambda c: _set(c, ["meaning", "meaning_payload", "today", "slots", "today_money"], 0, 1.5), "/meaning/meaning_payload/today/slots/today_money/0", "expected type"),
+    (lambda c: _set(c, ["meaning", "meta"], "version", "meaning_slots_v1.0"), "/meaning/meta/version", "expected 'meaning_slots_v1.1'"),
+    (lambda c: _set(c, ["meta"], "version", "2.0"), "/meta/version", "not one of"),
+]
+
+
+@pytest.mark.parametrize("mutate, path, message", VIOLATIONS)
+def test_rejects_violation(contract, mutate, path, message):
+    broken = copy.deepcopy(contract)
+    mutate(broken)
+    with pytest.raises(ContractValidationError) as e:
+        validate_contract(broken)
+    assert e.value.path == path
+    assert message in e.value.message
+
+
+def test_envelope_only_skips_documents(contract):
+    broken = copy.deepcopy(contract)
+    broken["calculation"]["daeun_detail"][3]["gan"] = 7
+    validate_contract(broken, documents=False)
+    with pytest.raises(ContractValidationError):
+        validate_contract(broken)
+
+
+def test_unresolvable_evidence_ref(calculations):
+    calculation = calculations[0]
+    v11 = build_interpretation_contract(calculation, run_engine(calculation), "1.1")
+    evidence = v11["meaning"]["meaning_payload"]["today"]["evidence"]
+    evidence["$ref"] = "#/calculation/no_such_block"
+    with pytest.raises(ContractValidationError) as e:
+        validate_contract(v11)
+    assert e.value.path == "/meaning/meaning_payload/today/evidence"
+    assert "unresolvable $ref" in e.value.message
+
+
+# ------------------------------------------------------------
+# 컴파일러 단위 검사 (작은 스키마)
+# ------------------------------------------------------------
+SCHEMA = {
+    "$defs": {
+        "doc": {
+            "type": "object",
+            "required": ["name", "kind", "rows"],
+            "properties": {
+                "name": {"type": "string"},
+                "kind": {"enum": ["a", "b"]},
+                "note": {"type": ["string", "null"], "maxLength": 3},
+                "rows": {"type": "array", "items": {"$ref": "#/$defs/row"}},
+                "tags": {"type": "object", "additionalProperties": {"type": "integer"}},
+                "either": {"anyOf": [{"type": "integer"}, {"type": "string", "minLength": 2}]},
+            },
+        },
+        "row": {
+            "type": "array",
+            "prefixItems": [{"type": "string"}, {"type": "string", "minLength": 1, "maxLength": 1}],
+            "minItems": 2,
+            "maxItems": 2,
+        },
+    }
+}
+
+VALID = {"name": "n", "kind": "a", "rows": [("x", "y")], "tags": {"t": 1}, "either": 3}
+
+
+@pytest.fixture(scope="module")
+def validate_doc():
+    return compile_schema(SCHEMA)["doc"]
+
+
+@pytest.mark.parametrize("change, path, message", [
+    ({"name": None}, "/name", "expected type string"),
+    ({"kind": "c"}, "/kind", "not one of"),
+    ({"kind": {"a": 1}}, "/kind", "not one of"),
+    ({"note": "long"}, "/note", "string too long"),
+    ({"rows": [("x", "y"), ("x", "yy")]}, "/rows/1/1", "string too long"),
+    ({"rows": [("x", "y", "z")]}, "/rows/0", "too many items"),
+    ({"rows": ["xy"]}, "/rows/0", "expected type array"),
+    ({"tags": {"t": True}}, "/tags/t", "expected type integer"),
+    ({"either": "x"}, "/either", "no anyOf alternative matched"),
+])
+def test_compiled_rejects(validate_doc, change, path, message):
+    with pytest.raises(ContractValidationError) as e:
+        validate_doc({**VALID, **change})
+    assert (e.value.path, message in e.value.message) == (path, True)
+
+
+def test_compiled_missing_key(validate_doc):
+    doc = dict(VALID)
+    del doc["rows"]
+    with pytest.raises(ContractValidationError) as e:
+        validate_doc(doc)
+    assert (e.value.path, e.value.message) == ("", "missing required 'rows'")
+
+
+def test_compiled_accepts(validate_doc):
+    validate_doc(VALID)
+    validate_doc({**VALID, "note": None, "either": "xy", "rows": [["x", "y"]], "tags": {}})
+
+
+def test_dangling_schema_ref():
+    with pytest.raises(KeyError):
+        compile_schema({"$defs": {"doc": {"$ref": "#/$defs/missing"}}})
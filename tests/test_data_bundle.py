@@ -0,0 +1,61 @@
+"""
+데이터 번들 (tboo_runtime/data_bundle.py, fusion_engine/build_bundle.py)
+- 엔진 import 쪽(open_bundle)은 읽기만: 오래된 / 버전이 다른 번들은 건너뛰고(None) 파일을 건드리지 않는다
+- 다시 만드는 것은 build_bundle() (CLI) 뿐
+"""
+
+import numpy as np
+
+from build_bundle import build_bundle
+from tboo_runtime.data_bundle import BUNDLE_FORMAT, BUNDLE_VERSION, bundle_status, open_bundle, source_fingerprint
+from tboo_runtime.shared_tables import write_tables
+
+
+def _bundle_over(path, source, version=BUNDLE_VERSION):
+    write_tables(
+        path,
+        {"g": {"a": np.arange(4)}},
+        meta={"format": BUNDLE_FORMAT, "version": version, "sources": {"src": source_fingerprint(source)}},
+    )
+
+
+def test_fresh_bundle_attaches(tmp_path):
+    source = tmp_path / "src.csv"
+    source.write_text("a,b\n")
+    path = tmp_path / "b.bundle"
+    _bundle_over(path, source)
+    bundle = open_bundle(path)
+    assert bundle is not None
+    assert bundle.table("g")["a"].tolist() == [0, 1, 2, 3]
+
+
+def test_stale_bundle_is_skipped_not_rebuilt(tmp_path, capsys):
+    source = tmp_path / "src.csv"
+    source.write_text("a,b\n")
+    path = tmp_path / "b.bundle"
+    _bundle_over(path, source)
+    before = path.read_bytes()
+    source.write_text("a,b,c\n")
+
+    assert open_bundle(path) is None
+    assert "stale:src" in capsys.readouterr().err
+    assert path.read_bytes() == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.bundle", "src.csv"]   # 잠금 / 임시 파일 없음
+
+
+def test_other_version_and_missing(tmp_path, capsys):
+    source = tmp_path / "src.csv"
+    source.write_text("a,b\n")
+    path = tmp_path / "b.bundle"
+    _bundle_over(path, source, version=BUNDLE_VERSION - 1)
+    assert open_bundle(path) is None
+    assert "version" in capsys.readouterr().err
+    assert open_bundle(tmp_path / "none.bundle") is None
+    assert capsys.readouterr().err == ""
+
+
+def test_build_step_makes_a_fresh_bundle(tmp_path):
+    path = tmp_path / "tboo_data.bundle"
+    assert build_bundle(path)["built"] is True
+    assert bundle_status(path)[0] == "fresh"
+    assert build_bundle(path)["built"] is False   # 원본이 같으면 건너뜀
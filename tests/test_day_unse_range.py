@@ -0,0 +1,50 @@
+"""
+기간 일운 (engine/saju_core.get_day_unse_range) == 날짜별 get_day_unse_for_date
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from engine.calendar_table import get_calendar_table
+from engine.ganji_tables import GAN_10
+from engine.saju_core import domain_sipshin_keys, get_day_unse_for_date, get_day_unse_range
+
+
+def _per_day(day_gan, start, end):
+    return [
+        get_day_unse_for_date(day_gan, datetime.combine(start + timedelta(days=i), datetime.min.time()))
+        for i in range((end - start).days)
+    ]
+
+
+@pytest.mark.parametrize("day_gan", GAN_10)
+def test_range_equals_per_day(day_gan):
+    start, end = date(2026, 1, 1), date(2027, 1, 1)
+    assert get_day_unse_range(day_gan, start, end) == _per_day(day_gan, start, end)
+
+
+def test_calendar_edges_and_empty_range():
+    table = get_calendar_table()
+    first, last = table.start, table.end
+    assert get_day_unse_range("甲", first, first + timedelta(days=3)) == _per_day("甲", first, first + timedelta(days=3))
+    assert get_day_unse_range("乙", last, last + timedelta(days=1)) == _per_day("乙", last, last + timedelta(days=1))
+    assert get_day_unse_range("甲", date(2026, 5, 1), date(2026, 5, 1)) == []
+    with pytest.raises(ValueError):
+        get_day_unse_range("甲", last, last + timedelta(days=2))
+    with pytest.raises(ValueError):
+        get_day_unse_range("甲", first - timedelta(days=1), first + timedelta(days=1))
+    with pytest.raises(ValueError):
+        get_day_unse_range("X", first, last)
+
+
+@pytest.mark.parametrize("gender", [1, 2])
+def test_domain_flags_follow_sipshin(gender):
+    rows = get_day_unse_range("丙", date(2026, 10, 1), date(2026, 11, 1), domains=["jaemul", "love", "job"], gender=gender)
+    keys = domain_sipshin_keys(gender)
+    for row in rows:
+        assert row["domains"] == {name: row["sipshin"] in keys[name] for name in ("jaemul", "love", "job")}
+    with pytest.raises(ValueError):
+        get_day_unse_range("丙", date(2026, 10, 1), date(2026, 10, 2), domains=["love"])
+    with pytest.raises(ValueError):
+        get_day_unse_range("丙", date(2026, 10, 1), date(2026, 10, 2), domains=["health"], gender=1)
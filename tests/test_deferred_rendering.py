@@ -0,0 +1,49 @@
+"""
+대운 라벨 / 텍스트 블록 지연 렌더링 (engine/daeun.py DaeunLabels · DeferredSajuRow, analyze_saju(defer=True))
+- 렌더링 전에는 아무 것도 만들지 않고, 렌더링 결과 == 기본(즉시) analyze_saju
+"""
+
+import pandas as pd
+import pytest
+
+from conftest import BIRTHS, TODAY
+from engine.daeun import DaeunLabels, DeferredSajuRow
+from engine.saju_core import analyze_saju, render_saju_info
+from engines import load_calculation_main
+
+
+@pytest.mark.parametrize("birth", BIRTHS)
+def test_deferred_renders_to_the_eager_result(birth):
+    name, gender, *when = birth
+    eager_info, eager_row = analyze_saju(*when, gender, name)
+    info, row = analyze_saju(*when, gender, name, defer=True)
+
+    assert isinstance(info["daeun_labels"], DaeunLabels) and isinstance(row, DeferredSajuRow)
+    assert "deferred" in repr(info["daeun_labels"]) and "deferred" in repr(row)
+    assert all("label" not in e for e in info["daeun_detail"])
+
+    assert render_saju_info(info) == eager_info
+    pd.testing.assert_frame_equal(row.to_dataframe(), eager_row)
+    assert row.text_block == eager_row["텍스트_블록"].iloc[0]
+    assert row.columns.tolist() == eager_row.columns.tolist()   # DataFrame 속성 위임
+
+
+def test_labels_are_a_read_only_sequence():
+    name, gender, *when = BIRTHS[1]
+    labels = analyze_saju(*when, gender, name, defer=True)[0]["daeun_labels"]
+    eager = analyze_saju(*when, gender, name)[0]["daeun_labels"]
+    assert len(labels) == len(eager) and "deferred" in repr(labels)
+    assert labels[0] == eager[0] and list(labels) == eager and labels == eager
+    assert "rendered" in repr(labels)
+
+
+def test_v33_json_is_the_same_either_way():
+    calc_main = load_calculation_main()
+    name, gender, *when = BIRTHS[3]
+    documents = []
+    for defer in (False, True):
+        info, _ = analyze_saju(*when, gender, name, defer=defer)
+        today = calc_main.compute_today_unse(info["day_gan"], gender, TODAY)
+        documents.append(calc_main.build_tboo_json_v33(name, "여성", *when, info, today))
+    assert documents[0] == documents[1]
+    assert documents[1]["daeun_detail"][0]["label"] == documents[1]["daeun"]["labels"][0]
@@ -0,0 +1,50 @@
+"""
+참조 구현 vs 빠른 경로 (calculation_engine/differential_check.py) — 표본 구간에서 불일치 없음
+- 전 구간 실행은 CLI 로 (python calculation_engine/differential_check.py)
+"""
+
+from datetime import date
+
+import pytest
+
+import differential_check as dc
+
+
+@pytest.fixture(scope="module", autouse=True)
+def reference_tables():
+    dc._init_worker()
+
+
+def test_si_ji_and_hour_gan_match():
+    checked, found = dc.check_si_ji()
+    assert found is None
+    assert checked == 24 * 60 + 10 * 12
+
+
+@pytest.mark.parametrize("start", [date(1900, 2, 3), date(1954, 3, 20), date(1987, 6, 30), date(2026, 2, 3)])
+def test_sample_days_match(start):
+    checked, found = dc.check_chunk(start, 2, ("daeun", "analyze"), (0, 89, 90, 690, 1439))
+    assert found is None, found
+    assert checked > 0
+
+
+def test_solar_rule_matches_on_dst_boundary_day():
+    # 1987-05-10: 일광절약시간 시작일
+    checked, found = dc.check_chunk(date(1987, 5, 10), 1, ("solar",), ())
+    assert found is None, found
+    assert checked >= 3 * 24 * 60
+
+
+def test_first_difference_reports_path_and_types():
+    assert dc.first_difference({"a": [1, 2]}, {"a": [1, 2]}) is None
+    assert dc.first_difference({"a": [1, 2]}, {"a": [1, 3]}) == ("/a/1", 2, 3)
+    assert dc.first_difference({"a": (1,)}, {"a": [1]}) == ("/a (type)", "tuple", "list")
+    assert dc.first_difference({"a": 1}, {"b": 1}) == ("/a", 1, "<missing>")
+    assert dc.first_difference(1, 1.0) == ("/", 1, 1.0)
+
+
+def test_divergence_carries_a_runnable_reproducer():
+    case = {"y": 1990, "m": 5, "d": 5, "h": 10, "mi": 30, "gender": 1}
+    report = dc.divergence("analyze", case, ("/x", 1, 2))
+    assert report["path"] == "/x" and report["case"] == case
+    compile(report["reproducer"], "<reproducer>", "exec")
@@ -0,0 +1,76 @@
+"""
+궁합 top-k 인덱스 (engine/gunghap.py GunghapIndex) == score_compatibility 전수 비교
+"""
+
+import random
+
+import pytest
+
+from engine.ganji_tables import GAN_10, JI_12
+from engine.gunghap import GunghapIndex, features_from_calculation, score_compatibility
+
+
+def random_features(size, seed=2026):
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(size):
+        counts = [0] * 5
+        for _ in range(rnd.choice((6, 8))):   # 시주 미상이면 6글자
+            counts[rnd.randrange(5)] += 1
+        out.append({
+            "gender": rnd.choice((1, 2)),
+            "day_gan": rnd.choice(GAN_10),
+            "day_ji": rnd.choice(JI_12),
+            "year_ji": rnd.choice(JI_12),
+            "elements": counts,
+        })
+    return out
+
+
+def brute_force(features, query, k, gender=None, exclude=None):
+    ranked = sorted(
+        (-score_compatibility(query, f)["score"], i)
+        for i, f in enumerate(features)
+        if (gender is None or f["gender"] == gender) and i != exclude
+    )
+    return [(i, -neg) for neg, i in ranked[:k]]
+
+
+@pytest.fixture(scope="module")
+def population():
+    features = random_features(1500)
+    return features, GunghapIndex.from_features(features)
+
+
+@pytest.mark.parametrize("k", [1, 10, 50])
+def test_top_k_matches_brute_force(population, k):
+    features, index = population
+    for qi in random.Random(k).sample(range(len(features)), 25):
+        query = features[qi]
+        opposite = 3 - query["gender"]
+        assert index.top_k(query, k, gender=opposite, exclude=qi) == brute_force(
+            features, query, k, gender=opposite, exclude=qi
+        )
+        assert index.top_k(query, k) == brute_force(features, query, k)
+
+
+def test_k_larger_than_population():
+    features = random_features(12, seed=7)
+    index = GunghapIndex.from_features(features)
+    assert index.top_k(features[0], 100, exclude=0) == brute_force(features, features[0], 100, exclude=0)
+
+
+def test_index_scores_match_pairwise_score(population):
+    features, index = population
+    for query in features[:20]:
+        scores = index.scores(query)
+        assert scores.tolist() == [score_compatibility(query, f)["score"] for f in features]
+
+
+def test_real_charts_symmetric(calculations):
+    features = [features_from_calculation(c) for c in calculations]
+    index = GunghapIndex.from_features(features)
+    for a in features:
+        scores = index.scores(a)
+        for j, b in enumerate(features):
+            assert score_compatibility(a, b)["score"] == score_compatibility(b, a)["score"] == scores[j]
@@ -0,0 +1,65 @@
+"""
+연도별 월운 구간표 (engine/month_table.py) == 만세력 DataFrame / CalendarTable 계산
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from engine.calendar_table import get_calendar_table
+from engine.ganji_tables import GAN_10
+from engine.month_table import get_month_table
+from engine.reference import load_reference_calendar
+from engine.saju_core import build_month_operation, domain_sipshin_keys, get_year_month_unse
+
+SAMPLE_YEARS = (1900, 1901, 1954, 1987, 2000, 2026, 2049, 2050)
+
+
+@pytest.fixture(scope="module")
+def reference_frame():
+    return load_reference_calendar()
+
+
+@pytest.mark.parametrize("year", SAMPLE_YEARS)
+def test_table_matches_dataframe(reference_frame, year):
+    for day_gan in ("甲", "丁", "癸"):
+        assert get_year_month_unse(day_gan, year) == get_year_month_unse(day_gan, year, reference_frame)
+
+
+def test_table_matches_calendar_table_every_year():
+    table, calendar = get_month_table(), get_calendar_table()
+    for year in range(table.first_year, table.last_year + 1):
+        assert get_year_month_unse("庚", year) == get_year_month_unse("庚", year, calendar), year
+
+
+def test_periods_are_contiguous():
+    table = get_month_table()
+    for year in range(table.first_year, table.last_year):
+        periods = table.year_periods(year)
+        assert 0 < len(periods) <= 13
+        for (_, end, _), (start, _, _) in zip(periods, periods[1:]):
+            assert date.fromisoformat(end) + timedelta(days=1) == date.fromisoformat(start)
+    assert table.year_periods(table.last_year + 1) == ()
+
+
+@pytest.mark.parametrize("gender", [1, 2])
+def test_month_operation_matches_year_month_unse(gender):
+    keys = domain_sipshin_keys(gender)
+    for day_gan in GAN_10:
+        operation = build_month_operation(day_gan, gender, 2026)
+        expected = get_year_month_unse(day_gan, 2026)
+        assert operation["year"] == 2026
+        assert [{k: v for k, v in m.items() if k != "domains"} for m in operation["months"]] == [
+            {k: v for k, v in m.items() if k != "note"} for m in expected
+        ]
+        for month in operation["months"]:
+            assert month["domains"] == {
+                name: month["sipshin"] in keys[name] for name in ("jaemul", "love", "job")
+            }
+
+
+def test_month_operation_out_of_range():
+    with pytest.raises(ValueError):
+        build_month_operation("甲", 1, 1800)
+    with pytest.raises(ValueError):
+        build_month_operation("X", 1, 2026)
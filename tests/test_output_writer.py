@@ -0,0 +1,76 @@
+"""
+결과 파일 비동기 기록기 (tboo_runtime/output_writer.py)
+- 넣은 순서대로 기록, .gz 는 gzip, 단일 파일은 원자적 교체
+- 역압 / 백그라운드 오류는 호출 스레드에서 보인다
+"""
+
+import gzip
+
+import pytest
+
+from tboo_runtime.output_writer import OutputWriter
+
+
+def test_lines_keep_order_per_path(tmp_path):
+    a, b = tmp_path / "a.jsonl", tmp_path / "sub" / "b.jsonl.gz"
+    with OutputWriter(linger=0.001) as writer:
+        writer.open(a)
+        for i in range(500):
+            writer.append(a, f"a{i}")
+            writer.append(b if i % 2 else a, f"x{i}\n")
+        writer.append_lines(b, ["y1", "y2"])
+        writer.append_lines(b, [])
+    stats = writer.stats()
+    expected_a = [line for i in range(500) for line in (f"a{i}",) + ((f"x{i}",) if i % 2 == 0 else ())]
+    assert a.read_text().splitlines() == expected_a
+    with gzip.open(b, "rt") as f:
+        assert f.read().splitlines() == [f"x{i}" for i in range(1, 500, 2)] + ["y1", "y2"]
+    assert stats["lines"] == 1002 and stats["pending_bytes"] == 0
+
+
+def test_open_truncates_unless_appending(tmp_path):
+    path = tmp_path / "out.jsonl"
+    path.write_text("old\n")
+    with OutputWriter() as writer:
+        writer.open(path, append=True)
+        writer.append(path, "kept")
+        writer.close_path(path)
+        assert path.read_text() == "old\nkept\n"
+        writer.open(path)
+        writer.append(path, "new")
+    assert path.read_text() == "new\n"
+
+
+def test_write_file_replaces_atomically(tmp_path):
+    path = tmp_path / "chart.json"
+    with OutputWriter() as writer:
+        writer.write_file(path, "1")
+        writer.write_file(path, b"2")
+        writer.write_file(tmp_path / "chart.json.gz", "3")
+    assert path.read_text() == "2"
+    assert gzip.decompress((tmp_path / "chart.json.gz").read_bytes()) == b"3"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["chart.json", "chart.json.gz"]
+
+
+def test_backpressure_stalls_but_writes_everything(tmp_path):
+    path = tmp_path / "big.jsonl"
+    line = "x" * 1000
+    with OutputWriter(max_pending_bytes=4096, batch_bytes=2048, linger=0) as writer:
+        for _ in range(300):
+            writer.append(path, line)
+            assert writer.stats()["pending_bytes"] <= 4096 + len(line) + 1
+    assert path.read_text().splitlines() == [line] * 300
+
+
+def test_background_error_surfaces_on_next_call(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    writer = OutputWriter()
+    writer.write_file(blocker / "child.json", "x")   # 부모가 파일 → 백그라운드에서 실패
+    with pytest.raises(OSError):
+        writer.flush()
+    writer.write_file(tmp_path / "ok.json", "y")   # 오류는 한 번만 올라오고 계속 쓸 수 있다
+    writer.close()
+    assert (tmp_path / "ok.json").read_text() == "y"
+    with pytest.raises(RuntimeError):
+        writer.append(tmp_path / "late.jsonl", "z")
@@ -0,0 +1,70 @@
+"""
+사주 → 출생 날짜 / 시각 역색인 (engine/pillar_index.py) == 만세력 전수 조회
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from conftest import BIRTHS
+from engine.calendar_table import get_calendar_table
+from engine.pillar_index import get_pillar_index, hour_windows
+from engine.saju_core import analyze_saju
+
+
+def _brute_force_days(year=None, month=None, day=None, hour_gan_days=None):
+    table = get_calendar_table()
+    days = []
+    for i in np.flatnonzero(table.day_codes < 60).tolist():
+        y, m, d = table.ganji(table.date_at(i))
+        if (year and y != year) or (month and m != month) or (day and d != day):
+            continue
+        if hour_gan_days is not None and d[0] not in hour_gan_days:
+            continue
+        days.append(table.date_at(i))
+    return days
+
+
+def _expand(ranges):
+    return [date.fromordinal(o) for s, e in ranges for o in range(s.toordinal(), e.toordinal() + 1)]
+
+
+@pytest.mark.parametrize("query", [
+    {"year": "丙午"},
+    {"year": "庚午", "month": "辛巳"},
+    {"month": "丙子", "day": "甲子"},
+    {"year": "丁卯", "month": "丙午", "day": "癸酉"},
+])
+def test_lookup_equals_brute_force(query):
+    result = get_pillar_index().lookup(**query)
+    expected = _brute_force_days(**query)
+    assert result["days"] == len(expected)
+    assert _expand(result["ranges"]) == expected
+    assert result["hour_windows"] is None
+
+
+def test_hour_ganji_narrows_the_day_stem():
+    index = get_pillar_index()
+    result = index.lookup(month="丙午", hour="甲子")   # 甲子시 → 일간 甲 / 己
+    assert _expand(result["ranges"]) == _brute_force_days(month="丙午", hour_gan_days={"甲", "己"})
+    assert result["hour_windows"] == [("00:00", "01:29"), ("23:30", "23:59")] == hour_windows("子")
+    assert index.lookup(month="丙午", hour="子")["days"] == len(_brute_force_days(month="丙午"))
+
+
+@pytest.mark.parametrize("birth", [b for b in BIRTHS if b[5] is not None])
+def test_analyzed_charts_find_their_birth(birth):
+    name, gender, year, month, day, hour, minute = birth
+    info, _ = analyze_saju(year, month, day, hour, minute, gender, name)
+    result = get_pillar_index().lookup(info["year_ganji"], info["month_ganji"], info["day_ganji"], info["hour_ganji"])
+    assert date(year, month, day) in _expand(result["ranges"])
+    clock = f"{hour:02d}:{minute:02d}"
+    assert any(lo <= clock <= hi for lo, hi in result["hour_windows"])
+
+
+def test_invalid_queries():
+    index = get_pillar_index()
+    for bad in ({"year": "甲丑"}, {"hour": "X"}, {"hour": "甲丑"}, {"hour": "甲子午"}):
+        with pytest.raises(ValueError):
+            index.lookup(**bad)
+    assert index.lookup(year="甲子", month="甲子")["ranges"] == []   # 甲년에는 甲子월이 없다
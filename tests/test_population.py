@@ -0,0 +1,62 @@
+"""
+만세력 분포 집계 (fusion_engine/population.py) — 날짜별 analyze_saju / run_engine 결과를 센 것과 같다
+"""
+
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+
+from engine.engine_core import run_engine
+from engine.saju_core import analyze_saju
+from population import population_distribution
+
+START, END = date(1990, 1, 1), date(1991, 1, 1)
+
+
+def _analyzed_days():
+    day = START
+    while day < END:
+        info, _ = analyze_saju(day.year, day.month, day.day, None, None, 1, "p", defer=True)
+        yield day, info
+        day += timedelta(days=1)
+
+
+def _counts(result):
+    assert len(result["rows"]) == 1
+    return result["rows"][0]["counts"]
+
+
+def test_structural_fields_match_per_day_analysis():
+    expected = {"day_ganji": Counter(), "sipshin.year": Counter(), "unseong.month": Counter()}
+    for _, info in _analyzed_days():
+        expected["day_ganji"][info["day_ganji"]] += 1
+        expected["sipshin.year"][info["sipshin"]["원국_년간"]] += 1
+        expected["unseong.month"][info["unseong"]["월지"]] += 1
+    for field, counter in expected.items():
+        assert _counts(population_distribution(field, start=START, end=END)) == dict(counter)
+
+
+@pytest.mark.parametrize("day", [date(1990, 5, 5), date(1954, 3, 21), date(2001, 12, 31), date(1900, 2, 10)])
+def test_meaning_fields_match_run_engine(make_calculation, day):
+    payload = run_engine(make_calculation("p", 1, day.year, day.month, day.day, None, None))["meaning_payload"]
+    one_day = {"start": day, "end": day + timedelta(days=1)}
+    for field in ("existence_type", "desire_direction"):
+        assert _counts(population_distribution(field, **one_day)) == {payload["natal"]["slots"][field]: 1}
+
+
+def test_groups_partition_the_range():
+    result = population_distribution("day_gan", by="month", start=START, end=END)
+    assert result["days"] == 365
+    assert [row["group"] for row in result["rows"]] == list(range(1, 13))
+    assert sum(row["total"] for row in result["rows"]) == 365
+    for row in result["rows"]:
+        assert sum(row["counts"].values()) == row["total"]
+        assert abs(sum(row["shares"].values()) - 1) < 1e-5
+
+
+def test_unknown_field_or_group():
+    with pytest.raises(ValueError):
+        population_distribution("nope")
+    with pytest.raises(ValueError):
+        population_distribution("day_gan", by="nope")
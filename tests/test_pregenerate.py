@@ -0,0 +1,67 @@
+"""
+로스터 today 사전 생성의 (일간, 성별) 그룹 중복 제거 (fusion_engine/pregenerate.py)
+- 그룹마다 한 번만 계산, 사용자 레코드는 그룹 참조 / 조회는 byte offset 색인
+"""
+
+import json
+from datetime import date
+
+import pregenerate
+from pregenerate import load_pregenerated, pregenerate_roster, today_group_key
+from stream_fusion import subject_key
+
+DAY = date(2026, 10, 20)
+
+
+def _roster(tmp_path, make_calculation, count):
+    births = [
+        (f"user{i}", 1 + i % 2, 1950 + i * 7 % 60, 1 + i % 12, 1 + i * 3 % 28, i % 24, i * 7 % 60)
+        for i in range(count)
+    ]
+    calculations = [make_calculation(*b) for b in births]
+    path = tmp_path / "roster.jsonl"
+    lines = [json.dumps(c, ensure_ascii=False) for c in calculations] + ['{"subject_id": "broken", "saju": {}}']
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path, calculations
+
+
+def test_one_computation_per_group(tmp_path, make_calculation, monkeypatch):
+    path, calculations = _roster(tmp_path, make_calculation, 48)
+    calls = []
+    compute_group = pregenerate.compute_group
+    monkeypatch.setattr(pregenerate, "compute_group", lambda *a, **kw: calls.append(a[:2]) or compute_group(*a, **kw))
+
+    manifest = pregenerate_roster(path, tmp_path / "store", DAY)
+    groups = {today_group_key(c) for c in calculations}
+    assert sorted(calls) == sorted(groups) and len(groups) <= 20
+    assert manifest["records"] == len(calculations) and manifest["groups"] == len(groups)
+    assert manifest["failed"] == 1
+    errors = (tmp_path / "store" / DAY.isoformat() / "errors.jsonl").read_text(encoding="utf-8")
+    assert json.loads(errors)["key"] == "broken"
+
+    store = load_pregenerated(tmp_path / "store", DAY)
+    assert sum(g["users"] for g in store.groups.values()) == len(calculations)
+
+
+def test_members_of_a_group_share_one_payload(tmp_path, make_calculation):
+    path, calculations = _roster(tmp_path, make_calculation, 24)
+    pregenerate_roster(path, tmp_path, DAY)
+    store = load_pregenerated(tmp_path, DAY)
+
+    by_group = {}
+    for calculation in calculations:
+        entry = store.get(subject_key(calculation))
+        assert entry["subject_key"] == subject_key(calculation) and entry["date"] == DAY.isoformat()
+        first = by_group.setdefault(today_group_key(calculation), entry)
+        assert entry["today"] is first["today"]
+
+    assert len(store) == len(calculations) and "broken" not in store
+    assert store.get("nobody") is None
+    assert [r["subject_key"] for r in store.records()] == [subject_key(c) for c in calculations]
+
+
+def test_unfinished_store_is_not_served(tmp_path, make_calculation):
+    path, _ = _roster(tmp_path, make_calculation, 2)
+    pregenerate_roster(path, tmp_path, DAY)
+    (tmp_path / DAY.isoformat() / "manifest.json").unlink()
+    assert load_pregenerated(tmp_path, DAY) is None
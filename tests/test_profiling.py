@@ -0,0 +1,66 @@
+"""
+--trace-malloc (tboo_runtime/profiling.py) — 단계 경계마다 최대치, 최대 단계 끝의 할당 위치 + 종료 시점 할당 위치
+"""
+
+import io
+
+from tboo_runtime.profiling import profiling_session
+from tboo_runtime.tracing import active_tracer, stage, tracing
+
+
+def _session(body):
+    out = io.StringIO()
+    with profiling_session(None, True, 5, "cumulative", out):
+        body()
+    return out.getvalue()
+
+
+def test_peak_is_attributed_to_the_stage_that_allocated():
+    def body():
+        with stage("small"):
+            _ = [0] * 1000
+        with stage("big"):
+            blob = bytearray(4 << 20)
+            del blob   # 종료 시점에는 남아 있지 않아도 최대치는 big
+        with stage("after"):
+            pass
+
+    report = _session(body)
+    assert "peak memory   : " in report and "(stage 'big')" in report
+    by_stage = report.split("peak by stage")[1].splitlines()
+    assert by_stage[1].endswith("big")
+    assert "live at the end of stage 'big' (peak, by size):" in report
+    assert "still live at exit" in report
+    assert active_tracer() is None   # 세션이 켠 트레이서는 나갈 때 끈다
+
+
+def test_existing_tracer_keeps_timings_and_hook_is_restored():
+    def body():
+        with stage("work"):
+            blob = [1] * 10000
+            del blob
+
+    with tracing() as tracer:   # CLI --trace 로 이미 켜진 트레이서
+        report = _session(body)
+        assert tracer.counts["work"] == 1
+        assert tracer.on_record is None
+    assert "(stage 'work')" in report
+
+
+def test_peak_after_the_last_stage_is_labelled():
+    def body():
+        with stage("small"):
+            pass
+        blob = bytearray(4 << 20)
+        del blob
+
+    report = _session(body)
+    assert "(after the last stage)" in report
+    assert "live at the end of stage" not in report
+
+
+def test_without_stages_only_the_exit_snapshot():
+    report = _session(lambda: None)
+    assert "peak by stage" not in report
+    assert "(stage " not in report and "(after the last stage)" not in report
+    assert "still live at exit" in report
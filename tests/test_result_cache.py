@@ -0,0 +1,122 @@
+"""
+run_engine 결과 캐시 (meaning_engine/engine/result_cache.py) — 적중 결과 == run_engine 결과
+- today 는 키에 들어가지 않고 적중마다 요청에서 다시 만든다 (날이 바뀌어도 적중)
+"""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from conftest import BIRTHS
+from engine.engine_core import run_engine
+from engine.result_cache import MeaningResultCache, chart_fingerprint
+from engine.saju_core import analyze_saju
+from engines import load_calculation_main
+from tboo_runtime.output_writer import OutputWriter, get_output_writer
+
+
+@pytest.mark.parametrize("slot_encoding", ["text", "id"])
+def test_hit_equals_run_engine(calculations, slot_encoding):
+    cache = MeaningResultCache()
+    for calculation in calculations:
+        expected = run_engine(calculation, slot_encoding=slot_encoding)
+        assert cache.run(calculation, slot_encoding) == expected   # miss
+        assert cache.run(calculation, slot_encoding) == expected   # hit
+    stats = cache.stats()
+    assert stats["misses"] == stats["hits"] == len(calculations)
+
+
+def test_same_chart_other_subject_shares_entry(make_calculation):
+    name, *birth = BIRTHS[1]
+    first = make_calculation(name, *birth, years=range(2026, 2029))
+    renamed = make_calculation("다른이름", *birth, years=range(2026, 2029))
+    assert chart_fingerprint(first) == chart_fingerprint(renamed)
+
+    cache = MeaningResultCache()
+    cache.run(first)
+    hit = cache.run(renamed)
+    assert cache.stats()["hits"] == 1
+    assert hit == run_engine(renamed)
+    assert hit["subject"]["name"] == "다른이름"
+
+
+def test_slot_inputs_change_the_key(make_calculation, calculations):
+    with_months = calculations[0]
+    without_months = make_calculation(*BIRTHS[0], years=range(2026, 2029))
+    assert chart_fingerprint(with_months) != chart_fingerprint(without_months)
+    assert len({chart_fingerprint(c) for c in calculations}) == len(calculations)
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path, calculations):
+    MeaningResultCache(directory=tmp_path).run(calculations[2], "id")
+    get_output_writer().flush()   # 디스크 기록은 output writer 스레드에서
+    cache = MeaningResultCache(directory=tmp_path)
+    assert cache.run(calculations[2], "id") == run_engine(calculations[2], slot_encoding="id")
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_lru_eviction_and_caller_mutation(calculations):
+    cache = MeaningResultCache(max_entries=1)
+    first = cache.run(calculations[0])
+    first["meta"]["trace"] = {"mutated": True}   # attach_trace 처럼 호출 측이 meta 를 고쳐도
+    assert "trace" not in cache.run(calculations[0])["meta"]
+
+    cache.run(calculations[1])
+    assert cache.stats()["evictions"] == 1
+    cache.run(calculations[0])
+    assert cache.stats()["misses"] == 3
+
+
+def test_max_entries_must_be_positive():
+    with pytest.raises(ValueError):
+        MeaningResultCache(max_entries=0)
+
+
+def _on_day(calculation, birth, day):
+    """같은 명식, 오늘 날짜만 다른 계산 결과."""
+    name, gender, year, month, d, hour, minute = birth
+    calc_main = load_calculation_main()
+    saju_info, _ = analyze_saju(year, month, d, hour, minute, gender, name, defer=True)
+    other = calc_main.build_tboo_json_v33(
+        name, "남성" if gender == 1 else "여성", year, month, d, hour, minute,
+        saju_info, calc_main.compute_today_unse(saju_info["day_gan"], gender, day),
+    )
+    return {**calculation, "today": other["today"]}
+
+
+@pytest.mark.parametrize("slot_encoding", ["text", "id"])
+def test_next_day_hits_with_fresh_today(calculations, slot_encoding):
+    cache = MeaningResultCache()
+    cache.run(calculations[0], slot_encoding)
+    for day in (datetime(2026, 10, 20), datetime(2026, 11, 3)):
+        next_day = _on_day(calculations[0], BIRTHS[0], day)
+        assert next_day["today"] != calculations[0]["today"]
+        assert chart_fingerprint(next_day) == chart_fingerprint(calculations[0])
+        assert cache.run(next_day, slot_encoding) == run_engine(next_day, slot_encoding=slot_encoding)
+    assert cache.stats()["hits"] == 2
+
+
+def test_concurrent_file_writes_do_not_collide(tmp_path):
+    # 같은 경로를 여러 기록기(워커)가 동시에 써도 임시 파일이 겹치지 않는다
+    path = tmp_path / "ab" / "entry.text.json"
+    writers = [OutputWriter() for _ in range(4)]
+    payloads = [f'{{"writer":{i}}}' for i in range(len(writers))]
+    errors = []
+
+    def burst(writer, payload):
+        try:
+            for _ in range(50):
+                writer.write_file(path, payload)
+            writer.close()   # 백그라운드 쓰기 오류는 여기서 올라온다
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=burst, args=pair) for pair in zip(writers, payloads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert path.read_text() in payloads
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
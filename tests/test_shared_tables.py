@@ -0,0 +1,82 @@
+"""
+프로세스 간 공유 테이블 파일 (tboo_runtime/shared_tables.py, fusion_engine/worker_tables.py)
+- 배열은 읽기 전용 mmap view, 문자열 트리는 pack / unpack 왕복
+- TBOO_SHARED_TABLES 로 붙은 워커의 결과 == 원본을 파싱한 프로세스의 결과
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from engine.engine_core import GANJI_BRANCH_LEXICON, GANJI_COMBINATION_RULES, GANJI_STEM_LEXICON, run_engine
+from tboo_runtime.shared_tables import ENV_VAR, MappedTables, pack_strings, unpack_strings, write_tables
+from worker_tables import engine_tables
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+WORKER = """
+import json, sys
+from datetime import datetime
+sys.path.insert(0, {fusion!r})
+from engines import load_calculation_main
+from engine.engine_core import run_engine
+from engine.saju_core import analyze_saju
+from tboo_runtime.shared_tables import attached_tables
+calc_main = load_calculation_main()
+info, _ = analyze_saju(1990, 5, 5, 10, 30, 1, "worker", defer=True)
+doc = calc_main.build_tboo_json_v33("worker", "남성", 1990, 5, 5, 10, 30, info,
+                                    calc_main.compute_today_unse(info["day_gan"], 1, datetime(2026, 10, 19)))
+print(json.dumps({{"attached": str(attached_tables().path), "meaning": run_engine(doc)}}, ensure_ascii=False))
+"""
+
+
+def test_arrays_round_trip_as_read_only_views(tmp_path):
+    arrays = {
+        "scalar": np.array(7, dtype=np.int64),
+        "strided": np.arange(12, dtype=np.int16).reshape(3, 4)[:, ::2],
+        "codes": np.arange(60, dtype=np.uint8),
+    }
+    path = write_tables(tmp_path / "t.bin", {"g": arrays}, blobs={"small": {"a": 1}}, meta={"v": 2})
+    mapped = MappedTables(path)
+    assert mapped.groups() == ["g"] and mapped.meta == {"v": 2} and mapped.verify()
+    table = mapped.table("g")
+    for name, array in arrays.items():
+        assert np.array_equal(table[name], array) and table[name].shape == array.shape
+        assert not table[name].flags.writeable
+    assert mapped.blob("small") == {"a": 1}
+    assert mapped.table("none") is None and mapped.blob("none") is None
+    assert [p.name for p in tmp_path.iterdir()] == ["t.bin"]
+
+
+def test_lexicon_strings_round_trip():
+    tree = (GANJI_STEM_LEXICON, GANJI_BRANCH_LEXICON, GANJI_COMBINATION_RULES)
+    restored = unpack_strings(pack_strings(tree))
+    assert restored == json.loads(json.dumps(tree))   # tuple → list
+    keys = [k for lexicon in restored[:2] for k in lexicon]
+    assert all(k is sys.intern(k) for k in keys)
+    with pytest.raises(TypeError):
+        pack_strings({"a": 1})
+
+
+def test_not_a_table_file(tmp_path):
+    path = tmp_path / "x.bin"
+    path.write_bytes(b"nope" * 8)
+    with pytest.raises(ValueError):
+        MappedTables(path)
+
+
+def test_worker_attached_to_shared_file_matches(tmp_path, make_calculation):
+    path = write_tables(tmp_path / "tables.bin", engine_tables())
+    env = {**os.environ, ENV_VAR: str(path)}
+    script = WORKER.format(fusion=str(BASE_DIR / "fusion_engine"))
+    out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+
+    assert result["attached"] == str(path)
+    expected = run_engine(make_calculation("worker", 1, 1990, 5, 5, 10, 30))
+    assert result["meaning"] == json.loads(json.dumps(expected, ensure_ascii=False))
@@ -0,0 +1,49 @@
+"""
+slot ID 인코딩 (engine_core: encode_slot_ids / decode_slot_ids / expand_slot_ids)
+"""
+
+import pytest
+
+from engine.engine_core import (
+    SLOT_VOCAB_CHECKSUM,
+    SLOT_VOCABULARY,
+    decode_slot_ids,
+    encode_slot_ids,
+    expand_slot_ids,
+    refresh_today_context,
+    run_engine,
+    slot_table,
+)
+
+
+def test_vocabulary_is_unique_and_checksummed():
+    assert len(set(SLOT_VOCABULARY)) == len(SLOT_VOCABULARY)
+    table = slot_table()
+    assert table["checksum"] == SLOT_VOCAB_CHECKSUM
+    assert table["size"] == len(table["strings"]) == len(SLOT_VOCABULARY)
+
+
+def test_encode_decode_round_trip_keeps_unknown_strings():
+    slots = {"known": list(SLOT_VOCABULARY[:5]), "fallback": "rhythm.?", "empty": None, "nested": {"x": [SLOT_VOCABULARY[-1]]}}
+    encoded = encode_slot_ids(slots)
+    assert encoded["known"] == [0, 1, 2, 3, 4]
+    assert encoded["fallback"] == "rhythm.?"
+    assert decode_slot_ids(encoded) == slots
+
+
+def test_id_payload_expands_to_text_payload(calculations):
+    for calculation in calculations:
+        text = run_engine(calculation)
+        ids = run_engine(calculation, slot_encoding="id")
+        assert ids["meta"]["slot_table"]["checksum"] == SLOT_VOCAB_CHECKSUM
+        assert expand_slot_ids(ids) == text
+        assert expand_slot_ids(ids, slot_table()) == text
+
+
+def test_foreign_slot_table_is_refused(calculations):
+    ids = run_engine(calculations[0], slot_encoding="id")
+    ids["meta"] = {**ids["meta"], "slot_table": {**ids["meta"]["slot_table"], "checksum": "0" * 16}}
+    with pytest.raises(ValueError, match="Slot table mismatch"):
+        expand_slot_ids(ids)
+    with pytest.raises(ValueError, match="Slot table mismatch"):
+        refresh_today_context(ids, calculations[0])
@@ -0,0 +1,123 @@
+"""
+지방 평균태양시 보정 (analyze_saju(longitude=…) / get_hour_pillars(longitude=…), utils/solar_time.py)
+- 보정된 시각은 태양시 시지 경계(子 23:00~00:59)로, 보정이 없으면 민간 시각 경계(子 23:30~)로
+- 표준시 UTC+9 / UTC+8:30(1954~61) / 서머타임(1948~51, 1955~60, 1987~88) / 1908 이전 지방 평균시
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from engine.calendar_table import get_calendar_table
+from engine.saju_core import analyze_saju, get_hour_pillars
+from utils.solar_time import SEOUL_LONGITUDE, correction_seconds, get_civil_time_table
+from utils.time_utils import get_hour_gan
+
+BUSAN_LONGITUDE = 129.075
+
+# (민간 시각, 경도, 보정 후 날짜, 시지) — 서울 보정량: UTC+9 −32분 05초 / UTC+8:30 −2분 05초
+#                                          서머타임 +1시간 (1955~60 은 UTC+9:30 → −1시간 02분 05초)
+CASES = [
+    # UTC+9
+    (datetime(2000, 6, 15, 13, 35), SEOUL_LONGITUDE, date(2000, 6, 15), "未"),
+    (datetime(2000, 6, 15, 1, 32), SEOUL_LONGITUDE, date(2000, 6, 15), "子"),
+    (datetime(2000, 6, 15, 1, 33), SEOUL_LONGITUDE, date(2000, 6, 15), "丑"),
+    (datetime(2000, 6, 15, 23, 32), SEOUL_LONGITUDE, date(2000, 6, 15), "亥"),
+    (datetime(2000, 6, 15, 23, 33), SEOUL_LONGITUDE, date(2000, 6, 15), "子"),
+    (datetime(2000, 6, 15, 0, 1), SEOUL_LONGITUDE, date(2000, 6, 14), "子"),
+    (datetime(2000, 6, 15, 0, 32), SEOUL_LONGITUDE, date(2000, 6, 14), "子"),
+    (datetime(2000, 6, 15, 0, 33), SEOUL_LONGITUDE, date(2000, 6, 15), "子"),
+    (datetime(1990, 3, 1, 23, 23), BUSAN_LONGITUDE, date(1990, 3, 1), "亥"),
+    (datetime(1990, 3, 1, 23, 24), BUSAN_LONGITUDE, date(1990, 3, 1), "子"),
+    # UTC+8:30 (1954-03-21 ~ 1961-08-09)
+    (datetime(1954, 3, 20, 1, 33), SEOUL_LONGITUDE, date(1954, 3, 20), "丑"),
+    (datetime(1954, 3, 21, 1, 2), SEOUL_LONGITUDE, date(1954, 3, 21), "子"),
+    (datetime(1956, 1, 10, 1, 2), SEOUL_LONGITUDE, date(1956, 1, 10), "子"),
+    (datetime(1956, 1, 10, 1, 3), SEOUL_LONGITUDE, date(1956, 1, 10), "丑"),
+    (datetime(1956, 1, 10, 23, 2), SEOUL_LONGITUDE, date(1956, 1, 10), "亥"),
+    (datetime(1956, 1, 10, 23, 3), SEOUL_LONGITUDE, date(1956, 1, 10), "子"),
+    (datetime(1956, 1, 10, 0, 2), SEOUL_LONGITUDE, date(1956, 1, 9), "子"),
+    (datetime(1956, 1, 10, 0, 3), SEOUL_LONGITUDE, date(1956, 1, 10), "子"),
+    (datetime(1961, 8, 9, 23, 3), SEOUL_LONGITUDE, date(1961, 8, 9), "子"),
+    (datetime(1961, 8, 10, 23, 3), SEOUL_LONGITUDE, date(1961, 8, 10), "亥"),
+    # 서머타임 UTC+10 (1948~51, 1987~88)
+    (datetime(1949, 6, 1, 2, 32), SEOUL_LONGITUDE, date(1949, 6, 1), "子"),
+    (datetime(1949, 6, 1, 2, 33), SEOUL_LONGITUDE, date(1949, 6, 1), "丑"),
+    (datetime(1987, 7, 1, 0, 32), SEOUL_LONGITUDE, date(1987, 6, 30), "亥"),
+    (datetime(1987, 7, 1, 0, 33), SEOUL_LONGITUDE, date(1987, 6, 30), "子"),
+    (datetime(1987, 7, 1, 1, 32), SEOUL_LONGITUDE, date(1987, 6, 30), "子"),
+    (datetime(1987, 7, 1, 1, 33), SEOUL_LONGITUDE, date(1987, 7, 1), "子"),
+    (datetime(1987, 7, 1, 2, 32), SEOUL_LONGITUDE, date(1987, 7, 1), "子"),
+    (datetime(1987, 7, 1, 2, 33), SEOUL_LONGITUDE, date(1987, 7, 1), "丑"),
+    (datetime(1987, 5, 10, 1, 59), SEOUL_LONGITUDE, date(1987, 5, 10), "丑"),   # 전환 직전 UTC+9
+    (datetime(1987, 5, 10, 3, 0), SEOUL_LONGITUDE, date(1987, 5, 10), "丑"),    # 전환 직후 UTC+10
+    (datetime(1988, 10, 9, 3, 33), SEOUL_LONGITUDE, date(1988, 10, 9), "寅"),   # 종료 후 UTC+9
+    # 서머타임 UTC+9:30 (1955~60)
+    (datetime(1957, 6, 1, 2, 2), SEOUL_LONGITUDE, date(1957, 6, 1), "子"),
+    (datetime(1957, 6, 1, 2, 3), SEOUL_LONGITUDE, date(1957, 6, 1), "丑"),
+    (datetime(1957, 6, 1, 0, 2), SEOUL_LONGITUDE, date(1957, 5, 31), "亥"),
+    (datetime(1957, 6, 1, 0, 3), SEOUL_LONGITUDE, date(1957, 5, 31), "子"),
+    # 1908-04-01 이전: 서울 지방 평균시 → 서울은 그대로, 부산은 +8분 23초
+    (datetime(1900, 3, 1, 22, 59), SEOUL_LONGITUDE, date(1900, 3, 1), "亥"),
+    (datetime(1900, 3, 1, 23, 0), SEOUL_LONGITUDE, date(1900, 3, 1), "子"),
+    (datetime(1900, 3, 1, 0, 59), SEOUL_LONGITUDE, date(1900, 3, 1), "子"),
+    (datetime(1900, 3, 1, 1, 0), SEOUL_LONGITUDE, date(1900, 3, 1), "丑"),
+    (datetime(1900, 3, 1, 22, 51), BUSAN_LONGITUDE, date(1900, 3, 1), "亥"),
+    (datetime(1900, 3, 1, 22, 52), BUSAN_LONGITUDE, date(1900, 3, 1), "子"),
+    (datetime(1900, 3, 1, 23, 52), BUSAN_LONGITUDE, date(1900, 3, 2), "子"),
+]
+
+
+def expected_pillars(solar_date, hour_ji):
+    day_ganji = get_calendar_table().day_ganji(solar_date)
+    return day_ganji, get_hour_gan(day_ganji[0], hour_ji) + hour_ji
+
+
+@pytest.mark.parametrize("wall, longitude, solar_date, hour_ji", CASES)
+def test_corrected_pillars(wall, longitude, solar_date, hour_ji):
+    day_ganji, hour_ganji = expected_pillars(solar_date, hour_ji)
+    saju_info, _ = analyze_saju(wall.year, wall.month, wall.day, wall.hour, wall.minute, 1, longitude=longitude)
+    assert (saju_info["day_ganji"], saju_info["hour_ganji"]) == (day_ganji, hour_ganji)
+    assert saju_info["pillars_detail"]["hour"]["ji"] == hour_ji
+
+
+def test_batch_matches_single():
+    births = [wall for wall, *_ in CASES]
+    for longitude in (SEOUL_LONGITUDE, BUSAN_LONGITUDE):
+        expected = [
+            analyze_saju(b.year, b.month, b.day, b.hour, b.minute, 1, longitude=longitude, defer=True)[0]["hour_ganji"]
+            for b in births
+        ]
+        assert get_hour_pillars(births, longitude) == expected
+
+
+def test_without_longitude_uses_civil_boundaries():
+    # 보정이 없으면 子 는 민간 시각 23:30 부터 (기존 동작)
+    saju_info, _ = analyze_saju(2000, 6, 15, 23, 30, 1)
+    assert saju_info["hour_ganji"][1] == "子"
+    assert "birth_time_correction" not in saju_info
+    assert get_hour_pillars([datetime(2000, 6, 15, 23, 30), datetime(2000, 6, 15, 1, 29)]) == [
+        saju_info["hour_ganji"], analyze_saju(2000, 6, 15, 1, 29, 1)[0]["hour_ganji"],
+    ]
+
+
+def test_correction_record():
+    saju_info, _ = analyze_saju(1987, 7, 1, 0, 20, 1, longitude=SEOUL_LONGITUDE)
+    assert saju_info["birth_time_correction"] == {
+        "longitude": SEOUL_LONGITUDE,
+        "civil_time": "1987-07-01 00:20",
+        "local_mean_time": "1987-06-30 22:47:55",
+        "utc_offset_minutes": 600,
+        "dst": True,
+        "correction_seconds": -5525,
+    }
+    before_1908, _ = analyze_saju(1900, 3, 1, 12, 0, 1, longitude=BUSAN_LONGITUDE)
+    assert before_1908["birth_time_correction"]["utc_offset_minutes"] is None
+    assert before_1908["birth_time_correction"]["correction_seconds"] == 503
+
+
+def test_table_matches_rules():
+    table = get_civil_time_table()
+    for wall in [w for w, *_ in CASES] + [datetime(1908, 3, 31, 23, 59), datetime(1908, 4, 1, 0, 0)]:
+        for longitude in (124.7, SEOUL_LONGITUDE, BUSAN_LONGITUDE):
+            assert table.correction_seconds(wall, longitude) == correction_seconds(wall, longitude), wall
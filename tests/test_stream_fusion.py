@@ -0,0 +1,113 @@
+"""
+calculation / meaning 스트림 키 조인 (stream_fusion.fuse_streams / run_stream_fusion)
+"""
+
+import gzip
+import json
+
+from stream_fusion import fuse_streams, iter_jsonl, run_stream_fusion, subject_key
+
+
+def records(keys):
+    return [(line_no, {"subject_id": key, "line": line_no}) for line_no, key in enumerate(keys, start=1)]
+
+
+def pair(calc, meaning):
+    if calc.get("invalid"):
+        raise ValueError("schema")
+    return {"key": calc["subject_id"], "calc_line": calc["line"], "meaning_line": meaning["line"]}
+
+
+def fuse(calc_keys, meaning_keys, **kw):
+    contracts, unmatched = [], []
+    calc = records(calc_keys)
+    for _, record in calc:
+        record["invalid"] = record["subject_id"].startswith("bad")
+    stats = fuse_streams(calc, records(meaning_keys), pair, contracts.append, unmatched.append, **kw)
+    return stats, contracts, unmatched
+
+
+def test_matches_out_of_order_pairs():
+    stats, contracts, unmatched = fuse(["a", "b", "c", "d"], ["c", "a", "d", "b"])
+    assert stats["matched"] == 4 and stats["unmatched"] == 0
+    assert sorted((c["key"], c["calc_line"], c["meaning_line"]) for c in contracts) == [
+        ("a", 1, 2), ("b", 2, 4), ("c", 3, 1), ("d", 4, 3),
+    ]
+    assert unmatched == []
+
+
+def test_unpaired_records_are_reported():
+    stats, contracts, unmatched = fuse(["a", "x"], ["a", "y", "z"])
+    assert stats["matched"] == 1
+    assert sorted((u["side"], u["key"], u["reason"]) for u in unmatched) == [
+        ("calculation", "x", "no_match"),
+        ("meaning", "y", "no_match"),
+        ("meaning", "z", "no_match"),
+    ]
+
+
+def test_pending_window_evicts_oldest():
+    # 상한을 넘을 때마다 두 스트림을 통틀어 가장 먼저 들어온 레코드가 빠진다 (도착 순서: a x1 b x2 c x3 ...)
+    stats, contracts, unmatched = fuse(["a", "b", "c", "d", "e"], ["x1", "x2", "x3", "x4", "e"], max_pending=3)
+    evicted = [(u["side"], u["key"]) for u in unmatched if u["reason"] == "evicted"]
+    assert evicted == [
+        ("calculation", "a"), ("meaning", "x1"), ("calculation", "b"),
+        ("meaning", "x2"), ("calculation", "c"), ("meaning", "x3"),
+    ]
+    assert stats["evicted"] == 6
+    assert stats["max_pending"] == 4   # 상한 + 방금 들어온 1개까지만
+    assert [c["key"] for c in contracts] == ["e"]
+    assert stats["matched"] == 1 and stats["unmatched"] == 8   # 나머지 8개는 evicted / no_match 로 한 번씩
+
+
+def test_eviction_follows_arrival_not_queue_length():
+    # meaning 쪽 대기열이 더 길어도 가장 오래된 것은 calculation 의 a
+    stats, contracts, unmatched = fuse(["a"], ["x1", "x2", "x3"], max_pending=3)
+    evicted = [(u["side"], u["key"]) for u in unmatched if u["reason"] == "evicted"]
+    assert evicted == [("calculation", "a")]
+    assert [(u["side"], u["key"]) for u in unmatched if u["reason"] == "no_match"] == [
+        ("meaning", "x1"), ("meaning", "x2"), ("meaning", "x3"),
+    ]
+
+
+def test_evicted_record_misses_its_late_partner():
+    stats, contracts, unmatched = fuse(["a", "b", "c"], ["x", "y", "a"], max_pending=2)
+    assert contracts == []
+    reasons = {(u["side"], u["key"]): u["reason"] for u in unmatched}
+    assert reasons[("calculation", "a")] == "evicted"
+    assert reasons[("meaning", "a")] == "no_match"
+
+
+def test_duplicate_waiting_key_reports_the_earlier_record():
+    stats, contracts, unmatched = fuse(["a", "a", "b"], ["b", "q", "a"])
+    assert stats["duplicate"] == 1
+    duplicate = [u for u in unmatched if u["reason"] == "duplicate"]
+    assert duplicate == [{"side": "calculation", "key": "a", "line": 1, "reason": "duplicate"}]
+    # 늦게 들어온 쪽이 짝을 찾는다
+    assert {(c["key"], c["calc_line"]) for c in contracts} == {("a", 2), ("b", 3)}
+
+
+def test_invalid_pair_is_reported_not_written():
+    stats, contracts, unmatched = fuse(["bad1", "ok"], ["bad1", "ok"])
+    assert stats["invalid"] == 1 and stats["matched"] == 1
+    assert [c["key"] for c in contracts] == ["ok"]
+    assert unmatched[0]["side"] == "pair" and unmatched[0]["reason"] == "invalid"
+
+
+def test_subject_key_fallback_fields():
+    assert subject_key({"subject_id": 7}) == "7"
+    assert subject_key({"user_info": {"name": "홍", "gender": "남성", "birthday": "1990-01-01"}}) == "홍|남성|1990-01-01"
+    assert subject_key({"subject": {"name": "홍", "gender": "남성", "birthday": "1990-01-01"}}) == "홍|남성|1990-01-01"
+
+
+def test_run_stream_fusion_files(tmp_path):
+    calc_path, meaning_path = tmp_path / "calc.jsonl", tmp_path / "meaning.jsonl.gz"
+    calc_path.write_text("".join(json.dumps(r) + "\n" for _, r in records(["a", "b", "c"])), encoding="utf-8")
+    with gzip.open(meaning_path, "wt", encoding="utf-8") as f:
+        f.write("".join(json.dumps(r) + "\n" for _, r in records(["b", "a"])))
+
+    out, report = tmp_path / "contracts.jsonl.gz", tmp_path / "unmatched.jsonl"
+    stats = run_stream_fusion(calc_path, meaning_path, out, report, lambda c, m: {"key": c["subject_id"]})
+    assert stats["matched"] == 2 and stats["unmatched"] == 1
+    assert sorted(r["key"] for _, r in iter_jsonl(out)) == ["a", "b"]
+    assert [r["key"] for _, r in iter_jsonl(report)] == ["c"]
@@ -0,0 +1,50 @@
+"""
+대운 / 세운 컨텍스트 (meaning_engine run_engine: daeun_<i> / year_<YYYY>, calculation build_year_flow)
+- year_<YYYY> 는 year_flow 가 있을 때, daeun_<i> 는 daeun=True 일 때만
+- year_flow 항목 ganji 는 today / 월운과 같은 문자열, 계약 검증 · v1.1 참조 통과
+"""
+
+from build_contract import build_interpretation_contract
+from contract_refs import find_ref_targets
+from contract_validator import validate_contract
+from engine.engine_core import run_engine
+from engine.result_cache import MeaningResultCache
+from engine.saju_core import build_year_flow, get_year_ganji
+
+
+def test_year_flow_ganji_is_a_string():
+    flow = build_year_flow("甲", range(2026, 2029))
+    assert [e["ganji"] for e in flow] == ["丙午", "丁未", "戊申"]
+    assert all(e["ganji"] == e["gan"] + e["ji"] == get_year_ganji(e["year"]) for e in flow)
+
+
+def test_daeun_contexts_are_opt_in(calculations):
+    calculation = calculations[0]
+    default = run_engine(calculation)["meaning_payload"]
+    assert [c for c in default if c.startswith(("daeun_", "year_"))] == ["year_2026", "year_2027", "year_2028"]
+
+    payload = run_engine(calculation, daeun=True)["meaning_payload"]
+    cycles = [c for c in payload if c.startswith("daeun_")]
+    assert cycles == [f"daeun_{i}" for i in range(len(calculation["daeun_detail"]))]
+    assert {c: body for c, body in payload.items() if c not in cycles} == default
+    assert payload["daeun_2"]["evidence"] is calculation["daeun_detail"][2]
+    assert payload["daeun_2"]["slots"]["rhythm"] is not None
+
+
+def test_timeline_contracts_validate(calculations):
+    calculation = calculations[3]
+    meaning = run_engine(calculation, daeun=True)
+    v10 = build_interpretation_contract(calculation, meaning, "1.0")
+    v11 = build_interpretation_contract(calculation, meaning, "1.1")
+    validate_contract(v10)
+    validate_contract(v11)
+    refs = set(find_ref_targets(v11))
+    assert {"#/calculation/daeun_detail/0", "#/calculation/year_flow/2"} <= refs
+
+
+def test_cache_keeps_daeun_apart(calculations):
+    cache = MeaningResultCache()
+    calculation = calculations[1]
+    assert cache.run(calculation) == run_engine(calculation)
+    assert cache.run(calculation, daeun=True) == run_engine(calculation, daeun=True)
+    assert cache.stats()["misses"] == 2
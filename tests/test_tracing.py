@@ -0,0 +1,63 @@
+"""
+단계별 트레이서 (tboo_runtime/tracing.py) — analyze_saju / run_engine / 계약 생성 구간 기록
+- 비활성 상태에서는 아무 것도 기록하지 않고 결과도 그대로
+"""
+
+import json
+
+from build_contract import build_interpretation_contract
+from conftest import BIRTHS
+from engine.engine_core import run_engine
+from engine.saju_core import analyze_saju
+from tboo_runtime.tracing import StageTracer, active_tracer, attach_trace, lap_timer, stage, traced, tracing
+
+ANALYZE_LAPS = ("calendar_load", "calendar_lookup", "natal", "solar_terms", "daeun", "year_2026", "dataframe")
+
+
+def test_inactive_points_are_shared_no_ops():
+    assert active_tracer() is None
+    assert stage("a") is lap_timer("b")   # 공용 no-op 객체
+    with stage("a"):
+        pass
+
+
+def test_hot_paths_record_their_laps(calculations):
+    name, gender, *birth = BIRTHS[1]
+    with tracing() as tracer:
+        analyze_saju(*birth, gender, name, defer=True)
+        meaning = run_engine(calculations[1])
+        build_interpretation_contract(calculations[1], meaning, "1.1")
+
+    assert {f"analyze_saju.{lap}" for lap in ANALYZE_LAPS} <= set(tracer.counts)
+    assert {"analyze_saju", "run_engine", "run_engine.ontology", "run_engine.slots"} <= set(tracer.counts)
+    assert {"build_interpretation_contract", "build_interpretation_contract.compact_refs"} <= set(tracer.counts)
+    # 구간 합은 전체를 넘지 않는다
+    laps = sum(tracer.totals[f"analyze_saju.{lap}"] for lap in ANALYZE_LAPS)
+    assert laps <= tracer.totals["analyze_saju"] + 1e-6
+    assert active_tracer() is None
+
+
+def test_traced_output_equals_untraced(calculations):
+    expected = run_engine(calculations[0], slot_encoding="id")
+    with tracing():
+        assert run_engine(calculations[0], slot_encoding="id") == expected
+
+
+def test_summary_merge_and_exports():
+    @traced("work")
+    def work():
+        return 1
+
+    first, second = StageTracer(), StageTracer()
+    with tracing(first):
+        work()
+        work()
+    second.record("work", 0.5)
+    first.merge(second)
+
+    summary = first.summary()["stages"]["work"]
+    assert summary["count"] == 3 and summary["max_ms"] == 500.0
+    assert 'tboo_stage_calls_total{stage="work"} 3' in first.to_prometheus()
+    document = attach_trace({"meta": {}}, first)
+    assert json.loads(json.dumps(document))["meta"]["trace"]["stages"]["work"]["count"] == 3
+    assert attach_trace({}, None) == {}